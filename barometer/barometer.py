@@ -5,17 +5,18 @@ import time
 import os
 import math
 from datetime import datetime
+
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
  
 OFFSET_FILE = './sensorlogs/altitude_offset.txt'
 log_dir = './sensorlogs'
 if not os.path.exists(log_dir): 
     os.makedirs(log_dir)
 
-## Create sensor log file (메모리 최적화)
-_barometer_log_buffer = []
-_barometer_log_buffer_size = 50
-_last_barometer_flush_time = time.time()
-_barometer_flush_interval = 10  # 10초마다 플러시
+## Create sensor log file
+# commit 기준 : config.json LOGGING.COMMIT_POLICY.BAROMETER_DRIVER
+barometerlogfile = GroupCommitFile(open_log_file(os.path.join(log_dir, 'barometer.txt')), "BAROMETER_DRIVER", "SENSOR_DRIVER")
 
 def save_offset(offset):
     with open(OFFSET_FILE, 'w') as f:
@@ -28,38 +29,10 @@ def load_offset():
     except (FileNotFoundError, ValueError):
         return None 
 
-def log_barometer(text):
-    """메모리 최적화된 로깅 함수"""
-    global _barometer_log_buffer, _barometer_log_buffer_size, _last_barometer_flush_time, _barometer_flush_interval
-    
+def log_barometer(text, commit=False):
+    """센서 로그 1줄 기록 (commit=True 면 즉시 commit)"""
     t = datetime.now().isoformat(sep=' ', timespec='milliseconds')
-    string_to_write = f'{t},{text}\n'
-    
-    # 버퍼에 추가
-    _barometer_log_buffer.append(string_to_write)
-    
-    # 버퍼가 가득 차거나 시간이 지나면 플러시
-    current_time = time.time()
-    if (len(_barometer_log_buffer) >= _barometer_log_buffer_size or 
-        current_time - _last_barometer_flush_time >= _barometer_flush_interval):
-        _flush_barometer_log_buffer()
-
-def _flush_barometer_log_buffer():
-    """Barometer 로그 버퍼를 파일에 플러시"""
-    global _barometer_log_buffer, _last_barometer_flush_time
-    
-    try:
-        if _barometer_log_buffer:
-            log_file_path = os.path.join(log_dir, 'barometer.txt')
-            with open(log_file_path, 'a') as f:
-                f.writelines(_barometer_log_buffer)
-            
-            # 버퍼 정리
-            _barometer_log_buffer.clear()
-            _last_barometer_flush_time = time.time()
-            
-    except Exception as e:
-        print(f"Barometer 로그 플러시 오류: {e}")
+    barometerlogfile.write(f'{t},{text}\n', commit)
     
 def init_barometer():
     import adafruit_bmp3xx
@@ -174,7 +147,7 @@ def read_barometer(bmp, offset:float):
         # 오류 로깅 (너무 자주 출력하지 않도록)
         if read_barometer.error_count <= 5 or read_barometer.error_count % 10 == 0:
             print(f"Barometer 읽기 오류: {e}")
-            log_barometer(f"READ_ERROR,{e}")
+            log_barometer(f"READ_ERROR,{e}", commit=True)
         
         # 연속 오류가 많으면 하드웨어 점검 안내
         if read_barometer.error_count >= 50:
@@ -269,10 +242,12 @@ def read_barometer_advanced(bmp, offset:float):
         
     except Exception as e:
         print(f"Barometer 고급 데이터 읽기 오류: {e}")
-        log_barometer(f"ADVANCED_READ_ERROR,{e}")
+        log_barometer(f"ADVANCED_READ_ERROR,{e}", commit=True)
         return (1013.25, 25.0, 0.0, 1013.25, None)
 
 def terminate_barometer(i2c):
+    # commit 되지 않은 로그 기록
+    barometerlogfile.flush()
     try:
         if hasattr(i2c, "deinit"):
             i2c.deinit()
@@ -8,7 +8,6 @@ import os
 import sys
 import time
 import threading
-import csv
 import signal
 from datetime import datetime
 from multiprocessing import Queue, Process, connection
@@ -18,6 +17,7 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lib import appargs, msgstructure, logging, types, prevstate
+from lib.base_app import MsgReceiver
 from barometer import barometer
 
 # 전역 변수
@@ -29,14 +29,16 @@ MAXALT_RESET_MUTEX = threading.Lock()
 
 # 로그 파일 경로
 LOG_DIR = "logs"
-HIGH_FREQ_LOG_PATH = os.path.join(LOG_DIR, "barometer_high_freq.csv")
 HK_LOG_PATH = os.path.join(LOG_DIR, "hk_log.csv")
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[{appargs.BarometerAppArg.AppName}] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, appargs.BarometerAppArg.AppName, args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[Barometer] 로깅 실패: {e}")
@@ -56,19 +58,9 @@ def emergency_log_to_file(log_type: str, message: str):
         print(f"Emergency logging failed: {e}")
 
 def log_csv(filepath: str, headers: list, data: list):
-    """CSV 파일에 데이터를 로깅하는 함수"""
+    """CSV 파일에 데이터를 로깅하는 함수 (파일 핸들 유지, 버퍼 후 주기 flush)"""
     try:
-        # 파일이 없으면 헤더 생성
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-        
-        # 데이터 추가
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(data)
-            
+        logging.get_csv_writer(filepath, headers).write_row(data)
     except Exception as e:
         emergency_log_to_file("ERROR", f"CSV logging failed: {e}")
 
@@ -196,6 +188,9 @@ def barometerapp_terminate(i2c_instance):
             safe_log(f"Error joining thread {thread_name}: {e}", "error".upper(), True)
         safe_log(f"Terminating thread {thread_name} Complete", "info".upper(), True)
 
+    # 버퍼에 남은 CSV 행 기록
+    logging.close_csv_writers()
+
     # The termination flag should switch to false AFTER ALL TERMINATION PROCESS HAS ENDED
     safe_log("Terminating barometerapp complete", "info".upper(), True)
     return
@@ -270,34 +265,32 @@ def send_barometer_data(Main_Queue : Queue):
         
         with MAXALT_RESET_MUTEX:
             # Send Message to Flight Logic in 10Hz
-            status = msgstructure.send_msg(Main_Queue,
+            status = msgstructure.publish_msg(Main_Queue,
                                             BarometerDataToFlightLogicMsg,
                                             appargs.BarometerAppArg.AppID,
-                                            appargs.FlightlogicAppArg.AppID,
                                             appargs.BarometerAppArg.MID_SendBarometerFlightLogicData,
-                                            f"{ALTITUDE}")
+                                            (ALTITUDE,))
             if status == False:
                 safe_log("Error When sending Barometer Flight Logic Message", "error".upper(), True)
 
         if msg_send_count > 10 : 
             # Send telemetry message to COMM app in 1Hz
             # 기본 데이터만 텔레메트리 전송 (고급 데이터는 로그에만 저장)
-            tlm_data = f"{PRESSURE},{TEMPERATURE},{ALTITUDE}"
+            tlm_data = (PRESSURE, TEMPERATURE, ALTITUDE)
             
-            status = msgstructure.send_msg(Main_Queue, 
+            status = msgstructure.publish_msg(Main_Queue, 
                                         BarometerDataToTlmMsg, 
                                         appargs.BarometerAppArg.AppID,
-                                        appargs.CommAppArg.AppID,
                                         appargs.BarometerAppArg.MID_SendBarometerTlmData,
                                         tlm_data)
             if status == False:
                 safe_log("Error When sending Barometer Tlm Message", "error".upper(), True)
             
-            # 고급 데이터 로깅
-            if RESOLUTION_INFO is not None:
-                pressure_res = RESOLUTION_INFO.get('pressure_resolution', 0.01)
-                temp_res = RESOLUTION_INFO.get('temperature_resolution', 0.01)
-                safe_log(f"Barometer Advanced Data - SeaLevelPressure: {SEA_LEVEL_PRESSURE:.2f}hPa, PressureRes: {pressure_res}hPa, TempRes: {temp_res}°C", "debug".upper(), False)
+            # 고급 데이터 로깅 (DEBUG 가 꺼져 있으면 값 조회 / 포맷팅 없음)
+            if RESOLUTION_INFO is not None and log_enabled("DEBUG", __name__):
+                safe_log("Barometer Advanced Data - SeaLevelPressure: %.2fhPa, PressureRes: %shPa, TempRes: %s°C", "DEBUG", False,
+                         args=(SEA_LEVEL_PRESSURE, RESOLUTION_INFO.get('pressure_resolution', 0.01),
+                               RESOLUTION_INFO.get('temperature_resolution', 0.01)))
 
             msg_send_count = 0
         
@@ -349,29 +342,24 @@ def barometerapp_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.BarometerAppArg.AppID, Main_Queue)
+
     try:
         while BAROMETERAPP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-            # Non-blocking receive with timeout
-            if Main_Pipe.poll(1.0):  # 1초 타임아웃
-                try:
-                    message = Main_Pipe.recv()
-                except Exception as e:
-                    safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
-                    # 에러 시 루프 계속
-                    continue
-            else:
+            try:
+                recv_msg = receiver.receive(1.0)  # 1초 타임아웃
+            except Exception as e:
+                safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
+                # 에러 시 루프 계속
+                continue
+            if recv_msg is None:
                 # 타임아웃 시 루프 계속
                 continue
-            recv_msg = message
-            
-            # Validate Message, Skip this message if target AppID different from barometerapp's AppID
-            # Exception when the message is from main app
-            if recv_msg.receiver_app == appargs.BarometerAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                # Handle Command According to Message ID
-                command_handler(Main_Queue, recv_msg, barometer_instance)
-            else:
-                safe_log("Receiver MID does not match with barometerapp MID", "error".upper(), True)
+
+            # Handle Command According to Message ID
+            command_handler(Main_Queue, recv_msg, barometer_instance)
 
     # If error occurs, terminate app
     except Exception as e:
@@ -3,22 +3,24 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib import blackboard
+from lib.base_app import MsgReceiver, MsgDispatcher
 from lib import logging
 
-# 로그 레벨을 DEBUG로 설정 (환경변수 설정)
-import os
-os.environ["LOG_LEVEL"] = "DEBUG"
+# 디버그 출력은 이 모듈의 로그 레벨로 제어 (config.json LOGGING.MODULE_LEVELS "comm.commapp", CMD DEBUG ON/OFF)
+# 프로세스 전체 LOG_LEVEL 은 건드리지 않음
+
+from lib.logging import safe_log as lib_safe_log, log_enabled
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[Comm] {message}", level, printlogs)
-        
-        # DEBUG 레벨일 때는 항상 콘솔에 출력 (메인 프로세스에서도 볼 수 있도록)
-        if level.upper() == "DEBUG" or os.environ.get("LOG_LEVEL", "INFO").upper() == "DEBUG":
-            print(f"[Comm-DEBUG] {message}")
-            
+        # 디버그 모드에서는 항상 콘솔에 출력 (메인 프로세스에서도 볼 수 있도록)
+        if not printlogs and log_enabled("DEBUG", __name__):
+            printlogs = True
+        lib_safe_log(message, level, printlogs, "Comm", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[Comm] 로깅 실패: {e}")
@@ -64,7 +66,6 @@ except Exception as e:
 
 # 강화된 로깅 및 데이터 전송 시스템
 import os
-import csv
 from datetime import datetime
 
 # 로그 디렉토리 생성
@@ -119,16 +120,7 @@ def log_telemetry_data(tlm_data_str: str, success: bool = True):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(TLM_LOG_PATH):
-            with open(TLM_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'telemetry_data', 'transmission_success'])
-        
-        # 데이터 추가
-        with open(TLM_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, tlm_data_str.strip(), success])
+        logging.get_csv_writer(TLM_LOG_PATH, ['timestamp', 'telemetry_data', 'transmission_success']).write_row([timestamp, tlm_data_str.strip(), success])
             
         # 전송 통계 업데이트
         global transmission_stats
@@ -152,16 +144,8 @@ def log_command_received(cmd: str, source: str = "unknown"):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(CMD_LOG_PATH):
-            with open(CMD_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'command', 'source'])
-        
-        # 데이터 추가
-        with open(CMD_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, cmd, source])
+        # 수신 명령은 즉시 flush
+        logging.get_csv_writer(CMD_LOG_PATH, ['timestamp', 'command', 'source']).write_row([timestamp, cmd, source], flush=True)
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"Command logging failed: {e}")
@@ -172,16 +156,8 @@ def log_error(error_msg: str, context: str = ""):
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         full_msg = f"{error_msg} | Context: {context}" if context else error_msg
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(ERROR_LOG_PATH):
-            with open(ERROR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'error_message'])
-        
-        # 데이터 추가
-        with open(ERROR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, full_msg])
+        # 오류는 즉시 flush
+        logging.get_csv_writer(ERROR_LOG_PATH, ['timestamp', 'error_message']).write_row([timestamp, full_msg], flush=True)
             
     except Exception as e:
         print(f"Error logging failed: {e}")
@@ -207,147 +183,120 @@ def safe_float(value, default=0.0):
         # 경고 메시지 제거 - 조용히 기본값 반환
         return default
 
-def command_handler (recv_msg : msgstructure.MsgStructure):
-    global COMMAPP_RUNSTATUS
-    global tlm_data
-
-    if recv_msg.MsgID == appargs.MainAppArg.MID_TerminateProcess:
-        # Change Runstatus to false to start termination process
-        safe_log(f"COMMAPP TERMINATION DETECTED", "info".upper(), True)
-        COMMAPP_RUNSTATUS = False
-
-    # Receive Telemetry Data from Apps
-
-    # Receive Barometer Data
-    elif recv_msg.MsgID == appargs.BarometerAppArg.MID_SendBarometerTlmData:
-        sep_data = recv_msg.data.split(",")
-        
-        # Check the length of separated data
-        if (len(sep_data) == 3):  # 기본 데이터
-            # If simulation mode, ignore the pressure and altitude data
-            if (tlm_data.mode == "F"):
-                tlm_data.pressure = safe_float(sep_data[0])
-                tlm_data.altitude = safe_float(sep_data[2])
-            tlm_data.temperature = safe_float(sep_data[1])
-            # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
-        else:
-            safe_log(f"ERROR receiving barometer, expected 3 fields, got {len(sep_data)}", "error".upper(), True)
-            return
-
-    # Receive IMU Data
-    elif recv_msg.MsgID == appargs.ImuAppArg.MID_SendImuTlmData:
-        sep_data = recv_msg.data.split(",")
-
-        # Check the length of separated data
-        if (len(sep_data) == 13):  # 기본 데이터
-            tlm_data.filtered_roll = safe_float(sep_data[0])
-            tlm_data.filtered_pitch = safe_float(sep_data[1])
-            tlm_data.filtered_yaw = safe_float(sep_data[2])
-            
-            tlm_data.acc_roll = safe_float(sep_data[3])
-            tlm_data.acc_pitch = safe_float(sep_data[4])
-            tlm_data.acc_yaw = safe_float(sep_data[5])
-
-            tlm_data.mag_roll = safe_float(sep_data[6])
-            tlm_data.mag_pitch = safe_float(sep_data[7])
-            tlm_data.mag_yaw = safe_float(sep_data[8])
-        
-            tlm_data.gyro_roll = safe_float(sep_data[9])
-            tlm_data.gyro_pitch = safe_float(sep_data[10])
-            tlm_data.gyro_yaw = safe_float(sep_data[11])
-            
-            tlm_data.imu_temperature = safe_float(sep_data[12])
-            
-            # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
-        else:
-            safe_log(f"ERROR receiving IMU, expected 13 fields, got {len(sep_data)}", "error".upper(), True)
-            return
-
-    # Receive GPS Data
-    elif recv_msg.MsgID == appargs.GpsAppArg.MID_SendGpsTlmData:
-        sep_data = recv_msg.data.split(",")
-
-        # Check the length of separated data
-        if (len(sep_data) == 5):  # 기본 데이터
-            tlm_data.gps_time = str(sep_data[0])
-            tlm_data.gps_alt = safe_float(sep_data[1])
-            tlm_data.gps_lat = safe_float(sep_data[2])
-            tlm_data.gps_lon = safe_float(sep_data[3])
-            try:
-                tlm_data.gps_sats = int(float(sep_data[4]))  # float을 거쳐서 안전하게 변환
-            except (ValueError, TypeError):
-                safe_log(f"Invalid GPS satellites value: {sep_data[4]}, using default: 0", "warning".upper(), True)
-                tlm_data.gps_sats = 0
-            # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
-        else:
-            safe_log(f"ERROR receiving GPS, expected 5 fields, got {len(sep_data)}", "error".upper(), True)
-            return
-
-    # Receive Voltage Sensor Data
-    #elif recv_msg.MsgID == appargs.VoltageAppArg.MID_SendVoltageTlmData:
-    #    tlm_data.voltage = float(recv_msg.data)
-    
-    # Receive Tachometer Data
-    #elif recv_msg.MsgID == appargs.TachometerAppArg.MID_SendDegPerSec:
-    #    tlm_data.rot_rate = float(recv_msg.data)
-
-    elif recv_msg.MsgID == appargs.FlightlogicAppArg.MID_SendCurrentStateToTlm:
-        tlm_data.state = recv_msg.data
-
-    # Receive Simulation Status Data
-    elif recv_msg.MsgID == appargs.FlightlogicAppArg.MID_SendSimulationStatustoTlm:
-        tlm_data.mode = recv_msg.data
-
-    elif recv_msg.MsgID == appargs.ThermoAppArg.MID_SendThermoTlmData:
-        sep_data = recv_msg.data.split(",")
-        if len(sep_data) == 2:
-            tlm_data.thermo_temp = float(sep_data[0])
-            tlm_data.thermo_humi = float(sep_data[1])
-
-    # FIR1 데이터 수신
-    elif recv_msg.MsgID == appargs.FirApp1Arg.MID_SendFIR1Data:
-        sep_data = recv_msg.data.split(",")
-        tlm_data.fir1_amb = float(sep_data[0])
-        tlm_data.fir1_obj = float(sep_data[1])
-
-    # Receive TMP007 Data
-    elif recv_msg.MsgID == appargs.Tmp007AppArg.MID_SendTmp007TlmData:
-        sep_data = recv_msg.data.split(",")
-        if len(sep_data) == 3:
-            tlm_data.tmp007_object_temp = safe_float(sep_data[0])
-            tlm_data.tmp007_die_temp = safe_float(sep_data[1])
-            tlm_data.tmp007_voltage = safe_float(sep_data[2])
-        else:
-            safe_log(f"ERROR receiving TMP007, expected 3 fields, got {len(sep_data)}", "error".upper(), True)
-
-
-
-    elif recv_msg.MsgID == appargs.ThermalcameraAppArg.MID_SendCamTlmData:
-        sep_data = recv_msg.data.split(",")
-        if len(sep_data) == 3:  # 기본 데이터
-            tlm_data.thermal_camera_avg = float(sep_data[0])
-            tlm_data.thermal_camera_min = float(sep_data[1])
-            tlm_data.thermal_camera_max = float(sep_data[2])
-            # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
-
-    elif recv_msg.MsgID == appargs.ThermisAppArg.MID_SendThermisTlmData:
-        sep_data = recv_msg.data.split(",")
-        if len(sep_data) == 1:
-            tlm_data.thermis_temp = float(sep_data[0])
-
+# MID → handler 등록 테이블 (handler(recv_msg, payload))
+DISPATCHER = MsgDispatcher("Comm")
 
+@DISPATCHER.register(appargs.MainAppArg.MID_TerminateProcess)
+def on_terminate(recv_msg, payload):
+    global COMMAPP_RUNSTATUS
+    # Change Runstatus to false to start termination process
+    safe_log(f"COMMAPP TERMINATION DETECTED", "info".upper(), True)
+    COMMAPP_RUNSTATUS = False
 
-    # 모터 상태 수신
-    elif recv_msg.MsgID == appargs.FlightlogicAppArg.MID_SendMotorStatus:
+# Receive Telemetry Data from Apps
+
+# Receive Barometer Data
+@DISPATCHER.register(appargs.BarometerAppArg.MID_SendBarometerTlmData)
+def on_barometer(recv_msg, payload):
+    # If simulation mode, ignore the pressure and altitude data
+    if (tlm_data.mode == "F"):
+        tlm_data.pressure = payload[0]
+        tlm_data.altitude = payload[2]
+    tlm_data.temperature = payload[1]
+
+# Receive IMU Data
+@DISPATCHER.register(appargs.ImuAppArg.MID_SendImuTlmData)
+def on_imu(recv_msg, payload):
+    (tlm_data.filtered_roll, tlm_data.filtered_pitch, tlm_data.filtered_yaw,
+     tlm_data.acc_roll, tlm_data.acc_pitch, tlm_data.acc_yaw,
+     tlm_data.mag_roll, tlm_data.mag_pitch, tlm_data.mag_yaw,
+     tlm_data.gyro_roll, tlm_data.gyro_pitch, tlm_data.gyro_yaw,
+     tlm_data.imu_temperature) = payload
+
+# Receive GPS Data
+@DISPATCHER.register(appargs.GpsAppArg.MID_SendGpsTlmData)
+def on_gps(recv_msg, payload):
+    sep_data = payload.split(",")
+
+    # Check the length of separated data
+    if (len(sep_data) == 5):  # 기본 데이터
+        tlm_data.gps_time = str(sep_data[0])
+        tlm_data.gps_alt = safe_float(sep_data[1])
+        tlm_data.gps_lat = safe_float(sep_data[2])
+        tlm_data.gps_lon = safe_float(sep_data[3])
         try:
-            tlm_data.motor_status = int(recv_msg.data)
+            tlm_data.gps_sats = int(float(sep_data[4]))  # float을 거쳐서 안전하게 변환
         except (ValueError, TypeError):
-            tlm_data.motor_status = 1  # 기본값: 닫힘
-
+            safe_log(f"Invalid GPS satellites value: {sep_data[4]}, using default: 0", "warning".upper(), True)
+            tlm_data.gps_sats = 0
+        # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
     else:
+        safe_log(f"ERROR receiving GPS, expected 5 fields, got {len(sep_data)}", "error".upper(), True)
+
+# Receive Voltage Sensor Data
+#@DISPATCHER.register(appargs.VoltageAppArg.MID_SendVoltageTlmData)
+#def on_voltage(recv_msg, payload):
+#    tlm_data.voltage = float(payload)
+
+# Receive Tachometer Data
+#@DISPATCHER.register(appargs.TachometerAppArg.MID_SendDegPerSec)
+#def on_tachometer(recv_msg, payload):
+#    tlm_data.rot_rate = float(payload)
+
+@DISPATCHER.register(appargs.FlightlogicAppArg.MID_SendCurrentStateToTlm)
+def on_state(recv_msg, payload):
+    tlm_data.state = payload
+
+# Receive Simulation Status Data
+@DISPATCHER.register(appargs.FlightlogicAppArg.MID_SendSimulationStatustoTlm)
+def on_simulation_status(recv_msg, payload):
+    tlm_data.mode = payload
+
+@DISPATCHER.register(appargs.ThermoAppArg.MID_SendThermoTlmData)
+def on_thermo(recv_msg, payload):
+    tlm_data.thermo_temp, tlm_data.thermo_humi = payload
+
+# FIR1 데이터 수신
+@DISPATCHER.register(appargs.FirApp1Arg.MID_SendFIR1Data)
+def on_fir1(recv_msg, payload):
+    tlm_data.fir1_amb, tlm_data.fir1_obj = payload
+
+# Receive TMP007 Data
+@DISPATCHER.register(appargs.Tmp007AppArg.MID_SendTmp007TlmData)
+def on_tmp007(recv_msg, payload):
+    tlm_data.tmp007_object_temp, tlm_data.tmp007_die_temp, tlm_data.tmp007_voltage = payload
+
+@DISPATCHER.register(appargs.ThermalcameraAppArg.MID_SendCamTlmData)
+def on_thermal_camera(recv_msg, payload):
+    tlm_data.thermal_camera_avg, tlm_data.thermal_camera_min, tlm_data.thermal_camera_max = payload
+    # 고급 데이터는 로그에만 저장 (텔레메트리에는 전송하지 않음)
+
+@DISPATCHER.register(appargs.ThermisAppArg.MID_SendThermisTlmData)
+def on_thermis(recv_msg, payload):
+    tlm_data.thermis_temp = payload[0]
+
+# 모터 상태 수신
+@DISPATCHER.register(appargs.FlightlogicAppArg.MID_SendMotorStatus)
+def on_motor_status(recv_msg, payload):
+    tlm_data.motor_status = payload[0]
+
+def command_handler (recv_msg : msgstructure.MsgStructure):
+    # payload 형식이 맞지 않는 스키마 MID 는 msgstructure 에서 로그 후 건너뜀
+    if not DISPATCHER.dispatch(recv_msg):
         safe_log(f"MID {recv_msg.MsgID} not handled", "error".upper(), True)
     return
 
+# 블랙보드 슬롯별 마지막으로 반영한 seq
+BLACKBOARD_SEQS = {}
+
+def refresh_from_blackboard():
+    """블랙보드의 새 텔레메트리 스냅샷을 tlm_data 에 반영 (메시지 수신과 같은 처리 경로)"""
+    board = blackboard.get_blackboard()
+    if board is None:
+        return
+    for recv_msg in board.poll_updates(appargs.CommAppArg.AppID, BLACKBOARD_SEQS):
+        command_handler(recv_msg)
+
 def send_hk(Main_Queue : Queue):
     global COMMAPP_RUNSTATUS
     while COMMAPP_RUNSTATUS:
@@ -432,6 +381,9 @@ def commapp_terminate(serial_instance):
             safe_log(f"Error joining thread {thread_name}: {e}", "error".upper(), True)
         safe_log(f"Terminating thread {thread_name} Complete", "info".upper(), True)
 
+    # 버퍼에 남은 CSV 행 기록
+    logging.close_csv_writers()
+
     # The termination flag should switch to false AFTER ALL TERMINATION PROCESS HAS ENDED
     safe_log("Terminating commapp complete", "info".upper(), True)
     return
@@ -538,6 +490,9 @@ def send_tlm(serial_instance):
 
     while COMMAPP_RUNSTATUS:
         try:
+            # 전송 직전 최신 센서값 스냅샷
+            refresh_from_blackboard()
+
             current_time = get_current_time()
             tlm_data.mission_time = current_time.strftime("%H:%M:%S")
 
@@ -618,7 +573,7 @@ def send_tlm(serial_instance):
                         str(tlm_data.imu_system_status)])+"\n"
 
             # DEBUG 모드일 때만 디버그 텍스트 출력
-            if os.environ.get("LOG_LEVEL", "INFO").upper() == "DEBUG":
+            if logging.log_enabled("DEBUG", __name__):
                 tlm_debug_text = f"\n=== TELEMETRY DEBUG INFO ===\n" \
                         f"ID : {tlm_data.team_id} TIME : {tlm_data.mission_time}, PCK_CNT : {tlm_data.packet_count}, MODE : {tlm_data.mode}, STATE : {tlm_data.state}\n"\
                         f"Barometer : Altitude({tlm_data.altitude}), Temperature({tlm_data.temperature}), Pressure({tlm_data.pressure}), SeaLevelP({tlm_data.barometer_sea_level_pressure})\n" \
@@ -687,14 +642,14 @@ def cmd_cx(option:str, Main_Queue:Queue):
 def cmd_debug(option:str, Main_Queue:Queue):
     """디버그 출력 제어 명령"""
     if option == "ON":
-        os.environ["LOG_LEVEL"] = "DEBUG"
+        logging.set_log_level("DEBUG", __name__)
         safe_log("Debug output enabled", "info".upper(), True)
         safe_log("🔍 DEBUG MODE ACTIVATED - Detailed CommApp output will be shown", "debug".upper(), True)
         # 메인 프로세스에도 디버그 상태 전달
         debug_msg = msgstructure.MsgStructure()
         msgstructure.send_msg(Main_Queue, debug_msg, appargs.CommAppArg.AppID, appargs.MainAppArg.AppID, appargs.MainAppArg.MID_SendHK, "DEBUG_ON")
     elif option == "OFF":
-        os.environ["LOG_LEVEL"] = "INFO"
+        logging.clear_log_level(__name__)
         safe_log("Debug output disabled", "info".upper(), True)
         safe_log("🔍 DEBUG MODE DEACTIVATED - CommApp debug output hidden", "debug".upper(), True)
         # 메인 프로세스에도 디버그 상태 전달
@@ -1034,39 +989,33 @@ def commapp_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함 : 자기 앱, 메인 앱, 구독 발행 메시지)
+    receiver = MsgReceiver(Main_Pipe, appargs.CommAppArg.AppID, Main_Queue)
+
     try:
         while COMMAPP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-            # Non-blocking receive with timeout
             try:
-                if Main_Pipe.poll(0.5):  # 0.5초 타임아웃으로 단축
-                    try:
-                        message = Main_Pipe.recv()
-                    except (EOFError, BrokenPipeError, ConnectionResetError) as e:
-                        safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
-                        log_error(f"Pipe connection lost: {e}", "commapp_main")
-                        # 연결이 끊어져도 로깅은 계속
-                        time.sleep(1)
-                        continue
-                    except Exception as e:
-                        safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
-                        log_error(f"Pipe receive error: {e}", "commapp_main")
-                        # 에러 시 루프 계속
-                        time.sleep(0.5)
-                        continue
-                else:
+                try:
+                    recv_msg = receiver.receive(0.5)  # 0.5초 타임아웃으로 단축
+                except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+                    safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
+                    log_error(f"Pipe connection lost: {e}", "commapp_main")
+                    # 연결이 끊어져도 로깅은 계속
+                    time.sleep(1)
+                    continue
+                except Exception as e:
+                    safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
+                    log_error(f"Pipe receive error: {e}", "commapp_main")
+                    # 에러 시 루프 계속
+                    time.sleep(0.5)
+                    continue
+                if recv_msg is None:
                     # 타임아웃 시 루프 계속
                     continue
-                    
-                recv_msg = message
-                
-                # Validate Message, Skip this message if target AppID different from commapp's AppID
-                # Exception when the message is from main app
-                if recv_msg.receiver_app == appargs.CommAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                    # Handle Command According to Message ID
-                    command_handler(recv_msg)
-                else:
-                    safe_log("Receiver MID does not match with commapp MID", "error".upper(), True)
+
+                # Handle Command According to Message ID
+                command_handler(recv_msg)
                     
             except Exception as e:
                 safe_log(f"Main loop error: {e}", "error".upper(), True)
@@ -10,18 +10,20 @@ import time
 import os
 from datetime import datetime
 
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
+
 log_dir = './sensorlogs'
 if not os.path.exists(log_dir): 
     os.makedirs(log_dir)
 
 ## Create sensor log file
-fir1logfile = open(os.path.join(log_dir, 'fir1.txt'), 'a')
+fir1logfile = GroupCommitFile(open_log_file(os.path.join(log_dir, 'fir1.txt')), "FIR1_DRIVER", "SENSOR_DRIVER")
 
 def _log(text):
     t = datetime.now().isoformat(sep=' ', timespec='milliseconds')
     string_to_write = f'{t},{text}\n'
     fir1logfile.write(string_to_write)
-    fir1logfile.flush()
 
 def init_fir1():
     """FIR1 센서 초기화 (직접 I2C 연결)"""
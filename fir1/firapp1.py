@@ -17,17 +17,21 @@ from lib import logging
 from lib import appargs
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[FIR1] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "FIR1", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[FIR1] 로깅 실패: {e}")
         print(f"[FIR1] 원본 메시지: {message}")
 
 from lib import msgstructure
+from lib.base_app import MsgReceiver
 from fir1 import fir1
 
 # ──────────────────────────────
@@ -90,27 +94,15 @@ def read_fir1_data(sensor):
 def send_fir1_data(Main_Queue: Queue):
     """FIR1 데이터 전송 스레드."""
     global FIR1_AMB, FIR1_OBJ
-    cnt = 0
-    fl_msg = msgstructure.MsgStructure()
-    tlm_msg = msgstructure.MsgStructure()
+    fir1_msg = msgstructure.MsgStructure()
 
     while FIR1APP_RUNSTATUS:
-        # Flightlogic 10 Hz
-        msgstructure.send_msg(Main_Queue, fl_msg,
-                              appargs.FirApp1Arg.AppID,
-                              appargs.FlightlogicAppArg.AppID,
-                              appargs.FirApp1Arg.MID_SendFIR1Data,
-                              f"{FIR1_AMB:.2f},{FIR1_OBJ:.2f}")
-
-        if cnt > 10:  # 1 Hz telemetry
-            msgstructure.send_msg(Main_Queue, tlm_msg,
-                                  appargs.FirApp1Arg.AppID,
-                                  appargs.CommAppArg.AppID,
-                                  appargs.FirApp1Arg.MID_SendFIR1Data,
-                                  f"{FIR1_AMB:.2f},{FIR1_OBJ:.2f}")
-            cnt = 0
-
-        cnt += 1
+        # 10 Hz 발행 : Flightlogic, Comm 모두 MID_SendFIR1Data 구독
+        msgstructure.publish_msg(Main_Queue, fir1_msg,
+                                 appargs.FirApp1Arg.AppID,
+                                 appargs.FirApp1Arg.MID_SendFIR1Data,
+                                 (FIR1_AMB, FIR1_OBJ))
+
         time.sleep(0.1)  # 10 Hz
 
 # ──────────────────────────────
@@ -132,6 +124,7 @@ def firapp1_terminate(i2c):
 # ──────────────────────────────
 def firapp1_main(Main_Queue: Queue, Main_Pipe: connection.Connection):
     """FIR1 앱 메인 함수."""
+    global FIR1APP_RUNSTATUS
     import threading
     
     # 초기화
@@ -149,10 +142,21 @@ def firapp1_main(Main_Queue: Queue, Main_Pipe: connection.Connection):
     read_thread.start()
     send_thread.start()
     
-    # 메인 루프
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.FirApp1Arg.AppID, Main_Queue)
+
+    # 메인 루프 (종료 명령 수신)
     try:
         while FIR1APP_RUNSTATUS:
-            time.sleep(1)
+            try:
+                recv_msg = receiver.receive(1.0)
+            except (EOFError, OSError) as e:
+                safe_log(f"Pipe receive error: {e}", "WARNING", True)
+                time.sleep(1)
+                continue
+            if recv_msg is not None and recv_msg.MsgID == appargs.MainAppArg.MID_TerminateProcess:
+                safe_log("FIR1APP TERMINATION DETECTED", "INFO", True)
+                FIR1APP_RUNSTATUS = False
     except KeyboardInterrupt:
         safe_log("FIR1 앱 사용자 중단", "INFO", True)
     finally:
@@ -3,6 +3,8 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib import blackboard
+from lib.base_app import MsgReceiver, MsgDispatcher
 from lib import logging
 from lib import types
 from lib import prevstate
@@ -13,7 +15,6 @@ from multiprocessing import Queue, connection
 import threading
 import time
 import os
-import csv
 from datetime import datetime
 
 # Runstatus of application. Application is terminated when false
@@ -48,6 +49,9 @@ MOTOR_TARGET_PULSE: int = -1  # 마지막으로 실제 서보에 지시한 각
 STATE_LIST = ["발사대 대기", "상승", "최고점", "하강", "모터 완전 닫음", "착륙"]
 CURRENT_STATE = 0
 
+# 로그 압축을 일시 정지하는 상태 (config.json LOGGING.COMPRESS_PAUSE_STATES)
+COMPRESS_PAUSE_STATES = tuple(config.get_config("LOGGING.COMPRESS_PAUSE_STATES", [1, 2, 3, 4]))
+
 # Simulation Mode Flags
 SIMULATION_ENABLE = False
 SIMULATION_ACTIVATE = False
@@ -81,6 +85,9 @@ LAST_BAROMETER = 0.0
 LAST_FIR1 = None
 LAST_THERMAL = None
 
+# 블랙보드 슬롯별 마지막으로 반영한 seq
+BLACKBOARD_SEQS = {}
+
 # ──────────────────────────────
 # 6. 강화된 로깅 시스템
 # ──────────────────────────────
@@ -94,6 +101,20 @@ SENSOR_LOG_PATH = os.path.join(LOG_DIR, "sensor_log.csv")
 ERROR_LOG_PATH = os.path.join(LOG_DIR, "error_log.csv")
 MOTOR_LOG_PATH = os.path.join(LOG_DIR, "motor_log.csv")
 
+# 고빈도 수치 센서 데이터는 센서별 바이너리 레코드로 기록 (lib/logging/flight_recorder.py)
+# sensor_type → (필드, struct 포맷), 파일 : LOG_DIR/sensor_<type>.frec
+# 표에 없는 센서(GPS 텍스트 등)는 SENSOR_LOG_PATH CSV 에 기록
+# 변환 : python3 -m lib.logging.flight_recorder logs/flight_logic/sensor_*.frec --csv
+SENSOR_RECORD_STREAMS = {
+    "DHT11":     (["temperature", "humidity"], "2f"),
+    "Thermis":   (["temperature"], "f"),
+    "IMU":       (["roll", "pitch", "yaw"], "3f"),
+    "Barometer": (["altitude"], "f"),
+    "FIR1":      (["ambient", "object"], "2f"),
+    "Thermal":   (["avg", "min", "max"], "3f"),
+    "TMP007":    (["object_temp", "die_temp", "voltage"], "3f"),
+}
+
 # 강제 종료 시에도 로그를 저장하기 위한 플래그
 _emergency_logging_enabled = True
 
@@ -112,12 +133,14 @@ data_transmission_stats = {
 # ──────────────────────────────
 # 7. 로깅 함수들 (lib/logging.py 사용)
 # ──────────────────────────────
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[{appargs.FlightlogicAppArg.AppName}] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[FlightLogic] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "FlightLogic", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[FLIGHT_LOGIC] 로깅 실패: {e}")
@@ -153,16 +176,9 @@ def log_state_change(old_state: str, new_state: str, reason: str = ""):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(STATE_LOG_PATH):
-            with open(STATE_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'old_state', 'new_state', 'reason'])
-        
-        # 데이터 추가
-        with open(STATE_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, old_state, new_state, reason])
+        # 상태 변경은 즉시 flush
+        logging.get_csv_writer(STATE_LOG_PATH, ['timestamp', 'old_state', 'new_state', 'reason']).write_row(
+            [timestamp, old_state, new_state, reason], flush=True)
             
         # lib/logging.py 사용
         safe_log(f"State change: {old_state} → {new_state} ({reason})", "INFO", True)
@@ -175,19 +191,12 @@ def log_motor_command(pulse: int, success: bool = True, context: str = ""):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(MOTOR_LOG_PATH):
-            with open(MOTOR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'pulse', 'angle_deg', 'success', 'context'])
-        
         # 각도 계산
         angle_deg = int((pulse - 500) * 180 / 2000)  # 500~2500 → 0~180도
         
-        # 데이터 추가
-        with open(MOTOR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, pulse, angle_deg, success, context])
+        # 모터 명령은 즉시 flush
+        logging.get_csv_writer(MOTOR_LOG_PATH, ['timestamp', 'pulse', 'angle_deg', 'success', 'context']).write_row(
+            [timestamp, pulse, angle_deg, success, context], flush=True)
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"Motor command logging failed: {e}")
@@ -195,18 +204,17 @@ def log_motor_command(pulse: int, success: bool = True, context: str = ""):
 def log_sensor_data(sensor_type: str, data: dict):
     """센서 데이터를 로깅"""
     try:
+        stream = SENSOR_RECORD_STREAMS.get(sensor_type)
+        if stream is not None:
+            fields, fmt = stream
+            path = os.path.join(LOG_DIR, f"sensor_{sensor_type.lower()}.frec")
+            logging.get_flight_recorder(path, sensor_type, fields, fmt).record(*(data[field] for field in fields))
+            return
+
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(SENSOR_LOG_PATH):
-            with open(SENSOR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'sensor_type', 'data'])
-        
-        # 데이터 추가
-        with open(SENSOR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, sensor_type, str(data)])
+        logging.get_csv_writer(SENSOR_LOG_PATH, ['timestamp', 'sensor_type', 'data']).write_row(
+            [timestamp, sensor_type, str(data)])
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"Sensor data logging failed: {e}")
@@ -216,16 +224,9 @@ def log_error(error_msg: str, context: str = ""):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(ERROR_LOG_PATH):
-            with open(ERROR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'error', 'context'])
-        
-        # 데이터 추가
-        with open(ERROR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, error_msg, context])
+        # 오류는 즉시 flush
+        logging.get_csv_writer(ERROR_LOG_PATH, ['timestamp', 'error', 'context']).write_row(
+            [timestamp, error_msg, context], flush=True)
             
         # lib/logging.py 사용
         safe_log(f"Error: {error_msg} (Context: {context})", "ERROR", True)
@@ -260,19 +261,9 @@ def safe(val):
     return val if val is not None else 0
 
 def log_csv(filepath: str, headers: list, data: list):
-    """CSV 파일에 데이터 로깅"""
+    """CSV 파일에 데이터 로깅 (파일 핸들 유지, 버퍼 후 주기 flush)"""
     try:
-        # 파일이 없으면 헤더 생성
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-        
-        # 데이터 추가
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(data)
-            
+        logging.get_csv_writer(filepath, headers).write_row(data)
     except Exception as e:
         emergency_log_to_file("ERROR", f"CSV logging failed: {e}")
 
@@ -299,7 +290,7 @@ def set_motor_pulse(Main_Queue: Queue, pulse: int) -> None:
                               appargs.FlightlogicAppArg.AppID,
                               appargs.MotorAppArg.AppID,
                               appargs.FlightlogicAppArg.MID_SetServoAngle,
-                              str(pulse))
+                              (int(pulse),))
             
             if success:
                 # 성공 시 통계 업데이트
@@ -353,11 +344,10 @@ def send_motor_status_to_comm(Main_Queue: Queue, pulse: int):
         motor_status = 0 if pulse == MOTOR_OPEN_PULSE else 1
         
         msg = msgstructure.MsgStructure()
-        success = msgstructure.send_msg(Main_Queue, msg,
+        success = msgstructure.publish_msg(Main_Queue, msg,
                           appargs.FlightlogicAppArg.AppID,
-                          appargs.CommAppArg.AppID,
                           appargs.FlightlogicAppArg.MID_SendMotorStatus,
-                          str(motor_status))
+                          (motor_status,))
         
         # 성공/실패 모두 조용히 처리 (로그 출력하지 않음)
             
@@ -401,119 +391,95 @@ def update_motor_logic(Main_Queue: Queue):
 # ──────────────────────────────
 # 11. 메시지 핸들러
 # ──────────────────────────────
-def command_handler(recv_msg: msgstructure.MsgStructure, Main_Queue: Queue):
-    """메시지 핸들러"""
-    global CURRENT_TEMP, CURRENT_THERMIS_TEMP
-    global LAST_GPS, LAST_IMU_ROLL, LAST_IMU_PITCH, LAST_BAROMETER, LAST_FIR1, LAST_THERMAL
-    
+# MID → handler 등록 테이블 (handler(recv_msg, payload, Main_Queue))
+DISPATCHER = MsgDispatcher("FlightLogic")
+
+# 프로세스 종료 명령
+@DISPATCHER.register(appargs.MainAppArg.MID_TerminateProcess)
+def on_terminate(recv_msg, payload, Main_Queue):
+    global FLIGHTLOGICAPP_RUNSTATUS
+    safe_log("TERMINATION DETECTED", "INFO", True)
+    FLIGHTLOGICAPP_RUNSTATUS = False
+
+# DHT11 온도 데이터
+@DISPATCHER.register(appargs.ThermoAppArg.MID_SendThermoFlightLogicData)
+def on_thermo(recv_msg, payload, Main_Queue):
+    global CURRENT_TEMP
+    CURRENT_TEMP = payload[0]
+    log_sensor_data("DHT11", {"temperature": CURRENT_TEMP, "humidity": payload[1]})
+
+# Thermis 온도 데이터
+@DISPATCHER.register(appargs.ThermisAppArg.MID_SendThermisFlightLogicData)
+def on_thermis(recv_msg, payload, Main_Queue):
+    global CURRENT_THERMIS_TEMP
+    CURRENT_THERMIS_TEMP = payload[0]
+    log_sensor_data("Thermis", {"temperature": CURRENT_THERMIS_TEMP})
+
+# IMU 데이터
+@DISPATCHER.register(appargs.ImuAppArg.MID_SendImuFlightLogicData)
+def on_imu(recv_msg, payload, Main_Queue):
+    global LAST_IMU_ROLL, LAST_IMU_PITCH
+    LAST_IMU_ROLL, LAST_IMU_PITCH, yaw = payload
+    log_sensor_data("IMU", {"roll": LAST_IMU_ROLL, "pitch": LAST_IMU_PITCH, "yaw": yaw})
+
+# GPS 데이터
+@DISPATCHER.register(appargs.GpsAppArg.MID_SendGpsTlmData)
+def on_gps_tlm(recv_msg, payload, Main_Queue):
+    global LAST_GPS
+    LAST_GPS = payload
+    log_sensor_data("GPS", {"data": LAST_GPS})
+
+# Barometer 데이터
+@DISPATCHER.register(appargs.BarometerAppArg.MID_SendBarometerFlightLogicData)
+def on_barometer(recv_msg, payload, Main_Queue):
+    global LAST_BAROMETER
+    altitude = payload[0]
+    LAST_BAROMETER = altitude
+    barometer_logic(Main_Queue, altitude)
+    log_sensor_data("Barometer", {"altitude": altitude})
+
+# FIR1 데이터
+@DISPATCHER.register(appargs.FirApp1Arg.MID_SendFIR1Data)
+def on_fir1(recv_msg, payload, Main_Queue):
+    global LAST_FIR1
+    LAST_FIR1 = payload
+    log_sensor_data("FIR1", {"ambient": payload[0], "object": payload[1]})
+
+# Thermal Camera 데이터
+@DISPATCHER.register(appargs.ThermalcameraAppArg.MID_SendCamFlightLogicData)
+def on_thermal_camera(recv_msg, payload, Main_Queue):
+    global LAST_THERMAL
+    LAST_THERMAL = payload
+    log_sensor_data("Thermal", {"avg": payload[0], "min": payload[1], "max": payload[2]})
+
+# TMP007 데이터 (2603)
+@DISPATCHER.register(appargs.Tmp007AppArg.MID_SendTmp007FlightLogicData)
+def on_tmp007(recv_msg, payload, Main_Queue):
+    object_temp, die_temp, voltage = payload
+    log_sensor_data("TMP007", {"object_temp": object_temp, "die_temp": die_temp, "voltage": voltage})
+
+# GPS FlightLogic 데이터 (1203, 텍스트 "lat,lon,alt,time,sats")
+@DISPATCHER.register(appargs.GpsAppArg.MID_SendGpsFlightLogicData)
+def on_gps(recv_msg, payload, Main_Queue):
     try:
-        # 프로세스 종료 명령
-        if recv_msg.MsgID == appargs.MainAppArg.MID_TerminateProcess:
-            safe_log("TERMINATION DETECTED", "INFO", True)
-            global FLIGHTLOGICAPP_RUNSTATUS
-            FLIGHTLOGICAPP_RUNSTATUS = False
-            return
-        
-        # DHT11 온도 데이터
-        elif recv_msg.MsgID == appargs.ThermoAppArg.MID_SendThermoFlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 2:
-                    CURRENT_TEMP = float(data[0])
-                    log_sensor_data("DHT11", {"temperature": CURRENT_TEMP, "humidity": data[1]})
-            except Exception as e:
-                log_error(f"DHT11 data parsing error: {e}", "command_handler")
-        
-        # Thermis 온도 데이터
-        elif recv_msg.MsgID == appargs.ThermisAppArg.MID_SendThermisFlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 1:
-                    CURRENT_THERMIS_TEMP = float(data[0])
-                    log_sensor_data("Thermis", {"temperature": CURRENT_THERMIS_TEMP})
-            except Exception as e:
-                log_error(f"Thermis data parsing error: {e}", "command_handler")
-        
-        # IMU 데이터
-        elif recv_msg.MsgID == appargs.ImuAppArg.MID_SendImuFlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 3:
-                    LAST_IMU_ROLL = float(data[0])
-                    LAST_IMU_PITCH = float(data[1])
-                    log_sensor_data("IMU", {"roll": LAST_IMU_ROLL, "pitch": LAST_IMU_PITCH, "yaw": data[2]})
-            except Exception as e:
-                log_error(f"IMU data parsing error: {e}", "command_handler")
-        
-        # GPS 데이터
-        elif recv_msg.MsgID == appargs.GpsAppArg.MID_SendGpsTlmData:
-            try:
-                LAST_GPS = recv_msg.data
-                log_sensor_data("GPS", {"data": LAST_GPS})
-            except Exception as e:
-                log_error(f"GPS data parsing error: {e}", "command_handler")
-        
-        # Barometer 데이터
-        elif recv_msg.MsgID == appargs.BarometerAppArg.MID_SendBarometerFlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 1:
-                    altitude = float(data[0])
-                    LAST_BAROMETER = altitude
-                    barometer_logic(Main_Queue, altitude)
-                    log_sensor_data("Barometer", {"altitude": altitude})
-            except Exception as e:
-                log_error(f"Barometer data parsing error: {e}", "command_handler")
-        
-        # FIR1 데이터
-        elif recv_msg.MsgID == appargs.FirApp1Arg.MID_SendFIR1Data:
-            try:
-                LAST_FIR1 = recv_msg.data
-                log_sensor_data("FIR1", {"data": LAST_FIR1})
-            except Exception as e:
-                log_error(f"FIR1 data parsing error: {e}", "command_handler")
-        
-        # Thermal Camera 데이터
-        elif recv_msg.MsgID == appargs.ThermalcameraAppArg.MID_SendCamFlightLogicData:
-            try:
-                LAST_THERMAL = recv_msg.data
-                log_sensor_data("Thermal", {"data": LAST_THERMAL})
-            except Exception as e:
-                log_error(f"Thermal data parsing error: {e}", "command_handler")
+        data = payload.split(',')
+        if len(data) >= 5:
+            lat = float(data[0])
+            lon = float(data[1])
+            alt = float(data[2])
+            time_str = data[3]
+            sats = int(data[4])
+            log_sensor_data("GPS_FL", {"lat": lat, "lon": lon, "alt": alt, "time": time_str, "sats": sats})
+    except Exception as e:
+        log_error(f"GPS FlightLogic data parsing error: {e}", "command_handler")
 
-        
-        # TMP007 데이터 (2603)
-        elif recv_msg.MsgID == appargs.Tmp007AppArg.MID_SendTmp007FlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 3:
-                    object_temp = float(data[0])
-                    die_temp = float(data[1])
-                    voltage = float(data[2])
-                    log_sensor_data("TMP007", {"object_temp": object_temp, "die_temp": die_temp, "voltage": voltage})
-            except Exception as e:
-                log_error(f"TMP007 data parsing error: {e}", "command_handler")
-        
-        # GPS FlightLogic 데이터 (1203)
-        elif recv_msg.MsgID == appargs.GpsAppArg.MID_SendGpsFlightLogicData:
-            try:
-                data = recv_msg.data.split(',')
-                if len(data) >= 5:
-                    lat = float(data[0])
-                    lon = float(data[1])
-                    alt = float(data[2])
-                    time_str = data[3]
-                    sats = int(data[4])
-                    log_sensor_data("GPS_FL", {"lat": lat, "lon": lon, "alt": alt, "time": time_str, "sats": sats})
-            except Exception as e:
-                log_error(f"GPS FlightLogic data parsing error: {e}", "command_handler")
-        
-        # 기타 메시지
-        else:
+def command_handler(recv_msg: msgstructure.MsgStructure, Main_Queue: Queue):
+    """메시지 핸들러 : MID 별 등록 handler 로 전달"""
+    try:
+        if not DISPATCHER.dispatch(recv_msg, Main_Queue):
             log_error(f"Unknown message ID: {recv_msg.MsgID}", "command_handler")
-            
     except Exception as e:
-        log_error(f"Command handler error: {e}", "command_handler")
+        log_error(f"Command handler error (MID {recv_msg.MsgID}): {e}", "command_handler")
 
 # ──────────────────────────────
 # 12. HK 송신 함수
@@ -680,6 +646,9 @@ def log_and_update_state(state: int, log_msg: str):
         prevstate.update_prevstate(CURRENT_STATE)
     except Exception as e:
         log_error(f"State change logging failed: {e}", "log_and_update_state")
+    
+    # 중요 비행 구간에서는 로그 압축 일시 정지 (SD / CPU 양보)
+    logging.set_log_compression_paused(state in COMPRESS_PAUSE_STATES)
 
 def launchpad_state_transition(Main_Queue: Queue):
     """발사대 대기 상태로 전환"""
@@ -780,6 +749,9 @@ def flightlogicapp_terminate():
     FLIGHTLOGICAPP_RUNSTATUS = False
     _emergency_logging_enabled = False
     
+    # 비행 상태에 따른 압축 일시 정지 해제 (종료 후 남은 로테이션이 멈춰 있지 않도록)
+    logging.resume_log_compression()
+    
     safe_log("Terminating flightlogicapp", "INFO", True)
     
     # 스레드 종료 대기
@@ -793,6 +765,10 @@ def flightlogicapp_terminate():
             safe_log(f"Error joining thread {thread_name}: {e}", "ERROR", True)
         safe_log(f"Terminating thread {thread_name} Complete", "INFO", True)
 
+    # 버퍼에 남은 CSV 행 / 바이너리 레코드 기록
+    logging.close_csv_writers()
+    logging.close_flight_recorders()
+
     safe_log("Terminating flightlogicapp complete", "INFO", True)
     return
 
@@ -817,18 +793,21 @@ def flightlogicapp_main(Main_Queue: Queue, Main_Pipe: connection.Connection):
             thread.start()
             safe_log(f"Started {thread_name} thread", "INFO", True)
         
+        receiver = MsgReceiver(Main_Pipe, appargs.FlightlogicAppArg.AppID, Main_Queue)
+        
         # 메인 루프
         while FLIGHTLOGICAPP_RUNSTATUS:
             try:
-                # 메시지 수신
-                if Main_Pipe.poll(0.1):
-                    recv_msg = Main_Pipe.recv()
-                    
-                    # Validate Message, Skip this message if target AppID different from flightlogicapp's AppID
-                    if recv_msg.receiver_app == appargs.FlightlogicAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                        command_handler(recv_msg, Main_Queue)
-                    else:
-                        safe_log(f"Receiver MID does not match with flightlogicapp MID: {recv_msg.receiver_app}", "error".upper(), True)
+                # 블랙보드 최신 센서값 반영
+                board = blackboard.get_blackboard()
+                if board is not None:
+                    for board_msg in board.poll_updates(appargs.FlightlogicAppArg.AppID, BLACKBOARD_SEQS):
+                        command_handler(board_msg, Main_Queue)
+
+                # 메시지 수신 (공통 수신 helper, 수신 앱 검증 포함)
+                recv_msg = receiver.receive(0.1)
+                if recv_msg is not None:
+                    command_handler(recv_msg, Main_Queue)
                     
             except Exception as e:
                 log_error(f"Main loop error: {e}", "flightlogicapp_main")
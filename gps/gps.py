@@ -3,6 +3,9 @@ import os
 import serial
 from datetime import datetime
 
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
+
 # serial0은 기본적으로 GPIO 14 (TX) / GPIO 15 (RX)에 매핑되어 있음
 SERIAL_PORT = '/dev/serial0'
 BAUDRATE = 9600
@@ -11,12 +14,11 @@ BAUDRATE = 9600
 log_dir = './sensorlogs'
 if not os.path.exists(log_dir): 
     os.makedirs(log_dir)
-gpslogfile = open(os.path.join(log_dir, 'gps.txt'), 'a')
+gpslogfile = GroupCommitFile(open_log_file(os.path.join(log_dir, 'gps.txt')), "GPS_DRIVER", "SENSOR_DRIVER")
 
 def log_gps(text):
     t = datetime.now().isoformat(sep=' ', timespec='milliseconds')
     gpslogfile.write(f'{t},{text}\n')
-    gpslogfile.flush()
 
 
 def init_gps():
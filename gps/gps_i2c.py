@@ -9,17 +9,19 @@ import os, time
 from datetime import datetime
 import board, busio
 
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
+
 # ─────────────────────────────
 # 1) 로그 파일 준비
 # ─────────────────────────────
 LOG_DIR = "./sensorlogs"
 os.makedirs(LOG_DIR, exist_ok=True)
-gps_log = open(os.path.join(LOG_DIR, "gps_i2c.txt"), "a")
+gps_log = GroupCommitFile(open_log_file(os.path.join(LOG_DIR, "gps_i2c.txt")), "GPS_DRIVER", "SENSOR_DRIVER")
 
 def _log(line: str) -> None:
     t = datetime.now().isoformat(sep=" ", timespec="milliseconds")
     gps_log.write(f"{t},{line}\n")
-    gps_log.flush()
 
 # ─────────────────────────────
 # 2) 초기화 / 종료
@@ -3,14 +3,17 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib.base_app import MsgReceiver
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[GPS] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[GPS] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "GPS", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[GPS] 로깅 실패: {e}")
@@ -93,23 +96,19 @@ def send_gps_data(Main_Queue : Queue):
                 gps_sats_int = 0
             
             # 고급 데이터 포함 텔레메트리 전송
-            if hasattr(gps, 'GPS_ADVANCED_DATA') and GPS_ADVANCED_DATA:
-                # 고급 데이터 로깅
-                hdop = GPS_ADVANCED_DATA.get('hdop', 0.0)
-                vdop = GPS_ADVANCED_DATA.get('vdop', 0.0)
-                ground_speed = GPS_ADVANCED_DATA.get('ground_speed', 0.0)
-                course = GPS_ADVANCED_DATA.get('course', 0.0)
-                quality = GPS_ADVANCED_DATA.get('gps_quality', 0)
-                fix_type = GPS_ADVANCED_DATA.get('fix_type', 0)
-                safe_log(f"GPS Advanced Data - HDOP: {hdop:.2f}, VDOP: {vdop:.2f}, GroundSpeed: {ground_speed:.2f}m/s, Course: {course:.1f}°, Quality: {quality}, FixType: {fix_type}", "debug".upper(), False)
+            # 고급 데이터 로깅 (DEBUG 가 꺼져 있으면 값 조회 / 포맷팅 없음)
+            if hasattr(gps, 'GPS_ADVANCED_DATA') and GPS_ADVANCED_DATA and log_enabled("DEBUG", __name__):
+                safe_log("GPS Advanced Data - HDOP: %.2f, VDOP: %.2f, GroundSpeed: %.2fm/s, Course: %.1f°, Quality: %s, FixType: %s",
+                         "DEBUG", False, args=(GPS_ADVANCED_DATA.get('hdop', 0.0), GPS_ADVANCED_DATA.get('vdop', 0.0),
+                                               GPS_ADVANCED_DATA.get('ground_speed', 0.0), GPS_ADVANCED_DATA.get('course', 0.0),
+                                               GPS_ADVANCED_DATA.get('gps_quality', 0), GPS_ADVANCED_DATA.get('fix_type', 0)))
             
             # 기본 데이터만 텔레메트리 전송
             gps_tlm_data = f"{GPS_LAT:.6f},{GPS_LON:.6f},{GPS_ALT:.2f},{gps_time_str},{gps_sats_int}"
             
-            status = msgstructure.send_msg(Main_Queue, 
+            status = msgstructure.publish_msg(Main_Queue, 
                                         GpsDataToTlmMsg,
                                         appargs.GpsAppArg.AppID,
-                                        appargs.CommAppArg.AppID,
                                         appargs.GpsAppArg.MID_SendGpsTlmData,
                                         gps_tlm_data)
             if status == False:
@@ -117,10 +116,9 @@ def send_gps_data(Main_Queue : Queue):
             
             # Send GPS data to FlightLogic (5Hz)
             if send_counter % 5 == 0:  # 5초마다 한 번씩
-                status = msgstructure.send_msg(Main_Queue, 
+                status = msgstructure.publish_msg(Main_Queue, 
                                             GpsDataToFlightLogicMsg,
                                             appargs.GpsAppArg.AppID,
-                                            appargs.FlightlogicAppArg.AppID,
                                             appargs.GpsAppArg.MID_SendGpsFlightLogicData,
                                             gps_tlm_data)
                 if status == False:
@@ -279,36 +277,30 @@ def gpsapp_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.GpsAppArg.AppID, Main_Queue)
+
     try:
         while GPSAPP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-            # Non-blocking receive with timeout
-            if Main_Pipe.poll(1.0):  # 1초 타임아웃
-                try:
-                    message = Main_Pipe.recv()
-                except (EOFError, BrokenPipeError, ConnectionResetError) as e:
-                    safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
-                    # 연결이 끊어져도 로깅은 계속
-                    time.sleep(1)
-                    continue
-                except Exception as e:
-                    safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
-                    # 에러 시 루프 계속
-                    time.sleep(0.5)
-                    continue
-            else:
+            try:
+                recv_msg = receiver.receive(1.0)  # 1초 타임아웃
+            except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+                safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
+                # 연결이 끊어져도 로깅은 계속
+                time.sleep(1)
+                continue
+            except Exception as e:
+                safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
+                # 에러 시 루프 계속
+                time.sleep(0.5)
+                continue
+            if recv_msg is None:
                 # 타임아웃 시 루프 계속
                 continue
-                
-            recv_msg = message
-            
-            # Validate Message, Skip this message if target AppID different from gpsapp's AppID
-            # Exception when the message is from main app
-            if recv_msg.receiver_app == appargs.GpsAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                # Handle Command According to Message ID
-                command_handler(recv_msg)
-            else:
-                safe_log("Receiver MID does not match with gpsapp MID", "error".upper(), True)
+
+            # Handle Command According to Message ID
+            command_handler(recv_msg)
 
     # If error occurs, terminate app gracefully
     except (KeyboardInterrupt, SystemExit):
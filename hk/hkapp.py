@@ -3,14 +3,19 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib import busqueue
+from lib import tracing
+from lib.base_app import MsgReceiver
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[HK] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[HK] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "HK", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[HK] 로깅 실패: {e}")
@@ -37,6 +42,13 @@ HKAPP_RUNSTATUS = True
 
 hk_dict = {}
 
+# 버스 drop 카운터 (보고 AppID → {MID → 누적 개수, 'total' → 합계})
+# 라우터(Main) 는 목적지 outbox drop, 각 앱은 송신 batch drop 을 보고
+bus_drop_stats = {}
+
+# 버스 지연 요약 (보고 앱 AppID → {MID: (count, p50, p99, max)} µs, 최근 보고 구간)
+bus_latency_stats = {}
+
 # Handles received message
 def command_handler (recv_msg : msgstructure.MsgStructure):
     global HKAPP_RUNSTATUS
@@ -47,6 +59,14 @@ def command_handler (recv_msg : msgstructure.MsgStructure):
         safe_log(f"HKAPP TERMINATION DETECTED", "info".upper(), True)
         HKAPP_RUNSTATUS = False
 
+    # 라우터 outbox / 앱 송신 batch drop 카운터 수신
+    elif recv_msg.MsgID in (appargs.MainAppArg.MID_SendBusStats, appargs.HkAppArg.MID_ReceiveDropStats):
+        update_bus_drop_stats(recv_msg.sender_app, recv_msg.data)
+
+    # 라우터/소비 앱 지연 요약 수신 (BUS.TRACE)
+    elif recv_msg.MsgID == appargs.HkAppArg.MID_ReceiveLatencyStats:
+        update_bus_latency_stats(recv_msg.sender_app, recv_msg.data)
+
     else:
         if recv_msg.sender_app not in hk_dict:
             hk_dict[recv_msg.sender_app] = 0
@@ -54,6 +74,35 @@ def command_handler (recv_msg : msgstructure.MsgStructure):
             hk_dict[recv_msg.sender_app] += 1
     return
 
+def update_bus_drop_stats(reporter: int, data: str):
+    """보고 앱별 drop 카운터 갱신. 새로 버려진 메시지가 있으면 MID 별로 경고"""
+    new_stats = busqueue.parse_drop_summary(data)
+    old_stats = bus_drop_stats.get(reporter, {})
+    increased = {mid: count - old_stats.get(mid, 0) for mid, count in new_stats.items()
+                 if mid != "total" and count > old_stats.get(mid, 0)}
+    bus_drop_stats[reporter] = new_stats
+
+    if increased:
+        stage = "router outbox" if reporter == appargs.MainAppArg.AppID else f"app {reporter} send batch"
+        detail = ", ".join(f"MID {mid}: +{count}" for mid, count in sorted(increased.items()))
+        safe_log(f"Bus dropped stale/overflow messages [{stage}] (total={new_stats.get('total', 0)}) - {detail}", "warning".upper(), True)
+    return
+
+def update_bus_latency_stats(reporter: int, data: str):
+    """지연 요약 갱신 및 로깅. 라우터 보고는 송신 → 라우터, 앱 보고는 송신 → 해당 앱 수신 구간"""
+    summary = tracing.parse_latency_summary(data)
+    if not summary:
+        return
+    bus_latency_stats[reporter] = summary
+
+    if not log_enabled("INFO", __name__):
+        return
+    stage = "send->router" if reporter == appargs.MainAppArg.AppID else f"send->app {reporter}"
+    detail = ", ".join(f"MID {mid}: n={count} p50={p50}us p99={p99}us max={peak}us"
+                       for mid, (count, p50, p99, peak) in sorted(summary.items()))
+    safe_log("Bus latency [%s] %s", "INFO", True, args=(stage, detail))
+    return
+
 ######################################################
 ## INITIALIZATION, TERMINATION                      ##
 ######################################################
@@ -153,57 +202,33 @@ def hkapp_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (언패킹/수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.HkAppArg.AppID, Main_Queue)
+
     try:
         while HKAPP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-                # Non-blocking receive with timeout
-                if Main_Pipe.poll(0.1):  # 0.1초 타임아웃으로 더 빠른 반응
-                    try:
-                        message = Main_Pipe.recv()
-                        
-                        # 메시지 언패킹
-                        try:
-                            if isinstance(message, bytes):
-                                # 바이트 메시지를 문자열로 디코드
-                                message_str = message.decode('utf-8')
-                            elif isinstance(message, str):
-                                message_str = message
-                            else:
-                                safe_log(f"Unknown message type: {type(message)}", "warning".upper(), True)
-                                continue
-                            
-                            # 메시지 언패킹
-                            recv_msg = msgstructure.MsgStructure()
-                            if not msgstructure.unpack_msg(recv_msg, message_str):
-                                safe_log("Failed to unpack message", "warning".upper(), True)
-                                continue
-                                
-                            # Validate Message, Skip this message if target AppID different from hkapp's AppID
-                            # Exception when the message is from main app
-                            if recv_msg.receiver_app == appargs.HkAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                                # Handle Command According to Message ID
-                                command_handler(recv_msg)
-                            else:
-                                safe_log("Receiver MID does not match with hkapp MID", "error".upper(), True)
-                                
-                        except Exception as e:
-                            safe_log(f"Message unpacking error: {e}", "warning".upper(), True)
-                            continue
-                            
-                    except (EOFError, BrokenPipeError, ConnectionResetError) as e:
-                        safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
-                        # 연결이 끊어져도 로깅은 계속
-                        time.sleep(0.1)
-                        continue
-                    except Exception as e:
-                        safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
-                        # 에러 시 루프 계속
-                        time.sleep(0.1)
-                        continue
-                else:
-                    # 타임아웃 시 루프 계속 (더 짧은 간격)
-                    time.sleep(0.01)
-                    continue
+            try:
+                recv_msg = receiver.receive(0.1)  # 0.1초 타임아웃으로 더 빠른 반응
+            except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+                safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
+                # 연결이 끊어져도 로깅은 계속
+                time.sleep(0.1)
+                continue
+            except Exception as e:
+                safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
+                # 에러 시 루프 계속
+                time.sleep(0.1)
+                continue
+            if recv_msg is None:
+                # 타임아웃 시 루프 계속
+                continue
+
+            # Handle Command According to Message ID
+            try:
+                command_handler(recv_msg)
+            except Exception as e:
+                safe_log(f"Message handling error: {e}", "warning".upper(), True)
 
     # If error occurs, terminate app gracefully
     except (KeyboardInterrupt, SystemExit):
@@ -3,6 +3,9 @@ import math
 from datetime import datetime
 import os
 
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
+
 # Variables for moving window filter
 angle_window = [[],[],[]] # (ROLL, PITCH, YAW)
 window_size = 5
@@ -12,7 +15,7 @@ if not os.path.exists(log_dir):
     os.makedirs(log_dir)
 
 ## Create sensor log file
-imulogfile = open(os.path.join(log_dir, 'imu.txt'), 'a')
+imulogfile = GroupCommitFile(open_log_file(os.path.join(log_dir, 'imu.txt')), "IMU_DRIVER", "SENSOR_DRIVER")
 
 # 통합 오프셋 관리 시스템 사용
 try:
@@ -30,7 +33,6 @@ def log_imu(text):
     t = datetime.now().isoformat(sep=' ', timespec='milliseconds')
     string_to_write = f'{t},{text}\n'
     imulogfile.write(string_to_write)
-    imulogfile.flush()
 
 def init_imu():
     """IMU 센서 초기화 (직접 I2C 연결)"""
@@ -3,14 +3,17 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib.base_app import MsgReceiver
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[{appargs.ImuAppArg.AppName}] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[IMU] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "IMU", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[IMU] 로깅 실패: {e}")
@@ -22,7 +25,6 @@ import signal
 from multiprocessing import Queue, connection
 import threading
 import time
-import csv
 import os
 from datetime import datetime
 
@@ -62,6 +64,15 @@ HIGH_FREQ_LOG_PATH = os.path.join(LOG_DIR, "high_freq_imu_log.csv")
 HK_LOG_PATH = os.path.join(LOG_DIR, "hk_log.csv")
 ERROR_LOG_PATH = os.path.join(LOG_DIR, "error_log.csv")
 
+# 고주파 IMU 데이터 바이너리 레코드 (lib/logging/flight_recorder.py)
+# 변환 : python3 -m lib.logging.flight_recorder logs/imu/high_freq_imu*.frec --csv
+HIGH_FREQ_RECORD_PATH = os.path.join(LOG_DIR, "high_freq_imu.frec")
+HIGH_FREQ_FIELDS = ["data_type", "temp", "roll", "pitch", "yaw",
+                    "accx", "accy", "accz", "magx", "magy", "magz",
+                    "gyrx", "gyry", "gyrz", "sensor_healthy", "error_count"]
+HIGH_FREQ_FORMAT = "B13f?H"
+HIGH_FREQ_DATA_TYPES = {"SENSOR": 0, "ERROR": 1, "DUMMY": 2}
+
 # 강제 종료 시에도 로그를 저장하기 위한 플래그
 _emergency_logging_enabled = True
 
@@ -92,23 +103,27 @@ def emergency_log_to_file(log_type: str, message: str):
         print(f"Emergency logging failed: {e}")
 
 def log_csv(filepath: str, headers: list, data: list):
-    """CSV 파일에 데이터를 로깅하는 함수"""
+    """CSV 파일에 데이터를 로깅하는 함수 (파일 핸들 유지, 버퍼 후 주기 flush)"""
     try:
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-        
-        # 데이터 추가
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(data)
-            
+        logging.get_csv_writer(filepath, headers).write_row(data)
     except Exception as e:
         safe_log(f"CSV 로깅 실패: {e}", "ERROR", True)
         emergency_log_to_file("ERROR", f"CSV logging failed: {e}")
 
+def log_high_freq(data_type: str, error_count: int):
+    """현재 IMU 값을 고주파 바이너리 레코드로 기록 (data_type : SENSOR=0, ERROR=1, DUMMY=2)"""
+    try:
+        recorder = logging.get_flight_recorder(HIGH_FREQ_RECORD_PATH, "imu", HIGH_FREQ_FIELDS, HIGH_FREQ_FORMAT)
+        recorder.record(HIGH_FREQ_DATA_TYPES[data_type], IMU_TEMP,
+                        IMU_ROLL, IMU_PITCH, IMU_YAW,
+                        IMU_ACCX, IMU_ACCY, IMU_ACCZ,
+                        IMU_MAGX, IMU_MAGY, IMU_MAGZ,
+                        IMU_GYRX, IMU_GYRY, IMU_GYRZ,
+                        _sensor_healthy, min(error_count, 0xFFFF))
+    except Exception as e:
+        safe_log(f"고주파 레코드 기록 실패: {e}", "ERROR", True)
+        emergency_log_to_file("ERROR", f"High frequency recording failed: {e}")
+
 def command_handler (recv_msg : msgstructure.MsgStructure):
     """명령 처리 함수"""
     global IMUAPP_RUNSTATUS
@@ -208,6 +223,10 @@ def imuapp_terminate(i2c_instance):
             except Exception as e:
                 safe_log(f"I2C 종료 오류: {e}", "WARNING", True)
         
+        # 버퍼에 남은 CSV 행 / 바이너리 레코드 기록
+        logging.close_csv_writers()
+        logging.close_flight_recorders()
+        
         safe_log("IMU 앱 종료 완료", "INFO", True)
         
     except Exception as e:
@@ -250,22 +269,7 @@ def read_imu_data(sensor):
                 }
                 
                 # 더미 데이터 로깅
-                high_freq_data = [
-                    datetime.now().isoformat(sep=' ', timespec='milliseconds'),
-                    "DUMMY",
-                    IMU_TEMP,
-                    IMU_ROLL, IMU_PITCH, IMU_YAW,
-                    IMU_ACCX, IMU_ACCY, IMU_ACCZ,
-                    IMU_MAGX, IMU_MAGY, IMU_MAGZ,
-                    IMU_GYRX, IMU_GYRY, IMU_GYRZ,
-                    _sensor_healthy,
-                    consecutive_errors
-                ]
-                
-                high_freq_headers = ["timestamp", "data_type", "temp", "roll", "pitch", "yaw", 
-                                   "accx", "accy", "accz", "magx", "magy", "magz", 
-                                   "gyrx", "gyry", "gyrz", "sensor_healthy", "error_count"]
-                log_csv(HIGH_FREQ_LOG_PATH, high_freq_headers, high_freq_data)
+                log_high_freq("DUMMY", consecutive_errors)
                 
                 time.sleep(0.1)  # 10 Hz
                 continue
@@ -321,22 +325,7 @@ def read_imu_data(sensor):
                         _sensor_error_count = 0
                         
                         # 성공적인 데이터 로깅
-                        high_freq_data = [
-                            datetime.now().isoformat(sep=' ', timespec='milliseconds'),
-                            "SENSOR",
-                            IMU_TEMP,
-                            IMU_ROLL, IMU_PITCH, IMU_YAW,
-                            IMU_ACCX, IMU_ACCY, IMU_ACCZ,
-                            IMU_MAGX, IMU_MAGY, IMU_MAGZ,
-                            IMU_GYRX, IMU_GYRY, IMU_GYRZ,
-                            _sensor_healthy,
-                            consecutive_errors
-                        ]
-                        
-                        high_freq_headers = ["timestamp", "data_type", "temp", "roll", "pitch", "yaw", 
-                                           "accx", "accy", "accz", "magx", "magy", "magz", 
-                                           "gyrx", "gyry", "gyrz", "sensor_healthy", "error_count"]
-                        log_csv(HIGH_FREQ_LOG_PATH, high_freq_headers, high_freq_data)
+                        log_high_freq("SENSOR", consecutive_errors)
                         
                     else:
                         # 데이터가 None인 경우 이전 값 유지하고 오류 카운트 증가
@@ -349,22 +338,7 @@ def read_imu_data(sensor):
                             safe_log(f"IMU 센서 데이터 연속 {consecutive_errors}회 실패 - 센서 비정상 상태", "WARNING", True)
                         
                         # 오류 상태 로깅
-                        high_freq_data = [
-                            datetime.now().isoformat(sep=' ', timespec='milliseconds'),
-                            "ERROR",
-                            IMU_TEMP,
-                            IMU_ROLL, IMU_PITCH, IMU_YAW,
-                            IMU_ACCX, IMU_ACCY, IMU_ACCZ,
-                            IMU_MAGX, IMU_MAGY, IMU_MAGZ,
-                            IMU_GYRX, IMU_GYRY, IMU_GYRZ,
-                            _sensor_healthy,
-                            consecutive_errors
-                        ]
-                        
-                        high_freq_headers = ["timestamp", "data_type", "temp", "roll", "pitch", "yaw", 
-                                           "accx", "accy", "accz", "magx", "magy", "magz", 
-                                           "gyrx", "gyry", "gyrz", "sensor_healthy", "error_count"]
-                        log_csv(HIGH_FREQ_LOG_PATH, high_freq_headers, high_freq_data)
+                        log_high_freq("ERROR", consecutive_errors)
                         
                 else:
                     # 기본 데이터 읽기 (fallback)
@@ -446,22 +420,7 @@ def read_imu_data(sensor):
                     safe_log(f"IMU 센서 연속 {consecutive_errors}회 오류 - 센서 비정상 상태", "WARNING", True)
                 
                 # 오류 상태 로깅
-                high_freq_data = [
-                    datetime.now().isoformat(sep=' ', timespec='milliseconds'),
-                    "ERROR",
-                    IMU_TEMP,
-                    IMU_ROLL, IMU_PITCH, IMU_YAW,
-                    IMU_ACCX, IMU_ACCY, IMU_ACCZ,
-                    IMU_MAGX, IMU_MAGY, IMU_MAGZ,
-                    IMU_GYRX, IMU_GYRY, IMU_GYRZ,
-                    _sensor_healthy,
-                    consecutive_errors
-                ]
-                
-                high_freq_headers = ["timestamp", "data_type", "temp", "roll", "pitch", "yaw", 
-                                   "accx", "accy", "accz", "magx", "magy", "magz", 
-                                   "gyrx", "gyry", "gyrz", "sensor_healthy", "error_count"]
-                log_csv(HIGH_FREQ_LOG_PATH, high_freq_headers, high_freq_data)
+                log_high_freq("ERROR", consecutive_errors)
             
         except Exception as e:
             safe_log(f"IMU 데이터 읽기 스레드 오류: {e}", "ERROR", True)
@@ -474,20 +433,26 @@ def send_imu_data(Main_Queue : Queue):
     """IMU 데이터 전송 스레드"""
     global IMUAPP_RUNSTATUS
     
+    tick = 0
     while IMUAPP_RUNSTATUS:
         try:
-            # IMU 데이터 메시지 생성
+            # FlightLogic : roll, pitch, yaw (10 Hz)
             imu_msg = msgstructure.MsgStructure()
-            
-            # 데이터 문자열 생성
-            imu_data_str = f"{IMU_TEMP:.2f},{IMU_ROLL:.2f},{IMU_PITCH:.2f},{IMU_YAW:.2f},{IMU_ACCX:.2f},{IMU_ACCY:.2f},{IMU_ACCZ:.2f},{IMU_MAGX:.2f},{IMU_MAGY:.2f},{IMU_MAGZ:.2f},{IMU_GYRX:.2f},{IMU_GYRY:.2f},{IMU_GYRZ:.2f}"
-            
-            msgstructure.fill_msg(imu_msg, appargs.ImuAppArg.AppID, appargs.FlightlogicAppArg.AppID, appargs.ImuAppArg.MID_ImuData, imu_data_str)
-            
-            # 메시지 패킹 및 전송
-            packed_msg = msgstructure.pack_msg(imu_msg)
-            Main_Queue.put(packed_msg)
-            
+            msgstructure.publish_msg(Main_Queue, imu_msg, appargs.ImuAppArg.AppID,
+                                     appargs.ImuAppArg.MID_SendImuFlightLogicData, (IMU_ROLL, IMU_PITCH, IMU_YAW))
+
+            # Comm 텔레메트리 (1 Hz) : euler, accel, mag, gyro, temp 순서
+            if tick % 10 == 0:
+                tlm_msg = msgstructure.MsgStructure()
+                msgstructure.publish_msg(Main_Queue, tlm_msg, appargs.ImuAppArg.AppID,
+                                         appargs.ImuAppArg.MID_SendImuTlmData,
+                                         (IMU_ROLL, IMU_PITCH, IMU_YAW,
+                                          IMU_ACCX, IMU_ACCY, IMU_ACCZ,
+                                          IMU_MAGX, IMU_MAGY, IMU_MAGZ,
+                                          IMU_GYRX, IMU_GYRY, IMU_GYRZ,
+                                          IMU_TEMP))
+            tick += 1
+
             time.sleep(0.1)  # 10 Hz
             
         except Exception as e:
@@ -520,37 +485,31 @@ def imuapp_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         t.daemon = True  # 메인 프로세스 종료 시 함께 종료
         t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.ImuAppArg.AppID, Main_Queue)
+
     try:
         while IMUAPP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-            # Non-blocking receive with timeout
             try:
-                if Main_Pipe.poll(0.5):  # 0.5초 타임아웃으로 단축
-                    try:
-                        message = Main_Pipe.recv()
-                    except (EOFError, BrokenPipeError, ConnectionResetError) as e:
-                        safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
-                        # 연결이 끊어져도 로깅은 계속
-                        time.sleep(1)
-                        continue
-                    except Exception as e:
-                        safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
-                        # 에러 시 루프 계속
-                        time.sleep(0.5)
-                        continue
-                else:
+                try:
+                    recv_msg = receiver.receive(0.5)  # 0.5초 타임아웃으로 단축
+                except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+                    safe_log(f"Pipe connection lost: {e}", "warning".upper(), True)
+                    # 연결이 끊어져도 로깅은 계속
+                    time.sleep(1)
+                    continue
+                except Exception as e:
+                    safe_log(f"Pipe receive error: {e}", "warning".upper(), False)
+                    # 에러 시 루프 계속
+                    time.sleep(0.5)
+                    continue
+                if recv_msg is None:
                     # 타임아웃 시 루프 계속
                     continue
-                    
-                recv_msg = message
-                
-                # Validate Message, Skip this message if target AppID different from imuapp's AppID
-                # Exception when the message is from main app
-                if recv_msg.receiver_app == appargs.ImuAppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                    # Handle Command According to Message ID
-                    command_handler(recv_msg)
-                else:
-                    safe_log("Receiver MID does not match with imuapp MID", "error".upper(), True)
+
+                # Handle Command According to Message ID
+                command_handler(recv_msg)
                     
             except Exception as e:
                 safe_log(f"Main loop error: {e}", "error".upper(), True)
@@ -7,9 +7,16 @@ CANSAT HEPHAESTUS 2025 FSW2 - 라이브러리 패키지
 # 핵심 기능들
 from .core import *
 from .core import appargs, msgstructure, types, config, prevstate, utils
+from .core import shmring, blackboard, busqueue, hotroute, pipebus, timerwheel, tracing, batchqueue, busrecord
 
 # 로깅 시스템
 from .logging import safe_log, get_unified_logger, LogLevel, LogCategory, LogRotator
+from .logging import set_log_level, log_enabled
+from .logging import CsvLogWriter, get_csv_writer, close_csv_writers
+from .logging import FlightRecorder, get_flight_recorder, close_flight_recorders
+from .logging import get_commit_policy, GroupCommitFile
+from .logging import mirror_log_file, mirror_stats
+from .logging import MmapLogSegment, open_log_file, start_log_server, stop_log_server
 
 # 최적화 기능들
 from .optimization import (
@@ -27,7 +34,7 @@ from .hardware import (
 )
 
 # 기본 앱 클래스
-from .base_app import BaseApp, SensorApp, CommunicationApp, create_app_instance, run_app
+from .base_app import BaseApp, SensorApp, CommunicationApp, MsgReceiver, MsgDispatcher, create_app_instance, run_app
 
 # 기타 유틸리티들
 from .type_hints import *
@@ -37,6 +44,7 @@ from .resource_manager import start_resource_monitoring, stop_resource_monitorin
 __all__ = [
     # 핵심 기능들 (core에서)
     'appargs', 'msgstructure', 'types', 'config', 'prevstate', 'utils',
+    'shmring', 'blackboard', 'busqueue', 'hotroute', 'pipebus', 'timerwheel', 'tracing', 'batchqueue', 'busrecord',
     'MainAppArg', 'HkAppArg', 'BarometerAppArg', 'GpsAppArg', 'ImuAppArg',
     'FlightlogicAppArg', 'CommAppArg', 'MotorAppArg', 'FirApp1Arg',
     'ThermisAppArg', 'Tmp007AppArg', 'ThermalcameraAppArg', 'ThermoAppArg',
@@ -46,6 +54,12 @@ __all__ = [
     
     # 로깅 시스템
     'safe_log', 'get_unified_logger', 'LogLevel', 'LogCategory',
+    'set_log_level', 'log_enabled',
+    'CsvLogWriter', 'get_csv_writer', 'close_csv_writers',
+    'FlightRecorder', 'get_flight_recorder', 'close_flight_recorders',
+    'get_commit_policy', 'GroupCommitFile',
+    'mirror_log_file', 'mirror_stats',
+    'MmapLogSegment', 'open_log_file', 'start_log_server', 'stop_log_server',
     
     # 최적화 기능들
     'start_memory_optimization', 'stop_memory_optimization',
@@ -59,7 +73,7 @@ __all__ = [
     'setup_exception_handler', 'handle_exception',
     
     # 기본 앱 클래스
-    'BaseApp', 'SensorApp', 'CommunicationApp', 'create_app_instance', 'run_app',
+    'BaseApp', 'SensorApp', 'CommunicationApp', 'MsgReceiver', 'MsgDispatcher', 'create_app_instance', 'run_app',
     
     # 기타 유틸리티들
     'start_resource_monitoring', 'stop_resource_monitoring',
@@ -7,14 +7,159 @@ CANSAT HEPHAESTUS 2025 FSW2 - 기본 앱 클래스
 import signal
 import threading
 import time
-from multiprocessing import Queue, connection
+from collections import deque
+from multiprocessing import BufferTooShort, Queue, connection
 from typing import Optional, Dict, Any, Callable
 from abc import ABC, abstractmethod
 
-from .core import appargs, msgstructure, types, prevstate
+from .core import appargs, msgstructure, types, prevstate, tracing
 from .logging import safe_log
 
 
+RECV_BUFFER_SIZE = 4096  # 수신 프레임 버퍼 초기 크기 (더 큰 프레임을 받으면 늘어남)
+COALESCE_BATCH = 64      # 밀린 메시지를 합칠 때 파이프에서 한 번에 꺼내는 최대 프레임 수
+_STATE_MIDS = frozenset(appargs.STATE_MIDS)
+
+
+class MsgReceiver:
+    """
+    앱 파이프 공통 수신 helper
+    라우터가 send_bytes 로 보낸 프레임을 재사용 버퍼로 받아 재사용 MsgStructure 1개에 디코딩 (pickle 없음)
+    반환된 메시지는 다음 receive() 호출 전까지만 유효
+    BUS.TRACE 가 켜져 있고 main_queue 가 주어지면 MID 별 송신 → 수신 지연을 집계해 HK 로 주기 보고
+    
+    파이프에 메시지가 밀려 있으면 (지연 후 깨어난 경우 등) 상태 MID (appargs.STATE_MIDS) 는
+    같은 (sender, MID) 의 최신 1개만 전달 → command_handler / 로깅 부하 없이 바로 최신 상태로 복귀
+    """
+    
+    def __init__(self, main_pipe: connection.Connection, app_id: types.AppID, main_queue: Queue = None):
+        self.pipe = main_pipe
+        self.app_id = app_id
+        self.main_queue = main_queue
+        self.msg = msgstructure.MsgStructure()
+        self._buf = bytearray(RECV_BUFFER_SIZE)
+        # 자기 앱 지정, 메인 앱 지정, 구독 발행 메시지만 수락
+        self._accept = frozenset((app_id, appargs.MainAppArg.AppID, appargs.PUBLISH_APPID))
+        self._pending = deque()     # 합친 뒤 전달 대기 중인 프레임
+        self.coalesced = 0          # 최신값으로 대체되어 건너뛴 상태 메시지 수
+        self.tracer = tracing.LatencyTracer() if msgstructure.BUS_TRACE and main_queue is not None else None
+    
+    def _read_frame(self):
+        try:
+            length = self.pipe.recv_bytes_into(self._buf)
+            return memoryview(self._buf)[:length]
+        except BufferTooShort as e:
+            # 버퍼보다 큰 프레임 : 이번 프레임은 그대로 사용하고 다음부터는 큰 버퍼 사용
+            self._buf = bytearray(len(e.args[0]))
+            return e.args[0]
+    
+    @staticmethod
+    def _expand(frames: list, frame):
+        # 라우터가 묶어 보낸 batch 프레임은 개별 프레임으로 풀기
+        if msgstructure.is_batch(frame):
+            frames.extend(msgstructure.iter_batch(frame))
+        else:
+            frames.append(bytes(frame))
+    
+    def _fill_pending(self):
+        frame = self._read_frame()
+        if not msgstructure.is_batch(frame) and not self.pipe.poll(0):
+            # 일반적인 경우 : 단일 프레임, 밀린 메시지 없음 → 버퍼를 그대로 사용 (복사 없음)
+            self._pending.append(frame)
+            return
+        
+        # batch 또는 밀린 메시지 : 상태 MID 는 (sender, MID) 별로 가장 최신 프레임만 남김 (도착 순서 유지)
+        frames = []
+        self._expand(frames, frame)
+        while len(frames) < COALESCE_BATCH and self.pipe.poll(0):
+            self._expand(frames, self.pipe.recv_bytes())
+        
+        latest = {}
+        for index, pending in enumerate(frames):
+            header = msgstructure.peek_header(pending)
+            if header is None or header[2] not in _STATE_MIDS:
+                continue
+            key = (header[0], header[2])
+            if key in latest:
+                frames[latest[key]] = None
+                self.coalesced += 1
+            latest[key] = index
+        self._pending.extend(pending for pending in frames if pending is not None)
+    
+    def _report_latency(self):
+        stats_msg = msgstructure.MsgStructure()
+        msgstructure.send_msg(self.main_queue, stats_msg, self.app_id, appargs.HkAppArg.AppID,
+                              appargs.HkAppArg.MID_ReceiveLatencyStats, self.tracer.pop_summary())
+    
+    def receive(self, timeout: float) -> Optional[msgstructure.MsgStructure]:
+        """
+        timeout 초 동안 메시지 1개 대기
+        타임아웃, 디코딩 실패, 수신 앱 불일치 시 None. 파이프 오류(EOFError/OSError)는 호출자에게 전달
+        """
+        if self.tracer is not None and self.tracer.report_due():
+            self._report_latency()
+        
+        if not self._pending:
+            if not self.pipe.poll(timeout):
+                return None
+            self._fill_pending()
+        frame = self._pending.popleft()
+        
+        if not msgstructure.unpack_msg(self.msg, frame):
+            safe_log(f"[{self.app_id}] Failed to unpack message", "WARNING", True)
+            return None
+        
+        if self.msg.receiver_app not in self._accept:
+            safe_log(f"[{self.app_id}] Receiver AppID mismatch: {self.msg.receiver_app}", "ERROR", True)
+            return None
+        
+        if self.tracer is not None:
+            self.tracer.record_received(self.msg.MsgID, frame)
+        return self.msg
+
+
+class MsgDispatcher:
+    """
+    MID → handler 등록 테이블 (command_handler 의 if/elif 체인 대체)
+    등록 시 MID 의 payload 디코더를 미리 만들어 두고, dispatch 는 dict 조회 1번으로 handler 호출
+    → 센서/MID 가 늘어나도 메시지당 처리 비용은 그대로
+    
+    handler(recv_msg, payload, *args)
+    - payload : 스키마가 있는 MID 는 값 tuple, 없는 MID 는 텍스트 그대로 (recv_msg.data)
+    - 스키마 MID 의 payload 디코딩에 실패하면 handler 를 호출하지 않음
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._table: Dict[types.MID, tuple] = {}    # MID → (handler, decoder)
+    
+    def register(self, mid: types.MID, handler: Callable = None):
+        """MID handler 등록. handler 를 생략하면 decorator 로 사용"""
+        if handler is None:
+            return lambda func: self.register(mid, func)
+        if mid in self._table:
+            raise ValueError(f"[{self.name}] MID {mid} already registered")
+        self._table[mid] = (handler, msgstructure.compile_decoder(mid))
+        return handler
+    
+    def handles(self, mid: types.MID) -> bool:
+        return mid in self._table
+    
+    def dispatch(self, recv_msg: msgstructure.MsgStructure, *args) -> bool:
+        """등록된 handler 호출. 등록되지 않은 MID 면 False"""
+        entry = self._table.get(recv_msg.MsgID)
+        if entry is None:
+            return False
+        handler, decoder = entry
+        if decoder is None:
+            handler(recv_msg, recv_msg.data, *args)
+            return True
+        payload = decoder(recv_msg)
+        if payload is not None:
+            handler(recv_msg, payload, *args)
+        return True
+
+
 class BaseApp(ABC):
     """모든 앱의 기본 클래스"""
     
@@ -36,8 +181,8 @@ class BaseApp(ABC):
         try:
             # 통합 로깅 시스템 사용
             from lib.logging import safe_log as unified_safe_log
-            self.safe_log = lambda msg, level="INFO", printlogs=True: unified_safe_log(
-                msg, level, printlogs, self.app_name
+            self.safe_log = lambda msg, level="INFO", printlogs=True, args=(): unified_safe_log(
+                msg, level, printlogs, self.app_name, args
             )
         except ImportError:
             # 폴백: 기본 로깅 시스템 사용
@@ -1,12 +1,16 @@
 # define arguments of each app (identifier, message ID, ...)
 from . import types
 
+# 발행(publish) 수신자 ID : receiver 가 0 이면 라우터가 MID 구독 테이블(SUBSCRIPTIONS)로 fan-out
+PUBLISH_APPID: types.AppID = 0
+
 # ────────────────────────── 시스템 공통 ──────────────────────────
 class MainAppArg:
     AppID: types.AppID = 1
     AppName = "Main"
     MID_TerminateProcess: types.MID = 100
     MID_SendHK:           types.MID = 101
+    MID_SendBusStats:     types.MID = 102  # 라우터 MID 별 drop 카운터 → HK
 
 class HkAppArg:
     AppID: types.AppID = 2
@@ -14,6 +18,8 @@ class HkAppArg:
     MID_Housekeeping:    types.MID = 200
     MID_ReceiveHK:       types.MID = 201
     MID_SendCombinedHK:  types.MID = 202
+    MID_ReceiveLatencyStats: types.MID = 203  # 라우터/소비 앱의 MID 별 지연 요약 (BUS.TRACE)
+    MID_ReceiveDropStats:    types.MID = 204  # 앱 송신 batch 의 MID 별 drop 카운터 (lib/core/batchqueue.py)
 
 class TelemetryAppArg:
     AppID: types.AppID = 3
@@ -29,6 +35,12 @@ class BarometerAppArg:
     MID_SendBarometerFlightLogicData: types.MID = 1003
     MID_ResetBarometerMaxAlt:       types.MID = 1004
 
+    # 바이너리 페이로드 스키마 (struct 포맷, MID 별)
+    SCHEMAS = {
+        MID_SendBarometerTlmData:         "ddd",  # pressure, temperature, altitude
+        MID_SendBarometerFlightLogicData: "d",    # altitude
+    }
+
 class GpsAppArg:
     AppID: types.AppID = 12
     AppName = "GPS"
@@ -44,6 +56,12 @@ class ImuAppArg:
     MID_SendYawData:   types.MID = 1303
     MID_SendImuFlightLogicData: types.MID = 1304
 
+    SCHEMAS = {
+        MID_SendImuTlmData:         "13d",  # euler(3), accel(3), mag(3), gyro(3), temp
+        MID_SendYawData:            "d",    # yaw
+        MID_SendImuFlightLogicData: "ddd",  # roll, pitch, yaw
+    }
+
 
 class FlightlogicAppArg:
     AppID: types.AppID = 14
@@ -61,6 +79,11 @@ class FlightlogicAppArg:
     # <NEW/> Motor 각도 지시 (Flightlogic → MotorApp)
     MID_SetServoAngle: types.MID = 1402
 
+    SCHEMAS = {
+        MID_SetServoAngle:  "i",  # servo pulse (µs)
+        MID_SendMotorStatus: "B",  # 0=열림, 1=닫힘
+    }
+
 class CommAppArg:
     AppID: types.AppID = 16
     AppName = "Communication"
@@ -89,6 +112,10 @@ class FirApp1Arg:
     MID_SendFIR1Data:      types.MID = 2002  # 1 Hz 텔레메트리 (amb,obj)
     MID_Fir1Calibration:   types.MID = 2004  # CAL 처리용(옵션)
 
+    SCHEMAS = {
+        MID_SendFIR1Data: "dd",  # ambient, object
+    }
+
 # ────────── THERMIS (ADS1115) ──────────
 class ThermisAppArg:
     AppID: types.AppID = 24          # **고유해야 함**
@@ -98,6 +125,11 @@ class ThermisAppArg:
     MID_SendThermisFlightLogicData: types.MID = 2403  # 10 Hz 온도
     MID_ThermisCalibration:    types.MID = 2404  # CAL 처리용(옵션)
 
+    SCHEMAS = {
+        MID_SendThermisTlmData:         "d",  # temp
+        MID_SendThermisFlightLogicData: "d",  # temp
+    }
+
 
 
 
@@ -110,6 +142,11 @@ class ThermalcameraAppArg:
     MID_SendCamTlmData: types.MID = 2202
     MID_SendCamFlightLogicData: types.MID = 2203
 
+    SCHEMAS = {
+        MID_SendCamTlmData:         "ddd",  # avg, min, max
+        MID_SendCamFlightLogicData: "ddd",  # avg, min, max
+    }
+
 
 class ThermoAppArg:
     AppID: types.AppID = 23
@@ -121,6 +158,11 @@ class ThermoAppArg:
     # 선택: 1 Hz 텔레메트리
     MID_SendThermoTlmData:            types.MID = 2303
 
+    SCHEMAS = {
+        MID_SendThermoFlightLogicData: "dd",  # temp, humidity
+        MID_SendThermoTlmData:         "dd",  # temp, humidity
+    }
+
 # ────────── TMP007 (Temperature Sensor) ──────────
 class Tmp007AppArg:
     AppID: types.AppID = 26          # **고유해야 함**
@@ -130,6 +172,11 @@ class Tmp007AppArg:
     MID_SendTmp007FlightLogicData: types.MID = 2603  # 4 Hz 온도 데이터
     MID_Tmp007Calibration:    types.MID = 2604  # CAL 처리용(옵션)
 
+    SCHEMAS = {
+        MID_SendTmp007TlmData:         "ddd",  # object_temp, die_temp, voltage
+        MID_SendTmp007FlightLogicData: "ddd",  # object_temp, die_temp, voltage
+    }
+
 # ────────── CAMERA (Raspberry Pi Camera Module v3 Wide) ────────── - 제거됨
 # class CameraAppArg:
 #     AppID: types.AppID = 27          # **고유해야 함**
@@ -146,3 +193,66 @@ class SampleAppArg:
     AppID: types.AppID = 99
     AppName = "Sample"
     MID_SendHK: types.MID = 9901
+
+
+# ────────── MID 구독 테이블 (소비 앱 AppID → 구독 MID 목록) ──────────
+# receiver 를 PUBLISH_APPID 로 발행된 메시지는 해당 MID 를 구독한 모든 앱에 전달됨
+SUBSCRIPTIONS = {
+    FlightlogicAppArg.AppID: (
+        BarometerAppArg.MID_SendBarometerFlightLogicData,
+        ImuAppArg.MID_SendImuFlightLogicData,
+        GpsAppArg.MID_SendGpsFlightLogicData,
+        FirApp1Arg.MID_SendFIR1Data,
+        ThermisAppArg.MID_SendThermisFlightLogicData,
+        ThermalcameraAppArg.MID_SendCamFlightLogicData,
+        ThermoAppArg.MID_SendThermoFlightLogicData,
+        Tmp007AppArg.MID_SendTmp007FlightLogicData,
+    ),
+    CommAppArg.AppID: (
+        BarometerAppArg.MID_SendBarometerTlmData,
+        ImuAppArg.MID_SendImuTlmData,
+        GpsAppArg.MID_SendGpsTlmData,
+        FlightlogicAppArg.MID_SendCurrentStateToTlm,
+        FlightlogicAppArg.MID_SendSimulationStatustoTlm,
+        FlightlogicAppArg.MID_SendMotorStatus,
+        FirApp1Arg.MID_SendFIR1Data,
+        ThermisAppArg.MID_SendThermisTlmData,
+        ThermalcameraAppArg.MID_SendCamTlmData,
+        ThermoAppArg.MID_SendThermoTlmData,
+        Tmp007AppArg.MID_SendTmp007TlmData,
+    ),
+    MotorAppArg.AppID: (
+        ImuAppArg.MID_SendYawData,
+    ),
+}
+
+# ────────── 상태(state) MID (lib/core/busqueue.py, lib/base_app.py) ──────────
+# 최신값만 의미 있는 주기 데이터 (구독 MID 전체). 라우터 outbox 와 앱 수신 helper 에서
+# 대기 중인 같은 (sender, MID) 메시지를 최신 1개로 합쳐 전달
+STATE_MIDS = tuple(sorted({mid for mids in SUBSCRIPTIONS.values() for mid in mids}))
+
+# ────────── Command lane MID (lib/core/busqueue.py) ──────────
+# 명령(NEVER_DROP) 외에 센서 트래픽보다 먼저 전달해야 하는 상태 변경 메시지
+COMMAND_LANE_MIDS = (
+    FlightlogicAppArg.MID_SendCurrentStateToTlm,
+    FlightlogicAppArg.MID_SendSimulationStatustoTlm,
+    FlightlogicAppArg.MID_SendMotorStatus,
+)
+
+# ────────── 블랙보드 MID (공유 메모리 최신값 슬롯, lib/core/blackboard.py) ──────────
+# 이 MID 들은 버스로 발행되지 않고 슬롯에 덮어쓰여지며, 구독 앱이 필요할 때 읽음
+# 상태 머신이 샘플마다 동작하는 Barometer FlightLogic 데이터와 스키마 없는 GPS 는 버스 유지
+BLACKBOARD_MIDS = (
+    BarometerAppArg.MID_SendBarometerTlmData,
+    ImuAppArg.MID_SendImuTlmData,
+    ImuAppArg.MID_SendImuFlightLogicData,
+    FirApp1Arg.MID_SendFIR1Data,
+    ThermisAppArg.MID_SendThermisTlmData,
+    ThermisAppArg.MID_SendThermisFlightLogicData,
+    ThermalcameraAppArg.MID_SendCamTlmData,
+    ThermalcameraAppArg.MID_SendCamFlightLogicData,
+    ThermoAppArg.MID_SendThermoTlmData,
+    ThermoAppArg.MID_SendThermoFlightLogicData,
+    Tmp007AppArg.MID_SendTmp007TlmData,
+    Tmp007AppArg.MID_SendTmp007FlightLogicData,
+)
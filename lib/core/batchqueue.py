@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Micro-batching send adapter for the software bus (config.json BUS.BATCH_WINDOW_MS / BUS.BATCH_MAX)
+bulk lane MID (센서/HK) 는 짧은 window 동안 모아 batch 프레임 1개로 put → IPC 호출/라우터 wakeup 감소
+command lane MID (명령, 상태 변경) 는 대기 중인 batch 를 먼저 보낸 뒤 즉시 전달 (순서 유지, 추가 지연 없음)
+
+- window 가 지나거나 BATCH_MAX 개 / BATCH_MAX_BYTES 에 도달하면 전송
+- window 만료 전송은 프로세스별 flusher 스레드가 담당 (첫 put 시 시작)
+- 라우터가 막혀 put 이 queue.Full 이면 batch 를 버리지 않고 대기 상태로 두었다가 다시 전송,
+  대기 batch 가 상한(BATCH_MAX / BATCH_MAX_BYTES)을 넘으면 가장 오래된 프레임부터 버리고 MID 별로 집계 (drops)
+- 새 drop 이 있으면 DROP_REPORT_INTERVAL 마다 누적 drops 를 HK 로 보고 (HkAppArg.MID_ReceiveDropStats,
+  페이로드 형식은 라우터의 MID_SendBusStats 와 같음). 보고도 막히면 다음 주기에 다시 시도
+"""
+
+import os
+import queue
+import threading
+import time
+
+from . import appargs
+from . import busqueue
+from . import msgstructure
+from ..logging import safe_log
+
+DEFAULT_WINDOW = 0.002  # batch 수집 window (초)
+DEFAULT_MAX = 16        # batch 1개 최대 메시지 수
+DROP_REPORT_INTERVAL = 1.0  # drop 카운터 HK 보고 최소 간격 (초)
+
+class BatchingQueue:
+    """앱 쪽 송신 어댑터 : multiprocessing.Queue 와 같은 put() 제공 (send_msg API 유지)"""
+
+    def __init__(self, queue, window: float = DEFAULT_WINDOW, max_items: int = DEFAULT_MAX, app_id: int = None):
+        self.queue = queue
+        self.window = window
+        self.max_items = max_items
+        self.app_id = app_id    # drop 보고 송신자 (None 이면 보고하지 않음)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.drops = {}         # MID → 버린 개수 (busqueue.Outbox.drops 와 같은 형태)
+        self._drops_unreported = False
+        self._report_at = 0.0
+        self._cond = None
+        self._pid = None
+        self._pending = []
+        self._pending_bytes = 0
+        self._deadline = 0.0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ("drops", "_drops_unreported", "_report_at", "_cond", "_pid", "_pending", "_pending_bytes", "_deadline"):
+            state.pop(key)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def _condition(self) -> threading.Condition:
+        # 프로세스마다 새 락/flusher 스레드 (fork 이후 부모 상태를 물려받지 않음)
+        if self._pid != os.getpid():
+            self._reset()
+            self._pid = os.getpid()
+            self._cond = threading.Condition()
+            threading.Thread(target=self._flusher, name="BusBatchFlusher", daemon=True).start()
+        return self._cond
+
+    def _flush_locked(self) -> bool:
+        """대기 batch 전송. 라우터가 막혀 있으면 (queue.Full) batch 를 그대로 두고 False"""
+        if not self._pending:
+            return True
+        try:
+            self.queue.put(msgstructure.pack_batch(self._pending))
+        except queue.Full:
+            return False
+        self._pending = []
+        self._pending_bytes = 0
+        return True
+
+    def _drop_oldest_locked(self) -> None:
+        frame = self._pending.pop(0)
+        self._pending_bytes -= msgstructure.BATCH_ITEM.size + len(frame)
+        header = msgstructure.peek_header(frame)
+        mid = header[2] if header is not None else None
+        self.drops[mid] = self.drops.get(mid, 0) + 1
+        self._drops_unreported = True
+        total = sum(self.drops.values())
+        if total & (total - 1) == 0:
+            # 1, 2, 4, 8 ... 번째 drop 마다 경고 (로그 폭주 방지)
+            safe_log(f"[BatchQueue] router busy, dropped {total} pending frames (last MID {mid})", "WARNING", True)
+
+    def _report_drops_locked(self) -> None:
+        """누적 drop 카운터를 HK 로 전송 (라우터가 막혀 있으면 다음 주기에 재시도)"""
+        self._report_at = time.monotonic() + DROP_REPORT_INTERVAL
+        stats_msg = msgstructure.MsgStructure()
+        if not msgstructure.fill_msg(stats_msg, self.app_id, appargs.HkAppArg.AppID, appargs.HkAppArg.MID_ReceiveDropStats,
+                                     busqueue.format_drop_summary(self.drops)):
+            return
+        frame = msgstructure.encode_msg(stats_msg)
+        if frame is None:
+            return
+        if isinstance(frame, str):
+            frame = frame.encode('utf-8')
+        try:
+            self.queue.put(frame, False)
+        except queue.Full:
+            return
+        self._drops_unreported = False
+
+    def _flusher(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                if self._pending:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining > 0:
+                        cond.wait(remaining)
+                        continue
+                    try:
+                        if not self._flush_locked():
+                            self._deadline = time.monotonic() + self.window   # window 후 재시도
+                            continue
+                    except Exception as e:
+                        safe_log(f"[BatchQueue] batch flush failed: {e}", "WARNING", True)
+                        self._deadline = time.monotonic() + self.window
+                        continue
+
+                # 대기 batch 를 다 보낸 뒤에 drop 보고 (보고가 데이터를 앞지르지 않음)
+                report = self._drops_unreported and self.app_id is not None
+                if report and time.monotonic() >= self._report_at:
+                    self._report_drops_locked()
+                if not self._pending:
+                    cond.wait(max(0.0, self._report_at - time.monotonic()) if report else None)
+
+    def put(self, msg, *args, **kwargs) -> None:
+        if isinstance(msg, str):
+            msg = msg.encode('utf-8')
+
+        header = msgstructure.peek_header(msg)
+        cond = self._condition()
+        with cond:
+            if header is None or busqueue.lane_of(header[2]) == busqueue.LANE_COMMAND:
+                # 명령 : 먼저 들어온 batch 를 보낸 뒤 즉시 전달 (batch 를 못 보내면 batch 는 대기 유지, 명령은 그대로 전송 시도)
+                self._flush_locked()
+                self.queue.put(msg, *args, **kwargs)
+                return
+
+            size = msgstructure.BATCH_ITEM.size + len(msg)
+            limit = msgstructure.BATCH_MAX_BYTES - msgstructure.BATCH_HEADER.size
+            if self._pending and self._pending_bytes + size > limit and not self._flush_locked():
+                # 라우터가 막혀 있음 : 새 프레임이 들어갈 때까지 가장 오래된 프레임부터 버림
+                while self._pending and self._pending_bytes + size > limit:
+                    self._drop_oldest_locked()
+
+            self._pending.append(msg)
+            self._pending_bytes += size
+            if len(self._pending) >= self.max_items and not self._flush_locked():
+                while len(self._pending) > self.max_items:
+                    self._drop_oldest_locked()
+            if len(self._pending) == 1:
+                self._deadline = time.monotonic() + self.window
+                cond.notify()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Latest-value telemetry blackboard (shared memory + seqlock)
+appargs.BLACKBOARD_MIDS 에 해당하는 텔레메트리는 버스 메시지 대신 MID 별 슬롯에 최신값만 덮어씀
+Comm / FlightLogic 은 필요할 때 슬롯을 읽어 일관된 스냅샷을 얻음
+
+슬롯 : seq(u32) | crc(u32) | stamp(f64) | payload(MID 스키마)
+- writer : seq 홀수 → payload/stamp/crc 기록 → seq 짝수 (MID 당 writer 1개)
+- reader : seq 가 짝수이고 읽기 전후 동일하며 stamp+payload 의 crc32 가 맞을 때만 채택, 아니면 재시도
+- seq/payload 는 struct.pack_into 일반 store 라 ARM 등 약한 메모리 순서 CPU 에서는 seq 만으로
+  순서가 보장되지 않음 (다른 프로세스가 새 seq 와 이전 payload 를 함께 볼 수 있음)
+  → 슬롯마다 crc32 를 같이 기록하고 읽을 때 검증해서 찢어진 스냅샷을 걸러냄
+"""
+
+import os
+import struct
+import time
+import zlib
+from multiprocessing import shared_memory
+
+from . import appargs
+from . import msgstructure
+from .config import get_config
+from ..logging import safe_log
+
+BLACKBOARD_ENABLE = bool(get_config("BLACKBOARD.ENABLE", True))
+BLACKBOARD_NAME = str(get_config("BLACKBOARD.NAME", "cansat_blackboard"))
+
+_MAGIC = 0xB1ACB0A2
+_HEADER = struct.Struct("<II")      # magic, slot count
+_SEQ = struct.Struct("<I")
+_CRC = struct.Struct("<I")
+_CRC_OFFSET = 4
+_STAMP_OFFSET = 8
+_STAMP = struct.Struct("<d")
+_SLOT_HEADER_SIZE = 16
+_READ_RETRIES = 100
+
+def _build_layout() -> tuple:
+    """MID → (슬롯 offset, schema). 모든 프로세스가 같은 순서로 계산하므로 별도 협의 불필요"""
+    layout = {}
+    offset = _HEADER.size
+    for mid in sorted(set(appargs.BLACKBOARD_MIDS)):
+        schema = msgstructure.PAYLOAD_SCHEMAS.get(mid)
+        if schema is None:
+            continue
+        layout[mid] = (offset, schema)
+        offset += (_SLOT_HEADER_SIZE + schema.size + 7) & ~7
+    return layout, offset
+
+SLOT_LAYOUT, BLACKBOARD_SIZE = _build_layout()
+
+class Blackboard:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.buf = shm.buf
+        self.owner = owner
+
+    @classmethod
+    def create(cls, name: str = BLACKBOARD_NAME) -> "Blackboard":
+        # 비정상 종료로 남은 세그먼트 정리
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=BLACKBOARD_SIZE)
+        shm.buf[:BLACKBOARD_SIZE] = bytes(BLACKBOARD_SIZE)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, len(SLOT_LAYOUT))
+        return cls(shm, True)
+
+    @classmethod
+    def attach(cls, name: str = BLACKBOARD_NAME) -> "Blackboard":
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+        magic, count = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or count != len(SLOT_LAYOUT) or shm.size < BLACKBOARD_SIZE:
+            shm.close()
+            raise ValueError(f"blackboard layout mismatch (slots {count}, expected {len(SLOT_LAYOUT)})")
+        return cls(shm, False)
+
+    def write(self, mid: int, values) -> bool:
+        """최신값 덮어쓰기. 블랙보드 MID 가 아니면 False"""
+        slot = SLOT_LAYOUT.get(mid)
+        if slot is None:
+            return False
+        offset, schema = slot
+
+        body = _STAMP.pack(time.time()) + schema.pack(*values)
+        seq = _SEQ.unpack_from(self.buf, offset)[0]
+        _SEQ.pack_into(self.buf, offset, (seq + 1) & 0xFFFFFFFF)
+        try:
+            self.buf[offset + _STAMP_OFFSET:offset + _STAMP_OFFSET + len(body)] = body
+            _CRC.pack_into(self.buf, offset + _CRC_OFFSET, zlib.crc32(body))
+        finally:
+            _SEQ.pack_into(self.buf, offset, (seq + 2) & 0xFFFFFFFF)
+        return True
+
+    def read(self, mid: int):
+        """일관된 스냅샷 (seq, stamp, values) 반환. 기록된 적 없거나 읽기 실패 시 None"""
+        slot = SLOT_LAYOUT.get(mid)
+        if slot is None:
+            return None
+        offset, schema = slot
+
+        for _ in range(_READ_RETRIES):
+            seq = _SEQ.unpack_from(self.buf, offset)[0]
+            if seq & 1:
+                continue
+            if seq == 0:
+                return None
+            crc = _CRC.unpack_from(self.buf, offset + _CRC_OFFSET)[0]
+            body = bytes(self.buf[offset + _STAMP_OFFSET:offset + _SLOT_HEADER_SIZE + schema.size])
+            if _SEQ.unpack_from(self.buf, offset)[0] != seq or zlib.crc32(body) != crc:
+                continue
+            stamp = _STAMP.unpack_from(body, 0)[0]
+            return seq, stamp, schema.unpack_from(body, _STAMP.size)
+        return None
+
+    def poll_updates(self, app_id, last_seqs: dict) -> list:
+        """app_id 가 구독한 블랙보드 MID 중 새 값이 있는 것만 MsgStructure 목록으로 반환"""
+        updates = []
+        for mid in appargs.SUBSCRIPTIONS.get(app_id, ()):
+            if mid not in SLOT_LAYOUT:
+                continue
+            snapshot = self.read(mid)
+            if snapshot is None or last_seqs.get(mid) == snapshot[0]:
+                continue
+            last_seqs[mid] = snapshot[0]
+
+            msg = msgstructure.MsgStructure()
+            msg.receiver_app = appargs.PUBLISH_APPID
+            msg.MsgID = mid
+            msg.values = snapshot[2]
+            updates.append(msg)
+        return updates
+
+    def close(self) -> None:
+        try:
+            self.buf = None
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+# 프로세스별 attach 캐시
+_board = None
+_board_pid = None
+
+def get_blackboard():
+    """현재 프로세스의 블랙보드 반환. 비활성/미생성 시 None (버스 메시지로 fallback)"""
+    global _board, _board_pid
+    if not BLACKBOARD_ENABLE:
+        return None
+    if _board_pid != os.getpid():
+        _board_pid = os.getpid()
+        try:
+            _board = Blackboard.attach(BLACKBOARD_NAME)
+        except Exception as e:
+            _board = None
+            safe_log(f"[Blackboard] attach failed, using bus messages: {e}", "WARNING", True)
+    return _board
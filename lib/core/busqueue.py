@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Bounded per-destination outboxes for the software bus router
+라우터는 수신한 프레임을 목적지 앱별 outbox 에 넣고, 파이프가 쓰기 가능할 때만 전달
+느린 소비자가 라우터나 다른 앱을 막지 않으며, MID 별 정책에 따라 메모리 사용량이 제한됨
+
+정책
+- KEEP_LATEST : 상태 MID (appargs.STATE_MIDS). 대기 중인 같은 (sender, MID) 샘플은 새 샘플로 교체
+- NEVER_DROP  : 명령. 정책상 버리지 않음. 단 소비 앱이 멈춰 메모리가 무한히 늘지 않도록
+                command_capacity 개에서 hard cap → 넘치면 새 명령을 거부하고 집계 (put 이 False, 라우터가 ERROR 로그)
+- DROP_OLDEST : HK. 용량 초과 시 가장 오래된 것부터 버림
+
+우선순위 lane
+- LANE_COMMAND : 명령(NEVER_DROP) 과 appargs.COMMAND_LANE_MIDS 의 상태 변경 메시지
+- LANE_BULK    : 그 외 센서/HK 트래픽
+대기 중인 command lane 메시지는 항상 bulk lane 보다 먼저 전달됨
+"""
+
+from collections import deque
+
+from . import appargs
+
+KEEP_LATEST = "KEEP_LATEST"
+NEVER_DROP = "NEVER_DROP"
+DROP_OLDEST = "DROP_OLDEST"
+
+LANE_COMMAND = 0
+LANE_BULK = 1
+
+DEFAULT_CAPACITY = 64
+DEFAULT_COMMAND_CAPACITY = 1024   # NEVER_DROP hard cap (정상 운용에서는 도달하지 않는 값)
+
+def _build_policy_table() -> dict:
+    """MID → 정책. 상태 MID 는 KEEP_LATEST, MID_SendHK 와 버스 통계는 DROP_OLDEST, 나머지(명령)는 NEVER_DROP"""
+    table = {}
+    for arg in vars(appargs).values():
+        if isinstance(arg, type) and hasattr(arg, "MID_SendHK"):
+            table[arg.MID_SendHK] = DROP_OLDEST
+    table[appargs.MainAppArg.MID_SendBusStats] = DROP_OLDEST
+    table[appargs.HkAppArg.MID_ReceiveLatencyStats] = DROP_OLDEST
+    table[appargs.HkAppArg.MID_ReceiveDropStats] = DROP_OLDEST
+    for mid in getattr(appargs, "STATE_MIDS", ()):
+        table[mid] = KEEP_LATEST
+    return table
+
+# MID → drop policy
+MID_POLICIES: dict = _build_policy_table()
+
+def policy_of(mid: int) -> str:
+    return MID_POLICIES.get(mid, NEVER_DROP)
+
+_COMMAND_LANE_MIDS = frozenset(getattr(appargs, "COMMAND_LANE_MIDS", ()))
+
+def lane_of(mid: int) -> int:
+    if mid in _COMMAND_LANE_MIDS or policy_of(mid) == NEVER_DROP:
+        return LANE_COMMAND
+    return LANE_BULK
+
+class Outbox:
+    """목적지 앱 1개의 대기열. lane 우선순위, lane 안에서는 도착 순서를 유지하며 정책에 따라 버림"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, command_capacity: int = DEFAULT_COMMAND_CAPACITY):
+        self.capacity = capacity
+        self.command_capacity = command_capacity
+        self._lanes = (deque(), deque())   # lane 별 [mid, frame, sender] 엔트리, frame 이 None 이면 버려진 자리
+        self._latest = {}           # KEEP_LATEST (sender, MID) → 대기 중인 엔트리
+        self._oldest = deque()      # DROP_OLDEST 엔트리 (오래된 순)
+        self._pending = 0
+        self._commands = 0          # 대기 중인 NEVER_DROP 엔트리 수
+        self.drops = {}             # MID → 버린 개수
+        self.overflows = 0          # NEVER_DROP hard cap 초과로 거부한 개수 (drops 에도 포함)
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def _count_drop(self, mid: int) -> None:
+        self.drops[mid] = self.drops.get(mid, 0) + 1
+
+    def put(self, mid: int, frame: bytes, sender: int = None) -> bool:
+        """적재. NEVER_DROP 이 hard cap 을 넘어 거부되면 False"""
+        policy = policy_of(mid)
+
+        if policy == KEEP_LATEST:
+            entry = self._latest.get((sender, mid))
+            if entry is not None:
+                # 대기 중인 오래된 샘플을 최신 샘플로 교체 (순서 유지)
+                entry[1] = frame
+                self._count_drop(mid)
+                return True
+            entry = [mid, frame, sender]
+            self._latest[(sender, mid)] = entry
+
+        elif policy == DROP_OLDEST:
+            if len(self._oldest) >= self.capacity:
+                dropped = self._oldest.popleft()
+                dropped[1] = None
+                self._pending -= 1
+                self._count_drop(dropped[0])
+            entry = [mid, frame, sender]
+            self._oldest.append(entry)
+
+        else:
+            if self._commands >= self.command_capacity:
+                self._count_drop(mid)
+                self.overflows += 1
+                return False
+            self._commands += 1
+            entry = [mid, frame, sender]
+
+        self._lanes[lane_of(mid)].append(entry)
+        self._pending += 1
+        return True
+
+    def pop(self):
+        """다음 (mid, frame) 반환 (command lane 우선). 비어 있으면 None"""
+        for lane in self._lanes:
+            while lane:
+                entry = lane.popleft()
+                mid, frame, sender = entry
+                if frame is None:
+                    continue
+                if self._latest.get((sender, mid)) is entry:
+                    del self._latest[(sender, mid)]
+                elif self._oldest and self._oldest[0] is entry:
+                    self._oldest.popleft()
+                elif policy_of(mid) == NEVER_DROP:
+                    self._commands -= 1
+                self._pending -= 1
+                return mid, frame
+        return None
+
+    def clear(self) -> None:
+        for lane in self._lanes:
+            lane.clear()
+        self._latest.clear()
+        self._oldest.clear()
+        self._pending = 0
+        self._commands = 0
+
+def drop_summary(outboxes: dict) -> dict:
+    """모든 outbox 의 MID 별 버린 개수 합계"""
+    summary = {}
+    for outbox in outboxes.values():
+        for mid, count in outbox.drops.items():
+            summary[mid] = summary.get(mid, 0) + count
+    return summary
+
+def format_drop_summary(summary: dict) -> str:
+    """HK 전달용 페이로드 : total=N,MID=count,..."""
+    fields = [f"total={sum(summary.values())}"]
+    fields.extend(f"{mid}={count}" for mid, count in sorted(summary.items()))
+    return ",".join(fields)
+
+def parse_drop_summary(data: str) -> dict:
+    """format_drop_summary 의 역변환. 키는 'total' 또는 MID(int)"""
+    summary = {}
+    for field in data.split(","):
+        key, sep, value = field.partition("=")
+        if not sep:
+            continue
+        try:
+            summary[key if key == "total" else int(key)] = int(value)
+        except ValueError:
+            continue
+    return summary
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Bus message recorder and replay driver (config.json BUS.RECORD / BUS.RECORD_DIR)
+main.runloop 이 라우팅하는 모든 프레임을 수신 시각과 함께 기록하고, 기록을 앱 1개의 파이프에 다시 넣어
+하드웨어 없이 실제 비행 트래픽으로 앱을 프로파일링 / 벤치마크
+
+- 기록 파일 (.brec) : 헤더 (MAGIC, 버전, 헤더 길이, wall clock, time.monotonic_ns())
+                      + 레코드 ('<qI' monotonic ns, 프레임 길이 + 프레임 bytes 그대로)
+                      + 블랙보드 슬롯 갱신 레코드 (길이에 SLOT_FLAG, 본문 = '<Id' MID, 슬롯 stamp + 스키마 payload)
+- 기록 위치 : main.intake_frame 이 batch 를 풀고 헤더 확인 후 (trace stamp 전) 프레임 1개씩 기록
+  → hot route mirror 사본도 포함
+- 블랙보드로만 전달되는 텔레메트리 : main 이 SLOT_SAMPLE_INTERVAL 마다 슬롯을 읽어 seq 가 바뀐 것만 기록
+  (소비 앱도 최신값만 읽으므로 그 사이 덮어쓴 값은 원래도 전달되지 않음)
+- commit 정책 : LOGGING.COMMIT_POLICY.BUS_RECORDER (없으면 FLIGHT_RECORDER, durability.GroupCommitFile 공용 flusher)
+  마지막 레코드가 잘린 파일은 읽을 때 제외
+
+재생 : python3 -m lib.core.busrecord replay FILE --app flightlogicapp [--speed 1 | 10 | 0]
+  대상 앱으로 라우팅됐던 프레임 (수신 AppID 일치 또는 구독 중인 발행 MID) 만 기록 시각 간격대로 전달
+  구독 중인 블랙보드 슬롯 갱신은 재생 전용 블랙보드 (이름 BLACKBOARD.NAME + _replay_PID) 에 같은 시각에 기록
+  (BLACKBOARD.ENABLE 이 꺼져 있으면 실제 비행처럼 발행 메시지로 파이프에 전달)
+  --speed 1 실시간, N 배속, 0 이면 가능한 한 빠르게. 앱이 보낸 메시지는 MID 별로 집계만 함
+정보 : python3 -m lib.core.busrecord info FILE
+"""
+
+import argparse
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+from . import appargs
+from . import blackboard
+from . import msgstructure
+from ..logging.durability import GroupCommitFile
+from ..logging.mirror import mirror_log_file
+
+MAGIC = b"BREC"
+VERSION = 2                             # 2 : 블랙보드 슬롯 갱신 레코드 추가
+READ_VERSIONS = (1, 2)
+PREAMBLE = struct.Struct("<4sHHdq")     # magic, 버전, 헤더 길이, wall clock, monotonic ns
+RECORD = struct.Struct("<qI")           # monotonic ns, 프레임 길이
+SLOT_FLAG = 0x80000000                  # 길이 최상위 bit : 블랙보드 슬롯 갱신 레코드
+SLOT = struct.Struct("<Id")             # MID, 슬롯 stamp (writer 의 time.time())
+SLOT_SAMPLE_INTERVAL = 0.05             # main 의 블랙보드 슬롯 확인 주기 (초, TimerWheel 해상도)
+FILE_SUFFIX = ".brec"
+FILE_BUFFER_SIZE = 64 * 1024
+
+DEFAULT_RECORD_DIR = "logs/bus"
+
+def recording_path(directory: str = DEFAULT_RECORD_DIR) -> str:
+    return os.path.join(directory, f"bus_{datetime.now().strftime('%Y%m%d_%H%M%S')}{FILE_SUFFIX}")
+
+class BusRecorder:
+    """라우팅된 프레임 기록 (main 프로세스 전용, 핸들 유지 + commit 정책에 따라 flush)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self.slot_records = 0
+        self._file = None
+        self._slot_seqs = {}
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = GroupCommitFile(mirror_log_file(open(self.path, "ab", buffering=FILE_BUFFER_SIZE), self.path),
+                                     "BUS_RECORDER", "FLIGHT_RECORDER", owner_only=True)
+        self._file.write(PREAMBLE.pack(MAGIC, VERSION, PREAMBLE.size, time.time(), time.monotonic_ns()), commit=True)
+
+    def record(self, frame: bytes) -> None:
+        if self._file is None:
+            self._open()
+        self._file.write(RECORD.pack(time.monotonic_ns(), len(frame)) + frame)
+        self.records += 1
+
+    def sample_blackboard(self, board) -> None:
+        """지난 확인 이후 갱신된 블랙보드 슬롯을 기록 (main timer 에서 주기 호출)"""
+        for mid, (_, schema) in blackboard.SLOT_LAYOUT.items():
+            snapshot = board.read(mid)
+            if snapshot is None or self._slot_seqs.get(mid) == snapshot[0]:
+                continue
+            self._slot_seqs[mid] = snapshot[0]
+            self.record_slot(mid, snapshot[1], schema.pack(*snapshot[2]))
+
+    def record_slot(self, mid: int, stamp: float, payload: bytes) -> None:
+        if self._file is None:
+            self._open()
+        body = SLOT.pack(mid, stamp) + payload
+        self._file.write(RECORD.pack(time.monotonic_ns(), len(body) | SLOT_FLAG) + body)
+        self.slot_records += 1
+
+    def commit(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+######################################################
+## 읽기                                             ##
+######################################################
+
+def read_recording(path: str, with_slots: bool = False):
+    """(헤더 dict, (monotonic ns, 프레임) 목록) 반환. 잘린 마지막 레코드는 제외
+    with_slots 면 (monotonic ns, MID, 슬롯 stamp, payload) 블랙보드 슬롯 갱신 목록도 함께 반환"""
+    with open(path, "rb") as f:
+        blob = f.read()
+    if len(blob) < PREAMBLE.size:
+        raise ValueError(f"{path}: not a bus recording (too short)")
+    magic, version, header_len, wall_time, mono_ns = PREAMBLE.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a bus recording (bad magic)")
+    if version not in READ_VERSIONS:
+        raise ValueError(f"{path}: unsupported bus recording version {version}")
+    records = []
+    slots = []
+    offset = header_len
+    while offset + RECORD.size <= len(blob):
+        t_ns, length = RECORD.unpack_from(blob, offset)
+        end = offset + RECORD.size + (length & ~SLOT_FLAG)
+        if end > len(blob):
+            break
+        data = blob[offset + RECORD.size:end]
+        if not length & SLOT_FLAG:
+            records.append((t_ns, data))
+        elif len(data) >= SLOT.size:
+            mid, stamp = SLOT.unpack_from(data)
+            slots.append((t_ns, mid, stamp, data[SLOT.size:]))
+        offset = end
+    header = {"version": version, "wall_time": wall_time, "mono_ns": mono_ns}
+    if with_slots:
+        return header, records, slots
+    return header, records
+
+def frames_for_app(records: list, app_id) -> list:
+    """main 라우터가 app_id 로 전달했을 프레임만 선택 (수신 AppID 일치 또는 구독 중인 발행 MID)"""
+    selected = []
+    for t_ns, frame in records:
+        route = msgstructure.peek_header(frame)
+        if route is None:
+            continue
+        _, receiver_app, msg_id = route
+        if receiver_app == app_id or (receiver_app == appargs.PUBLISH_APPID
+                                      and app_id in msgstructure.SUBSCRIBERS.get(msg_id, ())):
+            selected.append((t_ns, frame))
+    return selected
+
+def slots_for_app(slots: list, app_id) -> list:
+    """app_id 가 구독한 블랙보드 MID 의 슬롯 갱신만 (monotonic ns, MID, 값 tuple) 로 선택
+    (현재 슬롯 레이아웃에 없거나 payload 크기가 다른 MID 는 제외)"""
+    subscribed = appargs.SUBSCRIPTIONS.get(app_id, ())
+    selected = []
+    for t_ns, mid, _, payload in slots:
+        slot = blackboard.SLOT_LAYOUT.get(mid)
+        if mid in subscribed and slot is not None and len(payload) == slot[1].size:
+            selected.append((t_ns, mid, slot[1].unpack(payload)))
+    return selected
+
+def summarize(records: list) -> dict:
+    """MID 별 프레임 수"""
+    counts = {}
+    for _, frame in records:
+        route = msgstructure.peek_header(frame)
+        if route is not None:
+            counts[route[2]] = counts.get(route[2], 0) + 1
+    return counts
+
+######################################################
+## 재생                                             ##
+######################################################
+
+# 재생 대상 앱 : 모듈 이름 → (모듈 경로, 클래스 이름, AppID) (main.load_apps 와 같은 구성)
+REPLAY_APPS = {
+    "hkapp": ("hk.hkapp", "HKApp", appargs.HkAppArg.AppID),
+    "barometerapp": ("barometer.barometerapp", "BarometerApp", appargs.BarometerAppArg.AppID),
+    "gpsapp": ("gps.gpsapp", "GpsApp", appargs.GpsAppArg.AppID),
+    "imuapp": ("imu.imuapp", "ImuApp", appargs.ImuAppArg.AppID),
+    "flightlogicapp": ("flight_logic.flightlogicapp", "FlightLogicApp", appargs.FlightlogicAppArg.AppID),
+    "commapp": ("comm.commapp", "CommApp", appargs.CommAppArg.AppID),
+    "motorapp": ("motor.motorapp", "MotorApp", appargs.MotorAppArg.AppID),
+    "firapp1": ("fir1.firapp1", "FirApp1", appargs.FirApp1Arg.AppID),
+    "thermisapp": ("thermis.thermisapp", "ThermisApp", appargs.ThermisAppArg.AppID),
+    "tmp007app": ("tmp007.tmp007app", "Tmp007App", appargs.Tmp007AppArg.AppID),
+    "thermoapp": ("thermo.thermoapp", "ThermoApp", appargs.ThermoAppArg.AppID),
+}
+
+def _termination_frame() -> bytes:
+    """main.terminate_FSW 가 보내는 것과 같은 종료 메시지"""
+    message = msgstructure.MsgStructure()
+    msgstructure.fill_msg(message, appargs.MainAppArg.AppID, appargs.MainAppArg.AppID,
+                          appargs.MainAppArg.MID_TerminateProcess, "")
+    frame = msgstructure.encode_msg(message)
+    return frame.encode("utf-8") if isinstance(frame, str) else frame
+
+def _publish_frame(mid: int, values) -> bytes:
+    """블랙보드가 없을 때 발행 앱이 보내는 것과 같은 발행 메시지"""
+    message = msgstructure.MsgStructure()
+    msgstructure.fill_msg(message, appargs.MainAppArg.AppID, appargs.PUBLISH_APPID, mid, values)
+    frame = msgstructure.encode_msg(message)
+    return frame.encode("utf-8") if isinstance(frame, str) else frame
+
+def _drain_output(app_queue, counts: dict, stop: threading.Event) -> None:
+    """앱이 라우터로 보낸 메시지를 MID 별로 집계 (큐가 차서 앱이 멈추지 않도록 계속 비움)"""
+    while not stop.is_set():
+        try:
+            frame = app_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        except (EOFError, OSError):
+            return
+        if isinstance(frame, str):
+            frame = frame.encode("utf-8")
+        frames = msgstructure.iter_batch(frame) if msgstructure.is_batch(frame) else (frame,)
+        for item in frames:
+            route = msgstructure.peek_header(item)
+            mid = route[2] if route is not None else None
+            counts[mid] = counts.get(mid, 0) + 1
+
+def replay(path: str, app: str, speed: float = 1.0, settle: float = 1.0) -> dict:
+    """기록을 앱 1개의 파이프 (+ 재생 전용 블랙보드) 로 재생. speed : 1 실시간, N 배속, 0 이하면 가능한 한 빠르게"""
+    import multiprocessing
+    if app not in REPLAY_APPS:
+        raise ValueError(f"unknown app '{app}' (choose from {', '.join(REPLAY_APPS)})")
+    module_path, class_name, app_id = REPLAY_APPS[app]
+    header, records, slots = read_recording(path, with_slots=True)
+    frames = frames_for_app(records, app_id)
+    updates = slots_for_app(slots, app_id)
+    warnings = []
+    if header["version"] < 2 and any(mid in blackboard.SLOT_LAYOUT for mid in appargs.SUBSCRIPTIONS.get(app_id, ())):
+        warnings.append(f"{path}: version {header['version']} recording has no blackboard slot updates, "
+                        f"{app} will not receive blackboard telemetry")
+
+    # 슬롯 갱신 + 프레임을 기록 시각 순으로 (같은 시각이면 기록 순서 유지)
+    events = sorted([(t_ns, frame, None) for t_ns, frame in frames]
+                    + [(t_ns, mid, values) for t_ns, mid, values in updates], key=lambda event: event[0])
+
+    # 재생 전용 블랙보드 : 실행 중인 FSW 의 블랙보드와 겹치지 않는 이름으로 만들고 앱 fork 전에 이름을 바꿔 둠
+    board = None
+    board_name = blackboard.BLACKBOARD_NAME
+    if updates and blackboard.BLACKBOARD_ENABLE:
+        blackboard.BLACKBOARD_NAME = f"{board_name}_replay_{os.getpid()}"
+        try:
+            board = blackboard.Blackboard.create(blackboard.BLACKBOARD_NAME)
+        except Exception:
+            blackboard.BLACKBOARD_NAME = board_name
+            raise
+
+    app_class = getattr(__import__(module_path, fromlist=[class_name]), class_name)
+    app_queue = multiprocessing.Queue()
+    parent_pipe, child_pipe = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=app_class().start, args=(app_queue, child_pipe), name=f"Replay_{class_name}")
+    process.start()
+
+    outputs = {}
+    stop = threading.Event()
+    drainer = threading.Thread(target=_drain_output, args=(app_queue, outputs, stop), name="ReplayDrain", daemon=True)
+    drainer.start()
+
+    time.sleep(settle)   # 앱 초기화 대기
+    max_lag = 0.0
+    sent = 0
+    slot_writes = 0
+    started = time.monotonic()
+    first_ns = events[0][0] if events else 0
+    try:
+        for t_ns, data, values in events:
+            if speed > 0:
+                due = started + (t_ns - first_ns) / 1e9 / speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+            if not process.is_alive():
+                break
+            if values is None:
+                parent_pipe.send_bytes(data)
+                sent += 1
+            elif board is not None:
+                board.write(data, values)
+                slot_writes += 1
+            else:
+                # BLACKBOARD.ENABLE 이 꺼진 설정 : 실제 비행처럼 발행 메시지로 전달
+                parent_pipe.send_bytes(_publish_frame(data, values))
+                slot_writes += 1
+    finally:
+        elapsed = time.monotonic() - started
+        try:
+            parent_pipe.send_bytes(_termination_frame())
+        except Exception:
+            pass
+        process.join(max(settle, 2.0))
+        if process.is_alive():
+            process.terminate()
+            process.join(1.0)
+        stop.set()
+        drainer.join(1.0)
+        if board is not None:
+            board.close()
+        blackboard.BLACKBOARD_NAME = board_name
+
+    recorded = (events[-1][0] - first_ns) / 1e9 if events else 0.0
+    return {"app": app, "frames": sent, "selected": len(frames), "slot_updates": slot_writes,
+            "selected_slots": len(updates), "recorded_span": recorded,
+            "elapsed": elapsed, "rate": sent / elapsed if elapsed > 0 else 0.0,
+            "max_lag": max_lag, "outputs": outputs, "warnings": warnings}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bus recording (.brec) info / replay")
+    sub = parser.add_subparsers(dest="command", required=True)
+    info = sub.add_parser("info", help="기록 요약 (MID 별 프레임 수)")
+    info.add_argument("files", nargs="+")
+    play = sub.add_parser("replay", help="앱 1개에 기록 재생")
+    play.add_argument("file")
+    play.add_argument("--app", required=True, choices=sorted(REPLAY_APPS), help="재생 대상 앱 모듈 이름")
+    play.add_argument("--speed", type=float, default=1.0, help="1 실시간, N 배속, 0 이면 가능한 한 빠르게")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "info":
+            for path in args.files:
+                header, records, slots = read_recording(path, with_slots=True)
+                span = (records[-1][0] - records[0][0]) / 1e9 if records else 0.0
+                started = datetime.fromtimestamp(header["wall_time"]).isoformat(sep=" ", timespec="seconds")
+                print(f"{path}: start={started} frames={len(records)} slot_updates={len(slots)} span={span:.1f}s")
+                for mid, count in sorted(summarize(records).items()):
+                    print(f"  MID {mid}: {count}")
+                slot_counts = {}
+                for _, mid, _, _ in slots:
+                    slot_counts[mid] = slot_counts.get(mid, 0) + 1
+                for mid, count in sorted(slot_counts.items()):
+                    print(f"  blackboard MID {mid}: {count}")
+        else:
+            result = replay(args.file, args.app, args.speed)
+            for warning in result["warnings"]:
+                print(f"warning: {warning}", file=sys.stderr)
+            print(f"{args.app}: sent {result['frames']}/{result['selected']} frames, "
+                  f"{result['slot_updates']}/{result['selected_slots']} blackboard updates in {result['elapsed']:.2f}s "
+                  f"(recorded {result['recorded_span']:.2f}s, {result['rate']:.0f} frames/s, max lag {result['max_lag'] * 1000:.1f} ms)")
+            for mid, count in sorted(result["outputs"].items(), key=lambda item: str(item[0])):
+                print(f"  output MID {mid}: {count}")
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -97,7 +97,9 @@ DEFAULT_CONFIG = {
         "I2C_ADDRESS": 0x33,
         "READ_INTERVAL": 0.5,       # 초
         "TELMETRY_INTERVAL": 1.0,   # 초
-        "FLIGHTLOGIC_INTERVAL": 0.2  # 초 (5Hz)
+        "FLIGHTLOGIC_INTERVAL": 0.2, # 초 (5Hz)
+        "REFRESH_RATE_HZ": 2,       # MLX90640 refresh rate (0.5, 1, 2, 4, 8, 16, 32, 64), READ_INTERVAL 과 맞출 것
+        "FRAME_FORMAT": "INT16"     # 프레임 기록 형식 : INT16 (0.01 °C) / FLOAT32
     },
     
     # 모터 설정
@@ -138,11 +140,54 @@ DEFAULT_CONFIG = {
     "LOGGING": {
         "PRIMARY_LOG_DIR": "logs",
         "SECONDARY_LOG_DIR": "/mnt/log_sd/logs",
-        "LOG_LEVEL": "INFO",         # DEBUG, INFO, WARNING, ERROR
+        "LOG_LEVEL": "INFO",         # DEBUG, INFO, WARNING, ERROR (환경변수 LOG_LEVEL 이 있으면 우선)
+        "MODULE_LEVELS": {},         # 모듈(접두어)별 로그 레벨 예: {"comm.commapp": "DEBUG"}, 실행 중 set_log_level 로 변경
         "LOG_ROTATION_SIZE": 10,     # MB
         "LOG_RETENTION_DAYS": 7,
         "BACKUP_INTERVAL": 300,      # 초 (5분)
-        "RECOVERY_INTERVAL": 60      # 초 (1분)
+        "RECOVERY_INTERVAL": 60,     # 초 (1분)
+        "LOG_SERVER": False,         # True 면 로그 전용 프로세스 1개가 main_system/error/debug.log 기록 (앱은 채널로 전달)
+        "MMAP_LOGS": False,          # True 면 텍스트 로그를 미리 할당한 mmap 세그먼트(.mlog)에 기록 (줄마다 flush 없음)
+        "MMAP_SEGMENT_MB": 4,        # mmap 세그먼트 1개 크기 (MB)
+        "MIRROR_LOGS": True,         # True 면 모든 로그를 SECONDARY_LOG_DIR 에도 비동기 복사 (보조 저장소 장애는 기본 저장소에 영향 없음)
+        "COMPRESS_LEVEL": 1,         # 로그 로테이션 zlib 압축 레벨 (1 = 가장 빠름 ~ 9)
+        "COMPRESS_CHUNK_KB": 64,     # 스트리밍 압축 청크 크기 (KB)
+        "COMPRESS_RATE_MB_S": 2.0,   # 비행 중 백그라운드 압축 읽기 속도 상한 (MB/s, 0 이면 제한 없음)
+        "COMPRESS_PAUSE_STATES": [1, 2, 3, 4],   # 압축을 일시 정지하는 비행 상태 (상승, 최고점, 하강, 모터 닫음)
+        "ROTATION_CHECK_INTERVAL": 60,           # 비행 중 디스크 사용량 확인 / 백그라운드 로테이션 주기 (초)
+        # 스트림별 group commit 정책 : MAX_RECORDS 개 또는 MAX_DELAY_MS 마다 flush (FSYNC 면 fsync 까지)
+        # 상태 변경 / 오류 기록은 항상 즉시 commit (lib/logging/durability.py)
+        "COMMIT_POLICY": {
+            "DEFAULT":          {"MAX_RECORDS": 32, "MAX_DELAY_MS": 1000, "FSYNC": False},
+            "SYSTEM_LOG":       {"MAX_RECORDS": 1,  "MAX_DELAY_MS": 0},       # main_system / error / debug.log
+            "CSV":              {"MAX_RECORDS": 32, "MAX_DELAY_MS": 1000},    # 앱 CSV 로그
+            "FLIGHT_RECORDER":  {"MAX_RECORDS": 64, "MAX_DELAY_MS": 1000},    # 고주파 바이너리 레코드
+            "BUS_RECORDER":     {"MAX_RECORDS": 256, "MAX_DELAY_MS": 1000},   # 라우터 프레임 기록 (BUS.RECORD)
+            "SENSOR_DRIVER":    {"MAX_RECORDS": 1,  "MAX_DELAY_MS": 0},       # sensorlogs/*.txt
+            "BAROMETER_DRIVER": {"MAX_RECORDS": 50, "MAX_DELAY_MS": 10000}    # sensorlogs/barometer.txt
+        }
+    },
+    
+    # 소프트웨어 버스 설정
+    "BUS": {
+        "ENCODING": "BINARY",        # TEXT("sender|receiver|mid|data"), BINARY(struct 헤더 + 스키마 페이로드)
+        "VALIDATE": False,           # 라우터에서 모든 메시지 전체 언패킹/검증 (디버그용)
+        "TRANSPORT": "PIPE",         # PIPE(앱별 파이프 + connection.wait), QUEUE(multiprocessing.Queue), SHM(앱별 공유 메모리 링)
+        "SHM_RING_SIZE": 65536,      # SHM 전송 시 앱당 링 크기 (bytes)
+        "OUTBOX_CAPACITY": 64,       # 목적지 앱별 DROP_OLDEST(HK) 대기 메시지 상한
+        "COMMAND_OUTBOX_CAPACITY": 1024,  # 목적지 앱별 NEVER_DROP(명령) 대기 hard cap (넘치면 거부 + ERROR 로그)
+        "TRACE": False,              # 메시지 지연 추적 (MID 별 p50/p99/max 를 HK 로 보고, BINARY 전용)
+        "BATCH_WINDOW_MS": 2,        # 앱 → 라우터 bulk lane 메시지 묶음 window (0 이면 batch 없음)
+        "BATCH_MAX": 16,             # batch 1개 최대 메시지 수
+        "HOT_ROUTES": [[1003, 14], [1402, 17]],  # [MID, 소비 AppID] 라우터 우회 직접 전달 (Barometer→FL 고도, FL→Motor 서보)
+        "RECORD": False,             # 라우팅된 모든 프레임을 RECORD_DIR/bus_<시각>.brec 에 기록 (재생 : python3 -m lib.core.busrecord replay)
+        "RECORD_DIR": "logs/bus"
+    },
+    
+    # 텔레메트리 블랙보드 (공유 메모리 최신값 슬롯)
+    "BLACKBOARD": {
+        "ENABLE": True,              # False 면 모든 텔레메트리를 버스 메시지로 발행
+        "NAME": "cansat_blackboard"  # 공유 메모리 세그먼트 이름
     },
     
     # 시스템 설정
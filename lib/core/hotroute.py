@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Direct peer-to-peer channels for declared hot routes (config.json BUS.HOT_ROUTES)
+지연에 민감한 흐름(Barometer → FlightLogic, FlightLogic → Motor)은 라우터를 거치지 않고
+생산 앱 → 소비 앱 전용 파이프로 직접 전달 (IPC 2 hop → 1 hop)
+
+- 생산 앱 : HotRouteQueue.put 이 hot MID 를 전용 파이프로 먼저 보내고
+  FLAG_MIRROR 를 켠 사본을 라우터로 보냄 (로깅/집계용, 라우터는 해당 소비 앱에 재전달하지 않음)
+- 전용 파이프가 가득 찼거나 끊긴 경우 원본 프레임을 라우터로 보내 기존 outbox 경로로 전달
+- 소비 앱 : MuxConnection 이 메인 파이프와 hot 파이프를 하나의 Connection 처럼 poll/recv (hot 우선)
+- mirror 표시가 바이너리 헤더 flag 이므로 BUS.ENCODING = BINARY 에서만 동작
+"""
+
+import os
+import select
+import threading
+from multiprocessing import connection
+
+from . import appargs
+from . import msgstructure
+from .config import get_config
+from ..logging import safe_log
+
+def _mid_owners() -> dict:
+    """MID → 해당 MID 를 정의한 앱의 AppID (생산 앱)"""
+    owners = {}
+    for arg in vars(appargs).values():
+        if isinstance(arg, type) and hasattr(arg, "AppID"):
+            for name, value in vars(arg).items():
+                if name.startswith("MID_"):
+                    owners.setdefault(value, arg.AppID)
+    return owners
+
+def load_hot_routes() -> dict:
+    """BUS.HOT_ROUTES ([[MID, 소비 AppID], ...]) → {MID: (생산 AppID, 소비 AppID)}"""
+    routes = {}
+    declared = get_config("BUS.HOT_ROUTES", []) or []
+    if not declared:
+        return routes
+    if msgstructure.BUS_ENCODING != msgstructure.ENCODING_BINARY:
+        safe_log("[HotRoute] hot routes require BUS.ENCODING = BINARY, all traffic goes through the router", "WARNING", True)
+        return routes
+
+    owners = _mid_owners()
+    for entry in declared:
+        try:
+            mid, receiver = int(entry[0]), int(entry[1])
+        except (TypeError, ValueError, IndexError):
+            safe_log(f"[HotRoute] invalid hot route entry {entry}, expected [MID, AppID]", "WARNING", True)
+            continue
+        if mid in routes:
+            safe_log(f"[HotRoute] duplicate hot route for MID {mid}, keeping {routes[mid]}", "WARNING", True)
+            continue
+        producer = owners.get(mid)
+        if producer is None:
+            safe_log(f"[HotRoute] unknown MID {mid} in hot routes", "WARNING", True)
+            continue
+        routes[mid] = (producer, receiver)
+    return routes
+
+def drain(reader) -> int:
+    """전용 파이프에 남은 메시지 폐기 (소비 앱 재시작 시 오래된 데이터 전달 방지)"""
+    count = 0
+    try:
+        while reader.poll():
+            reader.recv_bytes()
+            count += 1
+    except (EOFError, OSError):
+        pass
+    return count
+
+class HotRouteQueue:
+    """생산 앱 쪽 송신 어댑터 : multiprocessing.Queue 와 같은 put() 제공 (send_msg API 유지)"""
+
+    def __init__(self, queue, writers: dict):
+        self.queue = queue
+        self.writers = writers      # MID → 전용 파이프 송신단
+        self._lock = None
+        self._lock_pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_lock_pid"] = None
+        return state
+
+    def _producer_lock(self) -> threading.Lock:
+        # 프로세스마다 새 락 (fork 이후 부모의 락 상태를 물려받지 않음)
+        if self._lock_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._lock_pid = os.getpid()
+        return self._lock
+
+    def _send_direct(self, writer, msg: bytes) -> bool:
+        """쓰기 가능할 때만 전용 파이프로 전달 (생산 앱이 느린 소비 앱에 막히지 않음)"""
+        with self._producer_lock():
+            try:
+                _, writable, _ = select.select([], [writer], [], 0)
+                if not writable:
+                    return False
+                writer.send_bytes(msg)
+                return True
+            except (OSError, ValueError):
+                return False
+
+    def put(self, msg, *args, **kwargs) -> None:
+        writer = None
+        if isinstance(msg, bytes) and len(msg) >= msgstructure.HEADER_SIZE and msg[0] == msgstructure.BIN_MAGIC:
+            writer = self.writers.get(msgstructure.ROUTE.unpack_from(msg, msgstructure.ROUTE_OFFSET)[1])
+
+        if writer is not None and self._send_direct(writer, msg):
+            msg = msgstructure.mark_mirror(msg)
+        self.queue.put(msg, *args, **kwargs)
+
+class MuxConnection:
+    """소비 앱 쪽 수신 어댑터 : 메인 파이프 + hot 파이프를 Connection 과 같은 poll()/recv_bytes() 로 제공"""
+
+    def __init__(self, main_pipe, hot_readers):
+        self.main_pipe = main_pipe
+        self._conns = list(hot_readers) + [main_pipe]   # hot 파이프 우선
+
+    def poll(self, timeout: float = 0.0) -> bool:
+        return bool(connection.wait(self._conns, timeout))
+
+    def _next_ready(self):
+        ready = connection.wait(self._conns)
+        for conn in self._conns:
+            if conn in ready:
+                return conn
+
+    def recv_bytes(self) -> bytes:
+        return self._next_ready().recv_bytes()
+
+    def recv_bytes_into(self, buf) -> int:
+        return self._next_ready().recv_bytes_into(buf)
+
+    def send_bytes(self, data) -> None:
+        self.main_pipe.send_bytes(data)
+
+    def fileno(self) -> int:
+        return self.main_pipe.fileno()
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -1,5 +1,9 @@
+import struct
+import time
 from multiprocessing import Queue
 from . import types
+from . import appargs
+from .config import get_config
 from ..logging import safe_log
 
 class MsgStructure:
@@ -7,108 +11,387 @@ class MsgStructure:
     receiver_app: types.AppID = None # AppID of receiver
     MsgID: types.MID = None # Message ID should be unique for identification
     data: str = None # Data
+    values: tuple = None # Typed payload values (schema MIDs)
 
-def fill_msg(target: MsgStructure, _sender : int, _receiver : int, _MsgID : int, _data: str):
+# ────────────────────────── 바이너리 인코딩 ──────────────────────────
+# Binary frame : fixed header + payload
+#   magic(u8) | flags(u8) | sender(u16) | receiver(u16) | MsgID(u16) | length(u16) | payload
+# Payload is struct-packed by the MID schema (FLAG_SCHEMA) or utf-8 text otherwise.
+BIN_MAGIC = 0xA5
+FLAG_SCHEMA = 0x01
+FLAG_MIRROR = 0x02   # hot route 로 이미 직접 전달된 프레임의 라우터용 사본 (집계 전용)
+FLAG_TRACE = 0x04    # payload 뒤에 trace trailer 포함 (lib/core/tracing.py)
+
+HEADER = struct.Struct("<BBHHHH")
+HEADER_SIZE = HEADER.size
+
+# 지연 추적 trailer : 송신 시각(f64) | 라우터 dequeue 시각(f64), time.monotonic 기준
+TRACE = struct.Struct("<dd")
+
+# 라우팅용 헤더 일부 : receiver(u16) | MsgID(u16)
+ROUTE = struct.Struct("<HH")
+ROUTE_OFFSET = 4
+
+# 헤더 주소 부분 : sender(u16) | receiver(u16) | MsgID(u16)
+ADDRESS = struct.Struct("<HHH")
+ADDRESS_OFFSET = 2
+
+# Batch frame : 여러 프레임을 IPC 1회로 전달 (lib/core/batchqueue.py, main.flush_outboxes)
+#   magic(u8) | reserved(u8) | count(u16) | { length(u32) | frame } * count
+BATCH_MAGIC = 0xB5
+BATCH_HEADER = struct.Struct("<BBH")
+BATCH_ITEM = struct.Struct("<I")
+BATCH_MAX_BYTES = 4096   # batch 1개 최대 크기 (파이프 원자적 쓰기 단위 PIPE_BUF)
+
+ENCODING_TEXT = "TEXT"
+ENCODING_BINARY = "BINARY"
+
+# 버스 인코딩 모드 (config.json BUS.ENCODING)
+BUS_ENCODING = str(get_config("BUS.ENCODING", ENCODING_TEXT)).upper()
+
+# 버스 지연 추적 (config.json BUS.TRACE, 바이너리 인코딩에서만 동작)
+BUS_TRACE = bool(get_config("BUS.TRACE", False))
+
+# struct 포맷 문자 → 텍스트 페이로드 변환 함수
+_TEXT_CONVERTERS = {
+    'f': float, 'd': float, 'e': float,
+    'b': int, 'B': int, 'h': int, 'H': int, 'i': int, 'I': int, 'l': int, 'L': int, 'q': int, 'Q': int,
+    '?': lambda s: s.strip() in ("1", "True", "true"),
+}
+
+def _build_schema_table() -> dict:
+    """appargs 의 각 AppArg.SCHEMAS 를 모아 MID → struct.Struct 테이블 생성"""
+    table = {}
+    for arg in vars(appargs).values():
+        if not isinstance(arg, type):
+            continue
+        schemas = getattr(arg, "SCHEMAS", None)
+        if not schemas:
+            continue
+        for mid, fmt in schemas.items():
+            table[mid] = struct.Struct("<" + fmt)
+    return table
+
+# MID → payload schema
+PAYLOAD_SCHEMAS: dict = _build_schema_table()
+
+def _build_subscriber_table() -> dict:
+    """appargs.SUBSCRIPTIONS 를 뒤집어 MID → 구독 AppID tuple 테이블 생성"""
+    table = {}
+    for app_id, mids in getattr(appargs, "SUBSCRIPTIONS", {}).items():
+        for mid in mids:
+            table[mid] = table.get(mid, ()) + (app_id,)
+    return table
+
+# MID → subscribers (PUBLISH_APPID 로 발행된 메시지의 fan-out 대상)
+SUBSCRIBERS: dict = _build_subscriber_table()
+
+# 블랙보드 슬롯으로 전달되는 MID
+_BLACKBOARD_MIDS = frozenset(getattr(appargs, "BLACKBOARD_MIDS", ()))
+
+def _schema_converters(schema: struct.Struct) -> list:
+    converters = []
+    count = ""
+    for ch in schema.format.lstrip("<>=!@"):
+        if ch.isdigit():
+            count += ch
+            continue
+        converters.extend([_TEXT_CONVERTERS.get(ch, str)] * int(count or 1))
+        count = ""
+    return converters
+
+# MID → 텍스트 페이로드 변환 함수 목록 (TEXT 모드 수신 시 사용)
+_PAYLOAD_CONVERTERS = {mid: _schema_converters(schema) for mid, schema in PAYLOAD_SCHEMAS.items()}
+
+def fill_msg(target: MsgStructure, _sender : int, _receiver : int, _MsgID : int, _data):
     try:
         # 입력값 검증
         if not isinstance(_sender, int) or not isinstance(_receiver, int) or not isinstance(_MsgID, int):
-            safe_log(f"[MsgStructure] Invalid type: sender={type(_sender)}, receiver={type(_receiver)}, MsgID={type(_MsgID)}", True)
+            safe_log(f"[MsgStructure] Invalid type: sender={type(_sender)}, receiver={type(_receiver)}, MsgID={type(_MsgID)}", "ERROR", True)
             return False
-        
-        if not isinstance(_data, str):
-            safe_log(f"[MsgStructure] Data must be string, got {type(_data)}", True)
+
+        # 값 목록(tuple/list)은 스키마에 따라 인코딩됨
+        if isinstance(_data, (tuple, list)):
+            values = tuple(_data)
+            data = None
+        elif isinstance(_data, str):
+            values = None
+            data = _data
+        else:
+            safe_log(f"[MsgStructure] Data must be string or tuple, got {type(_data)}", "ERROR", True)
             return False
-            
-        if '|' in _data:
-            safe_log(f"[MsgStructure] Data should not contain '|' since it is used to divide fields", True)
+
+        if data is not None and '|' in data:
+            safe_log(f"[MsgStructure] Data should not contain '|' since it is used to divide fields", "ERROR", True)
             return False
-            
+
         # 음수 값 검증
         if _sender < 0 or _receiver < 0 or _MsgID < 0:
-            safe_log(f"[MsgStructure] Negative values not allowed: sender={_sender}, receiver={_receiver}, MsgID={_MsgID}", True)
+            safe_log(f"[MsgStructure] Negative values not allowed: sender={_sender}, receiver={_receiver}, MsgID={_MsgID}", "ERROR", True)
             return False
-            
+
         target.sender_app = _sender
         target.receiver_app = _receiver
         target.MsgID = _MsgID
-        target.data = _data
+        target.data = data
+        target.values = values
         return True
     except Exception as e:
-        safe_log(f"[MsgStructure] Error when filling message: {e}", True)
+        safe_log(f"[MsgStructure] Error when filling message: {e}", "ERROR", True)
         return False
 
+def _text_payload(target: MsgStructure) -> str:
+    if target.data is not None:
+        return target.data
+    # repr 기반 문자열 변환으로 정밀도 손실 없음
+    return ",".join(str(v) for v in target.values)
+
 def pack_msg (target: MsgStructure) -> str:
     try:
         # None 체크 및 타입 검증
-        if target.sender_app is None or target.receiver_app is None or target.MsgID is None or target.data is None:
-            safe_log(f"[MsgStructure] Error when packing message: message is not filled", True)
+        if target.sender_app is None or target.receiver_app is None or target.MsgID is None or (target.data is None and target.values is None):
+            safe_log(f"[MsgStructure] Error when packing message: message is not filled", "ERROR", True)
             return "ERROR"
-            
+
         # 타입 검증
-        if not isinstance(target.sender_app, int) or not isinstance(target.receiver_app, int) or not isinstance(target.MsgID, int) or not isinstance(target.data, str):
-            safe_log(f"[MsgStructure] Error when packing message: invalid types", True)
+        if not isinstance(target.sender_app, int) or not isinstance(target.receiver_app, int) or not isinstance(target.MsgID, int):
+            safe_log(f"[MsgStructure] Error when packing message: invalid types", "ERROR", True)
             return "ERROR"
-            
-        return str(target.sender_app) + "|" + str(target.receiver_app) + "|" + str(target.MsgID) + "|" + target.data
+
+        return str(target.sender_app) + "|" + str(target.receiver_app) + "|" + str(target.MsgID) + "|" + _text_payload(target)
     except Exception as e:
-        safe_log(f"[MsgStructure] Error when packing message: {e}", True)
+        safe_log(f"[MsgStructure] Error when packing message: {e}", "ERROR", True)
         return "ERROR"
-    
-def unpack_msg (target : MsgStructure, msg: str) -> bool:
+
+def pack_msg_binary (target: MsgStructure) -> bytes:
+    """바이너리 프레임으로 패킹. 실패 시 None 반환"""
     try:
+        if target.sender_app is None or target.receiver_app is None or target.MsgID is None or (target.data is None and target.values is None):
+            safe_log(f"[MsgStructure] Error when packing binary message: message is not filled", "ERROR", True)
+            return None
+
+        schema = PAYLOAD_SCHEMAS.get(target.MsgID)
+        if target.values is not None and schema is not None:
+            payload = schema.pack(*target.values)
+            flags = FLAG_SCHEMA
+        else:
+            payload = _text_payload(target).encode('utf-8')
+            flags = 0
+
+        if BUS_TRACE:
+            return HEADER.pack(BIN_MAGIC, flags | FLAG_TRACE, target.sender_app, target.receiver_app, target.MsgID, len(payload)) + payload + TRACE.pack(time.monotonic(), 0.0)
+        return HEADER.pack(BIN_MAGIC, flags, target.sender_app, target.receiver_app, target.MsgID, len(payload)) + payload
+    except Exception as e:
+        safe_log(f"[MsgStructure] Error when packing binary message: {e}", "ERROR", True)
+        return None
+
+def encode_msg (target: MsgStructure):
+    """설정된 버스 인코딩(BUS.ENCODING)으로 패킹. 실패 시 None 반환"""
+    if BUS_ENCODING == ENCODING_BINARY:
+        return pack_msg_binary(target)
+    packed = pack_msg(target)
+    return None if packed == "ERROR" else packed
+
+def _unpack_binary (target: MsgStructure, msg) -> bool:
+    if len(msg) < HEADER_SIZE:
+        safe_log(f"[MsgStructure] Error when unpacking message: frame shorter than header ({len(msg)} bytes)", "ERROR", True)
+        return False
+
+    _, flags, sender_app, receiver_app, msg_id, length = HEADER.unpack_from(msg)
+    if len(msg) < HEADER_SIZE + length:
+        safe_log(f"[MsgStructure] Error when unpacking message: truncated payload ({len(msg) - HEADER_SIZE}/{length} bytes)", "ERROR", True)
+        return False
+
+    target.sender_app = sender_app
+    target.receiver_app = receiver_app
+    target.MsgID = msg_id
+    if flags & FLAG_SCHEMA:
+        schema = PAYLOAD_SCHEMAS.get(msg_id)
+        if schema is None or schema.size != length:
+            safe_log(f"[MsgStructure] Error when unpacking message: no matching schema for MID {msg_id}", "ERROR", True)
+            return False
+        target.values = schema.unpack_from(msg, HEADER_SIZE)
+        target.data = None
+    else:
+        target.values = None
+        target.data = bytes(msg[HEADER_SIZE:HEADER_SIZE + length]).decode('utf-8')
+    return True
+
+def unpack_msg (target : MsgStructure, msg) -> bool:
+    try:
+        # 바이트 메시지: 바이너리 프레임 또는 utf-8 텍스트
+        if isinstance(msg, (bytes, bytearray, memoryview)):
+            if len(msg) > 0 and msg[0] == BIN_MAGIC:
+                return _unpack_binary(target, msg)
+            msg = bytes(msg).decode('utf-8')
+
         # 입력 검증
         if not isinstance(msg, str):
-            safe_log(f"[MsgStructure] Error when unpacking message: msg must be string, got {type(msg)}", True)
+            safe_log(f"[MsgStructure] Error when unpacking message: msg must be string or bytes, got {type(msg)}", "ERROR", True)
             return False
-            
+
         if not msg or msg.strip() == "":
-            safe_log(f"[MsgStructure] Error when unpacking message: empty message", True)
+            safe_log(f"[MsgStructure] Error when unpacking message: empty message", "ERROR", True)
             return False
-            
+
         msg_list = msg.split('|')
         if len(msg_list) != 4:
-            safe_log(f"[MsgStructure] Error when unpacking message: Expected length of msg_list of 4 but {len(msg_list)}", True)
+            safe_log(f"[MsgStructure] Error when unpacking message: Expected length of msg_list of 4 but {len(msg_list)}", "ERROR", True)
             return False
-            
+
         # 숫자 변환 검증
         try:
             sender_app = int(msg_list[0])
             receiver_app = int(msg_list[1])
             msg_id = int(msg_list[2])
         except ValueError as e:
-            safe_log(f"[MsgStructure] Error when unpacking message: invalid numeric values: {e}", True)
+            safe_log(f"[MsgStructure] Error when unpacking message: invalid numeric values: {e}", "ERROR", True)
             return False
-            
+
         # 음수 값 검증
         if sender_app < 0 or receiver_app < 0 or msg_id < 0:
-            safe_log(f"[MsgStructure] Error when unpacking message: negative values not allowed", True)
+            safe_log(f"[MsgStructure] Error when unpacking message: negative values not allowed", "ERROR", True)
             return False
-            
+
         target.sender_app = sender_app
         target.receiver_app = receiver_app
         target.MsgID = msg_id
         target.data = msg_list[3]
+        target.values = None
         return True
     except Exception as e:
-        safe_log(f"[MsgStructure] Error when unpacking message: {e}", True)
+        safe_log(f"[MsgStructure] Error when unpacking message: {e}", "ERROR", True)
         return False
-    
+
+def peek_header (msg):
+    """
+    헤더만 읽어 (sender, receiver, MsgID) 반환. 페이로드는 파싱/복사하지 않음
+    헤더를 읽을 수 없으면 None 반환
+    """
+    try:
+        if isinstance(msg, (bytes, bytearray, memoryview)) and len(msg) >= HEADER_SIZE and msg[0] == BIN_MAGIC:
+            return ADDRESS.unpack_from(msg, ADDRESS_OFFSET)
+
+        # 텍스트 프레임 : sender|receiver|MsgID|data
+        sep = '|' if isinstance(msg, str) else b'|'
+        first = msg.find(sep)
+        second = msg.find(sep, first + 1)
+        third = msg.find(sep, second + 1)
+        if first < 0 or second < 0 or third < 0:
+            return None
+        return int(msg[:first]), int(msg[first + 1:second]), int(msg[second + 1:third])
+    except (ValueError, TypeError, AttributeError, struct.error):
+        return None
+
+def pack_batch (frames) -> bytes:
+    """프레임 목록을 batch 프레임 1개로 묶음. 프레임이 1개면 그대로 반환"""
+    if len(frames) == 1:
+        return frames[0]
+    parts = [BATCH_HEADER.pack(BATCH_MAGIC, 0, len(frames))]
+    for frame in frames:
+        parts.append(BATCH_ITEM.pack(len(frame)))
+        parts.append(frame)
+    return b"".join(parts)
+
+def is_batch (msg) -> bool:
+    return len(msg) >= BATCH_HEADER.size and msg[0] == BATCH_MAGIC
+
+def iter_batch (msg):
+    """batch 프레임 안의 프레임(bytes)을 순서대로 반환. 잘린 항목은 건너뜀"""
+    _, _, count = BATCH_HEADER.unpack_from(msg, 0)
+    offset = BATCH_HEADER.size
+    for _ in range(count):
+        if offset + BATCH_ITEM.size > len(msg):
+            return
+        length = BATCH_ITEM.unpack_from(msg, offset)[0]
+        offset += BATCH_ITEM.size
+        if offset + length > len(msg):
+            return
+        yield bytes(msg[offset:offset + length])
+        offset += length
+
+def mark_mirror (msg: bytes) -> bytes:
+    """바이너리 프레임에 FLAG_MIRROR 를 켠 사본 반환"""
+    return msg[:1] + bytes((msg[1] | FLAG_MIRROR,)) + msg[2:]
+
+def is_mirror (msg) -> bool:
+    return isinstance(msg, (bytes, bytearray)) and len(msg) >= HEADER_SIZE and msg[0] == BIN_MAGIC and bool(msg[1] & FLAG_MIRROR)
+
+def payload_values (target: MsgStructure):
+    """
+    메시지 페이로드를 값 tuple 로 반환 (인코딩 모드와 무관)
+    바이너리 스키마 메시지는 그대로, 텍스트 메시지는 MID 스키마에 따라 변환
+    형식이 맞지 않으면 None 반환
+    """
+    if target.values is not None:
+        return target.values
+    if target.data is None:
+        return None
+
+    converters = _PAYLOAD_CONVERTERS.get(target.MsgID)
+    if converters is None:
+        return tuple(target.data.split(','))
+    return _decode_text(target, converters)
+
+def _decode_text (target: MsgStructure, converters: list):
+    fields = target.data.split(',')
+    if len(fields) != len(converters):
+        safe_log(f"[MsgStructure] MID {target.MsgID}: expected {len(converters)} fields, got {len(fields)}", "ERROR", True)
+        return None
+    try:
+        target.values = tuple(conv(field) for conv, field in zip(converters, fields))
+    except ValueError as e:
+        safe_log(f"[MsgStructure] MID {target.MsgID}: invalid payload value: {e}", "ERROR", True)
+        return None
+    return target.values
+
+def compile_decoder (mid: types.MID):
+    """
+    MID 전용 payload 디코더 생성 (디스패처 등록 시 1회)
+    스키마/변환 함수 조회를 미리 끝낸 함수 반환 : decoder(target) → 값 tuple 또는 None
+    스키마가 없는 MID 는 None 반환 (텍스트 그대로 사용)
+    """
+    converters = _PAYLOAD_CONVERTERS.get(mid)
+    if converters is None:
+        return None
+
+    def decode(target: MsgStructure):
+        if target.values is not None:
+            return target.values
+        if target.data is None:
+            return None
+        return _decode_text(target, converters)
+    return decode
+
 # Send message for SB Methods to route
-def send_msg (Main_Queue : Queue, target: MsgStructure, _sender : types.AppID, _receiver : types.AppID, _MsgID : types.MID, _data: str):
+def send_msg (Main_Queue : Queue, target: MsgStructure, _sender : types.AppID, _receiver : types.AppID, _MsgID : types.MID, _data):
     try:
         # Fill Message
         fill_msg(target, _sender, _receiver, _MsgID, _data)
-        
-        # Pack Message
-        packed_msg = pack_msg(target)
-        
+
+        # Pack Message (BUS.ENCODING 에 따라 텍스트 또는 바이너리)
+        packed_msg = encode_msg(target)
+
         # Send Message
-        if packed_msg == "ERROR":
-            safe_log(f"[MsgStructure] Error when sending message: packing failed", True)
+        if packed_msg is None:
+            safe_log(f"[MsgStructure] Error when sending message: packing failed", "ERROR", True)
             return False
-            
+
         Main_Queue.put(packed_msg)
         return True
     except Exception as e:
-        safe_log(f"[MsgStructure] Error when sending message: {e}", True)
-        return False
\ No newline at end of file
+        safe_log(f"[MsgStructure] Error when sending message: {e}", "ERROR", True)
+        return False
+
+# Publish message to every app subscribed to the MID
+def publish_msg (Main_Queue : Queue, target: MsgStructure, _sender : types.AppID, _MsgID : types.MID, _data):
+    # 블랙보드 MID 는 최신값 슬롯에만 기록 (버스 트래픽 없음), 블랙보드가 없으면 버스로 발행
+    if _MsgID in _BLACKBOARD_MIDS and isinstance(_data, (tuple, list)):
+        from .blackboard import get_blackboard
+        board = get_blackboard()
+        if board is not None:
+            try:
+                return board.write(_MsgID, _data)
+            except Exception as e:
+                safe_log(f"[MsgStructure] Blackboard write failed for MID {_MsgID}: {e}", "WARNING", True)
+    return send_msg(Main_Queue, target, _sender, appargs.PUBLISH_APPID, _MsgID, _data)
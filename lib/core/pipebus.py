@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Per-app inbound pipe transport for the software bus (BUS.TRANSPORT = "PIPE")
+앱마다 앱 → 라우터 전용 단방향 파이프 1개. 라우터는 multiprocessing.connection.wait 로
+모든 파이프를 한 번에 대기하므로 트래픽이 있을 때만 깨어남 (주기 polling 없음)
+
+- PipeQueue : 앱 쪽 송신 어댑터 (multiprocessing.Queue 와 같은 put)
+  같은 앱 안의 여러 스레드는 프로세스 로컬 threading.Lock 으로 직렬화
+- PipeBus   : 라우터 쪽 수신기 (Queue 의 get/get_nowait/empty 와 동일 사용)
+  준비된 파이프에서 1개씩 번갈아 읽어 한 앱이 라우터를 독점하지 않음
+"""
+
+import os
+import queue
+import select
+import threading
+import time
+from collections import deque
+from multiprocessing import Pipe, connection
+
+PUT_TIMEOUT = 0.1   # 라우터가 파이프를 비우지 못할 때 put 최대 대기 (초)
+
+class PipeQueue:
+    """앱 쪽 송신 어댑터 : multiprocessing.Queue 와 같은 put() 제공 (send_msg API 유지)"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self._lock = None
+        self._lock_pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_lock_pid"] = None
+        return state
+
+    def _producer_lock(self) -> threading.Lock:
+        # 프로세스마다 새 락 (fork 이후 부모의 락 상태를 물려받지 않음)
+        if self._lock_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._lock_pid = os.getpid()
+        return self._lock
+
+    def put(self, msg, block: bool = True, timeout: float = None) -> None:
+        if isinstance(msg, str):
+            msg = msg.encode('utf-8')
+
+        with self._producer_lock():
+            # 라우터가 멈춰 있으면 앱 스레드를 무한정 막지 않고 queue.Full
+            wait = (PUT_TIMEOUT if timeout is None else timeout) if block else 0
+            _, writable, _ = select.select([], [self.writer], [], wait)
+            if not writable:
+                raise queue.Full
+            self.writer.send_bytes(msg)
+
+class PipeBus:
+    """라우터 쪽 수신기 : 앱별 파이프를 connection.wait 로 대기"""
+
+    def __init__(self):
+        self.pipes: dict = {}       # AppID → (수신단, 송신단)
+        self._readers: list = []
+        self._ready = deque()
+
+    def producer(self, app_id) -> PipeQueue:
+        """앱 전용 송신 큐 반환 (재시작 시 같은 파이프 재사용)"""
+        if app_id not in self.pipes:
+            self.pipes[app_id] = Pipe(duplex=False)
+            self._readers.append(self.pipes[app_id][0])
+        return PipeQueue(self.pipes[app_id][1])
+
+    def connections(self) -> list:
+        return list(self._readers)
+
+    def _wait(self, timeout) -> None:
+        if not self._ready and self._readers:
+            self._ready.extend(connection.wait(self._readers, timeout))
+
+    def get_nowait(self) -> bytes:
+        self._wait(0)
+        while self._ready:
+            try:
+                return self._ready.popleft().recv_bytes()
+            except (EOFError, OSError):
+                continue
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: float = None) -> bytes:
+        try:
+            return self.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+
+        if not self._readers:
+            # 등록된 앱이 없으면 대기만 (connection.wait 는 빈 목록에서 바로 반환)
+            if timeout is not None:
+                time.sleep(timeout)
+            raise queue.Empty
+        self._wait(timeout)
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        return not self._ready and not (self._readers and connection.wait(self._readers, 0))
+
+    def close(self) -> None:
+        for reader, writer in self.pipes.values():
+            reader.close()
+            writer.close()
+        self.pipes.clear()
+        self._readers.clear()
+        self._ready.clear()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Shared-memory ring buffer transport for the software bus
+앱 → 라우터 방향 메시지를 multiprocessing.shared_memory 링으로 전달 (BUS.TRANSPORT = "SHM")
+
+- 앱마다 링 1개 (단일 생산자 / 단일 소비자, 락 없음)
+  같은 앱 안의 여러 스레드는 프로세스 로컬 threading.Lock 으로 직렬화
+- 레코드 : length(u32) + crc(u32) + frame bytes, 링 끝에서 자연스럽게 wrap
+- 라우터가 대기 중일 때만 세마포어(doorbell)로 깨움 → 송신 경로에 공유 락 없음
+
+메모리 순서
+- head/tail 은 native 정렬 u64 (memcpy 1회 store) 라 값 자체는 찢어지지 않지만,
+  ARM 등 약한 메모리 순서 CPU 에서는 소비자가 head 를 데이터보다 먼저 볼 수 있음
+- 그래서 레코드마다 crc32(frame, 스트림 위치) 를 기록하고 소비자가 검증
+  불일치(아직 보이지 않은 레코드, 이전 바퀴의 같은 자리 레코드)는 tail 을 옮기지 않고 다음 read 에서 재시도
+- tail 공개는 crc 검증 분기 뒤에 있으므로 (제어 의존) 생산자는 소비자가 다 읽은 영역만 덮어씀
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from multiprocessing import RawValue, Semaphore, shared_memory
+
+# 링 헤더 : head(u64, 생산자 쓰기 위치) | tail(u64, 소비자 읽기 위치)
+_INDEX = struct.Struct("Q")     # native 정렬 : 한 번의 8 byte store 로 기록
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = 8
+_DATA_OFFSET = 64           # 헤더를 데이터 영역과 캐시 라인 분리
+_RECORD = struct.Struct("<II")  # length, crc32(frame, 스트림 위치)
+
+DEFAULT_RING_SIZE = 64 * 1024   # 앱당 링 데이터 영역 (bytes)
+PUT_TIMEOUT = 0.1               # 링이 가득 찼을 때 put 최대 대기 (초)
+_PUT_RETRY_SLEEP = 0.0005
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python 3.13+ : 자식 프로세스가 resource_tracker 에 중복 등록하지 않도록
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+class ShmRing:
+    """단일 생산자/단일 소비자 바이트 링 (공유 메모리)"""
+
+    def __init__(self, size: int = DEFAULT_RING_SIZE, name: str = None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=_DATA_OFFSET + size)
+            self.shm.buf[:_DATA_OFFSET] = bytes(_DATA_OFFSET)
+            self.owner = True
+        else:
+            self.shm = _attach_shm(name)
+            self.owner = False
+        self.capacity = size
+        self.buf = self.shm.buf
+
+    # 자식 프로세스로 전달 시 이름으로 다시 attach
+    def __reduce__(self):
+        return (ShmRing, (self.capacity, self.shm.name))
+
+    def _head(self) -> int:
+        return _INDEX.unpack_from(self.buf, _HEAD_OFFSET)[0]
+
+    def _tail(self) -> int:
+        return _INDEX.unpack_from(self.buf, _TAIL_OFFSET)[0]
+
+    def _copy_in(self, pos: int, data) -> None:
+        off = pos % self.capacity
+        first = min(len(data), self.capacity - off)
+        self.buf[_DATA_OFFSET + off:_DATA_OFFSET + off + first] = data[:first]
+        if first < len(data):
+            self.buf[_DATA_OFFSET:_DATA_OFFSET + len(data) - first] = data[first:]
+
+    def _copy_out(self, pos: int, length: int) -> bytes:
+        off = pos % self.capacity
+        first = min(length, self.capacity - off)
+        data = bytes(self.buf[_DATA_OFFSET + off:_DATA_OFFSET + off + first])
+        if first < length:
+            data += bytes(self.buf[_DATA_OFFSET:_DATA_OFFSET + length - first])
+        return data
+
+    def empty(self) -> bool:
+        return self._head() == self._tail()
+
+    @staticmethod
+    def _crc(data, pos: int) -> int:
+        # 위치를 seed 로 → 이전 바퀴에 같은 offset 에 남은 레코드는 검증 실패
+        return zlib.crc32(data, pos & 0xFFFFFFFF)
+
+    def write(self, data: bytes) -> bool:
+        """레코드 1개 기록 (생산자 전용). 공간 부족 시 False"""
+        need = _RECORD.size + len(data)
+        if need > self.capacity:
+            raise ValueError(f"message of {len(data)} bytes exceeds ring capacity {self.capacity}")
+
+        head = self._head()
+        if self.capacity - (head - self._tail()) < need:
+            return False
+
+        self._copy_in(head, _RECORD.pack(len(data), self._crc(data, head)))
+        self._copy_in(head + _RECORD.size, data)
+        # 데이터 기록 후 head 공개 (순서가 뒤바뀌어 보여도 소비자의 crc 검증이 걸러냄)
+        _INDEX.pack_into(self.buf, _HEAD_OFFSET, head + need)
+        return True
+
+    def read(self):
+        """레코드 1개 읽기 (소비자 전용). 비어 있거나 레코드가 아직 다 보이지 않으면 None"""
+        tail = self._tail()
+        available = self._head() - tail
+        if available <= 0:
+            return None
+
+        length, crc = _RECORD.unpack(self._copy_out(tail, _RECORD.size))
+        if _RECORD.size + length > available:
+            return None
+        data = self._copy_out(tail + _RECORD.size, length)
+        if self._crc(data, tail) != crc:
+            return None
+        _INDEX.pack_into(self.buf, _TAIL_OFFSET, tail + _RECORD.size + length)
+        return data
+
+    def close(self) -> None:
+        try:
+            self.buf = None
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+class RingQueue:
+    """앱 쪽 송신 어댑터 : multiprocessing.Queue 와 같은 put() 제공 (send_msg API 유지)"""
+
+    def __init__(self, ring: ShmRing, waiting, bell):
+        self.ring = ring
+        self._waiting = waiting
+        self._bell = bell
+        self._lock = None
+        self._lock_pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_lock_pid"] = None
+        return state
+
+    def _producer_lock(self) -> threading.Lock:
+        # 프로세스마다 새 락 (fork 이후 부모의 락 상태를 물려받지 않음)
+        if self._lock_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._lock_pid = os.getpid()
+        return self._lock
+
+    def put(self, msg, block: bool = True, timeout: float = None) -> None:
+        if isinstance(msg, str):
+            msg = msg.encode('utf-8')
+
+        deadline = time.monotonic() + (PUT_TIMEOUT if timeout is None else timeout)
+        with self._producer_lock():
+            while not self.ring.write(msg):
+                if not block or time.monotonic() >= deadline:
+                    raise queue.Full
+                time.sleep(_PUT_RETRY_SLEEP)
+
+        # 라우터가 대기 중일 때만 doorbell
+        if self._waiting.value:
+            self._waiting.value = 0
+            self._bell.release()
+
+class RingBus:
+    """라우터 쪽 수신기 : 앱별 링을 round-robin 으로 읽음 (multiprocessing.Queue 의 get 과 동일 사용)"""
+
+    def __init__(self, ring_size: int = DEFAULT_RING_SIZE):
+        self.ring_size = ring_size
+        self.rings: dict = {}
+        self._order: list = []
+        self._next = 0
+        self._waiting = RawValue('b', 0)
+        self._bell = Semaphore(0)
+
+    def producer(self, app_id) -> RingQueue:
+        """앱 전용 송신 큐 반환 (재시작 시 같은 링 재사용)"""
+        if app_id not in self.rings:
+            self.rings[app_id] = ShmRing(self.ring_size)
+            self._order.append(self.rings[app_id])
+        return RingQueue(self.rings[app_id], self._waiting, self._bell)
+
+    def get_nowait(self) -> bytes:
+        count = len(self._order)
+        for i in range(count):
+            index = (self._next + i) % count
+            msg = self._order[index].read()
+            if msg is not None:
+                self._next = index + 1
+                return msg
+        raise queue.Empty
+
+    def get(self, block: bool = True, timeout: float = None) -> bytes:
+        try:
+            return self.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # 대기 표시 후 다시 확인 → 표시 직전에 들어온 메시지를 놓치지 않음
+            self._waiting.value = 1
+            try:
+                msg = self.get_nowait()
+                self._waiting.value = 0
+                return msg
+            except queue.Empty:
+                pass
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self._waiting.value = 0
+                raise queue.Empty
+            self._bell.acquire(timeout=remaining)
+            try:
+                return self.get_nowait()
+            except queue.Empty:
+                continue
+
+    def empty(self) -> bool:
+        return all(ring.empty() for ring in self._order)
+
+    def close(self) -> None:
+        for ring in self._order:
+            ring.close()
+        self.rings.clear()
+        self._order.clear()
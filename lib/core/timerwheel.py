@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Hashed timer wheel for the router's periodic jobs
+작업은 만료 tick % 슬롯 수 위치의 슬롯에 저장되고, 한 바퀴 이상 남은 작업은 만료 tick 비교로 건너뜀
+라우터는 next_timeout() 만큼만 대기하므로 트래픽이나 타이머 만료가 없으면 깨어나지 않음
+"""
+
+import math
+import time
+
+from ..logging import safe_log
+
+DEFAULT_TICK = 0.05     # 타이머 해상도 (초)
+DEFAULT_SLOTS = 256     # 슬롯 수 (한 바퀴 = 12.8초)
+
+class _Job:
+    __slots__ = ("interval", "callback", "deadline_tick")
+
+    def __init__(self, interval, callback):
+        self.interval = interval        # None 이면 1회성
+        self.callback = callback
+        self.deadline_tick = 0
+
+class TimerWheel:
+    def __init__(self, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS):
+        self.tick = tick
+        self.slots = [[] for _ in range(slots)]
+        self._cursor = self._tick_of(time.monotonic())
+        self._jobs = 0
+
+    def _tick_of(self, t: float) -> int:
+        return int(t / self.tick)
+
+    def _insert(self, job: _Job, deadline: float) -> None:
+        job.deadline_tick = max(math.ceil(deadline / self.tick), self._cursor + 1)
+        self.slots[job.deadline_tick % len(self.slots)].append(job)
+        self._jobs += 1
+
+    def every(self, interval: float, callback) -> None:
+        """interval 초마다 callback 실행 (첫 실행은 interval 후)"""
+        self._insert(_Job(interval, callback), time.monotonic() + interval)
+
+    def after(self, delay: float, callback) -> None:
+        """delay 초 후 callback 1회 실행"""
+        self._insert(_Job(None, callback), time.monotonic() + delay)
+
+    def run_due(self) -> int:
+        """만료된 작업 실행. 실행한 작업 수 반환"""
+        now = time.monotonic()
+        now_tick = self._tick_of(now)
+        ran = 0
+        while self._cursor < now_tick:
+            self._cursor += 1
+            slot = self.slots[self._cursor % len(self.slots)]
+            due = [job for job in slot if job.deadline_tick <= self._cursor]
+            if not due:
+                continue
+            slot[:] = [job for job in slot if job.deadline_tick > self._cursor]
+            self._jobs -= len(due)
+
+            for job in due:
+                # 주기 유지, 지연된 경우에는 몰아서 실행하지 않도록 현재 시각 기준으로 재등록
+                if job.interval is not None:
+                    deadline = job.deadline_tick * self.tick + job.interval
+                    self._insert(job, deadline if deadline > now else now + job.interval)
+                try:
+                    job.callback()
+                except Exception as e:
+                    safe_log(f"[TimerWheel] job {getattr(job.callback, '__name__', job.callback)} failed: {e}", "ERROR", True)
+                ran += 1
+        return ran
+
+    def next_timeout(self, limit: float = 1.0) -> float:
+        """다음 작업 만료까지 남은 시간 (초, 최대 limit)"""
+        if not self._jobs:
+            return limit
+        now = time.monotonic()
+        span = min(len(self.slots), int(limit / self.tick) + 1)
+        for offset in range(1, span + 1):
+            tick = self._cursor + offset
+            if any(job.deadline_tick <= tick for job in self.slots[tick % len(self.slots)]):
+                # tick 경계를 확실히 넘도록 1ms 여유
+                return min(limit, max(0.0, tick * self.tick - now + 0.001))
+        return limit
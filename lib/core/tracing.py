@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+End-to-end bus latency tracing (config.json BUS.TRACE)
+바이너리 프레임 payload 뒤에 trace trailer (송신 시각, 라우터 dequeue 시각 : time.monotonic, f64) 를 붙여
+MID 별 지연 히스토그램을 수집. CLOCK_MONOTONIC 은 프로세스 간 공유되므로 시각을 직접 비교 가능
+
+- 송신 앱   : msgstructure.pack_msg_binary 가 FLAG_TRACE 와 송신 시각 기록
+- 라우터    : main.intake_frame 이 dequeue 시각 기록, 송신 → 라우터 구간 집계
+- 소비 앱   : base_app.MsgReceiver 가 송신 → 수신 구간 집계
+- 각 단계는 REPORT_INTERVAL 마다 구간 요약을 HkAppArg.MID_ReceiveLatencyStats 로 HK 에 보고
+"""
+
+import time
+from bisect import bisect_left
+
+from . import msgstructure
+
+REPORT_INTERVAL = 5.0   # HK 보고 주기 (초), 보고 후 히스토그램 초기화
+
+# 버킷 상한 (µs) : 1µs ~ 약 14s, 2^(1/4) 배 간격 (상대 오차 < 19%)
+_BOUNDS_US = tuple(2 ** (i / 4) for i in range(96))
+
+# 헤더의 payload length 위치 (magic, flags, sender, receiver, MsgID 다음)
+_LENGTH_OFFSET = 8
+
+class LatencyHistogram:
+    __slots__ = ("counts", "total", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BOUNDS_US) + 1)
+        self.total = 0
+        self.max_us = 0.0
+
+    def record(self, latency: float) -> None:
+        us = latency * 1e6
+        self.counts[bisect_left(_BOUNDS_US, us)] += 1
+        self.total += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, p: float) -> float:
+        """p (0~100) 백분위 지연 (µs, 버킷 상한)"""
+        if not self.total:
+            return 0.0
+        rank = p / 100.0 * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(_BOUNDS_US[index], self.max_us) if index < len(_BOUNDS_US) else self.max_us
+        return self.max_us
+
+def trace_stamps(msg):
+    """trace 프레임이면 (송신 시각, 라우터 시각) 반환, 아니면 None. 라우터를 거치지 않았으면 라우터 시각 0"""
+    if len(msg) < msgstructure.HEADER_SIZE or msg[0] != msgstructure.BIN_MAGIC or not msg[1] & msgstructure.FLAG_TRACE:
+        return None
+    offset = msgstructure.HEADER_SIZE + int.from_bytes(msg[_LENGTH_OFFSET:_LENGTH_OFFSET + 2], "little")
+    if len(msg) < offset + msgstructure.TRACE.size:
+        return None
+    return msgstructure.TRACE.unpack_from(msg, offset)
+
+class LatencyTracer:
+    """한 단계(라우터 또는 소비 앱)의 MID 별 지연 히스토그램"""
+
+    def __init__(self, report_interval: float = REPORT_INTERVAL):
+        self.histograms = {}
+        self.report_interval = report_interval
+        self._last_report = time.monotonic()
+
+    def record(self, mid: int, latency: float) -> None:
+        hist = self.histograms.get(mid)
+        if hist is None:
+            hist = self.histograms[mid] = LatencyHistogram()
+        hist.record(latency)
+
+    def record_received(self, mid: int, msg) -> None:
+        """소비 앱 수신 시점 : 송신 → 수신 구간 기록"""
+        stamps = trace_stamps(msg)
+        if stamps is not None:
+            self.record(mid, time.monotonic() - stamps[0])
+
+    def stamp_router(self, msg: bytes, mid: int) -> bytes:
+        """라우터 dequeue 시점 : 송신 → 라우터 구간 기록 후 라우터 시각을 기록한 프레임 반환"""
+        stamps = trace_stamps(msg)
+        if stamps is None:
+            return msg
+        now = time.monotonic()
+        self.record(mid, now - stamps[0])
+        offset = len(msg) - msgstructure.TRACE.size
+        return msg[:offset] + msgstructure.TRACE.pack(stamps[0], now)
+
+    def report_due(self) -> bool:
+        return bool(self.histograms) and time.monotonic() - self._last_report >= self.report_interval
+
+    def pop_summary(self) -> str:
+        """구간 요약 반환 후 히스토그램 초기화"""
+        summary = format_latency_summary(self.histograms)
+        self.histograms = {}
+        self._last_report = time.monotonic()
+        return summary
+
+def format_latency_summary(histograms: dict) -> str:
+    """HK 전달용 페이로드 : MID=count/p50/p99/max,... (µs 정수)"""
+    return ",".join(
+        f"{mid}={hist.total}/{hist.percentile(50):.0f}/{hist.percentile(99):.0f}/{hist.max_us:.0f}"
+        for mid, hist in sorted(histograms.items())
+    )
+
+def parse_latency_summary(data: str) -> dict:
+    """format_latency_summary 의 역변환 : MID → (count, p50, p99, max)"""
+    summary = {}
+    for field in data.split(","):
+        key, sep, value = field.partition("=")
+        if not sep:
+            continue
+        try:
+            summary[int(key)] = tuple(int(v) for v in value.split("/"))
+        except ValueError:
+            continue
+    return summary
@@ -9,16 +9,42 @@ from .unified_logging import (
     safe_log, get_unified_logger, 
     LogLevel, LogCategory,
     log_sensor_data, log_system_event,
-    log_error, log_warning, log_info, log_debug
+    log_error, log_warning, log_info, log_debug,
+    set_log_level, clear_log_level, log_enabled
 )
 
 # 로그 로테이션
-from .log_rotation import LogRotator
+from .log_rotation import LogRotator, pause_log_compression, resume_log_compression, set_log_compression_paused
+
+# 앱 데이터 CSV 로그 (핸들 유지 + 버퍼)
+from .csv_writer import CsvLogWriter, get_csv_writer, flush_csv_writers, close_csv_writers
+
+# 고주파 센서 바이너리 레코드
+from .flight_recorder import FlightRecorder, get_flight_recorder, close_flight_recorders
+
+# 로그 스트림별 group commit 정책
+from .durability import CommitPolicy, get_commit_policy, GroupCommitFile, commit_log_files
+
+# mmap 세그먼트 텍스트 로그 (선택)
+from .mmap_log import MmapLogSegment, open_log_file
+
+# 보조 저장소 로그 미러링
+from .mirror import MirroredLogFile, mirror_log_file, mirror_stats, flush_mirror
+
+# 로그 전용 writer 프로세스 (선택)
+from .log_server import start_log_server, stop_log_server, log_server_running
 
 __all__ = [
     'safe_log', 'get_unified_logger', 
     'LogLevel', 'LogCategory',
     'log_sensor_data', 'log_system_event',
     'log_error', 'log_warning', 'log_info', 'log_debug',
-    'LogRotator'
+    'set_log_level', 'clear_log_level', 'log_enabled',
+    'LogRotator', 'pause_log_compression', 'resume_log_compression', 'set_log_compression_paused',
+    'CsvLogWriter', 'get_csv_writer', 'flush_csv_writers', 'close_csv_writers',
+    'FlightRecorder', 'get_flight_recorder', 'close_flight_recorders',
+    'CommitPolicy', 'get_commit_policy', 'GroupCommitFile', 'commit_log_files',
+    'MmapLogSegment', 'open_log_file',
+    'MirroredLogFile', 'mirror_log_file', 'mirror_stats', 'flush_mirror',
+    'start_log_server', 'stop_log_server', 'log_server_running'
 ] 
\ No newline at end of file
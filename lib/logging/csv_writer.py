@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Persistent buffered CSV writer for app data logs
+행마다 os.path.exists + open/append/close 하던 log_csv 를 대체
+파일 핸들을 열어 둔 채 헤더는 파일이 비어 있을 때 1번만 쓰고,
+행은 버퍼에 모았다가 commit 정책(config.json LOGGING.COMMIT_POLICY, 파일 이름 → "CSV")의
+MAX_RECORDS 개 또는 MAX_DELAY_MS 마다, 그리고 종료 시 flush
+
+- get_csv_writer(path, headers) : 프로세스 안에서 경로별 writer 1개 공유 (앱의 여러 스레드에서 사용 가능)
+- write_row(row, flush=True)    : 상태 변경/오류처럼 바로 남겨야 하는 행은 즉시 flush
+- close_csv_writers()           : 앱 종료 함수에서 호출 (multiprocessing 자식은 atexit 이 실행되지 않음)
+- commit 은 durability.GroupCommitFile 사용 : 행이 더 들어오지 않아도 프로세스별 공용 flusher 스레드가
+  MAX_DELAY_MS 안에 남은 버퍼를 flush
+"""
+
+import atexit
+import csv
+import os
+import threading
+
+from .durability import GroupCommitFile
+from .mirror import mirror_log_file, flush_mirror
+
+FILE_BUFFER_SIZE = 64 * 1024
+
+class CsvLogWriter:
+    """CSV 파일 1개에 대한 핸들 유지 writer"""
+
+    def __init__(self, filepath: str, headers: list, flush_rows: int = None, flush_interval: float = None):
+        self.filepath = filepath
+        self.headers = list(headers) if headers else None
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+
+    def _open(self) -> None:
+        # fork 로 물려받은 부모의 핸들/버퍼는 사용하지 않음 (같은 행이 두 번 기록되는 것 방지)
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handle = mirror_log_file(open(self.filepath, 'a', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE), self.filepath)
+        empty = handle.tell() == 0
+        # commit 정책 : config.json LOGGING.COMMIT_POLICY (파일 이름 → "CSV")
+        self._file = GroupCommitFile(handle, os.path.basename(self.filepath), "CSV",
+                                     max_records=self.flush_rows, max_delay=self.flush_interval, owner_only=True)
+        self._writer = csv.writer(self._file)
+        if self.headers and empty:
+            self._writer.writerow(self.headers)
+            self._file.flush()
+
+    def write_row(self, row, flush: bool = False) -> None:
+        with self._lock:
+            if self._file is None or not self._file.owned():
+                self._open()
+            self._writer.writerow(row)
+            if flush:
+                self._file.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def flush_if_stale(self) -> None:
+        """commit 정책의 MAX_DELAY_MS 보다 오래 버퍼에 남은 행이 있으면 flush (보통은 공용 flusher 가 호출)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.commit_if_stale()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+# 프로세스 안 경로별 공유 writer
+_writers: dict = {}
+_writers_lock = threading.Lock()
+
+def get_csv_writer(filepath: str, headers: list = None) -> CsvLogWriter:
+    """경로별 공유 writer 반환 (없으면 생성, 헤더는 처음 생성할 때만 사용)"""
+    writer = _writers.get(filepath)
+    if writer is not None:
+        return writer
+    with _writers_lock:
+        writer = _writers.get(filepath)
+        if writer is None:
+            writer = _writers[filepath] = CsvLogWriter(filepath, headers)
+        return writer
+
+def flush_csv_writers() -> None:
+    for writer in list(_writers.values()):
+        try:
+            writer.flush()
+        except Exception:
+            pass
+
+def close_csv_writers() -> None:
+    """모든 writer flush 후 닫기 (앱 종료 시, 보조 저장소 복사본 포함)"""
+    for writer in list(_writers.values()):
+        try:
+            writer.close()
+        except Exception:
+            pass
+    flush_mirror()
+
+atexit.register(close_csv_writers)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Group-commit durability policy for logs (config.json LOGGING.COMMIT_POLICY)
+로그 스트림마다 하드코딩되어 있던 flush 기준(줄마다 / 50줄 또는 10초 / 32행 또는 1초 ...)을 설정 1곳에서 관리
+
+- 스트림별 정책 : MAX_RECORDS 개 또는 MAX_DELAY_MS 가 지나면 commit (flush, FSYNC 면 fsync 까지)
+- 정책 이름은 구체적인 것부터 차례로 찾고 없으면 DEFAULT (예: CsvLogWriter 는 파일 이름 → "CSV" → "DEFAULT")
+- 상태 변경 / 오류 기록은 정책과 관계없이 즉시 commit (호출부에서 commit=True / flush=True)
+- GroupCommitFile : 로그 핸들에 정책을 적용하는 래퍼 (센서 드라이버 로그, CsvLogWriter, FlightRecorder, BusRecorder)
+  프로세스별 flusher 스레드 1개가 기록이 멈춘 뒤에도 MAX_DELAY_MS 안에 남은 레코드를 commit
+"""
+
+import atexit
+import os
+import threading
+import time
+
+# 설정이 없을 때 사용하는 기본 정책
+DEFAULT_POLICY = {"MAX_RECORDS": 32, "MAX_DELAY_MS": 1000, "FSYNC": False}
+FLUSHER_INTERVAL = 0.1      # GroupCommitFile flusher 확인 주기 (초)
+
+class CommitPolicy:
+    __slots__ = ("name", "max_records", "max_delay", "fsync")
+
+    def __init__(self, name: str, max_records: int, max_delay: float, fsync: bool):
+        self.name = name
+        self.max_records = max(1, max_records)
+        self.max_delay = max(0.0, max_delay)   # 초
+        self.fsync = fsync
+
+    def due(self, pending: int, age: float) -> bool:
+        return pending >= self.max_records or age >= self.max_delay
+
+_policies = None
+
+def _load_policies() -> dict:
+    global _policies
+    if _policies is None:
+        try:
+            from ..core import config
+            table = config.get_config("LOGGING.COMMIT_POLICY", {}) or {}
+        except Exception:
+            table = {}
+        base = dict(DEFAULT_POLICY)
+        base.update(table.get("DEFAULT", {}))
+        policies = {}
+        for name, values in table.items():
+            merged = dict(base)
+            merged.update(values)
+            policies[name] = CommitPolicy(name, int(merged["MAX_RECORDS"]),
+                                          float(merged["MAX_DELAY_MS"]) / 1000.0, bool(merged["FSYNC"]))
+        policies.setdefault("DEFAULT", CommitPolicy("DEFAULT", int(base["MAX_RECORDS"]),
+                                                    float(base["MAX_DELAY_MS"]) / 1000.0, bool(base["FSYNC"])))
+        _policies = policies
+    return _policies
+
+def get_commit_policy(*streams) -> CommitPolicy:
+    """주어진 이름 중 처음 설정된 스트림 정책 (없으면 DEFAULT)"""
+    policies = _load_policies()
+    for stream in streams:
+        if stream in policies:
+            return policies[stream]
+    return policies["DEFAULT"]
+
+def commit_handle(handle, fsync: bool = False) -> None:
+    """핸들 버퍼를 커널로 flush, fsync 정책이면 디스크까지 동기화"""
+    handle.flush()
+    if fsync:
+        if hasattr(handle, "sync"):
+            handle.sync()           # MmapLogSegment (msync)
+        else:
+            os.fsync(handle.fileno())
+
+class GroupCommitFile:
+    """로그 핸들 + commit 정책 (write 1번 = 레코드 1개)
+
+    max_records / max_delay : 스트림 정책 대신 사용할 값 (None 이면 정책 값)
+    owner_only : True 면 연 프로세스에서만 commit / close (fork 로 물려받은 부모 버퍼를 자식이 다시 쓰지 않음)
+                 False 면 fork 전에 열고 자식에서 쓰는 드라이버 로그처럼 어느 프로세스에서나 사용
+    """
+
+    def __init__(self, handle, *streams, max_records: int = None, max_delay: float = None, owner_only: bool = False):
+        self.handle = handle
+        policy = get_commit_policy(*streams)
+        if max_records is not None or max_delay is not None:
+            policy = CommitPolicy(policy.name,
+                                  max_records if max_records is not None else policy.max_records,
+                                  max_delay if max_delay is not None else policy.max_delay,
+                                  policy.fsync)
+        self.policy = policy
+        self.owner_pid = os.getpid() if owner_only else None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._first_pending = 0.0
+        _register(self)
+
+    def owned(self) -> bool:
+        return self.owner_pid is None or self.owner_pid == os.getpid()
+
+    def write(self, text: str, commit: bool = False) -> int:
+        if _flusher_pid != os.getpid():
+            _start_flusher()
+        with self._lock:
+            written = self.handle.write(text)
+            now = time.monotonic()
+            if self._pending == 0:
+                self._first_pending = now
+            self._pending += 1
+            if commit or self.policy.due(self._pending, now - self._first_pending):
+                self._commit_locked()
+        return written
+
+    def _commit_locked(self) -> None:
+        if self._pending and self.owned():
+            commit_handle(self.handle, self.policy.fsync)
+            self._pending = 0
+
+    def flush(self) -> None:
+        """즉시 commit"""
+        with self._lock:
+            self._commit_locked()
+
+    def commit_if_stale(self) -> None:
+        with self._lock:
+            if self._pending and time.monotonic() - self._first_pending >= self.policy.max_delay:
+                self._commit_locked()
+
+    def close(self) -> None:
+        _unregister(self)
+        with self._lock:
+            if self.owned():
+                self._commit_locked()
+                self.handle.close()
+
+# 프로세스 안 GroupCommitFile 목록
+_files: list = []
+_files_lock = threading.Lock()
+_flusher_pid = None
+
+def _flusher() -> None:
+    while True:
+        time.sleep(FLUSHER_INTERVAL)
+        for log_file in list(_files):
+            if not log_file.owned():
+                continue
+            try:
+                log_file.commit_if_stale()
+            except Exception:
+                pass
+
+def _register(log_file: GroupCommitFile) -> None:
+    with _files_lock:
+        _files.append(log_file)
+
+def _unregister(log_file: GroupCommitFile) -> None:
+    with _files_lock:
+        try:
+            _files.remove(log_file)
+        except ValueError:
+            pass
+
+def _start_flusher() -> None:
+    """프로세스마다 flusher 스레드 1개 (드라이버 모듈은 fork 전에 열리므로 첫 write 에서 시작)"""
+    global _flusher_pid
+    with _files_lock:
+        if _flusher_pid != os.getpid():
+            _flusher_pid = os.getpid()
+            threading.Thread(target=_flusher, name="LogCommitFlusher", daemon=True).start()
+
+def commit_log_files() -> None:
+    """모든 GroupCommitFile 즉시 commit (앱 종료 시)"""
+    for log_file in list(_files):
+        try:
+            log_file.flush()
+        except Exception:
+            pass
+
+atexit.register(commit_log_files)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Binary flight recorder for high-rate sensor logs
+고주파 센서 로그를 텍스트(ISO 시각 + 포맷팅) 대신 고정 크기 바이너리 레코드로 기록
+
+파일 1개 = 스트림 1개
+- 헤더   : MAGIC, 버전, 헤더 길이, 파일 생성 시 wall clock (epoch 초) / time.monotonic_ns()
+           + JSON {"stream", "format", "fields"} (self-describing, 스트림별 추가 정보 meta 포함 가능)
+- 레코드 : '<q' monotonic 시각 (ns) + struct format 의 필드 값 (고정 크기)
+- 이미 내용이 있는 파일은 이어 쓰지 않고 name.1.frec, name.2.frec ... 새 파일 사용
+  (앱 재시작/재부팅 후 monotonic 기준이 달라지므로 파일마다 기준 시각을 가짐)
+- 마지막 레코드가 잘린 파일(전원 차단 등)은 읽을 때 온전한 레코드까지만 사용
+
+오프라인 변환 : python3 -m lib.logging.flight_recorder FILE... [--csv] [--npy]
+"""
+
+import argparse
+import atexit
+import csv
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+from .durability import GroupCommitFile
+from .mirror import mirror_log_file, flush_mirror
+
+MAGIC = b"FREC"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sHHdq")     # magic, version, 헤더 전체 길이, wall clock, monotonic ns
+TIMESTAMP_FORMAT = "q"
+TIMESTAMP_STRUCT = struct.Struct("<" + TIMESTAMP_FORMAT)
+TIMESTAMP_SIZE = TIMESTAMP_STRUCT.size
+FIELD_TYPES = "bBhHiIqQfd?"             # 레코드 필드에 허용하는 struct 포맷 문자 (고정 크기 수치)
+FILE_SUFFIX = ".frec"
+
+FILE_BUFFER_SIZE = 64 * 1024
+
+def _expand_format(fmt: str) -> str:
+    """'3f' → 'fff' (필드 1개당 포맷 문자 1개)"""
+    expanded = ""
+    count = ""
+    for ch in fmt:
+        if ch.isdigit():
+            count += ch
+            continue
+        if ch not in FIELD_TYPES:
+            raise ValueError(f"unsupported recorder field type '{ch}'")
+        expanded += ch * int(count or 1)
+        count = ""
+    return expanded
+
+def _free_path(path: str) -> str:
+    """비어 있지 않은 파일이 있으면 name.N.frec 중 빈 경로 반환"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return path
+    base = path[:-len(FILE_SUFFIX)] if path.endswith(FILE_SUFFIX) else path
+    index = 1
+    while True:
+        candidate = f"{base}.{index}{FILE_SUFFIX}"
+        if not os.path.exists(candidate) or os.path.getsize(candidate) == 0:
+            return candidate
+        index += 1
+
+class FlightRecorder:
+    """스트림 1개의 바이너리 레코드 writer (핸들 유지, 버퍼 후 주기 flush)"""
+
+    def __init__(self, path: str, stream: str, fields: list, fmt: str,
+                 flush_records: int = None, flush_interval: float = None, meta: dict = None):
+        self.fields = list(fields)
+        self.format = _expand_format(fmt)
+        if len(self.format) != len(self.fields):
+            raise ValueError(f"[{stream}] {len(self.fields)} fields but format '{fmt}' has {len(self.format)} values")
+        self.path = path
+        self.stream = stream
+        self.meta = dict(meta or {})
+        self.record_struct = struct.Struct("<" + TIMESTAMP_FORMAT + self.format)
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = _free_path(self.path)
+        meta = dict(self.meta, stream=self.stream, format=self.format, fields=self.fields)
+        meta = json.dumps(meta).encode("utf-8")
+        header = PREAMBLE.pack(MAGIC, VERSION, PREAMBLE.size + len(meta), time.time(), time.monotonic_ns()) + meta
+        # commit 정책 : config.json LOGGING.COMMIT_POLICY (스트림 이름 → "FLIGHT_RECORDER")
+        self._file = GroupCommitFile(mirror_log_file(open(self.path, "ab", buffering=FILE_BUFFER_SIZE), self.path),
+                                     self.stream, "FLIGHT_RECORDER", max_records=self.flush_records,
+                                     max_delay=self.flush_interval, owner_only=True)
+        self._file.write(header, commit=True)
+
+    def record(self, *values, flush: bool = False) -> None:
+        """현재 monotonic 시각으로 레코드 1개 기록"""
+        self._write(self.record_struct.pack(time.monotonic_ns(), *values), flush)
+
+    def record_packed(self, payload: bytes, flush: bool = False) -> None:
+        """이미 '<' + format 으로 pack 된 필드 bytes 를 레코드 1개로 기록 (필드가 많은 프레임용)"""
+        if len(payload) != self.record_struct.size - TIMESTAMP_SIZE:
+            raise ValueError(f"[{self.stream}] payload is {len(payload)} bytes, expected {self.record_struct.size - TIMESTAMP_SIZE}")
+        self._write(TIMESTAMP_STRUCT.pack(time.monotonic_ns()) + payload, flush)
+
+    def _write(self, data: bytes, flush: bool) -> None:
+        with self._lock:
+            if self._file is None or not self._file.owned():
+                self._open()
+            self._file.write(data, flush)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def flush_if_stale(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.commit_if_stale()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+
+# 프로세스 안 경로별 공유 recorder
+_recorders: dict = {}
+_recorders_lock = threading.Lock()
+
+def get_flight_recorder(path: str, stream: str, fields: list, fmt: str, meta: dict = None) -> FlightRecorder:
+    """경로별 공유 recorder 반환 (없으면 생성)"""
+    recorder = _recorders.get(path)
+    if recorder is not None:
+        return recorder
+    with _recorders_lock:
+        recorder = _recorders.get(path)
+        if recorder is None:
+            recorder = _recorders[path] = FlightRecorder(path, stream, fields, fmt, meta=meta)
+        return recorder
+
+def close_flight_recorders() -> None:
+    """모든 recorder flush 후 닫기 (앱 종료 시, 보조 저장소 복사본 포함)"""
+    for recorder in list(_recorders.values()):
+        try:
+            recorder.close()
+        except Exception:
+            pass
+    flush_mirror()
+
+atexit.register(close_flight_recorders)
+
+######################################################
+## 오프라인 변환                                     ##
+######################################################
+
+def read_recording(path: str):
+    """(헤더 dict, 레코드 bytes) 반환. 잘린 마지막 레코드는 제외"""
+    with open(path, "rb") as f:
+        blob = f.read()
+    if len(blob) < PREAMBLE.size:
+        raise ValueError(f"{path}: not a flight recorder file (too short)")
+    magic, version, header_len, wall_time, mono_ns = PREAMBLE.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a flight recorder file (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported recorder version {version}")
+    header = json.loads(blob[PREAMBLE.size:header_len].decode("utf-8"))
+    header.update({"version": version, "wall_time": wall_time, "mono_ns": mono_ns})
+    record_struct = struct.Struct("<" + TIMESTAMP_FORMAT + header["format"])
+    body = blob[header_len:]
+    body = body[:len(body) - len(body) % record_struct.size]
+    header["record_size"] = record_struct.size
+    return header, body
+
+def iter_records(path: str):
+    """(헤더, 레코드 tuple iterator) : 레코드 = (monotonic ns, 필드 값...)"""
+    header, body = read_recording(path)
+    return header, struct.iter_unpack("<" + TIMESTAMP_FORMAT + header["format"], body)
+
+def export_csv(path: str, out_path: str = None) -> str:
+    """CSV 로 변환 (timestamp = 파일 기준 wall clock 으로 환산한 ISO 시각)"""
+    header, records = iter_records(path)
+    out_path = out_path or os.path.splitext(path)[0] + ".csv"
+    wall_time, mono_ns = header["wall_time"], header["mono_ns"]
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "t_mono_ns"] + header["fields"])
+        for record in records:
+            wall = datetime.fromtimestamp(wall_time + (record[0] - mono_ns) / 1e9)
+            writer.writerow([wall.isoformat(sep=" ", timespec="milliseconds")] + list(record))
+    return out_path
+
+def to_numpy(path: str):
+    """NumPy structured array 로 변환 (필드 : t_mono_ns + 스트림 필드)"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("NumPy export requires numpy (pip3 install numpy)")
+    header, body = read_recording(path)
+    dtype = np.dtype([("t_mono_ns", "<i8")] + [(name, "<" + ch) for name, ch in zip(header["fields"], header["format"])])
+    return np.frombuffer(body, dtype=dtype)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flight recorder (.frec) exporter")
+    parser.add_argument("files", nargs="+", help="변환할 .frec 파일")
+    parser.add_argument("--csv", action="store_true", help="같은 이름의 .csv 로 변환")
+    parser.add_argument("--npy", action="store_true", help="같은 이름의 .npy (structured array) 로 변환")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        try:
+            header, body = read_recording(path)
+            print(f"{path}: stream={header['stream']} records={len(body) // header['record_size']} fields={','.join(header['fields'])}")
+            if args.csv:
+                print(f"  -> {export_csv(path)}")
+            if args.npy:
+                import numpy as np
+                out_path = os.path.splitext(path)[0] + ".npy"
+                np.save(out_path, to_numpy(path))
+                print(f"  -> {out_path}")
+        except (OSError, ValueError, ImportError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
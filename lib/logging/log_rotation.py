@@ -2,15 +2,90 @@
 """
 CANSAT FSW 로그 파일 로테이션 스크립트
 로그 파일의 크기와 나이를 관리하여 디스크 공간을 효율적으로 사용
+
+압축은 파일 전체를 읽지 않고 COMPRESS_CHUNK_KB 단위 스트리밍 (zlib, gzip 호환 .gz)
+- COMPRESS_LEVEL : 1 (가장 빠름) ~ 9, 비행 중 CPU 사용을 줄이려면 낮게
+- COMPRESS_RATE_MB_S : 백그라운드 압축의 읽기 속도 상한 (SD 대역폭 양보, 0 이면 제한 없음)
+- rotate_logs_async() : nice 19 + idle I/O 우선순위의 별도 프로세스에서 로테이션 (센서 루프 지연 없음)
+- pause_log_compression() / resume_log_compression() : 프로세스 간 공유 플래그, 청크 사이에서 대기
+  (FlightLogic 이 LOGGING.COMPRESS_PAUSE_STATES 상태에서 일시 정지)
+- 로그 미러링(LOGGING.MIRROR_LOGS) 중이면 보조 저장소 루트 아래 전체(하위 디렉토리 포함)에도 같은 규칙 적용
+- 어떤 프로세스든 열어 둔 파일(/proc/<pid>/fd)은 압축/삭제하지 않음 : CsvLogWriter, GroupCommitFile 드라이버 로그,
+  보조 저장소 SecondaryWriter 처럼 핸들을 계속 유지하는 writer 가 지워진 파일에 기록하지 않도록
 """
 
 import os
-import gzip
-import shutil
+import zlib
+import time
+import signal
+import subprocess
+import multiprocessing
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from .mirror import secondary_root
+
+COMPRESS_LEVEL = 1              # zlib 압축 레벨 (1 = 가장 빠름)
+COMPRESS_CHUNK_KB = 64          # 스트리밍 압축 청크 크기 (KB)
+COMPRESS_RATE_MB_S = 2.0        # 백그라운드 압축 읽기 속도 상한 (MB/s, 0 이면 제한 없음)
+PAUSE_POLL_INTERVAL = 0.2       # 일시 정지 중 재확인 주기 (초)
+ACTIVE_FILE_WINDOW = 60         # 백그라운드 로테이션에서 최근 수정된(기록 중인) 파일은 건너뜀 (초)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# 프로세스 간 공유 일시 정지 플래그 (main 이 앱을 fork 하기 전에 import 되므로 모든 앱이 공유)
+_compression_paused = multiprocessing.RawValue('b', 0)
+
+def pause_log_compression():
+    _compression_paused.value = 1
+
+def resume_log_compression():
+    _compression_paused.value = 0
+
+def set_log_compression_paused(paused: bool):
+    _compression_paused.value = 1 if paused else 0
+
+def log_compression_paused() -> bool:
+    return bool(_compression_paused.value)
+
+def open_file_paths() -> set:
+    """현재 어떤 프로세스든 열어 둔 파일의 실제 경로 (/proc/<pid>/fd, 확인할 수 없으면 빈 집합)"""
+    paths = set()
+    try:
+        pids = [name for name in os.listdir('/proc') if name.isdigit()]
+    except OSError:
+        return paths
+    for pid in pids:
+        fd_dir = os.path.join('/proc', pid, 'fd')
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue
+            if target.startswith('/'):
+                paths.add(target)
+    return paths
+
+def _lower_priority():
+    """현재 프로세스를 최저 CPU / idle I/O 우선순위로 (실패해도 계속)"""
+    try:
+        os.nice(19)
+    except Exception:
+        pass
+    try:
+        import psutil
+        psutil.Process().ionice(psutil.IOPRIO_CLASS_IDLE)
+    except Exception:
+        try:
+            subprocess.run(["ionice", "-c", "3", "-p", str(os.getpid())],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
+        except Exception:
+            pass
+
 class LogRotator:
     """로그 파일 로테이션 클래스"""
     
@@ -18,29 +93,59 @@ class LogRotator:
         self.max_size_mb = max_size_mb
         self.max_age_days = max_age_days
         self.log_dirs = ['logs', 'eventlogs']
+        self.compress_level = COMPRESS_LEVEL
+        self.chunk_size = COMPRESS_CHUNK_KB * 1024
+        self.rate_limit = 0.0           # bytes/s, 백그라운드 로테이션에서만 적용
+        self.background_rate = COMPRESS_RATE_MB_S
+        self.skip_active = False
+        self.honor_pause = False        # 비행 상태 일시 정지는 백그라운드 로테이션에서만 (종료 시 동기 로테이션은 대기하지 않음)
+        self._worker = None
+        try:
+            from ..core import config
+            self.compress_level = int(config.get_config("LOGGING.COMPRESS_LEVEL", COMPRESS_LEVEL))
+            self.chunk_size = int(config.get_config("LOGGING.COMPRESS_CHUNK_KB", COMPRESS_CHUNK_KB)) * 1024
+            self.background_rate = float(config.get_config("LOGGING.COMPRESS_RATE_MB_S", COMPRESS_RATE_MB_S))
+        except Exception:
+            pass
         
         # 로그 디렉토리 생성
         for log_dir in self.log_dirs:
             Path(log_dir).mkdir(exist_ok=True)
     
+    def _rotation_dirs(self):
+        """(디렉토리, 파일 이름 목록) : 로그 디렉토리 + 보조 저장소 루트 아래 전체 (마운트되어 있을 때만)"""
+        for log_dir in self.log_dirs:
+            if os.path.exists(log_dir):
+                yield log_dir, os.listdir(log_dir)
+        mirror_root = secondary_root()
+        if mirror_root and os.path.isdir(mirror_root):
+            for log_dir, _, filenames in os.walk(mirror_root):
+                yield log_dir, filenames
+    
     def rotate_logs(self):
         """모든 로그 파일 로테이션"""
         print("🔄 로그 파일 로테이션 시작...")
+        open_paths = open_file_paths()
         
-        for log_dir in self.log_dirs:
-            if not os.path.exists(log_dir):
-                continue
-                
+        for log_dir, filenames in self._rotation_dirs():
             print(f"📁 {log_dir} 디렉토리 처리 중...")
             
-            for filename in os.listdir(log_dir):
+            for filename in filenames:
                 filepath = os.path.join(log_dir, filename)
                 
                 if not os.path.isfile(filepath):
                     continue
                 
-                # 이미 압축된 파일은 건너뛰기
-                if filename.endswith('.gz'):
+                # 이미 압축된 파일 / 압축 중 임시 파일은 건너뛰기
+                if filename.endswith('.gz') or filename.endswith('.gz.tmp'):
+                    continue
+                
+                # 핸들을 열어 둔 writer 가 있는 파일은 건드리지 않음
+                if os.path.realpath(filepath) in open_paths:
+                    continue
+                
+                # 백그라운드 로테이션은 기록 중인 파일을 건드리지 않음
+                if self.skip_active and self.is_active_file(filepath):
                     continue
                 
                 # 파일 크기 확인
@@ -51,25 +156,83 @@ class LogRotator:
                     self.compress_log(filepath)
                 
                 # 오래된 파일 확인
-                if self.is_old_file(filepath):
+                if os.path.exists(filepath) and self.is_old_file(filepath):
                     print(f"🗑️ 오래된 파일 삭제: {filename}")
                     os.remove(filepath)
         
         print("✅ 로그 파일 로테이션 완료")
     
     def compress_log(self, filepath):
-        """로그 파일 압축"""
+        """로그 파일 스트리밍 압축 (청크 단위, 일시 정지 / 속도 제한 적용)"""
+        tmp_path = filepath + '.gz.tmp'
         try:
-            with open(filepath, 'rb') as f_in:
-                with gzip.open(filepath + '.gz', 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, GZIP_WBITS)
+            started = time.monotonic()
+            total = 0
+            with open(filepath, 'rb') as f_in, open(tmp_path, 'wb') as f_out:
+                while True:
+                    # 중요 비행 상태에서는 청크 사이에서 대기 (백그라운드 로테이션만)
+                    while self.honor_pause and log_compression_paused():
+                        time.sleep(PAUSE_POLL_INTERVAL)
+                        started = time.monotonic() - (total / self.rate_limit if self.rate_limit else 0.0)
+                    
+                    chunk = f_in.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    f_out.write(compressor.compress(chunk))
+                    total += len(chunk)
+                    
+                    # 읽기 속도 상한 유지
+                    if self.rate_limit:
+                        ahead = total / self.rate_limit - (time.monotonic() - started)
+                        if ahead > 0:
+                            time.sleep(ahead)
+                f_out.write(compressor.flush())
             
-            # 원본 파일 삭제
+            # 압축하는 동안 다른 프로세스가 파일을 열었으면 원본 유지
+            if os.path.realpath(filepath) in open_file_paths():
+                print(f"⏭️ {os.path.basename(filepath)} 기록 중, 압축 취소")
+                os.remove(tmp_path)
+                return
+            
+            # 압축 완료 후 교체, 원본 파일 삭제
+            os.replace(tmp_path, filepath + '.gz')
             os.remove(filepath)
             print(f"✅ {os.path.basename(filepath)} 압축 완료")
             
         except Exception as e:
             print(f"❌ 압축 실패: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _background_rotate(self):
+        """백그라운드 로테이션 프로세스 본체"""
+        # main 의 종료 시그널 처리를 물려받지 않음
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        _lower_priority()
+        self.rate_limit = self.background_rate * 1024 * 1024
+        self.skip_active = True
+        self.honor_pause = True
+        self.rotate_logs()
+    
+    def rotate_logs_async(self):
+        """낮은 우선순위의 별도 프로세스에서 로테이션 (이전 로테이션이 진행 중이면 False)"""
+        if self._worker is not None and self._worker.is_alive():
+            return False
+        ctx = multiprocessing.get_context("fork")
+        self._worker = ctx.Process(target=self._background_rotate, name="LogRotator", daemon=True)
+        self._worker.start()
+        return True
+    
+    def is_active_file(self, filepath):
+        """최근 ACTIVE_FILE_WINDOW 초 안에 수정된(기록 중인) 파일인지 확인"""
+        try:
+            return time.time() - os.path.getmtime(filepath) < ACTIVE_FILE_WINDOW
+        except OSError:
+            return False
     
     def is_old_file(self, filepath):
         """파일이 지정된 일수보다 오래되었는지 확인"""
@@ -79,11 +242,11 @@ class LogRotator:
         except Exception:
             return False
     
-    def get_disk_usage(self):
+    def get_disk_usage(self, path='/'):
         """디스크 사용량 확인"""
         try:
             import psutil
-            disk_usage = psutil.disk_usage('/')
+            disk_usage = psutil.disk_usage(path)
             return {
                 'total_gb': disk_usage.total / (1024**3),
                 'used_gb': disk_usage.used / (1024**3),
@@ -93,10 +256,25 @@ class LogRotator:
         except ImportError:
             return None
     
+    def _mirror_disk_full(self):
+        """보조 저장소(별도 SD) 사용량이 80% 를 넘었는지"""
+        mirror_root = secondary_root()
+        if not mirror_root or not os.path.isdir(mirror_root):
+            return False
+        try:
+            disk_info = self.get_disk_usage(mirror_root)
+        except OSError:
+            return False
+        return bool(disk_info and disk_info['percent'] > 80)
+    
     def check_and_rotate(self):
         """디스크 사용량 확인 후 필요시 로테이션"""
         disk_info = self.get_disk_usage()
         
+        if self._mirror_disk_full():
+            self.rotate_logs()
+            return True
+        
         if disk_info and disk_info['percent'] > 80:
             print(f"⚠️ 디스크 사용량 경고: {disk_info['percent']:.1f}%")
             print(f"💾 사용 중: {disk_info['used_gb']:.1f}GB / {disk_info['total_gb']:.1f}GB")
@@ -104,6 +282,15 @@ class LogRotator:
             return True
         
         return False
+    
+    def check_and_rotate_async(self):
+        """디스크 사용량 확인 후 필요시 백그라운드 로테이션 (비행 중 주기 호출용)"""
+        disk_info = self.get_disk_usage()
+        
+        if (disk_info and disk_info['percent'] > 80) or self._mirror_disk_full():
+            return self.rotate_logs_async()
+        
+        return False
 
 def main():
     """메인 함수"""
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Single dedicated log-writer process (config.json LOGGING.LOG_SERVER)
+앱 프로세스마다 _log_worker 스레드와 main_system.log / error.log / debug.log 핸들을 따로 열어
+같은 파일에 줄 단위로 flush 하던 구조 대신, 로그 전용 프로세스 1개가 모든 파일을 씀
+
+- main 이 앱 프로세스를 fork 하기 전에 start_log_server() 호출 → 앱들은 채널(multiprocessing.Queue)을 물려받음
+- 앱 쪽 safe_log 는 레코드를 채널에 put_nowait 만 하고 바로 반환 (채널이 가득 차면 기존 로컬 버퍼로 대체)
+- 로그 프로세스는 레코드를 송신 시각(time.monotonic, 프로세스 간 공유) 기준으로 REORDER_WINDOW 동안 정렬한 뒤
+  파일별로 모아 한 번에 write, commit 정책(LOGGING.COMMIT_POLICY.SYSTEM_LOG)에 따라 flush
+  (한 타임라인, 쓰기 횟수 감소, ERROR / CRITICAL 이 포함된 묶음은 즉시 commit)
+- stop_log_server() : 남은 레코드를 모두 기록하고 종료, 이후 safe_log 는 프로세스 내부 워커로 동작
+"""
+
+import heapq
+import multiprocessing
+import os
+import queue
+import signal
+import time
+
+from . import unified_logging
+from .mmap_log import open_log_file
+from .durability import get_commit_policy, commit_handle
+
+CHANNEL_SIZE = 10000        # 채널 최대 대기 레코드 수
+REORDER_WINDOW = 0.05       # 프로세스 간 도착 순서 보정 window (초)
+FILE_BUFFER_SIZE = 64 * 1024
+STOP_TIMEOUT = 5.0          # 종료 시 남은 레코드 기록 대기 (초)
+DRAIN_MAX = 1000            # 한 번에 채널에서 꺼낼 최대 레코드 수
+
+_server = None
+_channel = None
+_owner_pid = None
+
+def _write_batch(files: dict, batch: list) -> bool:
+    """정렬된 레코드 묶음을 파일별로 모아 한 번에 기록, 즉시 commit 할 레코드가 있으면 True"""
+    commit = False
+    lines = {unified_logging.MAIN_LOG_PATH: []}
+    for _, timestamp, level, app_name, message, printlogs in batch:
+        formatted_message = f"[{timestamp}] [{level}] [{app_name}] {message}"
+        if printlogs:
+            try:
+                print(formatted_message)
+            except Exception:
+                pass
+        lines[unified_logging.MAIN_LOG_PATH].append(formatted_message)
+        if level in unified_logging.COMMIT_IMMEDIATE_LEVELS:
+            commit = True
+        if level in ("ERROR", "CRITICAL"):
+            lines.setdefault(unified_logging.ERROR_LOG_PATH, []).append(formatted_message)
+        elif level == "DEBUG":
+            lines.setdefault(unified_logging.DEBUG_LOG_PATH, []).append(formatted_message)
+
+    for path, path_lines in lines.items():
+        if not path_lines:
+            continue
+        handle = files.get(path)
+        if handle is None:
+            handle = files[path] = open_log_file(path, FILE_BUFFER_SIZE)
+        handle.write('\n'.join(path_lines) + '\n')
+    return commit
+
+def _server_main(channel) -> None:
+    """로그 프로세스 본체 : 종료 신호(None)를 받거나 main 이 사라질 때까지 실행"""
+    # main 의 종료 시그널 처리는 main 이 담당, 로그 프로세스는 stop_log_server 의 종료 신호로 끝남
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    parent = os.getppid()
+    os.makedirs(unified_logging.LOG_DIR, exist_ok=True)
+
+    policy = get_commit_policy("SYSTEM_LOG")
+    files = {}
+    pending = []        # (monotonic, 순번, 레코드) heap
+    sequence = 0
+    running = True
+    uncommitted = 0     # commit 안 된 레코드 수
+    first_uncommitted = 0.0
+    while running:
+        try:
+            record = channel.get(timeout=REORDER_WINDOW)
+            for _ in range(DRAIN_MAX):
+                if record is None:
+                    running = False
+                    break
+                heapq.heappush(pending, (record[0], sequence, record))
+                sequence += 1
+                record = channel.get_nowait()
+        except queue.Empty:
+            if os.getppid() != parent:
+                running = False
+        except (EOFError, OSError):
+            running = False
+
+        # window 가 지난 레코드만 기록 (종료 시에는 전부)
+        horizon = time.monotonic() - REORDER_WINDOW
+        batch = []
+        while pending and (not running or pending[0][0] <= horizon):
+            batch.append(heapq.heappop(pending)[2])
+        try:
+            now = time.monotonic()
+            commit = not running
+            if batch:
+                commit = _write_batch(files, batch) or commit
+                if uncommitted == 0:
+                    first_uncommitted = now
+                uncommitted += len(batch)
+            if uncommitted and (commit or policy.due(uncommitted, now - first_uncommitted)):
+                for handle in files.values():
+                    commit_handle(handle, policy.fsync)
+                uncommitted = 0
+        except Exception as e:
+            try:
+                print(f"[LOG_SERVER_ERROR] {e}")
+            except Exception:
+                pass
+
+    for handle in files.values():
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+def start_log_server() -> bool:
+    """로그 전용 프로세스 시작 후 이 프로세스(와 이후 fork 되는 앱)의 safe_log 를 채널로 전환"""
+    global _server, _channel, _owner_pid
+    if _server is not None and _server.is_alive():
+        return True
+    ctx = multiprocessing.get_context("fork")
+    _channel = ctx.Queue(CHANNEL_SIZE)
+    _server = ctx.Process(target=_server_main, args=(_channel,), name="LogServer", daemon=True)
+    _server.start()
+    _owner_pid = os.getpid()
+    unified_logging.set_log_channel(_channel)
+    return True
+
+def stop_log_server(timeout: float = STOP_TIMEOUT) -> None:
+    """남은 레코드 기록 후 로그 프로세스 종료, safe_log 는 프로세스 내부 워커로 복귀"""
+    global _server, _channel
+    unified_logging.set_log_channel(None)
+    if _server is None or _owner_pid != os.getpid():
+        return
+    try:
+        _channel.put(None, timeout=timeout)
+        _server.join(timeout)
+        if _server.is_alive():
+            _server.terminate()
+    except Exception:
+        pass
+    _channel.close()
+    _server = None
+    _channel = None
+
+def log_server_running() -> bool:
+    return _server is not None and _server.is_alive()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Mirrored dual-directory log writing (config.json LOGGING.MIRROR_LOGS / PRIMARY_LOG_DIR / SECONDARY_LOG_DIR)
+SD 카드 손상 대비로 모든 로그를 보조 저장소(SPI SD, /mnt/log_sd)에도 복사
+
+- 기본 저장소 쓰기는 기존 경로 그대로 (호출 스레드에서 바로 write)
+- 보조 저장소 복사본은 프로세스별 백그라운드 스레드가 비동기로 기록
+  · 대기 버퍼는 SECONDARY_BUFFER_KB 로 제한, 넘치면 가장 오래된 항목부터 버림 (기본 저장소 쓰기는 절대 대기하지 않음)
+  · 쓰기 실패 시 RECOVERY_INTERVAL 동안 보조 저장소 사용 중지 후 재시도 (그동안 들어온 항목은 버림)
+- 보조 경로 : PRIMARY_LOG_DIR 아래 파일은 같은 상대 경로, 그 밖(sensorlogs 등)은 작업 디렉토리 기준 상대 경로
+- SECONDARY_LOG_DIR 가 없으면 상위 디렉토리가 마운트 지점일 때만 생성 (SD 미장착 시 루트 파일시스템에 쓰지 않음)
+- 보조 저장소 크기 관리는 LogRotator 가 secondary_root() 아래 전체에 같은 크기/보존 기간 규칙 적용
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+
+SECONDARY_BUFFER_KB = 1024      # 보조 저장소 대기 버퍼 상한 (KB)
+FLUSH_INTERVAL = 1.0            # 보조 저장소 flush 주기 (초)
+RECOVERY_INTERVAL = 60.0        # 쓰기 실패 후 재시도까지 대기 (초)
+
+# None 이면 처음 사용할 때 config.json LOGGING 을 읽음
+MIRROR_LOGS = None
+PRIMARY_LOG_DIR = "logs"
+SECONDARY_LOG_DIR = None
+
+def _load_config() -> bool:
+    global MIRROR_LOGS, PRIMARY_LOG_DIR, SECONDARY_LOG_DIR, RECOVERY_INTERVAL
+    if MIRROR_LOGS is None:
+        try:
+            from ..core import config
+            MIRROR_LOGS = bool(config.get_config("LOGGING.MIRROR_LOGS", False))
+            PRIMARY_LOG_DIR = config.get_config("LOGGING.PRIMARY_LOG_DIR", PRIMARY_LOG_DIR)
+            SECONDARY_LOG_DIR = config.get_config("LOGGING.SECONDARY_LOG_DIR", None)
+            RECOVERY_INTERVAL = float(config.get_config("LOGGING.RECOVERY_INTERVAL", RECOVERY_INTERVAL))
+        except Exception:
+            MIRROR_LOGS = False
+        if not SECONDARY_LOG_DIR:
+            MIRROR_LOGS = False
+    return MIRROR_LOGS
+
+def secondary_path_for(path: str):
+    """기본 저장소 경로 → 보조 저장소 경로 (미러링하지 않으면 None)"""
+    if not _load_config():
+        return None
+    full_path = os.path.abspath(path)
+    primary = os.path.abspath(PRIMARY_LOG_DIR)
+    secondary = os.path.abspath(SECONDARY_LOG_DIR)
+    if full_path.startswith(secondary + os.sep):
+        return None
+    if full_path.startswith(primary + os.sep):
+        relative = os.path.relpath(full_path, primary)
+    else:
+        relative = os.path.relpath(full_path)
+        if relative.startswith(os.pardir):
+            relative = os.path.basename(full_path)
+    return os.path.join(secondary, relative)
+
+class SecondaryWriter:
+    """보조 저장소 비동기 writer (프로세스당 1개)"""
+
+    def __init__(self, max_bytes: int = SECONDARY_BUFFER_KB * 1024):
+        self.max_bytes = max_bytes
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._pending_bytes = 0
+        self._files = {}
+        self._retry_at = 0.0
+        self._inflight = 0      # 대기열에서 꺼내 기록 중인 항목 수 (flush 가 기록 완료까지 대기)
+        self.written = 0        # 기록한 bytes
+        self.dropped = 0        # 버퍼 초과 / 실패로 버린 항목 수
+        self.failures = 0
+        threading.Thread(target=self._run, name="LogMirror", daemon=True).start()
+
+    def submit(self, path: str, data: bytes) -> None:
+        """기본 저장소 쓰기 직후 호출 : 대기하지 않음"""
+        with self._cond:
+            if time.monotonic() < self._retry_at:
+                self.dropped += 1
+                return
+            self._pending.append((path, data))
+            self._pending_bytes += len(data)
+            while self._pending_bytes > self.max_bytes and self._pending:
+                _, old = self._pending.popleft()
+                self._pending_bytes -= len(old)
+                self.dropped += 1
+            self._cond.notify()
+
+    def _open(self, path: str):
+        handle = self._files.get(path)
+        if handle is None:
+            root = os.path.abspath(SECONDARY_LOG_DIR)
+            if not os.path.isdir(root) and not os.path.ismount(os.path.dirname(root)):
+                raise OSError(f"secondary log storage not mounted: {root}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle = self._files[path] = open(path, 'ab')
+        return handle
+
+    def _close_all(self) -> None:
+        for handle in self._files.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._files.clear()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait(FLUSH_INTERVAL)
+                batch = list(self._pending)
+                self._pending.clear()
+                self._pending_bytes = 0
+                self._inflight = len(batch)
+            try:
+                grouped = {}
+                for path, data in batch:
+                    grouped.setdefault(path, []).append(data)
+                for path, chunks in grouped.items():
+                    handle = self._open(path)
+                    handle.write(b"".join(chunks))
+                    self.written += sum(len(chunk) for chunk in chunks)
+                for handle in self._files.values():
+                    handle.flush()
+            except Exception:
+                # 보조 저장소 장애 : 한동안 사용 중지 (기본 저장소에는 영향 없음)
+                self.failures += 1
+                self.dropped += len(batch)
+                self._close_all()
+                with self._cond:
+                    self._retry_at = time.monotonic() + RECOVERY_INTERVAL
+            with self._cond:
+                self._inflight = 0
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """대기 중 / 기록 중인 항목이 모두 기록될 때까지 대기 (앱 종료 시, 최대 timeout 초)"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._pending or self._inflight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+_writer = None
+_writer_pid = None
+_writer_lock = threading.Lock()
+
+def get_secondary_writer() -> SecondaryWriter:
+    global _writer, _writer_pid
+    if _writer_pid != os.getpid():
+        with _writer_lock:
+            if _writer_pid != os.getpid():
+                # fork 이후 부모의 스레드/버퍼는 사용하지 않음
+                _writer = SecondaryWriter()
+                _writer_pid = os.getpid()
+    return _writer
+
+class MirroredLogFile:
+    """기본 저장소 핸들 + 보조 저장소 비동기 복사 (파일 핸들처럼 사용)"""
+
+    def __init__(self, handle, secondary_path: str):
+        self.handle = handle
+        self.secondary_path = secondary_path
+        self._text = 'b' not in getattr(handle, 'mode', 'a')
+
+    def write(self, data):
+        written = self.handle.write(data)
+        try:
+            get_secondary_writer().submit(self.secondary_path, data.encode('utf-8') if self._text else bytes(data))
+        except Exception:
+            pass
+        return written
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    def __getattr__(self, name):
+        return getattr(self.handle, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.handle.close()
+
+def secondary_root():
+    """미러링 중이면 보조 저장소 루트 (절대 경로), 아니면 None"""
+    if not _load_config():
+        return None
+    return os.path.abspath(SECONDARY_LOG_DIR)
+
+def mirror_log_file(handle, path: str):
+    """미러링이 켜져 있으면 MirroredLogFile 로 감싸서 반환, 아니면 handle 그대로"""
+    secondary_path = secondary_path_for(path)
+    if secondary_path is None:
+        return handle
+    return MirroredLogFile(handle, secondary_path)
+
+def mirror_stats() -> dict:
+    """이 프로세스의 보조 저장소 기록 통계"""
+    if _writer is None or _writer_pid != os.getpid():
+        return {"written": 0, "dropped": 0, "failures": 0}
+    return {"written": _writer.written, "dropped": _writer.dropped, "failures": _writer.failures}
+
+def flush_mirror(timeout: float = 2.0) -> None:
+    if _writer is not None and _writer_pid == os.getpid():
+        _writer.flush(timeout)
+
+atexit.register(flush_mirror)
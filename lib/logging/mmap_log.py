@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped preallocated log segments (config.json LOGGING.MMAP_LOGS)
+전원 차단 대비로 줄마다 flush() (write 시스템 콜) 하던 텍스트 로그를 대체하는 선택 기능
+
+- 세그먼트 파일을 SEGMENT_SIZE 만큼 미리 할당(posix_fallocate, 디스크 부족은 열 때 오류)하고 mmap 으로 매핑
+- write(text) : 레코드(길이 + CRC32 + 본문)를 매핑에 복사한 뒤 헤더의 commit offset/counter 갱신
+  → 시스템 콜 없이 페이지 캐시에 반영 (프로세스가 죽어도 커널이 기록, flush-per-line 과 같은 보장)
+- 세그먼트가 가득 차면 name.N.mlog 로 새 세그먼트, 정상 종료 시 사용한 크기로 truncate
+- 비정상 종료 후 복구 : python3 -m lib.logging.mmap_log FILE... [--text]
+  마지막 유효 레코드(CRC 확인)까지 남기고 truncate, --text 는 같은 이름의 .log 텍스트로 변환
+
+open_log_file(path) 는 MMAP_LOGS 가 켜져 있으면 세그먼트(.mlog), 아니면 기존처럼 텍스트 파일 핸들을 반환
+(둘 다 write / flush / close 제공 → 호출부 변경 없음, LOGGING.MIRROR_LOGS 면 보조 저장소 미러링 포함)
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+
+from .mirror import mirror_log_file
+
+MAGIC = b"MLOG"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")    # magic, 버전, 데이터 시작 offset, 세그먼트 크기
+COMMIT = struct.Struct("<QQ")       # commit offset (다음 레코드 위치), commit counter (레코드 수)
+RECORD = struct.Struct("<II")       # 본문 길이, CRC32
+DATA_OFFSET = 64
+FILE_SUFFIX = ".mlog"
+
+SEGMENT_SIZE = 4 * 1024 * 1024      # 기본 세그먼트 크기 (bytes)
+
+# None 이면 처음 사용할 때 config.json LOGGING.MMAP_LOGS / MMAP_SEGMENT_MB 를 읽음
+MMAP_LOGS = None
+
+def _create_segment(path: str):
+    """path, name.1.mlog, name.2.mlog ... 중 아직 없는 파일을 O_EXCL 로 만들어 (경로, fd) 반환
+    (동시에 fork 된 앱들이 같은 세그먼트를 고르지 않도록 생성 자체로 경로를 확보)"""
+    base = path[:-len(FILE_SUFFIX)] if path.endswith(FILE_SUFFIX) else path
+    candidate = path
+    index = 0
+    while True:
+        try:
+            return candidate, os.open(candidate, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            index += 1
+            candidate = f"{base}.{index}{FILE_SUFFIX}"
+
+def _preallocate(fd: int, size: int) -> None:
+    """세그먼트 블록을 실제로 할당 (sparse 파일이면 비행 중 첫 기록 시 할당 → 공간 부족 시 SIGBUS)"""
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fd, 0, size)
+    else:
+        os.ftruncate(fd, size)
+
+class MmapLogSegment:
+    """미리 할당한 mmap 세그먼트에 줄 단위 레코드 기록 (파일 핸들처럼 write / flush / close)"""
+
+    def __init__(self, path: str, segment_size: int = SEGMENT_SIZE):
+        self.base_path = path
+        self.path = path
+        self.segment_size = max(segment_size, DATA_OFFSET + 4096)
+        self._lock = threading.Lock()
+        self._fd = None
+        self._mm = None
+        self._pid = None
+        self._offset = DATA_OFFSET
+        self._count = 0
+
+    def _open(self) -> None:
+        # fork 로 물려받은 매핑(MAP_SHARED)은 부모와 공유되므로 사용하지 않고 새 세그먼트를 염
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path, fd = _create_segment(self.base_path)
+        try:
+            _preallocate(fd, self.segment_size)
+        except OSError:
+            os.close(fd)
+            os.remove(self.path)
+            raise
+        self._fd = fd
+        self._mm = mmap.mmap(self._fd, self.segment_size)
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, DATA_OFFSET, self.segment_size)
+        self._offset = DATA_OFFSET
+        self._count = 0
+        COMMIT.pack_into(self._mm, HEADER.size, self._offset, self._count)
+        self._pid = os.getpid()
+
+    def _close_locked(self) -> None:
+        """사용한 크기로 truncate 후 닫기"""
+        if self._mm is None:
+            return
+        if self._pid == os.getpid():
+            self._mm.flush()
+            self._mm.close()
+            os.ftruncate(self._fd, self._offset)
+            os.close(self._fd)
+        self._mm = None
+        self._fd = None
+
+    def write(self, text: str) -> int:
+        data = text.encode('utf-8')
+        if not data:
+            return 0
+        with self._lock:
+            if self._mm is None or self._pid != os.getpid():
+                self._close_locked()
+                self._open()
+            capacity = self.segment_size - DATA_OFFSET - RECORD.size
+            if len(data) > capacity:
+                data = data[:capacity]
+            end = self._offset + RECORD.size + len(data)
+            if end > self.segment_size:
+                # 세그먼트가 가득 참 → 닫고 다음 세그먼트
+                self._close_locked()
+                self._open()
+                end = self._offset + RECORD.size + len(data)
+            self._mm[self._offset + RECORD.size:end] = data
+            RECORD.pack_into(self._mm, self._offset, len(data), zlib.crc32(data))
+            self._offset = end
+            self._count += 1
+            COMMIT.pack_into(self._mm, HEADER.size, self._offset, self._count)
+        return len(text)
+
+    def flush(self) -> None:
+        """write 가 이미 매핑에 commit 하므로 할 일 없음 (파일 핸들 호환용)"""
+
+    def sync(self) -> None:
+        """매핑을 디스크에 동기화 (msync)"""
+        with self._lock:
+            if self._mm is not None and self._pid == os.getpid():
+                self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+def mmap_logs_enabled() -> bool:
+    global MMAP_LOGS, SEGMENT_SIZE
+    if MMAP_LOGS is None:
+        try:
+            from ..core import config
+            MMAP_LOGS = bool(config.get_config("LOGGING.MMAP_LOGS", False))
+            SEGMENT_SIZE = int(float(config.get_config("LOGGING.MMAP_SEGMENT_MB", SEGMENT_SIZE / (1024 * 1024))) * 1024 * 1024)
+        except Exception:
+            MMAP_LOGS = False
+    return MMAP_LOGS
+
+def open_log_file(path: str, buffering: int = 1):
+    """텍스트 로그 핸들 열기 : MMAP_LOGS 면 같은 이름의 .mlog 세그먼트, 아니면 append 모드 텍스트 파일"""
+    if mmap_logs_enabled():
+        return mirror_log_file(MmapLogSegment(os.path.splitext(path)[0] + FILE_SUFFIX, SEGMENT_SIZE), path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return mirror_log_file(open(path, 'a', encoding='utf-8', buffering=buffering), path)
+
+######################################################
+## 복구                                             ##
+######################################################
+
+def scan_segment(blob: bytes):
+    """(유효 레코드 본문 목록, 마지막 유효 레코드 끝 offset, 헤더 commit offset) 반환"""
+    if len(blob) < DATA_OFFSET:
+        raise ValueError("not a log segment (too short)")
+    magic, version, data_offset, _ = HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("not a log segment (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"unsupported segment version {version}")
+    commit_offset, _ = COMMIT.unpack_from(blob, HEADER.size)
+
+    records = []
+    offset = data_offset
+    while offset + RECORD.size <= len(blob):
+        length, crc = RECORD.unpack_from(blob, offset)
+        end = offset + RECORD.size + length
+        if length == 0 or end > len(blob):
+            break
+        data = blob[offset + RECORD.size:end]
+        if zlib.crc32(data) != crc:
+            break
+        records.append(data)
+        offset = end
+    return records, offset, commit_offset
+
+def recover_segment(path: str) -> dict:
+    """마지막 유효 레코드까지 남기고 truncate, commit 헤더도 맞춤"""
+    with open(path, "r+b") as f:
+        blob = f.read()
+        records, end, commit_offset = scan_segment(blob)
+        f.seek(HEADER.size)
+        f.write(COMMIT.pack(end, len(records)))
+        f.truncate(end)
+    return {"records": len(records), "end": end, "commit_offset": commit_offset, "truncated": len(blob) - end}
+
+def export_text(path: str, out_path: str = None) -> str:
+    """레코드 본문을 이어 붙여 텍스트 로그로 변환"""
+    with open(path, "rb") as f:
+        records, _, _ = scan_segment(f.read())
+    out_path = out_path or os.path.splitext(path)[0] + ".log"
+    with open(out_path, "wb") as f:
+        f.write(b"".join(records))
+    return out_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="mmap log segment (.mlog) recovery / export")
+    parser.add_argument("files", nargs="+", help="복구할 .mlog 세그먼트")
+    parser.add_argument("--text", action="store_true", help="같은 이름의 .log 텍스트로 변환")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        try:
+            result = recover_segment(path)
+            print(f"{path}: records={result['records']} commit={result['commit_offset']} "
+                  f"end={result['end']} truncated={result['truncated']} bytes")
+            if args.text:
+                print(f"  -> {export_text(path)}")
+        except (OSError, ValueError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@ from typing import Optional, Dict, Any
 import atexit
 import signal
 
+from .mmap_log import open_log_file
+from .durability import get_commit_policy, commit_handle
+
 # 글로벌 로깅 상태
 _logging_initialized = False
 _log_queue = queue.Queue(maxsize=1000)  # 로그 큐 크기 증가
@@ -37,6 +40,9 @@ _log_thread = None
 _log_thread_running = False
 _log_lock = threading.RLock()
 
+# 로그 전용 프로세스 채널 (lib/logging/log_server.py, None 이면 프로세스 내부 워커 사용)
+_log_channel = None
+
 # 로그 파일 경로
 LOG_DIR = "logs"
 MAIN_LOG_PATH = os.path.join(LOG_DIR, "main_system.log")
@@ -53,9 +59,16 @@ LOG_LEVELS = {
     "CRITICAL": 4
 }
 
-# 현재 로그 레벨 (환경변수에서 읽거나 기본값 사용)
+# 현재 로그 레벨 (환경변수 LOG_LEVEL > config.json LOGGING.LOG_LEVEL > INFO, set_log_level 로 변경)
 _current_log_level = LOG_LEVELS.get(os.environ.get("LOG_LEVEL", "INFO").upper(), LOG_LEVELS["INFO"])
 
+# 모듈별 로그 레벨 (config.json LOGGING.MODULE_LEVELS, set_log_level(level, module) 로 실행 중 변경)
+# 레벨 확인은 safe_log 진입 직후 (포맷팅 / 큐 전달 전), 호출 모듈 이름은 점(.) 단위 접두어로 찾음
+_module_levels = {}         # 모듈 이름 → 레벨 번호
+_module_level_cache = {}    # 호출 모듈 이름 → 적용 레벨 번호
+_min_log_level = _current_log_level   # 전체/모듈 레벨 중 가장 낮은 값 (이보다 낮으면 바로 반환)
+_levels_loaded = False
+
 # 로그 버퍼 (메모리 기반 백업)
 _log_buffer = []
 _max_buffer_size = 1000  # 버퍼 크기 증가
@@ -63,6 +76,11 @@ _max_buffer_size = 1000  # 버퍼 크기 증가
 # 프로세스 안전성을 위한 파일 핸들러
 _file_handlers = {}
 _file_locks = {}
+_file_pending = {}      # 파일별 [commit 안 된 줄 수, 가장 오래된 줄 시각]
+_commit_policy = None   # config.json LOGGING.COMMIT_POLICY.SYSTEM_LOG (처음 쓸 때 로드)
+
+# 정책과 관계없이 즉시 commit 하는 레벨
+COMMIT_IMMEDIATE_LEVELS = ("ERROR", "CRITICAL")
 
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -344,18 +362,128 @@ def get_unified_logger() -> UnifiedLogger:
         _unified_logger = UnifiedLogger()
     return _unified_logger
 
+def _load_levels():
+    """config.json LOGGING.LOG_LEVEL / MODULE_LEVELS 를 처음 한 번 읽음"""
+    global _levels_loaded, _current_log_level
+    _levels_loaded = True
+    try:
+        from ..core import config
+        if "LOG_LEVEL" not in os.environ:
+            _current_log_level = LOG_LEVELS.get(str(config.get_config("LOGGING.LOG_LEVEL", "INFO")).upper(), _current_log_level)
+        for module, level in (config.get_config("LOGGING.MODULE_LEVELS", {}) or {}).items():
+            if str(level).upper() in LOG_LEVELS:
+                _module_levels[module] = LOG_LEVELS[str(level).upper()]
+    except Exception:
+        pass
+    _update_levels()
+
+def _update_levels():
+    global _min_log_level
+    _module_level_cache.clear()
+    _min_log_level = min([_current_log_level] + list(_module_levels.values()))
+
+def _module_threshold(module: str) -> int:
+    """호출 모듈에 적용되는 레벨 번호 (가장 긴 접두어 설정, 없으면 전체 레벨)"""
+    threshold = _module_level_cache.get(module)
+    if threshold is None:
+        threshold = _current_log_level
+        name = module
+        while name:
+            if name in _module_levels:
+                threshold = _module_levels[name]
+                break
+            name = name.rpartition(".")[0]
+        _module_level_cache[module] = threshold
+    return threshold
+
+def set_log_level(level: str, module: str = None):
+    """전체 로그 레벨 (module=None) 또는 모듈(접두어)별 로그 레벨을 실행 중 변경 (이 프로세스에만 적용)"""
+    global _current_log_level
+    if not _levels_loaded:
+        _load_levels()
+    number = LOG_LEVELS.get(str(level).upper())
+    if number is None:
+        raise ValueError(f"unknown log level '{level}'")
+    if module is None:
+        _current_log_level = number
+    else:
+        _module_levels[module] = number
+    _update_levels()
+
+def clear_log_level(module: str):
+    """모듈별 로그 레벨 설정 제거 (전체 레벨을 따름)"""
+    _module_levels.pop(module, None)
+    _update_levels()
+
+def log_enabled(level: str, module: str = None) -> bool:
+    """호출 모듈(또는 module)에서 level 로그가 기록되는지 (비싼 디버그 출력 준비 전에 확인)"""
+    if not _levels_loaded:
+        _load_levels()
+    number = LOG_LEVELS.get(level)
+    if number is None:
+        number = LOG_LEVELS.get(str(level).upper(), 0)
+    if number < _min_log_level:
+        return False
+    if not _module_levels:
+        return number >= _current_log_level
+    if module is None:
+        module = sys._getframe(1).f_globals.get("__name__", "")
+    return number >= _module_threshold(module)
+
+def _format_message(message, args) -> str:
+    """format 문자열 + args 레코드를 문자열로 (기록하는 레코드만 포맷팅)"""
+    if not args:
+        return str(message)
+    try:
+        return str(message) % args
+    except Exception as e:
+        return f"{message} {args!r} [FORMAT_ERROR: {e}]"
+
 # 기존 로깅 시스템과의 호환성을 위한 함수들
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True, app_name: str = "UNKNOWN"):
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, app_name: str = "UNKNOWN", args: tuple = ()):
     """
     안전한 로깅 함수 - 앱 종료 시에도 로그 보존
     
     Args:
-        message: 로그 메시지
+        message: 로그 메시지 (args 가 있으면 % 포맷 문자열, 기록되는 레코드만 워커에서 포맷팅)
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         printlogs: 콘솔 출력 여부
         app_name: 앱 이름 (기본값: UNKNOWN)
+        args: message 포맷 인자 (예: safe_log("alt=%.2f", "DEBUG", False, args=(alt,)))
     """
+    # 레벨 확인을 가장 먼저 (꺼진 레벨은 포맷팅 / 큐 전달 없이 반환)
+    if not _levels_loaded:
+        _load_levels()
+    level_no = LOG_LEVELS.get(level)
+    if level_no is None:
+        level = str(level).upper() if level is not None else "INFO"
+        level_no = LOG_LEVELS.get(level, 0)
+    if level_no < _min_log_level:
+        return
+    if _module_levels:
+        if level_no < _module_threshold(sys._getframe(1).f_globals.get("__name__", "")):
+            return
+    elif level_no < _current_log_level:
+        return
+
     try:
+        # 로그 전용 프로세스 사용 시 채널에 넣고 바로 반환 (non-blocking)
+        if _log_channel is not None:
+            level_str = str(level).upper() if level is not None else "INFO"
+            try:
+                _log_channel.put_nowait((
+                    time.monotonic(),
+                    datetime.now().isoformat(sep=' ', timespec='milliseconds'),
+                    level_str,
+                    app_name,
+                    _format_message(message, args),
+                    printlogs
+                ))
+                return
+            except queue.Full:
+                # 채널이 가득 찬 경우 아래 로컬 처리로 대체
+                pass
+
         # 로깅 시스템 초기화 확인
         if not _logging_initialized:
             _initialize_logging()
@@ -369,11 +497,13 @@ def safe_log(message: str, level: str = "INFO", printlogs: bool = True, app_name
                 level_str,
                 app_name,
                 message,
-                printlogs
+                printlogs,
+                args
             ))
         except queue.Full:
             # 큐가 가득 찬 경우 버퍼에 직접 저장
             level_str = str(level).upper() if level is not None else "INFO"
+            message = _format_message(message, args)
             _log_buffer.append(f"[QUEUE_FULL] [{level_str}] [{app_name}] {message}")
             if len(_log_buffer) > _max_buffer_size:
                 _log_buffer.pop(0)
@@ -396,6 +526,11 @@ def safe_log(message: str, level: str = "INFO", printlogs: bool = True, app_name
             # 모든 출력이 실패한 경우 무시
             pass
 
+def set_log_channel(channel):
+    """safe_log 가 레코드를 보낼 로그 전용 프로세스 채널 설정 (None 이면 프로세스 내부 워커)"""
+    global _log_channel
+    _log_channel = channel
+
 def emergency_log(message: str, app_name: str = "EMERGENCY"):
     """
     긴급 로깅 함수 - 로깅 시스템이 실패해도 작동
@@ -410,10 +545,10 @@ def emergency_log(message: str, app_name: str = "EMERGENCY"):
         emergency_message = f"[{timestamp}] [EMERGENCY] [{app_name}] {message}"
         
         # 메인 로그 파일에 직접 쓰기
-        _write_log_safe(MAIN_LOG_PATH, emergency_message)
+        _write_log_safe(MAIN_LOG_PATH, emergency_message, commit=True)
         
         # 에러 로그에도 저장
-        _write_log_safe(ERROR_LOG_PATH, emergency_message)
+        _write_log_safe(ERROR_LOG_PATH, emergency_message, commit=True)
         
         # 콘솔 출력
         try:
@@ -450,6 +585,7 @@ def flush_logs():
             for buffered_msg in _log_buffer:
                 _write_log_safe(MAIN_LOG_PATH, buffered_msg)
             _log_buffer.clear()
+        _commit_stale_logs(force=True)
     except Exception as e:
         # 플러시 실패 시에도 계속 진행
         pass
@@ -491,21 +627,35 @@ def _get_file_handler(filepath: str):
     if filepath not in _file_handlers:
         try:
             _ensure_log_directory()
-            _file_handlers[filepath] = open(filepath, 'a', encoding='utf-8', buffering=1)
+            _file_handlers[filepath] = open_log_file(filepath)
             _file_locks[filepath] = threading.Lock()
         except Exception as e:
             # 파일 핸들러 생성 실패 시 None 반환
             return None, None
     return _file_handlers[filepath], _file_locks[filepath]
 
-def _write_log_safe(filepath: str, message: str):
-    """안전한 로그 쓰기 (파일 오류 시에도 계속 진행)"""
+def _get_commit_policy():
+    global _commit_policy
+    if _commit_policy is None:
+        _commit_policy = get_commit_policy("SYSTEM_LOG")
+    return _commit_policy
+
+def _write_log_safe(filepath: str, message: str, commit: bool = False):
+    """안전한 로그 쓰기 (파일 오류 시에도 계속 진행), commit 정책에 따라 flush / commit=True 면 즉시"""
     try:
         handler, lock = _get_file_handler(filepath)
         if handler and lock:
+            policy = _get_commit_policy()
             with lock:
                 handler.write(message + '\n')
-                handler.flush()  # 즉시 디스크에 쓰기
+                now = time.monotonic()
+                pending = _file_pending.setdefault(filepath, [0, now])
+                if pending[0] == 0:
+                    pending[1] = now
+                pending[0] += 1
+                if commit or policy.due(pending[0], now - pending[1]):
+                    commit_handle(handler, policy.fsync)
+                    pending[0] = 0
         else:
             # 파일 핸들러가 없으면 버퍼에 저장
             _log_buffer.append(f"[BUFFER] {message}")
@@ -517,6 +667,21 @@ def _write_log_safe(filepath: str, message: str):
         if len(_log_buffer) > _max_buffer_size:
             _log_buffer.pop(0)
 
+def _commit_stale_logs(force: bool = False):
+    """MAX_DELAY_MS 보다 오래 commit 안 된 줄이 있는 파일 flush"""
+    policy = _get_commit_policy()
+    now = time.monotonic()
+    for filepath, pending in list(_file_pending.items()):
+        if pending[0] and (force or now - pending[1] >= policy.max_delay):
+            try:
+                handler, lock = _get_file_handler(filepath)
+                if handler and lock:
+                    with lock:
+                        commit_handle(handler, policy.fsync)
+                        pending[0] = 0
+            except Exception:
+                pass
+
 def _log_worker():
     """로그 워커 스레드 (백그라운드에서 로그 처리)"""
     global _log_thread_running
@@ -526,21 +691,18 @@ def _log_worker():
         try:
             # 큐에서 로그 메시지 가져오기 (타임아웃으로 종료 가능하게)
             try:
-                log_entry = _log_queue.get(timeout=1.0)
+                log_entry = _log_queue.get(timeout=min(1.0, max(0.05, _get_commit_policy().max_delay)))
             except queue.Empty:
+                _commit_stale_logs()
                 continue
             
             if log_entry is None:  # 종료 신호
                 break
                 
-            timestamp, level, app_name, message, print_to_console = log_entry
+            timestamp, level, app_name, message, print_to_console, args = log_entry
             
-            # 로그 레벨 체크
-            if LOG_LEVELS.get(level.upper(), 0) < _current_log_level:
-                continue
-            
-            # 타임스탬프가 있는 메시지 생성
-            formatted_message = f"[{timestamp}] [{level.upper()}] [{app_name}] {message}"
+            # 레벨 확인은 safe_log 에서 끝남, 여기서는 포맷팅만
+            formatted_message = f"[{timestamp}] [{level.upper()}] [{app_name}] {_format_message(message, args)}"
             
             # 콘솔 출력
             if print_to_console:
@@ -549,16 +711,19 @@ def _log_worker():
                 except:
                     pass  # 콘솔 출력 실패 시 무시
             
-            # 파일에 쓰기
-            _write_log_safe(MAIN_LOG_PATH, formatted_message)
+            # 파일에 쓰기 (오류는 즉시 commit)
+            commit = level.upper() in COMMIT_IMMEDIATE_LEVELS
+            _write_log_safe(MAIN_LOG_PATH, formatted_message, commit)
             
             # 에러 레벨 이상은 별도 에러 로그에 저장
             if level.upper() in ["ERROR", "CRITICAL"]:
-                _write_log_safe(ERROR_LOG_PATH, formatted_message)
+                _write_log_safe(ERROR_LOG_PATH, formatted_message, commit)
             
             # 디버그 레벨은 별도 디버그 로그에 저장
             if level.upper() == "DEBUG":
                 _write_log_safe(DEBUG_LOG_PATH, formatted_message)
+            
+            _commit_stale_logs()
                 
         except Exception as e:
             # 로그 워커에서 오류가 발생해도 계속 실행
@@ -574,6 +739,7 @@ def _log_worker():
             _write_log_safe(MAIN_LOG_PATH, f"[BUFFER_DUMP] {len(_log_buffer)} buffered messages")
             for buffered_msg in _log_buffer:
                 _write_log_safe(MAIN_LOG_PATH, buffered_msg)
+        _commit_stale_logs(force=True)
     except:
         pass
 
@@ -606,7 +772,8 @@ def _initialize_logging():
             "INFO",
             "LOGGING_SYSTEM",
             "Unified logging system initialized successfully",
-            True
+            True,
+            ()
         ))
         
     except Exception as e:
@@ -641,6 +808,7 @@ def _cleanup_logging():
                 pass
         _file_handlers.clear()
         _file_locks.clear()
+        _file_pending.clear()
         
     except Exception as e:
         # 정리 과정에서 오류가 발생해도 무시
@@ -8,6 +8,8 @@ import sys
 import os
 import signal
 import atexit
+import queue
+import select
 import time
 from datetime import datetime
 
@@ -16,7 +18,9 @@ _termination_in_progress = False
 
 # Custom libraries
 from lib import appargs, msgstructure, types, config, prevstate
-from lib import safe_log, LogRotator
+from lib import shmring, blackboard, busqueue, hotroute, pipebus, timerwheel, tracing, batchqueue, busrecord
+from lib import safe_log, LogRotator, start_log_server, stop_log_server
+from lib.base_app import MsgDispatcher
 
 # Multiprocessing Library is used on Python FSW V2
 # Each application should have its own runloop
@@ -41,11 +45,62 @@ resource_manager.start_resource_monitoring()
 # 로그 로테이션 초기화
 log_rotator = LogRotator(max_size_mb=10, max_age_days=30)
 
+# 비행 중 디스크 사용량 확인 / 백그라운드 로그 로테이션 주기 (낮은 우선순위 별도 프로세스)
+LOG_ROTATION_CHECK_INTERVAL = float(config.get_config("LOGGING.ROTATION_CHECK_INTERVAL", 60))
+
+# 로그 전용 writer 프로세스 사용 여부 (config.json LOGGING.LOG_SERVER, lib/logging/log_server.py)
+LOG_SERVER = bool(config.get_config("LOGGING.LOG_SERVER", False))
+
 if config.get_config("FSW_MODE") == "NONE":
     main_safe_log("CONFIG IS SELECTED AS NONE, TERMINATING FSW", "ERROR", True)
     sys.exit(0)
 
-main_queue = Queue()
+# 앱 → 라우터 전송 방식 (config.json BUS.TRANSPORT)
+BUS_TRANSPORT = str(config.get_config("BUS.TRANSPORT", "PIPE")).upper()
+
+if BUS_TRANSPORT == "PIPE":
+    main_queue = pipebus.PipeBus()
+elif BUS_TRANSPORT == "SHM":
+    main_queue = shmring.RingBus(int(config.get_config("BUS.SHM_RING_SIZE", shmring.DEFAULT_RING_SIZE)))
+else:
+    main_queue = Queue()
+
+# 텔레메트리 블랙보드 생성 (앱들은 이름으로 attach, 실패 시 버스 메시지로 동작)
+telemetry_board = None
+if blackboard.BLACKBOARD_ENABLE:
+    try:
+        telemetry_board = blackboard.Blackboard.create()
+    except Exception as e:
+        main_safe_log(f"Blackboard creation failed, telemetry falls back to bus messages: {e}", "WARNING", True)
+
+# 라우터 우회 직접 전달 경로 (config.json BUS.HOT_ROUTES, lib/core/hotroute.py)
+HOT_ROUTES = hotroute.load_hot_routes()   # MID → (생산 AppID, 소비 AppID)
+hot_channels: dict = {}                   # MID → (수신단, 송신단) 전용 파이프, load_apps 에서 생성
+hot_route_counts: dict = {}               # MID → 라우터가 받은 mirror 사본 수
+
+# 앱 → 라우터 micro-batching (config.json BUS.BATCH_WINDOW_MS / BUS.BATCH_MAX, 0 이면 사용 안 함)
+BUS_BATCH_WINDOW = float(config.get_config("BUS.BATCH_WINDOW_MS", 0)) / 1000.0
+BUS_BATCH_MAX = int(config.get_config("BUS.BATCH_MAX", batchqueue.DEFAULT_MAX))
+
+def app_queue(appID):
+    """앱이 send_msg 에 사용할 큐 (PIPE/SHM 전송이면 앱 전용 파이프/링, batch/hot route 어댑터 적용)"""
+    app_bus = main_queue.producer(appID) if BUS_TRANSPORT in ("PIPE", "SHM") else main_queue
+    if BUS_BATCH_WINDOW > 0 and BUS_BATCH_MAX > 1:
+        app_bus = batchqueue.BatchingQueue(app_bus, BUS_BATCH_WINDOW, BUS_BATCH_MAX, appID)
+    writers = {mid: hot_channels[mid][1] for mid, (producer, _) in HOT_ROUTES.items() if producer == appID and mid in hot_channels}
+    if writers:
+        return hotroute.HotRouteQueue(app_bus, writers)
+    return app_bus
+
+def hot_readers(appID) -> list:
+    return [hot_channels[mid][0] for mid, (_, receiver) in HOT_ROUTES.items() if receiver == appID and mid in hot_channels]
+
+def app_pipe(appID, child_pipe):
+    """앱이 수신에 사용할 파이프 (hot route 소비 앱이면 메인 파이프 + 전용 파이프 묶음)"""
+    readers = hot_readers(appID)
+    if readers:
+        return hotroute.MuxConnection(child_pipe, readers)
+    return child_pipe
 
 class app_elements:
     process : Process = None
@@ -63,6 +118,25 @@ app_health_status = {}
 app_failure_threshold = 5  # 5초 동안 응답 없으면 비정상으로 간주
 app_restart_cooldown = 30  # 재시작 후 30초 대기
 
+# 라우터 전체 메시지 검증 (디버그 모드, config.json BUS.VALIDATE)
+BUS_VALIDATE = bool(config.get_config("BUS.VALIDATE", False))
+
+# 목적지 앱별 bounded outbox (MID 별 drop 정책, lib/core/busqueue.py)
+BUS_OUTBOX_CAPACITY = int(config.get_config("BUS.OUTBOX_CAPACITY", busqueue.DEFAULT_CAPACITY))
+BUS_COMMAND_OUTBOX_CAPACITY = int(config.get_config("BUS.COMMAND_OUTBOX_CAPACITY", busqueue.DEFAULT_COMMAND_CAPACITY))
+OUTBOX_FLUSH_BATCH = 16  # 쓰기 가능 확인 1회당 최대 전달 개수
+OUTBOX_RETRY_INTERVAL = 0.005  # outbox 에 남은 메시지가 있을 때 재시도 대기 (초)
+INTAKE_BATCH = 256       # 루프 1회당 main_queue 에서 꺼내는 최대 메시지 수
+
+# 버스 지연 추적 (config.json BUS.TRACE, lib/core/tracing.py) : 송신 → 라우터 구간
+router_tracer = tracing.LatencyTracer() if msgstructure.BUS_TRACE else None
+
+# 라우팅 프레임 기록 (config.json BUS.RECORD, lib/core/busrecord.py) : 재생은 python3 -m lib.core.busrecord replay
+bus_recorder = None
+if config.get_config("BUS.RECORD", False):
+    bus_recorder = busrecord.BusRecorder(busrecord.recording_path(config.get_config("BUS.RECORD_DIR", busrecord.DEFAULT_RECORD_DIR)))
+outboxes: dict[types.AppID, busqueue.Outbox] = {}
+
 def monitor_app_health():
     """앱 상태 모니터링 및 로깅"""
     global app_health_status
@@ -110,6 +184,10 @@ def log_system_status():
         
         main_safe_log(status_msg, "INFO", True)
         
+        # hot route 직접 전달 건수 (라우터가 받은 mirror 사본 기준)
+        if hot_route_counts:
+            main_safe_log(f"Hot routes (direct deliveries): {dict(sorted(hot_route_counts.items()))}", "INFO", True)
+        
         # 개별 앱 상태 로깅 (디버그 레벨)
         for app_id, app_elem in app_dict.items():
             if not app_elem.is_healthy:
@@ -143,14 +221,16 @@ def terminate_FSW():
 
     termination_message = msgstructure.MsgStructure()
     msgstructure.fill_msg(termination_message, appargs.MainAppArg.AppID, appargs.MainAppArg.AppID, appargs.MainAppArg.MID_TerminateProcess, "")
-    termination_message_to_send = msgstructure.pack_msg(termination_message)
+    termination_message_to_send = msgstructure.encode_msg(termination_message)
+    if isinstance(termination_message_to_send, str):
+        termination_message_to_send = termination_message_to_send.encode('utf-8')
 
     # 종료 메시지 전송
     for appID in app_dict:
         if app_dict[appID].process and app_dict[appID].process.is_alive():
             main_safe_log(f"Terminating AppID {appID}", "INFO", True)
             try:
-                app_dict[appID].pipe.send(termination_message_to_send)
+                app_dict[appID].pipe.send_bytes(termination_message_to_send)
             except Exception as e:
                 main_safe_log(f"Failed to send termination to {appID}: {e}", "ERROR", True)
     
@@ -181,9 +261,17 @@ def terminate_FSW():
     
     main_safe_log(f"All Termination Process complete, terminating FSW", "INFO", True)
     
+    if bus_recorder is not None:
+        try:
+            bus_recorder.close()
+            main_safe_log(f"Bus recording saved: {bus_recorder.path} ({bus_recorder.records} frames, "
+                          f"{bus_recorder.slot_records} blackboard updates)", "INFO", True)
+        except Exception as e:
+            main_safe_log(f"Bus recorder close error: {e}", "ERROR", True)
+    
     try:
-        # 추가 정리 작업
-        pass
+        # 로그 전용 프로세스에 남은 로그 기록 후 종료 (이후 로그는 main 내부 워커가 기록)
+        stop_log_server()
     except Exception as e:
         main_safe_log(f"Child process cleanup error: {e}", "ERROR", True)
 
@@ -225,6 +313,19 @@ def cleanup_queues():
                 main_queue.get_nowait()
             except:
                 break
+        # 라우터 outbox 정리
+        for outbox in outboxes.values():
+            outbox.clear()
+        # 앱별 파이프/공유 메모리 링/블랙보드 해제
+        if BUS_TRANSPORT in ("PIPE", "SHM"):
+            main_queue.close()
+        if telemetry_board is not None:
+            telemetry_board.close()
+        # hot route 전용 파이프 닫기
+        for reader, writer in hot_channels.values():
+            reader.close()
+            writer.close()
+        hot_channels.clear()
         main_safe_log("큐 정리 완료", "INFO", False)
     except Exception as e:
         main_safe_log(f"큐 정리 실패: {e}", "WARNING", False)
@@ -301,7 +402,11 @@ def restart_app(appID):
                 # 프로세스 및 파이프 생성
                 parent_pipe, child_pipe = Pipe()
                 
-                app_elem.process = Process(target=app_instance.start, args=(main_queue, child_pipe))
+                # 이전 프로세스가 읽지 못한 hot route 메시지 폐기 (오래된 데이터 전달 방지)
+                for reader in hot_readers(appID):
+                    hotroute.drain(reader)
+                
+                app_elem.process = Process(target=app_instance.start, args=(app_queue(appID), app_pipe(appID, child_pipe)))
                 app_elem.pipe = parent_pipe
                 
                 # 프로세스 시작
@@ -351,6 +456,11 @@ def load_apps():
 
         main_safe_log(f"로드할 앱 수: {len(apps_to_load)}", "INFO", True)
 
+        # hot route 전용 파이프 생성 (생산 앱 → 소비 앱 직접 전달, 재시작 시 재사용)
+        for mid, (producer, receiver) in HOT_ROUTES.items():
+            hot_channels[mid] = Pipe(duplex=False)
+            main_safe_log(f"Hot route MID {mid}: {producer} -> {receiver} (direct pipe)", "INFO", True)
+
         for module_path, class_name, app_id in apps_to_load:
             try:
                 main_safe_log(f"{class_name} 앱 로드 시도 중...", "INFO", True)
@@ -366,7 +476,7 @@ def load_apps():
                 parent_pipe, child_pipe = Pipe()
                 
                 app_elements_instance = app_elements()
-                app_elements_instance.process = Process(target=app_instance.start, args=(main_queue, child_pipe))
+                app_elements_instance.process = Process(target=app_instance.start, args=(app_queue(app_id), app_pipe(app_id, child_pipe)))
                 app_elements_instance.pipe = parent_pipe
                 app_elements_instance.last_heartbeat = time.time()
                 
@@ -398,140 +508,275 @@ def load_apps():
         import traceback
         main_safe_log(f"예외 상세: {traceback.format_exc()}", "ERROR", True)
 
+def route_to_app(appID, recv_msg : bytes, msg_id : types.MID, sender : types.AppID = None):
+    """메시지를 목적지 앱의 outbox 에 적재 (전달은 flush_outboxes, 상태 MID 는 (sender, MID) 별 최신값만 유지)"""
+    if appID not in outboxes:
+        outboxes[appID] = busqueue.Outbox(BUS_OUTBOX_CAPACITY, BUS_COMMAND_OUTBOX_CAPACITY)
+    outbox = outboxes[appID]
+    if not outbox.put(msg_id, recv_msg, sender):
+        # 명령이 버려지는 것은 소비 앱이 멈췄다는 뜻 → 첫 발생과 2의 거듭제곱 번째마다 ERROR
+        if outbox.overflows & (outbox.overflows - 1) == 0:
+            main_safe_log(f"Command outbox of app {appID} full ({outbox.command_capacity}), dropped MID {msg_id} "
+                          f"({outbox.overflows} commands dropped so far)", "ERROR", True)
+
+def flush_outboxes(current_time : float) -> bool:
+    """쓰기 가능한 파이프에만 outbox 내용을 전달. 남은 메시지가 있으면 True"""
+    pending = [appID for appID, outbox in outboxes.items() if len(outbox) and app_dict[appID].pipe is not None]
+    if not pending:
+        return False
+
+    try:
+        _, writable, _ = select.select([], [app_dict[appID].pipe for appID in pending], [], 0)
+    except (OSError, ValueError):
+        # 닫힌 파이프가 섞여 있으면 send_to_app 에서 오류/재시작 처리
+        writable = [app_dict[appID].pipe for appID in pending]
+
+    for appID in pending:
+        if app_dict[appID].pipe not in writable:
+            continue
+        # 꺼낸 메시지를 batch 프레임으로 묶어 전달 (파이프 쓰기 1회, BATCH_MAX_BYTES 단위)
+        outbox = outboxes[appID]
+        frames = []
+        size = msgstructure.BATCH_HEADER.size
+        for _ in range(OUTBOX_FLUSH_BATCH):
+            item = outbox.pop()
+            if item is None:
+                break
+            item_size = msgstructure.BATCH_ITEM.size + len(item[1])
+            if frames and size + item_size > msgstructure.BATCH_MAX_BYTES:
+                send_to_app(appID, msgstructure.pack_batch(frames), current_time)
+                frames = []
+                size = msgstructure.BATCH_HEADER.size
+            frames.append(item[1])
+            size += item_size
+        if frames:
+            send_to_app(appID, msgstructure.pack_batch(frames), current_time)
+
+    return any(len(outbox) for outbox in outboxes.values())
+
+def send_bus_stats():
+    """MID 별 drop 카운터를 HK 앱으로 전달"""
+    if appargs.HkAppArg.AppID not in app_dict:
+        return
+    stats_msg = msgstructure.MsgStructure()
+    payload = busqueue.format_drop_summary(busqueue.drop_summary(outboxes))
+    if not msgstructure.fill_msg(stats_msg, appargs.MainAppArg.AppID, appargs.HkAppArg.AppID, appargs.MainAppArg.MID_SendBusStats, payload):
+        return
+    frame = msgstructure.encode_msg(stats_msg)
+    if frame is None:
+        return
+    if isinstance(frame, str):
+        frame = frame.encode('utf-8')
+    route_to_app(appargs.HkAppArg.AppID, frame, appargs.MainAppArg.MID_SendBusStats)
+
+def send_latency_stats():
+    """송신 → 라우터 구간 지연 요약을 HK 앱으로 전달"""
+    if router_tracer is None or not router_tracer.histograms or appargs.HkAppArg.AppID not in app_dict:
+        return
+    stats_msg = msgstructure.MsgStructure()
+    if not msgstructure.fill_msg(stats_msg, appargs.MainAppArg.AppID, appargs.HkAppArg.AppID, appargs.HkAppArg.MID_ReceiveLatencyStats, router_tracer.pop_summary()):
+        return
+    frame = msgstructure.encode_msg(stats_msg)
+    if frame is None:
+        return
+    if isinstance(frame, str):
+        frame = frame.encode('utf-8')
+    route_to_app(appargs.HkAppArg.AppID, frame, appargs.HkAppArg.MID_ReceiveLatencyStats)
+
+def record_blackboard():
+    """블랙보드로만 전달되는 텔레메트리도 버스 기록에 남김 (재생 시 재생 전용 블랙보드에 다시 기록)"""
+    if bus_recorder is not None and telemetry_board is not None:
+        bus_recorder.sample_blackboard(telemetry_board)
+
+def send_to_app(appID, recv_msg : bytes, current_time : float):
+    """메시지를 해당 앱 파이프로 전달 (죽은 앱은 재시작 후 재전송)"""
+    app_elem = app_dict[appID]
+    
+    if app_elem.pipe is None:
+        main_safe_log(f"Pipe is None for {appID}", "ERROR", True)
+        return
+    
+    if not app_elem.process.is_alive():
+        # 앱이 죽어있으면 재시작 시도
+        main_safe_log(f"Process {appID} is dead, attempting restart", "WARNING", True)
+        if restart_app(appID):
+            # 재시작 성공 시 메시지 전송 재시도
+            try:
+                app_elem.pipe.send_bytes(recv_msg)
+                main_safe_log(f"Message sent to restarted app {appID}", "INFO", True)
+            except Exception as e:
+                main_safe_log(f"Failed to send message to restarted app {appID}: {e}", "ERROR", True)
+        return
+    
+    try:
+        app_elem.pipe.send_bytes(recv_msg)
+        # 성공적인 메시지 전송 시 앱 상태 업데이트
+        app_elem.last_heartbeat = current_time
+        app_elem.is_healthy = True
+        app_elem.failure_count = 0
+    except BrokenPipeError:
+        main_safe_log(f"Broken pipe for {appID}, attempting restart", "WARNING", True)
+        restart_app(appID)
+    except Exception as e:
+        try:
+            app_elem.pipe.close()
+        except:
+            pass
+        main_safe_log(f"파이프 닫기 오류: {e}", "WARNING")
+        main_safe_log(f"Failed to send message to {appID}: {e}", "ERROR", True)
+        
+        # 메시지 전송 실패 시 앱 상태 업데이트
+        app_elem.failure_count += 1
+        if app_elem.failure_count >= app_failure_threshold:
+            app_elem.is_healthy = False
+
+# 라우팅 대상 앱이 없는 메시지의 MID 별 처리 (handler(recv_msg, payload, receiver_app))
+UNROUTED_DISPATCHER = MsgDispatcher("Main")
+
+@UNROUTED_DISPATCHER.register(appargs.MainAppArg.MID_TerminateProcess)
+def on_unrouted_terminate(recv_msg, payload, receiver_app):
+    main_safe_log(f"Termination message received, but receiver app {receiver_app} not found", "WARNING", True)
+
+@UNROUTED_DISPATCHER.register(appargs.HkAppArg.MID_Housekeeping)
+def on_unrouted_housekeeping(recv_msg, payload, receiver_app):
+    main_safe_log(f"HK message received, but receiver app {receiver_app} not found", "WARNING", True)
+
+@UNROUTED_DISPATCHER.register(appargs.MainAppArg.MID_SendHK)
+def on_unrouted_debug_status(recv_msg, payload, receiver_app):
+    # CommApp에서 보낸 디버그 상태 메시지 처리
+    if payload == "DEBUG_ON":
+        main_safe_log("🔍 DEBUG MODE ENABLED - CommApp debug output will be shown", "INFO", True)
+    elif payload == "DEBUG_OFF":
+        main_safe_log("🔍 DEBUG MODE DISABLED - CommApp debug output hidden", "INFO", True)
+
+def intake_frame(recv_msg):
+    """수신 프레임 1개를 헤더만 보고 목적지 outbox 로 라우팅"""
+    # 메시지 타입 체크 및 변환
+    if isinstance(recv_msg, str):
+        try:
+            recv_msg = recv_msg.encode('utf-8')
+        except Exception as e:
+            main_safe_log(f"문자열을 바이트로 변환 실패: {e}", "ERROR", True)
+            return
+    elif not isinstance(recv_msg, bytes):
+        main_safe_log(f"지원하지 않는 메시지 타입: {type(recv_msg)}", "ERROR", True)
+        return
+
+    # 앱이 묶어 보낸 batch 프레임은 개별 프레임으로 풀어 라우팅
+    if msgstructure.is_batch(recv_msg):
+        for frame in msgstructure.iter_batch(recv_msg):
+            intake_frame(frame)
+        return
+
+    # 라우팅 fast path : 헤더의 sender/receiver/MsgID 만 읽고 페이로드는 건드리지 않음
+    route = msgstructure.peek_header(recv_msg)
+    if route is None:
+        main_safe_log(f"메시지 헤더 해석 실패: 잘못된 메시지 형식", "WARNING", True)
+        main_safe_log(f"메시지 내용: {recv_msg[:100]}...", "DEBUG", True)
+        return
+    sender_app, receiver_app, msg_id = route
+
+    if bus_recorder is not None:
+        bus_recorder.record(recv_msg)
+
+    # 지연 추적 : 라우터 dequeue 시각 기록 및 송신 → 라우터 구간 집계
+    if router_tracer is not None:
+        recv_msg = router_tracer.stamp_router(recv_msg, msg_id)
+
+    # hot route mirror 사본 : 소비 앱에는 전용 파이프로 이미 전달됨 → 집계만 하고 재전달하지 않음
+    direct_app = None
+    if msgstructure.is_mirror(recv_msg):
+        hot_route_counts[msg_id] = hot_route_counts.get(msg_id, 0) + 1
+        direct_app = HOT_ROUTES.get(msg_id, (None, None))[1]
+
+    # 디버그 모드(BUS.VALIDATE)에서만 전체 언패킹/검증
+    if BUS_VALIDATE:
+        unpacked_msg = msgstructure.MsgStructure()
+        if not msgstructure.unpack_msg(unpacked_msg, recv_msg):
+            main_safe_log(f"메시지 언패킹 실패: 잘못된 메시지 형식", "WARNING", True)
+            main_safe_log(f"메시지 내용: {recv_msg[:100]}...", "DEBUG", True)
+            return
+        main_safe_log(f"Main app received message: {msg_id} from {unpacked_msg.sender_app}", "DEBUG", True)
+
+    # 메시지 라우팅
+    if receiver_app == appargs.PUBLISH_APPID:
+        # 발행 메시지 : MID 구독 테이블에 따라 모든 구독 앱으로 fan-out
+        for subscriber in msgstructure.SUBSCRIBERS.get(msg_id, ()):
+            if subscriber in app_dict and subscriber != direct_app:
+                route_to_app(subscriber, recv_msg, msg_id, sender_app)
+    else:
+        # 일반 메시지 처리 (단일 수신 앱 지정)
+        if receiver_app == direct_app:
+            return
+        if receiver_app in app_dict:
+            route_to_app(receiver_app, recv_msg, msg_id, sender_app)
+        else:
+            # 라우팅 대상이 없는 메시지 (드묾) : 이 경로에서만 전체 언패킹
+            unpacked_msg = msgstructure.MsgStructure()
+            if not msgstructure.unpack_msg(unpacked_msg, recv_msg):
+                main_safe_log(f"메시지 언패킹 실패: 잘못된 메시지 형식", "WARNING", True)
+                return
+
+            main_safe_log(f"Unknown receiver app: {receiver_app} (MsgID: {msg_id}, Sender: {unpacked_msg.sender_app})", "WARNING", True)
+
+            # 특별한 메시지 타입 처리
+            if not UNROUTED_DISPATCHER.dispatch(unpacked_msg, receiver_app):
+                main_safe_log(f"Unhandled message type {msg_id} for unknown receiver {receiver_app}", "WARNING", True)
+
 def runloop(Main_Queue : Queue):
-    """메인 루프 (개선된 버전)"""
+    """메인 루프 (이벤트 기반 : 수신 트래픽 또는 타이머 만료 시에만 깨어남)"""
     global MAINAPP_RUNSTATUS
     
-    start_time = time.time()
     max_runtime = 3600  # 1시간
-    last_health_check = time.time()
-    last_status_log = time.time()
     health_check_interval = 5.0  # 5초마다 앱 상태 체크
     status_log_interval = 30.0   # 30초마다 시스템 상태 로깅
+    bus_stats_interval = 5.0     # 5초마다 drop 카운터를 HK 로 전달
+    
+    def stop_on_max_runtime():
+        global MAINAPP_RUNSTATUS
+        main_safe_log("Maximum runtime reached, terminating FSW", "WARNING", True)
+        MAINAPP_RUNSTATUS = False
+    
+    # 주기 작업은 timer wheel 로 관리 (다음 만료 시각까지 수신 대기)
+    timers = timerwheel.TimerWheel()
+    timers.every(health_check_interval, monitor_app_health)
+    timers.every(status_log_interval, log_system_status)
+    timers.every(bus_stats_interval, send_bus_stats)
+    timers.every(LOG_ROTATION_CHECK_INTERVAL, log_rotator.check_and_rotate_async)
+    if router_tracer is not None:
+        timers.every(tracing.REPORT_INTERVAL, send_latency_stats)
+    if bus_recorder is not None and telemetry_board is not None:
+        timers.every(busrecord.SLOT_SAMPLE_INTERVAL, record_blackboard)
+    timers.after(max_runtime, stop_on_max_runtime)
     
     while MAINAPP_RUNSTATUS:
         try:
-            # 최대 실행 시간 체크
-            if time.time() - start_time > max_runtime:
-                main_safe_log("Maximum runtime reached, terminating FSW", "WARNING", True)
+            # 만료된 주기 작업 실행
+            timers.run_due()
+            if not MAINAPP_RUNSTATUS:
                 break
             
-            current_time = time.time()
-            
-            # 주기적 앱 상태 모니터링
-            if current_time - last_health_check >= health_check_interval:
-                monitor_app_health()
-                last_health_check = current_time
-            
-            # 주기적 시스템 상태 로깅
-            if current_time - last_status_log >= status_log_interval:
-                log_system_status()
-                last_status_log = current_time
-            
-            # 메시지 처리
-            try:
-                recv_msg = Main_Queue.get(timeout=0.1)
-            except:
-                continue
-            
-            # 메시지 타입 체크 및 변환
-            if isinstance(recv_msg, str):
-                # 문자열 메시지를 바이트로 변환
-                try:
-                    recv_msg = recv_msg.encode('utf-8')
-                    main_safe_log(f"문자열 메시지를 바이트로 변환: {recv_msg[:50]}...", "DEBUG", True)
-                except Exception as e:
-                    main_safe_log(f"문자열을 바이트로 변환 실패: {e}", "ERROR", True)
-                    continue
-            elif not isinstance(recv_msg, bytes):
-                main_safe_log(f"지원하지 않는 메시지 타입: {type(recv_msg)}", "ERROR", True)
-                continue
+            # 대기 중인 outbox 전달 (쓰기 가능한 파이프만)
+            outbox_pending = flush_outboxes(time.time())
             
-            # 메시지 언패킹
+            # 트래픽 또는 다음 타이머 만료까지 대기 (outbox 에 남은 메시지가 있으면 짧게 대기 후 재시도)
+            timeout = timers.next_timeout()
+            if outbox_pending:
+                timeout = min(timeout, OUTBOX_RETRY_INTERVAL)
             try:
-                unpacked_msg = msgstructure.MsgStructure()
-                if not msgstructure.unpack_msg(unpacked_msg, recv_msg.decode('utf-8')):
-                    main_safe_log(f"메시지 언패킹 실패: 잘못된 메시지 형식", "WARNING", True)
-                    main_safe_log(f"메시지 내용: {recv_msg[:100]}...", "DEBUG", True)
-                    continue
-            except Exception as e:
-                main_safe_log(f"메시지 언패킹 실패: {e}", "WARNING", True)
-                main_safe_log(f"메시지 내용: {recv_msg[:100]}...", "DEBUG", True)
+                recv_msg = Main_Queue.get(timeout=timeout)
+            except queue.Empty:
                 continue
             
-            main_safe_log(f"Main app received message: {unpacked_msg.MsgID} from {unpacked_msg.sender_app}", "DEBUG", True)
+            intake_frame(recv_msg)
             
-            # 메시지 라우팅
-            if unpacked_msg.receiver_app == appargs.CommAppArg.AppID:
-                # 텔레메트리 메시지를 Comm 앱으로 리다이렉트
+            # 같은 시점에 쌓인 메시지를 모두 outbox 로 옮긴 뒤 전달 → lane 우선순위가 대기 중인 트래픽 전체에 적용
+            for _ in range(INTAKE_BATCH - 1):
                 try:
-                    if appargs.CommAppArg.AppID in app_dict and app_dict[appargs.CommAppArg.AppID].pipe:
-                        app_dict[appargs.CommAppArg.AppID].pipe.send(recv_msg)
-                        main_safe_log(f"Telemetry message redirected to Comm app: {unpacked_msg.MsgID}", "DEBUG", True)
-                    else:
-                        main_safe_log(f"Comm app not available for telemetry message: {unpacked_msg.MsgID}", "WARNING", True)
-                except Exception as e:
-                    main_safe_log(f"Failed to redirect telemetry message to Comm app: {e}", "ERROR", True)
-                except:
-                    main_safe_log(f"Comm app not found for telemetry message: {unpacked_msg.MsgID}", "WARNING", True)
-            else:
-                # 일반 메시지 처리
-                if unpacked_msg.receiver_app in app_dict:
-                    app_elem = app_dict[unpacked_msg.receiver_app]
-                    
-                    if app_elem.pipe is None:
-                        main_safe_log(f"Pipe is None for {unpacked_msg.receiver_app}", "ERROR", True)
-                        continue
-                    
-                    if not app_elem.process.is_alive():
-                        # 앱이 죽어있으면 재시작 시도
-                        main_safe_log(f"Process {unpacked_msg.receiver_app} is dead, attempting restart", "WARNING", True)
-                        if restart_app(unpacked_msg.receiver_app):
-                            # 재시작 성공 시 메시지 전송 재시도
-                            try:
-                                app_elem.pipe.send(recv_msg)
-                                main_safe_log(f"Message sent to restarted app {unpacked_msg.receiver_app}", "INFO", True)
-                            except Exception as e:
-                                main_safe_log(f"Failed to send message to restarted app {unpacked_msg.receiver_app}: {e}", "ERROR", True)
-                        continue
-                    
-                    try:
-                        app_elem.pipe.send(recv_msg)
-                        # 성공적인 메시지 전송 시 앱 상태 업데이트
-                        app_elem.last_heartbeat = current_time
-                        app_elem.is_healthy = True
-                        app_elem.failure_count = 0
-                    except BrokenPipeError:
-                        main_safe_log(f"Broken pipe for {unpacked_msg.receiver_app}, attempting restart", "WARNING", True)
-                        restart_app(unpacked_msg.receiver_app)
-                    except Exception as e:
-                        try:
-                            app_elem.pipe.close()
-                        except:
-                            pass
-                        main_safe_log(f"파이프 닫기 오류: {e}", "WARNING")
-                        main_safe_log(f"Failed to send message to {unpacked_msg.receiver_app}: {e}", "ERROR", True)
-                        
-                        # 메시지 전송 실패 시 앱 상태 업데이트
-                        app_elem.failure_count += 1
-                        if app_elem.failure_count >= app_failure_threshold:
-                            app_elem.is_healthy = False
-                else:
-                    main_safe_log(f"Unknown receiver app: {unpacked_msg.receiver_app} (MsgID: {unpacked_msg.MsgID}, Sender: {unpacked_msg.sender_app})", "WARNING", True)
-                    
-                    # 특별한 메시지 타입 처리
-                    if unpacked_msg.MsgID == appargs.MainAppArg.MID_TerminateProcess:
-                        main_safe_log(f"Termination message received, but receiver app {unpacked_msg.receiver_app} not found", "WARNING", True)
-                    elif unpacked_msg.MsgID == appargs.HkAppArg.MID_Housekeeping:
-                        main_safe_log(f"HK message received, but receiver app {unpacked_msg.receiver_app} not found", "WARNING", True)
-                    elif unpacked_msg.MsgID == appargs.MainAppArg.MID_SendHK:
-                        # CommApp에서 보낸 디버그 상태 메시지 처리
-                        if unpacked_msg.data == "DEBUG_ON":
-                            main_safe_log("🔍 DEBUG MODE ENABLED - CommApp debug output will be shown", "INFO", True)
-                        elif unpacked_msg.data == "DEBUG_OFF":
-                            main_safe_log("🔍 DEBUG MODE DISABLED - CommApp debug output hidden", "INFO", True)
-                    else:
-                        main_safe_log(f"Unhandled message type {unpacked_msg.MsgID} for unknown receiver {unpacked_msg.receiver_app}", "WARNING", True)
+                    recv_msg = Main_Queue.get_nowait()
+                except queue.Empty:
+                    break
+                intake_frame(recv_msg)
             
         except Exception as e:
             main_safe_log(f"Main loop error: {e}", "ERROR", True)
@@ -544,6 +789,11 @@ def main():
     try:
         main_safe_log("CANSAT HEPHAESTUS 2025 FSW2 시작", "INFO", True)
         
+        # 앱 프로세스가 채널을 물려받도록 앱 로드 전에 시작
+        if LOG_SERVER:
+            start_log_server()
+            main_safe_log("Log server process started", "INFO", True)
+        
         # 앱 로드
         main_safe_log("load_apps() 호출 시작", "INFO", True)
         load_apps()
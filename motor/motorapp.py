@@ -35,17 +35,21 @@ import pigpio
 
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[Motor] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "Motor", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[Motor] 로깅 실패: {e}")
         print(f"[Motor] 원본 메시지: {message}")
 
 from lib import appargs, msgstructure, logging, config  # type: ignore
+from lib.base_app import MsgReceiver  # type: ignore
 from motor import motor  # local helper that provides angle_to_pulse()
 
 # ────────────────────────────────────────────
@@ -172,7 +176,7 @@ def command_handler(main_q: Queue, recv: msgstructure.MsgStructure) -> None:
     elif recv.MsgID == appargs.ImuAppArg.MID_SendYawData:
         # Control motor only if config is payload and is activated
         if config.FSW_CONF == config.CONF_PAYLOAD and PAYLOAD_MOTOR_ENABLE == True:
-            recv_yaw = float(recv.data)
+            recv_yaw = float(msgstructure.payload_values(recv)[0])
             # Yaw 데이터를 기반으로 모터 제어 (간단한 예시)
             angle = max(0, min(180, 90 + recv_yaw))  # 90도를 중심으로 ±90도
             pulse = motor.angle_to_pulse(angle)
@@ -235,11 +239,11 @@ def command_handler(main_q: Queue, recv: msgstructure.MsgStructure) -> None:
     # Angle command from Flightlogic
     elif recv.MsgID == appargs.FlightlogicAppArg.MID_SetServoAngle:
         try:
-            pulse = int(float(recv.data))
+            pulse = int(msgstructure.payload_values(recv)[0])
             set_servo_pulse(pulse)
-            safe_log(f"Servo pulse set to {pulse}µs (from flightlogic)", "info".upper(), True)
+            safe_log("Servo pulse set to %dµs (from flightlogic)", "INFO", True, args=(pulse,))
         except Exception as e:
-            safe_log(f"Bad pulse cmd: {recv.data} – {e}", "error".upper(), True)
+            safe_log(f"Bad pulse cmd: {recv.values or recv.data} – {e}", "error".upper(), True)
         return
 
     else:
@@ -281,7 +285,7 @@ def controlgimbalmotor(yaw):
         angle = max(0, min(180, 90 + yaw))  # 90도를 중심으로 ±90도
         pulse = motor.angle_to_pulse(angle)
         set_servo_pulse(pulse)
-        safe_log(f"Gimbal motor controlled by yaw: {yaw}° -> angle: {angle}°", "info".upper(), True)
+        safe_log("Gimbal motor controlled by yaw: %s° -> angle: %s°", "INFO", True, args=(yaw, angle))
 
 # ────────────────────────────────────────────
 # Main loop
@@ -343,29 +347,26 @@ def motorapp_main(main_q: Queue, main_pipe: connection.Connection):
     # 스레드 자동 재시작 래퍼
     thread_dict["READ"] = resilient_thread(read_motor_status, name="READ")
 
+    # 공통 수신 helper (수신 앱 검증 포함, hot route 파이프도 함께 수신)
+    receiver = MsgReceiver(main_pipe, appargs.MotorAppArg.AppID, main_q)
+
     try:
         while MOTORAPP_RUNSTATUS:
             # Non-blocking receive with timeout
             try:
-                if main_pipe.poll(0.5):  # 0.5초 타임아웃으로 단축
-                    try:
-                        raw = main_pipe.recv()
-                    except (EOFError, BrokenPipeError, ConnectionResetError):
-                        safe_log("Pipe connection lost", "error".upper(), True)
-                        break
-                    except Exception as e:
-                        safe_log(f"Pipe receive error: {e}", "error".upper(), True)
-                        continue
-                else:
+                try:
+                    m = receiver.receive(0.5)  # 0.5초 타임아웃으로 단축
+                except (EOFError, BrokenPipeError, ConnectionResetError):
+                    safe_log("Pipe connection lost", "error".upper(), True)
+                    break
+                except Exception as e:
+                    safe_log(f"Pipe receive error: {e}", "error".upper(), True)
+                    continue
+                if m is None:
                     # 타임아웃 시 루프 계속
                     continue
-                    
-                m = raw
 
-                if m.receiver_app in (appargs.MotorAppArg.AppID, appargs.MainAppArg.AppID):
-                    command_handler(main_q, m)
-                else:
-                    safe_log("Receiver AppID mismatch for motorapp", "error".upper(), True)
+                command_handler(main_q, m)
                                     
             except Exception as e:
                 safe_log(f"Main loop error: {e}", "error".upper(), True)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Software Bus Benchmark
+센서 없이 소프트웨어 버스(main_queue + 앱별 Pipe)만 측정하는 벤치마크
+
+- 실제 main.runloop 라우터를 띄우고 N 쌍의 합성 생산/소비 앱 프로세스를 연결
+- 메시지 rate (생산 앱당 msg/s) 와 payload 크기를 sweep
+- 측정 지점마다 처리량(msg/s), 프로세스별 CPU 사용률, 송신 → 수신 지연 백분위를 JSON Lines 로 출력
+- 전송 방식(BUS.TRANSPORT), 인코딩(BUS.ENCODING), micro-batch window 를 바꿔 비교 가능
+
+파일 이름이 test_ 로 시작하지 않으므로 pytest 수집 대상이 아님 (직접 실행)
+측정 지점마다 새 프로세스에서 main 을 import 하므로 라우터 상태가 지점 간에 섞이지 않음
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PRODUCER_BASE_ID = 100      # 합성 생산 앱 AppID = 100 + i
+CONSUMER_BASE_ID = 150      # 합성 소비 앱 AppID = 150 + i
+BENCH_BASE_MID = 9000       # 합성 MID = 9000 + i (스키마 없음, 텍스트 payload)
+STARTUP_DELAY = 0.5         # 앱 프로세스 시작 후 측정 시작까지 대기 (초)
+RESULT_TIMEOUT = 10.0       # 앱 결과 수집 최대 대기 (초)
+
+def make_payload(seq: int, size: int) -> str:
+    """'seq,송신 시각,패딩' 형식, 최소 길이 이상이면 size 바이트로 맞춤"""
+    head = f"{seq},{time.monotonic():.9f},"
+    return head + "x" * max(0, size - len(head))
+
+def producer_main(app_id, consumer_id, mid, bus, rate, size, duration, start, results):
+    """합성 생산 앱 : start 이후 duration 동안 rate msg/s 로 소비 앱에 전송 (rate 0 이면 최대 속도)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from lib import msgstructure
+
+    msg = msgstructure.MsgStructure()
+    interval = 1.0 / rate if rate > 0 else 0.0
+    sent = 0
+    failures = 0
+
+    start.wait()
+    cpu_start = time.process_time()
+    next_send = time.monotonic()
+    end = next_send + duration
+    while True:
+        now = time.monotonic()
+        if now >= end:
+            break
+        if interval and now < next_send:
+            time.sleep(min(next_send - now, end - now))
+            continue
+        if msgstructure.send_msg(bus, msg, app_id, consumer_id, mid, make_payload(sent, size)):
+            sent += 1
+        else:
+            failures += 1
+        next_send += interval
+
+    # micro-batch 로 대기 중인 프레임이 있으면 flusher 스레드가 보낼 시간을 줌
+    time.sleep(0.05)
+    results.put(("producer", app_id, {"sent": sent, "send_failures": failures,
+                                      "cpu": time.process_time() - cpu_start}))
+
+def consumer_main(app_id, pipe, start, stop, results):
+    """합성 소비 앱 : stop 까지 수신하며 payload 의 송신 시각으로 지연 히스토그램 기록"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from lib.base_app import MsgReceiver
+    from lib.core import tracing
+
+    receiver = MsgReceiver(pipe, app_id)
+    hist = tracing.LatencyHistogram()
+    received = 0
+    invalid = 0
+
+    start.wait()
+    cpu_start = time.process_time()
+    while not stop.is_set():
+        try:
+            recv_msg = receiver.receive(0.05)
+        except (EOFError, OSError):
+            break
+        if recv_msg is None:
+            continue
+        try:
+            sent_at = float(recv_msg.data.split(",", 2)[1])
+        except (AttributeError, IndexError, ValueError):
+            invalid += 1
+            continue
+        hist.record(time.monotonic() - sent_at)
+        received += 1
+
+    results.put(("consumer", app_id, {"received": received, "invalid": invalid,
+                                      "coalesced": receiver.coalesced,
+                                      "cpu": time.process_time() - cpu_start,
+                                      "hist": (hist.counts, hist.total, hist.max_us)}))
+
+def configure_bus(main, args):
+    """main import 후 명령줄 인자로 버스 설정 덮어쓰기 (config.json 은 수정하지 않음)"""
+    from lib import msgstructure, busqueue, pipebus, shmring
+
+    if args.encoding:
+        msgstructure.BUS_ENCODING = args.encoding
+    if args.batch_window_ms is not None:
+        main.BUS_BATCH_WINDOW = args.batch_window_ms / 1000.0
+    # 합성 MID 만 사용하므로 hot route 없음
+    main.HOT_ROUTES = {}
+
+    transport = args.transport or main.BUS_TRANSPORT
+    if transport != main.BUS_TRANSPORT:
+        if main.BUS_TRANSPORT in ("PIPE", "SHM"):
+            main.main_queue.close()
+        if transport == "PIPE":
+            main.main_queue = pipebus.PipeBus()
+        elif transport == "SHM":
+            main.main_queue = shmring.RingBus()
+        else:
+            main.main_queue = multiprocessing.Queue()
+        main.BUS_TRANSPORT = transport
+
+    for index in range(args.pairs):
+        busqueue.MID_POLICIES[BENCH_BASE_MID + index] = args.policy
+
+def run_point(args, rate, size, output):
+    """측정 지점 1개 : 라우터(이 프로세스) + 합성 앱 2N 개 실행 후 결과를 output 큐로 전달"""
+    if not args.verbose:
+        sys.stdout = open(os.devnull, "w")
+    import atexit
+    import main
+    from lib import busqueue, msgstructure, tracing
+
+    # FSW 종료 처리(prevstate 초기화 등)가 벤치마크 종료에 끼어들지 않도록 해제
+    atexit.unregister(main.terminate_FSW)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    main.resource_manager.stop_resource_monitoring()
+    configure_bus(main, args)
+
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Event()
+    stop = ctx.Event()
+    results = ctx.Queue()
+    for index in range(args.pairs):
+        producer_id = PRODUCER_BASE_ID + index
+        consumer_id = CONSUMER_BASE_ID + index
+        parent_pipe, child_pipe = ctx.Pipe()
+        for app_id, process in (
+            (producer_id, ctx.Process(target=producer_main, args=(producer_id, consumer_id, BENCH_BASE_MID + index,
+                                                                  main.app_queue(producer_id), rate, size,
+                                                                  args.duration, start, results))),
+            (consumer_id, ctx.Process(target=consumer_main, args=(consumer_id, child_pipe, start, stop, results))),
+        ):
+            app_elem = main.app_elements()
+            app_elem.process = process
+            app_elem.pipe = parent_pipe if app_id == consumer_id else None
+            app_elem.last_heartbeat = time.time()
+            main.app_dict[app_id] = app_elem
+            process.start()
+
+    time.sleep(STARTUP_DELAY)
+
+    def finish():
+        stop.set()
+        main.MAINAPP_RUNSTATUS = False
+    threading.Timer(args.duration + args.drain, finish).start()
+
+    start.set()
+    cpu_start = time.process_time()
+    main.runloop(main.main_queue)
+    router_cpu = time.process_time() - cpu_start
+
+    reports = {}
+    deadline = time.monotonic() + RESULT_TIMEOUT
+    while len(reports) < 2 * args.pairs and time.monotonic() < deadline:
+        try:
+            kind, app_id, report = results.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        reports[app_id] = (kind, report)
+    main.cleanup_child_processes()
+    dropped = sum(busqueue.drop_summary(main.outboxes).values())
+    main.cleanup_queues()
+
+    producers = [report for kind, report in reports.values() if kind == "producer"]
+    consumers = [report for kind, report in reports.values() if kind == "consumer"]
+    hist = tracing.LatencyHistogram()
+    for report in consumers:
+        counts, total, max_us = report.pop("hist")
+        hist.counts = [a + b for a, b in zip(hist.counts, counts)]
+        hist.total += total
+        hist.max_us = max(hist.max_us, max_us)
+
+    received = sum(report["received"] for report in consumers)
+    latency = {f"p{p}": round(hist.percentile(p), 1) for p in (50, 90, 99)}
+    latency["max"] = round(hist.max_us, 1)
+    output.put({
+        "transport": main.BUS_TRANSPORT,
+        "encoding": msgstructure.BUS_ENCODING,
+        "batch_window_ms": main.BUS_BATCH_WINDOW * 1000.0,
+        "policy": args.policy,
+        "pairs": args.pairs,
+        "rate": rate,
+        "size": size,
+        "duration": args.duration,
+        "sent": sum(report["sent"] for report in producers),
+        "send_failures": sum(report["send_failures"] for report in producers),
+        "received": received,
+        "dropped": dropped,
+        "coalesced": sum(report["coalesced"] for report in consumers),
+        "missing_reports": 2 * args.pairs - len(reports),
+        "msgs_per_sec": round(received / args.duration, 1),
+        "latency_us": latency,
+        "cpu_percent": {
+            "router": round(router_cpu / (args.duration + args.drain) * 100, 1),
+            "producers": [round(report["cpu"] / args.duration * 100, 1) for report in producers],
+            "consumers": [round(report["cpu"] / (args.duration + args.drain) * 100, 1) for report in consumers],
+        },
+    })
+
+def parse_list(text: str) -> list:
+    return [int(value) for value in text.split(",") if value.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="CANSAT FSW software bus benchmark (JSON Lines output)")
+    parser.add_argument("--pairs", type=int, default=4, help="합성 생산/소비 앱 쌍 수")
+    parser.add_argument("--rates", type=parse_list, default=[100, 1000], help="생산 앱당 msg/s 목록 (0 = 최대 속도)")
+    parser.add_argument("--sizes", type=parse_list, default=[32, 256, 1024], help="payload 크기(bytes) 목록")
+    parser.add_argument("--duration", type=float, default=5.0, help="측정 지점당 송신 시간 (초)")
+    parser.add_argument("--drain", type=float, default=1.0, help="송신 종료 후 수신 대기 시간 (초)")
+    parser.add_argument("--transport", choices=("PIPE", "SHM", "QUEUE"), help="BUS.TRANSPORT 덮어쓰기")
+    parser.add_argument("--encoding", choices=("TEXT", "BINARY"), help="BUS.ENCODING 덮어쓰기")
+    parser.add_argument("--batch-window-ms", type=float, help="BUS.BATCH_WINDOW_MS 덮어쓰기 (0 = batch 사용 안 함)")
+    parser.add_argument("--policy", choices=("DROP_OLDEST", "NEVER_DROP", "KEEP_LATEST"), default="DROP_OLDEST",
+                        help="합성 MID 의 outbox drop 정책 (DROP_OLDEST = 센서 bulk lane)")
+    parser.add_argument("--output", help="결과 JSON Lines 파일 (기본 : 표준 출력)")
+    parser.add_argument("--verbose", action="store_true", help="FSW 로그 출력 유지")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("fork")
+    out = open(args.output, "a") if args.output else sys.stdout
+    try:
+        for rate in args.rates:
+            for size in args.sizes:
+                output = ctx.Queue()
+                point = ctx.Process(target=run_point, args=(args, rate, size, output))
+                point.start()
+                try:
+                    result = output.get(timeout=STARTUP_DELAY + args.duration + args.drain + 2 * RESULT_TIMEOUT + 30)
+                except queue.Empty:
+                    result = {"rate": rate, "size": size, "error": "benchmark point timed out"}
+                point.join(timeout=5)
+                if point.is_alive():
+                    point.kill()
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
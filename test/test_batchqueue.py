@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+앱 → 라우터 micro-batching (lib/core/batchqueue.py) 테스트
+batch 프레임 묶기/풀기, 명령이 대기 batch 뒤에 즉시 전달되는 순서, 라우터가 막혔을 때 drop 과 HK 보고 확인
+"""
+
+import os
+import queue
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import appargs, batchqueue, busqueue, msgstructure
+
+APP_ID = appargs.BarometerAppArg.AppID
+BULK_MID = appargs.BarometerAppArg.MID_SendHK
+COMMAND_MID = appargs.MainAppArg.MID_TerminateProcess
+
+class FakeQueue:
+    """라우터 큐 대역 : full 이면 queue.Full"""
+
+    def __init__(self):
+        self.items = []
+        self.full = False
+
+    def put(self, msg, *args, **kwargs):
+        if self.full:
+            raise queue.Full
+        self.items.append(msg)
+
+def _frame(sender, receiver, mid, data):
+    msg = msgstructure.MsgStructure()
+    msgstructure.fill_msg(msg, sender, receiver, mid, data)
+    return msgstructure.pack_msg_binary(msg)
+
+def _bulk(i):
+    return _frame(APP_ID, appargs.HkAppArg.AppID, BULK_MID, f"hk{i}")
+
+def _unbatch(items):
+    frames = []
+    for item in items:
+        frames.extend(msgstructure.iter_batch(item) if msgstructure.is_batch(item) else [item])
+    return frames
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+def test_batch_round_trip():
+    frames = [_frame(3, 4, COMMAND_MID, str(i)) for i in range(5)]
+    batch = msgstructure.pack_batch(frames)
+    assert msgstructure.is_batch(batch)
+    assert list(msgstructure.iter_batch(batch)) == frames
+
+def test_single_frame_batch_is_unchanged():
+    frame = _frame(3, 4, COMMAND_MID, "only")
+    assert msgstructure.pack_batch([frame]) == frame
+    assert not msgstructure.is_batch(frame)
+
+def test_truncated_batch_stops_at_last_whole_frame():
+    frames = [b"a" * 10, b"b" * 20, b"c" * 30]
+    batch = msgstructure.pack_batch(frames)
+    assert list(msgstructure.iter_batch(batch[:-5])) == frames[:2]
+
+def test_window_flush():
+    target = FakeQueue()
+    batching = batchqueue.BatchingQueue(target, window=0.02, max_items=16)
+    for i in range(3):
+        batching.put(_bulk(i))
+    assert target.items == []
+    assert _wait_for(lambda: target.items)
+    assert len(target.items) == 1
+    assert _unbatch(target.items) == [_bulk(i) for i in range(3)]
+
+def test_command_follows_pending_batch_immediately():
+    """명령은 window 를 기다리지 않고, 먼저 들어온 bulk batch 를 보낸 직후 전달 (순서 유지)"""
+    target = FakeQueue()
+    batching = batchqueue.BatchingQueue(target, window=10.0, max_items=16)
+    batching.put(_bulk(0))
+    batching.put(_bulk(1))
+    command = _frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, "stop")
+    batching.put(command)
+    assert _unbatch(target.items) == [_bulk(0), _bulk(1), command]
+
+def test_max_items_flush():
+    target = FakeQueue()
+    batching = batchqueue.BatchingQueue(target, window=10.0, max_items=4)
+    for i in range(4):
+        batching.put(_bulk(i))
+    assert len(target.items) == 1
+    assert _unbatch(target.items) == [_bulk(i) for i in range(4)]
+
+def test_router_full_drops_oldest_and_reports():
+    target = FakeQueue()
+    target.full = True
+    batching = batchqueue.BatchingQueue(target, window=0.02, max_items=4, app_id=APP_ID)
+    for i in range(10):
+        batching.put(_bulk(i))
+    assert batching.drops == {BULK_MID: 6}
+    assert target.items == []
+
+    # 라우터가 다시 받기 시작하면 남은 최신 4개와 drop 보고가 전달됨
+    target.full = False
+    assert _wait_for(lambda: any(not msgstructure.is_batch(item) for item in target.items))
+    frames = _unbatch(target.items)
+    assert [frame for frame in frames if frame in [_bulk(i) for i in range(10)]] == [_bulk(i) for i in range(6, 10)]
+
+    report = msgstructure.MsgStructure()
+    assert msgstructure.unpack_msg(report, frames[-1])
+    assert (report.sender_app, report.receiver_app, report.MsgID) == (APP_ID, appargs.HkAppArg.AppID, appargs.HkAppArg.MID_ReceiveDropStats)
+    assert busqueue.parse_drop_summary(report.data) == {"total": 6, BULK_MID: 6}
+
+def test_no_report_without_app_id():
+    target = FakeQueue()
+    target.full = True
+    batching = batchqueue.BatchingQueue(target, window=0.02, max_items=2)
+    for i in range(4):
+        batching.put(_bulk(i))
+    target.full = False
+    assert _wait_for(lambda: target.items)
+    time.sleep(0.1)
+    assert all(msgstructure.is_batch(item) for item in target.items)
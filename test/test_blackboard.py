@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+텔레메트리 블랙보드 (lib/core/blackboard.py) 테스트
+seqlock 슬롯 읽기/쓰기, attach, crc 검증으로 찢어진 스냅샷 거부 확인
+"""
+
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import appargs, blackboard
+
+BOARD_NAME = f"cansat_blackboard_test_{os.getpid()}"
+MID = appargs.BarometerAppArg.MID_SendBarometerTlmData
+
+def test_blackboard_write_read():
+    board = blackboard.Blackboard.create(BOARD_NAME)
+    try:
+        assert board.read(MID) is None
+
+        assert board.write(MID, (1013.25, 21.5, 123.0))
+        seq, stamp, values = board.read(MID)
+        assert seq == 2 and seq % 2 == 0
+        assert stamp > 0
+        assert values == (1013.25, 21.5, 123.0)
+
+        # 다른 프로세스와 같은 방식으로 attach 해도 같은 슬롯
+        reader = blackboard.Blackboard.attach(BOARD_NAME)
+        board.write(MID, (1000.0, 20.0, 200.0))
+        assert reader.read(MID)[0] == 4
+        assert reader.read(MID)[2] == (1000.0, 20.0, 200.0)
+        reader.close()
+    finally:
+        board.close()
+
+def test_blackboard_rejects_unknown_mid():
+    board = blackboard.Blackboard.create(BOARD_NAME)
+    try:
+        assert not board.write(appargs.MainAppArg.MID_TerminateProcess, ("x",))
+        assert board.read(appargs.MainAppArg.MID_TerminateProcess) is None
+    finally:
+        board.close()
+
+def test_blackboard_torn_snapshot_not_returned():
+    """seq 가 홀수(쓰는 중)이거나 payload 가 crc 와 맞지 않으면 스냅샷을 내지 않음"""
+    board = blackboard.Blackboard.create(BOARD_NAME)
+    try:
+        board.write(MID, (1.0, 2.0, 3.0))
+        offset, _ = blackboard.SLOT_LAYOUT[MID]
+
+        struct.pack_into("<I", board.buf, offset, 3)
+        assert board.read(MID) is None
+
+        struct.pack_into("<I", board.buf, offset, 4)
+        struct.pack_into("<d", board.buf, offset + blackboard._SLOT_HEADER_SIZE, 99.0)
+        assert board.read(MID) is None
+
+        # 정상 기록 후 다시 읽힘
+        board.write(MID, (4.0, 5.0, 6.0))
+        assert board.read(MID)[2] == (4.0, 5.0, 6.0)
+    finally:
+        board.close()
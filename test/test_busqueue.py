@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+라우터 outbox (lib/core/busqueue.py) 정책 테스트
+KEEP_LATEST / DROP_OLDEST / NEVER_DROP(hard cap) 와 command lane 우선순위 확인
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import appargs, busqueue
+
+STATE_MID = appargs.BarometerAppArg.MID_SendBarometerTlmData
+HK_MID = appargs.BarometerAppArg.MID_SendHK
+COMMAND_MID = appargs.MainAppArg.MID_TerminateProcess
+
+def _drain(outbox):
+    items = []
+    while True:
+        item = outbox.pop()
+        if item is None:
+            return items
+        items.append(item)
+
+def test_policies():
+    assert busqueue.policy_of(STATE_MID) == busqueue.KEEP_LATEST
+    assert busqueue.policy_of(HK_MID) == busqueue.DROP_OLDEST
+    assert busqueue.policy_of(COMMAND_MID) == busqueue.NEVER_DROP
+
+def test_keep_latest_replaces_pending_sample():
+    outbox = busqueue.Outbox()
+    outbox.put(STATE_MID, b"old", sender=1)
+    outbox.put(STATE_MID, b"new", sender=1)
+    outbox.put(STATE_MID, b"other", sender=2)
+    assert len(outbox) == 2
+    assert _drain(outbox) == [(STATE_MID, b"new"), (STATE_MID, b"other")]
+    assert outbox.drops == {STATE_MID: 1}
+
+    # 전달된 뒤 들어온 샘플은 교체가 아니라 새 엔트리
+    outbox.put(STATE_MID, b"next", sender=1)
+    assert _drain(outbox) == [(STATE_MID, b"next")]
+
+def test_drop_oldest_over_capacity():
+    outbox = busqueue.Outbox(capacity=3)
+    for i in range(5):
+        outbox.put(HK_MID, bytes([i]))
+    assert len(outbox) == 3
+    assert _drain(outbox) == [(HK_MID, bytes([i])) for i in (2, 3, 4)]
+    assert outbox.drops == {HK_MID: 2}
+
+def test_never_drop_ignores_capacity():
+    outbox = busqueue.Outbox(capacity=2)
+    for i in range(10):
+        outbox.put(COMMAND_MID, bytes([i]))
+    assert len(outbox) == 10
+    assert _drain(outbox) == [(COMMAND_MID, bytes([i])) for i in range(10)]
+    assert outbox.drops == {}
+
+def test_command_lane_first():
+    outbox = busqueue.Outbox()
+    outbox.put(HK_MID, b"hk")
+    outbox.put(STATE_MID, b"state", sender=1)
+    outbox.put(COMMAND_MID, b"cmd")
+    assert _drain(outbox)[0] == (COMMAND_MID, b"cmd")
+
+def test_drop_summary_round_trip():
+    first, second = busqueue.Outbox(capacity=1), busqueue.Outbox(capacity=1)
+    for outbox in (first, second):
+        outbox.put(HK_MID, b"a")
+        outbox.put(HK_MID, b"b")
+    summary = busqueue.drop_summary({1: first, 2: second})
+    assert summary == {HK_MID: 2}
+    assert busqueue.parse_drop_summary(busqueue.format_drop_summary(summary)) == {"total": 2, HK_MID: 2}
+
+def test_never_drop_hard_cap():
+    """소비 앱이 멈춰도 명령 대기열은 command_capacity 에서 멈추고 초과분은 거부/집계"""
+    outbox = busqueue.Outbox(capacity=2, command_capacity=3)
+    results = [outbox.put(COMMAND_MID, bytes([i])) for i in range(5)]
+    assert results == [True, True, True, False, False]
+    assert outbox.overflows == 2
+    assert outbox.drops == {COMMAND_MID: 2}
+
+    # 전달되면 다시 받을 수 있음
+    assert outbox.pop() == (COMMAND_MID, bytes([0]))
+    assert outbox.put(COMMAND_MID, b"again")
+    assert [frame for _, frame in _drain(outbox)] == [bytes([1]), bytes([2]), b"again"]
+
+def test_hard_cap_ignores_bulk_traffic():
+    outbox = busqueue.Outbox(capacity=2, command_capacity=1)
+    assert outbox.put(COMMAND_MID, b"cmd")
+    for i in range(5):
+        assert outbox.put(HK_MID, bytes([i]))
+        assert outbox.put(STATE_MID, bytes([i]), sender=1)
+    assert outbox.overflows == 0
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+버스 기록 / 재생 (lib/core/busrecord.py) 테스트
+프레임 + 블랙보드 슬롯 갱신 기록 왕복, 잘린 꼬리 제외, 재생 시 재생 전용 블랙보드에 슬롯 값 재현 확인
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import appargs, blackboard, busrecord, msgstructure
+
+# 블랙보드 MID 를 구독하는 앱 하나와 그 MID
+REPLAY_APP_ID, BOARD_MID = next((app_id, mid) for app_id, mids in appargs.SUBSCRIPTIONS.items()
+                                for mid in mids if mid in blackboard.SLOT_LAYOUT)
+SCHEMA = blackboard.SLOT_LAYOUT[BOARD_MID][1]
+RESULT_PATH = None
+
+def _values(seed):
+    """스키마 필드 수에 맞춘 값 (정수/실수 필드 모두 seed 로 표현 가능한 값)"""
+    return SCHEMA.unpack(SCHEMA.pack(*[seed] * len(SCHEMA.unpack(bytes(SCHEMA.size)))))
+
+def _frame(mid, receiver=appargs.PUBLISH_APPID):
+    message = msgstructure.MsgStructure()
+    msgstructure.fill_msg(message, appargs.MainAppArg.AppID, receiver, mid, "x")
+    frame = msgstructure.encode_msg(message)
+    return frame.encode("utf-8") if isinstance(frame, str) else frame
+
+def _truncate(path, count):
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - count)
+
+def test_bus_recording_truncated_tail(tmp_path):
+    path = str(tmp_path / "bus.brec")
+    recorder = busrecord.BusRecorder(path)
+    frames = [bytes([i]) * (i + 1) for i in range(10)]
+    for frame in frames:
+        recorder.record(frame)
+    recorder.close()
+    _truncate(path, 4)
+
+    header, records = busrecord.read_recording(path)
+    assert header["version"] == busrecord.VERSION
+    assert [frame for _, frame in records] == frames[:9]
+
+def test_slot_records_round_trip(tmp_path):
+    path = str(tmp_path / "bus.brec")
+    recorder = busrecord.BusRecorder(path)
+    recorder.record(b"frame 1")
+    recorder.record_slot(BOARD_MID, 123.5, SCHEMA.pack(*_values(1)))
+    recorder.record(b"frame 2")
+    recorder.close()
+    assert (recorder.records, recorder.slot_records) == (2, 1)
+
+    # 슬롯 갱신은 프레임 목록에 섞이지 않음
+    _, records = busrecord.read_recording(path)
+    assert [frame for _, frame in records] == [b"frame 1", b"frame 2"]
+    _, records, slots = busrecord.read_recording(path, with_slots=True)
+    assert len(records) == 2
+    assert [(mid, stamp, payload) for _, mid, stamp, payload in slots] == [(BOARD_MID, 123.5, SCHEMA.pack(*_values(1)))]
+    assert records[0][0] <= slots[0][0] <= records[1][0]
+
+def test_version_1_recording_readable(tmp_path):
+    path = str(tmp_path / "old.brec")
+    with open(path, "wb") as f:
+        f.write(busrecord.PREAMBLE.pack(busrecord.MAGIC, 1, busrecord.PREAMBLE.size, time.time(), 0))
+        f.write(busrecord.RECORD.pack(5, 3) + b"abc")
+    header, records, slots = busrecord.read_recording(path, with_slots=True)
+    assert header["version"] == 1
+    assert records == [(5, b"abc")] and slots == []
+
+def test_sample_blackboard_records_changed_slots(tmp_path):
+    board = blackboard.Blackboard.create(f"test_busrecord_{os.getpid()}")
+    try:
+        recorder = busrecord.BusRecorder(str(tmp_path / "bus.brec"))
+        recorder.sample_blackboard(board)
+        assert recorder.slot_records == 0       # 기록된 적 없는 슬롯은 건너뜀
+        board.write(BOARD_MID, _values(1))
+        recorder.sample_blackboard(board)
+        recorder.sample_blackboard(board)
+        assert recorder.slot_records == 1       # seq 가 바뀐 슬롯만
+        board.write(BOARD_MID, _values(2))
+        recorder.sample_blackboard(board)
+        recorder.close()
+    finally:
+        board.close()
+
+    _, _, slots = busrecord.read_recording(recorder.path, with_slots=True)
+    assert [SCHEMA.unpack(payload) for _, _, _, payload in slots] == [_values(1), _values(2)]
+
+def test_slots_for_app_selects_subscribed(tmp_path):
+    payload = SCHEMA.pack(*_values(3))
+    slots = [(1, BOARD_MID, 0.0, payload), (2, BOARD_MID, 0.0, payload[:-1]), (3, 0xFFFF, 0.0, payload)]
+    assert busrecord.slots_for_app(slots, REPLAY_APP_ID) == [(1, BOARD_MID, _values(3))]
+    other = next(app_id for app_id, mids in appargs.SUBSCRIPTIONS.items() if BOARD_MID not in mids)
+    assert busrecord.slots_for_app(slots, other) == []
+
+class ReplayProbe:
+    """재생 대상 앱 대역 : 블랙보드 슬롯과 파이프 프레임을 받은 대로 RESULT_PATH 에 기록"""
+
+    def start(self, app_queue, pipe):
+        board = blackboard.get_blackboard()
+        seqs = {}
+        seen = []
+        frames = 0
+        while True:
+            if board is not None:
+                seen += [list(msg.values) for msg in board.poll_updates(REPLAY_APP_ID, seqs)]
+            if pipe.poll(0.01):
+                route = msgstructure.peek_header(pipe.recv_bytes())
+                if route is not None and route[2] == appargs.MainAppArg.MID_TerminateProcess:
+                    break
+                frames += 1
+        with open(RESULT_PATH, "w") as f:
+            json.dump({"board": blackboard.BLACKBOARD_NAME, "seen": seen, "frames": frames}, f)
+
+def test_replay_recreates_blackboard(tmp_path, monkeypatch):
+    global RESULT_PATH
+    RESULT_PATH = str(tmp_path / "result.json")
+    monkeypatch.setattr(blackboard, "BLACKBOARD_ENABLE", True)
+    monkeypatch.setitem(busrecord.REPLAY_APPS, "probe", (__name__, "ReplayProbe", REPLAY_APP_ID))
+
+    path = str(tmp_path / "bus.brec")
+    recorder = busrecord.BusRecorder(path)
+    recorder.record(_frame(appargs.MainAppArg.MID_TerminateProcess + 1, REPLAY_APP_ID))
+    recorder.record_slot(BOARD_MID, time.time(), SCHEMA.pack(*_values(1)))
+    time.sleep(0.2)
+    recorder.record_slot(BOARD_MID, time.time(), SCHEMA.pack(*_values(2)))
+    time.sleep(0.2)
+    recorder.record(_frame(appargs.MainAppArg.MID_TerminateProcess + 1, REPLAY_APP_ID))
+    recorder.close()
+
+    default_name = blackboard.BLACKBOARD_NAME
+    result = busrecord.replay(path, "probe", speed=1.0, settle=0.3)
+    assert blackboard.BLACKBOARD_NAME == default_name
+    assert (result["frames"], result["slot_updates"], result["warnings"]) == (2, 2, [])
+
+    with open(RESULT_PATH) as f:
+        probe = json.load(f)
+    assert probe["board"] != default_name
+    assert probe["frames"] == 2
+    assert [tuple(values) for values in probe["seen"]] == [_values(1), _values(2)]
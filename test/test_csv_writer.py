@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+핸들 유지 CSV writer (lib/logging/csv_writer.py) 테스트
+헤더는 빈 파일에 1번만, 행은 flush_rows / flush_interval / flush=True 기준으로 commit 되는지 확인
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import csv_writer
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+def test_header_written_once(tmp_path):
+    path = str(tmp_path / "data.csv")
+    writer = csv_writer.CsvLogWriter(path, ["timestamp", "value"])
+    writer.write_row(["t0", 1])
+    writer.close()
+
+    # 재시작 후 같은 파일에 이어 쓸 때 헤더를 다시 쓰지 않음
+    writer = csv_writer.CsvLogWriter(path, ["timestamp", "value"])
+    writer.write_row(["t1", 2])
+    writer.close()
+    assert _lines(path) == ["timestamp,value", "t0,1", "t1,2"]
+
+def test_shared_writer_per_path(tmp_path):
+    path = str(tmp_path / "shared.csv")
+    first = csv_writer.get_csv_writer(path, ["a"])
+    assert csv_writer.get_csv_writer(path, ["ignored"]) is first
+    first.write_row([1])
+    first.close()
+    assert _lines(path) == ["a", "1"]
+
+def test_rows_commit_after_flush_rows(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    writer = csv_writer.CsvLogWriter(path, ["v"], flush_rows=3, flush_interval=60.0)
+    writer.write_row([1])
+    writer.write_row([2])
+    assert _lines(path) == ["v"]
+    writer.write_row([3])
+    assert _lines(path) == ["v", "1", "2", "3"]
+    writer.close()
+
+def test_immediate_flush_row(tmp_path):
+    path = str(tmp_path / "event.csv")
+    writer = csv_writer.CsvLogWriter(path, ["event"], flush_rows=100, flush_interval=60.0)
+    writer.write_row(["buffered"])
+    writer.write_row(["state change"], flush=True)
+    assert _lines(path) == ["event", "buffered", "state change"]
+    writer.close()
+
+def test_stale_rows_commit_after_interval(tmp_path):
+    path = str(tmp_path / "stale.csv")
+    writer = csv_writer.CsvLogWriter(path, ["v"], flush_rows=100, flush_interval=0.05)
+    writer.write_row([1])
+    writer.flush_if_stale()
+    assert _lines(path) == ["v"]
+    time.sleep(0.06)
+    writer.flush_if_stale()
+    assert _lines(path) == ["v", "1"]
+    writer.close()
+
+def test_close_flushes_remaining_rows(tmp_path):
+    path = str(tmp_path / "close.csv")
+    writer = csv_writer.CsvLogWriter(path, ["v"], flush_rows=100, flush_interval=60.0)
+    for i in range(5):
+        writer.write_row([i])
+    writer.close()
+    assert _lines(path) == ["v"] + [str(i) for i in range(5)]
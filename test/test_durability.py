@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Group-commit 정책 (lib/logging/durability.py) 테스트
+COMMIT_POLICY 조회 순서 (스트림 이름 → 분류 → DEFAULT), GroupCommitFile commit 기준, 프로세스별 공용 flusher 확인
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import config
+from lib.logging import durability, csv_writer, flight_recorder
+
+TABLE = {
+    "DEFAULT": {"MAX_RECORDS": 10, "MAX_DELAY_MS": 500},
+    "CSV": {"MAX_DELAY_MS": 200},
+    "imu.csv": {"MAX_RECORDS": 1, "FSYNC": True},
+}
+
+@pytest.fixture
+def policies(monkeypatch):
+    monkeypatch.setattr(config, "get_config", lambda key, default=None: TABLE if key == "LOGGING.COMMIT_POLICY" else default)
+    monkeypatch.setattr(durability, "_policies", None)
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def test_stream_policy_first(policies):
+    policy = durability.get_commit_policy("imu.csv", "CSV")
+    assert policy.name == "imu.csv"
+    assert policy.max_records == 1 and policy.fsync
+    # 설정하지 않은 값은 DEFAULT 를 따름 (분류 "CSV" 값은 섞이지 않음)
+    assert policy.max_delay == 0.5
+
+def test_category_then_default(policies):
+    policy = durability.get_commit_policy("gps.csv", "CSV")
+    assert policy.name == "CSV"
+    assert (policy.max_records, policy.max_delay, policy.fsync) == (10, 0.2, False)
+
+    policy = durability.get_commit_policy("UNKNOWN_STREAM")
+    assert policy.name == "DEFAULT"
+    assert (policy.max_records, policy.max_delay) == (10, 0.5)
+
+def test_builtin_default_without_config(monkeypatch):
+    monkeypatch.setattr(config, "get_config", lambda key, default=None: default)
+    monkeypatch.setattr(durability, "_policies", None)
+    policy = durability.get_commit_policy("CSV")
+    assert policy.name == "DEFAULT"
+    assert policy.max_records == durability.DEFAULT_POLICY["MAX_RECORDS"]
+    assert policy.max_delay == durability.DEFAULT_POLICY["MAX_DELAY_MS"] / 1000.0
+
+def test_group_commit_records_and_override(tmp_path, policies):
+    path = str(tmp_path / "driver.txt")
+    log_file = durability.GroupCommitFile(open(path, "a"), "gps.csv", "CSV", max_records=3, max_delay=60.0)
+    assert log_file.policy.max_records == 3 and log_file.policy.max_delay == 60.0
+    log_file.write("a\n")
+    log_file.write("b\n")
+    assert _read(path) == ""
+    log_file.write("c\n")
+    assert _read(path) == "a\nb\nc\n"
+    log_file.write("event\n", commit=True)
+    assert _read(path) == "a\nb\nc\nevent\n"
+    log_file.close()
+    assert log_file not in durability._files
+
+def test_flusher_commits_stale_records(tmp_path):
+    path = str(tmp_path / "stale.txt")
+    log_file = durability.GroupCommitFile(open(path, "a"), "TEST", max_records=100, max_delay=0.05)
+    log_file.write("stale\n")
+    deadline = time.monotonic() + 2.0
+    while _read(path) == "" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _read(path) == "stale\n"
+    log_file.close()
+
+def test_owner_only_ignored_in_other_process(tmp_path):
+    path = str(tmp_path / "owned.txt")
+    handle = open(path, "a")
+    log_file = durability.GroupCommitFile(handle, "TEST", max_records=100, max_delay=60.0, owner_only=True)
+    log_file.write("parent buffer\n")
+    log_file.owner_pid = -1     # fork 된 자식 프로세스에서 보는 상태
+    log_file.flush()
+    log_file.close()
+    assert _read(path) == ""
+    assert not handle.closed
+    handle.close()
+
+def test_one_flusher_thread_per_process(tmp_path):
+    writer = csv_writer.CsvLogWriter(str(tmp_path / "data.csv"), ["v"])
+    writer.write_row([1])
+    recorder = flight_recorder.FlightRecorder(str(tmp_path / "imu.frec"), "imu", ["x"], "f")
+    recorder.record(1.0)
+    names = [thread.name for thread in threading.enumerate()]
+    assert names.count("LogCommitFlusher") == 1
+    assert "CsvLogFlusher" not in names and "FlightRecorderFlusher" not in names
+    writer.close()
+    recorder.close()
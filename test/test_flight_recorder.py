@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+바이너리 flight recorder (lib/logging/flight_recorder.py) 테스트
+헤더/레코드 왕복, CSV 변환, 전원 차단으로 잘린 마지막 레코드 제외 확인
+"""
+
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import flight_recorder
+
+def _record(path, count):
+    recorder = flight_recorder.FlightRecorder(path, "imu", ["roll", "pitch", "count"], "2fH", meta={"unit": "deg"})
+    for i in range(count):
+        recorder.record(float(i), -float(i), i)
+    recorder.close()
+    return recorder.path
+
+def test_round_trip(tmp_path):
+    path = _record(str(tmp_path / "imu.frec"), 5)
+    header, records = flight_recorder.iter_records(path)
+    records = list(records)
+    assert header["stream"] == "imu"
+    assert header["fields"] == ["roll", "pitch", "count"]
+    assert header["unit"] == "deg"
+    assert [record[1:] for record in records] == [(float(i), -float(i), i) for i in range(5)]
+    timestamps = [record[0] for record in records]
+    assert timestamps == sorted(timestamps)
+
+def test_truncated_tail(tmp_path):
+    path = _record(str(tmp_path / "imu.frec"), 10)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 3)
+
+    _, records = flight_recorder.iter_records(path)
+    assert [record[1:] for record in records] == [(float(i), -float(i), i) for i in range(9)]
+
+def test_existing_file_not_appended(tmp_path):
+    """같은 이름의 기록이 있으면 name.N.frec 로 새 파일 (헤더가 파일마다 1개)"""
+    first = _record(str(tmp_path / "imu.frec"), 2)
+    second = _record(str(tmp_path / "imu.frec"), 3)
+    assert first != second
+    assert len(list(flight_recorder.iter_records(second)[1])) == 3
+
+def test_export_csv(tmp_path):
+    path = _record(str(tmp_path / "imu.frec"), 3)
+    out_path = flight_recorder.export_csv(path)
+    with open(out_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp", "t_mono_ns", "roll", "pitch", "count"]
+    assert [row[2:] for row in rows[1:]] == [["0.0", "-0.0", "0"], ["1.0", "-1.0", "1"], ["2.0", "-2.0", "2"]]
+
+def test_format_mismatch_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        flight_recorder.FlightRecorder(str(tmp_path / "bad.frec"), "bad", ["a", "b"], "f")
+    recorder = flight_recorder.FlightRecorder(str(tmp_path / "packed.frec"), "packed", ["a"], "f")
+    with pytest.raises(ValueError):
+        recorder.record_packed(b"\x00" * 3)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+로그 로테이션 (lib/logging/log_rotation.py) 테스트
+스트리밍 gzip 압축 왕복, 비행 상태 일시 정지, 열려 있는 로그 파일 건너뛰기 확인
+"""
+
+import gzip
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import log_rotation
+
+@pytest.fixture
+def rotator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rotator = log_rotation.LogRotator(max_size_mb=0, max_age_days=30)
+    rotator.chunk_size = 4096
+    yield rotator
+    log_rotation.resume_log_compression()
+
+def _write_log(path, lines=5000):
+    data = "".join(f"2025-01-01 00:00:00.000,{i},{i * 0.5:.3f}\n" for i in range(lines)).encode()
+    with open(path, "wb") as f:
+        f.write(data)
+    return data
+
+def test_streaming_gzip_round_trip(rotator):
+    data = _write_log("logs/system.log")
+    assert len(data) > rotator.chunk_size * 4
+
+    rotator.compress_log("logs/system.log")
+    assert not os.path.exists("logs/system.log")
+    assert not os.path.exists("logs/system.log.gz.tmp")
+    with gzip.open("logs/system.log.gz", "rb") as f:
+        assert f.read() == data
+
+def test_pause_holds_compression_between_chunks(rotator):
+    data = _write_log("logs/imu.log")
+    rotator.honor_pause = True
+    log_rotation.pause_log_compression()
+    worker = threading.Thread(target=rotator.compress_log, args=("logs/imu.log",))
+    worker.start()
+    time.sleep(3 * log_rotation.PAUSE_POLL_INTERVAL)
+    assert worker.is_alive()
+    assert os.path.exists("logs/imu.log")
+
+    log_rotation.resume_log_compression()
+    worker.join(5.0)
+    assert not worker.is_alive()
+    with gzip.open("logs/imu.log.gz", "rb") as f:
+        assert f.read() == data
+
+def test_open_files_skipped(rotator):
+    _write_log("logs/open.log")
+    _write_log("logs/closed.log")
+    with open("logs/open.log", "a") as handle:
+        rotator.rotate_logs()
+        assert os.path.exists("logs/open.log")
+        assert not os.path.exists("logs/open.log.gz")
+        assert os.path.exists("logs/closed.log.gz")
+        handle.write("still writing\n")
+
+    rotator.rotate_logs()
+    assert os.path.exists("logs/open.log.gz")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+로그 전용 프로세스 (lib/logging/log_server.py) 테스트
+프로세스 간 도착 순서가 뒤섞여도 송신 시각 순으로 기록, 레벨별 파일 분리, 종료 시 남은 레코드 기록 확인
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import log_server, unified_logging
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(unified_logging, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(unified_logging, "MAIN_LOG_PATH", str(tmp_path / "main_system.log"))
+    monkeypatch.setattr(unified_logging, "ERROR_LOG_PATH", str(tmp_path / "error.log"))
+    monkeypatch.setattr(unified_logging, "DEBUG_LOG_PATH", str(tmp_path / "debug.log"))
+    assert log_server.start_log_server()
+    yield tmp_path
+    log_server.stop_log_server()
+
+def _put(t_mono, level, message):
+    log_server._channel.put((t_mono, datetime.now().isoformat(sep=' ', timespec='milliseconds'),
+                             level, "TEST", message, False))
+
+def _messages(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.rsplit("] ", 1)[1] for line in f.read().splitlines()]
+
+def test_records_sorted_by_send_time(server):
+    now = time.monotonic()
+    _put(now + 0.010, "INFO", "third")
+    _put(now, "INFO", "first")
+    _put(now + 0.005, "INFO", "second")
+    log_server.stop_log_server()
+    assert _messages(server / "main_system.log") == ["first", "second", "third"]
+
+def test_level_files(server):
+    now = time.monotonic()
+    _put(now, "INFO", "info")
+    _put(now + 0.001, "ERROR", "error")
+    _put(now + 0.002, "DEBUG", "debug")
+    log_server.stop_log_server()
+    assert _messages(server / "main_system.log") == ["info", "error", "debug"]
+    assert _messages(server / "error.log") == ["error"]
+    assert _messages(server / "debug.log") == ["debug"]
+
+def test_shutdown_drains_channel(server):
+    now = time.monotonic()
+    for i in range(500):
+        _put(now + i * 1e-6, "INFO", f"record {i}")
+    log_server.stop_log_server()
+    assert not log_server.log_server_running()
+    assert _messages(server / "main_system.log") == [f"record {i}" for i in range(500)]
+
+def test_safe_log_goes_through_channel(server):
+    unified_logging.safe_log("via channel", "WARNING", False, "TEST")
+    log_server.stop_log_server()
+    assert _messages(server / "main_system.log") == ["via channel"]
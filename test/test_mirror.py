@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+보조 저장소 로그 미러링 (lib/logging/mirror.py) 테스트
+비동기 복사 왕복, 대기 버퍼 초과 시 오래된 항목 버림, 쓰기 실패 후 RECOVERY_INTERVAL 동안 사용 중지 확인
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import mirror
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    primary = tmp_path / "logs"
+    secondary = tmp_path / "log_sd"
+    primary.mkdir()
+    secondary.mkdir()
+    monkeypatch.setattr(mirror, "MIRROR_LOGS", True)
+    monkeypatch.setattr(mirror, "PRIMARY_LOG_DIR", str(primary))
+    monkeypatch.setattr(mirror, "SECONDARY_LOG_DIR", str(secondary))
+    # 이전 테스트에서 (보조 저장소 없음으로) 사용 중지된 프로세스 writer 대신 새 writer
+    monkeypatch.setattr(mirror, "_writer", None)
+    monkeypatch.setattr(mirror, "_writer_pid", None)
+    return primary, secondary
+
+class _NoThread:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+def test_mirrored_file_round_trip(dirs):
+    primary, secondary = dirs
+    path = str(primary / "sub" / "system.log")
+    os.makedirs(os.path.dirname(path))
+    handle = mirror.mirror_log_file(open(path, "a", encoding="utf-8"), path)
+    assert isinstance(handle, mirror.MirroredLogFile)
+    handle.write("line 1\n")
+    handle.writelines(["line 2\n", "line 3\n"])
+    handle.close()
+    mirror.flush_mirror()
+
+    with open(secondary / "sub" / "system.log", encoding="utf-8") as f:
+        assert f.read() == "line 1\nline 2\nline 3\n"
+
+def test_secondary_path_mapping(dirs):
+    primary, secondary = dirs
+    assert mirror.secondary_path_for(str(primary / "a" / "b.log")) == str(secondary / "a" / "b.log")
+    # 보조 저장소 안의 파일은 다시 미러링하지 않음
+    assert mirror.secondary_path_for(str(secondary / "b.log")) is None
+
+def test_overflow_drops_oldest(dirs, monkeypatch):
+    monkeypatch.setattr(mirror.threading, "Thread", _NoThread)
+    writer = mirror.SecondaryWriter(max_bytes=10)
+    for i in range(5):
+        writer.submit("x.log", bytes([i]) * 4)
+    assert writer.dropped == 3
+    assert [data for _, data in writer._pending] == [bytes([3]) * 4, bytes([4]) * 4]
+    assert writer._pending_bytes == 8
+
+def test_failure_backs_off_then_recovers(dirs, monkeypatch, tmp_path):
+    _, secondary = dirs
+    # 마운트되지 않은 보조 저장소 → 쓰기 실패
+    missing = tmp_path / "unmounted" / "log_sd"
+    monkeypatch.setattr(mirror, "SECONDARY_LOG_DIR", str(missing))
+    monkeypatch.setattr(mirror, "RECOVERY_INTERVAL", 0.3)
+    writer = mirror.SecondaryWriter()
+    target = str(missing / "system.log")
+
+    writer.submit(target, b"lost\n")
+    writer.flush()
+    assert writer.failures == 1
+    assert writer.dropped == 1
+
+    # 사용 중지 동안 들어온 항목은 대기열에 넣지 않음
+    writer.submit(target, b"during backoff\n")
+    assert writer.dropped == 2
+    assert not writer._pending
+
+    missing.mkdir(parents=True)
+    time.sleep(0.35)
+    writer.submit(target, b"recovered\n")
+    writer.flush()
+    assert writer.failures == 1
+    with open(target, "rb") as f:
+        assert f.read() == b"recovered\n"
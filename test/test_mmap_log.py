@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+mmap 로그 세그먼트 (lib/logging/mmap_log.py) 테스트
+레코드 왕복, 세그먼트 넘김, 잘린/손상된 꼬리 복구, close 없이 끝난 세그먼트, 텍스트 변환 확인
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import mmap_log
+
+def _records(path):
+    with open(path, "rb") as f:
+        records, _, _ = mmap_log.scan_segment(f.read())
+    return [record.decode() for record in records]
+
+def test_round_trip_truncates_on_close(tmp_path):
+    segment = mmap_log.MmapLogSegment(str(tmp_path / "system.mlog"), 64 * 1024)
+    lines = [f"line {i}\n" for i in range(10)]
+    for line in lines:
+        segment.write(line)
+    segment.close()
+
+    assert _records(segment.path) == lines
+    assert os.path.getsize(segment.path) == mmap_log.DATA_OFFSET + sum(
+        mmap_log.RECORD.size + len(line) for line in lines)
+
+def test_existing_segment_not_reused(tmp_path):
+    """같은 이름이 이미 있으면 (이전 부팅 / 다른 앱) name.N.mlog 로 새로 만듦"""
+    path = str(tmp_path / "system.mlog")
+    first = mmap_log.MmapLogSegment(path, 64 * 1024)
+    first.write("first\n")
+    second = mmap_log.MmapLogSegment(path, 64 * 1024)
+    second.write("second\n")
+    first.close()
+    second.close()
+
+    assert first.path == path
+    assert second.path == str(tmp_path / "system.1.mlog")
+    assert _records(first.path) == ["first\n"]
+    assert _records(second.path) == ["second\n"]
+
+def test_full_segment_rolls_over(tmp_path):
+    segment = mmap_log.MmapLogSegment(str(tmp_path / "system.mlog"), 0)
+    line = "x" * 1000 + "\n"
+    for _ in range(10):
+        segment.write(line)
+    segment.close()
+
+    paths = sorted(p for p in os.listdir(tmp_path) if p.endswith(mmap_log.FILE_SUFFIX))
+    assert len(paths) > 1
+    assert sum(len(_records(str(tmp_path / p))) for p in paths) == 10
+
+def test_mmap_segment_recovery(tmp_path):
+    path = str(tmp_path / "system.mlog")
+    segment = mmap_log.MmapLogSegment(path, 64 * 1024)
+    lines = [f"line {i}\n" for i in range(20)]
+    for line in lines:
+        segment.write(line)
+    segment_path = segment.path
+    segment.close()
+
+    # 마지막 레코드 일부 손상 (crc 불일치) → 그 앞까지만 유지
+    with open(segment_path, "r+b") as f:
+        f.seek(os.path.getsize(segment_path) - 2)
+        f.write(b"XX")
+
+    result = mmap_log.recover_segment(segment_path)
+    assert result["records"] == 19
+    assert os.path.getsize(segment_path) == result["end"]
+    with open(segment_path, "rb") as f:
+        records, end, commit_offset = mmap_log.scan_segment(f.read())
+    assert [record.decode() for record in records] == lines[:19]
+    assert end == commit_offset == result["end"]
+
+def test_mmap_segment_unclosed(tmp_path):
+    """close 없이 끝난 (미리 할당된 0 영역이 남은) 세그먼트도 기록된 레코드까지 읽힘"""
+    path = str(tmp_path / "event.mlog")
+    segment = mmap_log.MmapLogSegment(path, 64 * 1024)
+    for i in range(5):
+        segment.write(f"event {i}\n")
+    segment.sync()
+    with open(segment.path, "rb") as f:
+        blob = f.read()
+    segment.close()
+
+    assert len(blob) == 64 * 1024
+    records, _, commit_offset = mmap_log.scan_segment(blob)
+    assert [record.decode() for record in records] == [f"event {i}\n" for i in range(5)]
+    assert commit_offset == mmap_log.DATA_OFFSET + sum(mmap_log.RECORD.size + len(r) for r in records)
+
+def test_export_text(tmp_path):
+    segment = mmap_log.MmapLogSegment(str(tmp_path / "system.mlog"), 64 * 1024)
+    segment.write("a\n")
+    segment.write("b\n")
+    segment.close()
+
+    out_path = mmap_log.export_text(segment.path)
+    assert out_path == str(tmp_path / "system.log")
+    with open(out_path, encoding="utf-8") as f:
+        assert f.read() == "a\nb\n"
+
+def test_open_log_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(mmap_log, "MMAP_LOGS", True)
+    handle = mmap_log.open_log_file(str(tmp_path / "imu.txt"))
+    handle.write("mmap\n")
+    handle.close()
+    assert _records(str(tmp_path / "imu.mlog")) == ["mmap\n"]
+
+    monkeypatch.setattr(mmap_log, "MMAP_LOGS", False)
+    handle = mmap_log.open_log_file(str(tmp_path / "imu.txt"))
+    handle.write("text\n")
+    handle.close()
+    with open(tmp_path / "imu.txt", encoding="utf-8") as f:
+        assert f.read() == "text\n"
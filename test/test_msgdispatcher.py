@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+MID 디스패치 테이블 (lib/base_app.py MsgDispatcher) 테스트
+등록/중복 등록, 스키마 MID 의 값 tuple 전달 (바이너리/텍스트 공통), 텍스트 MID, 디코딩 실패 확인
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.base_app import MsgDispatcher
+from lib.core import appargs, msgstructure
+
+SCHEMA_MID = appargs.BarometerAppArg.MID_SendBarometerTlmData
+TEXT_MID = appargs.MainAppArg.MID_TerminateProcess
+
+def _message(mid, data):
+    msg = msgstructure.MsgStructure()
+    msgstructure.fill_msg(msg, appargs.BarometerAppArg.AppID, appargs.PUBLISH_APPID, mid, data)
+    return msg
+
+def _decoded(frame):
+    msg = msgstructure.MsgStructure()
+    assert msgstructure.unpack_msg(msg, frame)
+    return msg
+
+def test_dispatch_schema_mid_binary_and_text():
+    dispatcher = MsgDispatcher("test")
+    calls = []
+    dispatcher.register(SCHEMA_MID, lambda msg, payload, *args: calls.append((payload, args)))
+
+    source = _message(SCHEMA_MID, [1013.25, 21.5, 123.0])
+    assert dispatcher.dispatch(_decoded(msgstructure.pack_msg_binary(source)), "extra")
+    assert dispatcher.dispatch(_decoded(msgstructure.pack_msg(source)), "extra")
+    assert calls == [((1013.25, 21.5, 123.0), ("extra",))] * 2
+
+def test_dispatch_text_mid_passes_data():
+    dispatcher = MsgDispatcher("test")
+    calls = []
+
+    @dispatcher.register(TEXT_MID)
+    def on_terminate(msg, payload):
+        calls.append(payload)
+
+    assert dispatcher.handles(TEXT_MID)
+    assert dispatcher.dispatch(_decoded(msgstructure.pack_msg(_message(TEXT_MID, "bye"))))
+    assert calls == ["bye"]
+
+def test_unregistered_mid():
+    dispatcher = MsgDispatcher("test")
+    assert not dispatcher.handles(TEXT_MID)
+    assert not dispatcher.dispatch(_message(TEXT_MID, "ignored"))
+
+def test_duplicate_registration_rejected():
+    dispatcher = MsgDispatcher("test")
+    dispatcher.register(TEXT_MID, lambda msg, payload: None)
+    with pytest.raises(ValueError):
+        dispatcher.register(TEXT_MID, lambda msg, payload: None)
+
+def test_malformed_text_payload_skips_handler():
+    """스키마 MID 의 텍스트 payload 가 형식에 맞지 않으면 handler 를 호출하지 않지만 처리된 것으로 봄"""
+    dispatcher = MsgDispatcher("test")
+    calls = []
+    dispatcher.register(SCHEMA_MID, lambda msg, payload: calls.append(payload))
+    msg = msgstructure.MsgStructure()
+    assert msgstructure.unpack_msg(msg, f"10|0|{SCHEMA_MID}|1.0,abc")
+    assert dispatcher.dispatch(msg)
+    assert calls == []
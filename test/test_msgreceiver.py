@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+앱 수신 helper (lib/base_app.py MsgReceiver) / 헤더 peek 테스트
+밀린 상태 MID 를 (sender, MID) 별 최신값으로 합치는지, 명령/다른 sender 는 그대로 두는지 확인
+"""
+
+import os
+import sys
+from multiprocessing import Pipe
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.base_app import MsgReceiver
+from lib.core import appargs, msgstructure
+
+APP_ID = appargs.FlightlogicAppArg.AppID
+STATE_MID = appargs.BarometerAppArg.MID_SendBarometerTlmData
+COMMAND_MID = appargs.MainAppArg.MID_TerminateProcess
+
+def _frame(sender, receiver, mid, data):
+    msg = msgstructure.MsgStructure()
+    msgstructure.fill_msg(msg, sender, receiver, mid, data)
+    return msgstructure.pack_msg_binary(msg)
+
+def _state(sender, altitude):
+    return _frame(sender, appargs.PUBLISH_APPID, STATE_MID, [1000.0, 20.0, altitude])
+
+@pytest.fixture
+def pipe():
+    reader, writer = Pipe(duplex=False)
+    yield reader, writer
+    reader.close()
+    writer.close()
+
+def _receive_all(receiver):
+    received = []
+    while True:
+        msg = receiver.receive(0.05)
+        if msg is None:
+            return received
+        received.append((msg.sender_app, msg.MsgID, msg.values if msg.values is not None else msg.data))
+
+def test_peek_header():
+    frame = _frame(3, 4, COMMAND_MID, "x")
+    assert msgstructure.peek_header(frame) == (3, 4, COMMAND_MID)
+    assert msgstructure.peek_header(memoryview(frame)) == (3, 4, COMMAND_MID)
+    assert msgstructure.peek_header("3|4|100|x") == (3, 4, 100)
+    assert msgstructure.peek_header(b"3|4|100|x") == (3, 4, 100)
+    assert msgstructure.peek_header("garbage") is None
+
+def test_single_frame(pipe):
+    reader, writer = pipe
+    receiver = MsgReceiver(reader, APP_ID)
+    writer.send_bytes(_state(5, 10.0))
+    msg = receiver.receive(1.0)
+    assert msg.MsgID == STATE_MID and msg.values == (1000.0, 20.0, 10.0)
+    assert receiver.receive(0.01) is None
+
+def test_backlog_coalesces_state_per_sender(pipe):
+    reader, writer = pipe
+    receiver = MsgReceiver(reader, APP_ID)
+    for altitude in (1.0, 2.0, 3.0):
+        writer.send_bytes(_state(5, altitude))
+    writer.send_bytes(_frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, "first"))
+    writer.send_bytes(_state(6, 100.0))
+    writer.send_bytes(_frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, "second"))
+    writer.send_bytes(_state(5, 4.0))
+
+    received = _receive_all(receiver)
+    assert received == [
+        (appargs.MainAppArg.AppID, COMMAND_MID, "first"),
+        (6, STATE_MID, (1000.0, 20.0, 100.0)),
+        (appargs.MainAppArg.AppID, COMMAND_MID, "second"),
+        (5, STATE_MID, (1000.0, 20.0, 4.0)),
+    ]
+    assert receiver.coalesced == 3
+
+def test_batch_frame_is_expanded_and_coalesced(pipe):
+    reader, writer = pipe
+    receiver = MsgReceiver(reader, APP_ID)
+    writer.send_bytes(msgstructure.pack_batch([_state(5, 1.0), _state(5, 2.0),
+                                               _frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, "cmd")]))
+    assert _receive_all(receiver) == [
+        (5, STATE_MID, (1000.0, 20.0, 2.0)),
+        (appargs.MainAppArg.AppID, COMMAND_MID, "cmd"),
+    ]
+    assert receiver.coalesced == 1
+
+def test_foreign_receiver_rejected(pipe):
+    reader, writer = pipe
+    receiver = MsgReceiver(reader, APP_ID)
+    writer.send_bytes(_frame(appargs.MainAppArg.AppID, appargs.MotorAppArg.AppID, COMMAND_MID, "not mine"))
+    assert receiver.receive(1.0) is None
+
+def test_frame_larger_than_buffer(pipe):
+    reader, writer = pipe
+    receiver = MsgReceiver(reader, APP_ID)
+    data = "x" * 6000
+    writer.send_bytes(_frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, data))
+    writer.send_bytes(_frame(appargs.MainAppArg.AppID, APP_ID, COMMAND_MID, "small"))
+    assert receiver.receive(1.0).data == data
+    assert receiver.receive(1.0).data == "small"
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+MsgStructure 바이너리 프레임 테스트
+pack_msg_binary ↔ unpack_msg 왕복, 잘린 프레임 거부 확인
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import appargs, msgstructure
+
+def _filled(sender, receiver, mid, data):
+    msg = msgstructure.MsgStructure()
+    msgstructure.fill_msg(msg, sender, receiver, mid, data)
+    return msg
+
+def test_schema_frame_round_trip():
+    """스키마 MID 는 숫자 값 그대로 왕복"""
+    mid = appargs.BarometerAppArg.MID_SendBarometerTlmData
+    frame = msgstructure.pack_msg_binary(_filled(appargs.BarometerAppArg.AppID, appargs.PUBLISH_APPID, mid, [1013.25, 21.5, 123.0]))
+    assert frame[0] == msgstructure.BIN_MAGIC
+    assert frame[1] & msgstructure.FLAG_SCHEMA
+
+    decoded = msgstructure.MsgStructure()
+    assert msgstructure.unpack_msg(decoded, frame)
+    assert (decoded.sender_app, decoded.receiver_app, decoded.MsgID) == (appargs.BarometerAppArg.AppID, appargs.PUBLISH_APPID, mid)
+    assert decoded.values == (1013.25, 21.5, 123.0)
+    assert decoded.data is None
+
+def test_text_frame_round_trip():
+    """스키마 없는 MID 는 텍스트 payload 로 왕복"""
+    frame = msgstructure.pack_msg_binary(_filled(appargs.MainAppArg.AppID, appargs.HkAppArg.AppID,
+                                                 appargs.MainAppArg.MID_TerminateProcess, "terminate"))
+    assert not frame[1] & msgstructure.FLAG_SCHEMA
+
+    decoded = msgstructure.MsgStructure()
+    assert msgstructure.unpack_msg(decoded, frame)
+    assert decoded.MsgID == appargs.MainAppArg.MID_TerminateProcess
+    assert decoded.data == "terminate"
+    assert decoded.values is None
+
+def test_truncated_frame_rejected():
+    frame = msgstructure.pack_msg_binary(_filled(3, 4, appargs.MainAppArg.MID_TerminateProcess, "payload"))
+    assert not msgstructure.unpack_msg(msgstructure.MsgStructure(), frame[:msgstructure.HEADER_SIZE + 2])
+    assert not msgstructure.unpack_msg(msgstructure.MsgStructure(), frame[:msgstructure.HEADER_SIZE - 1])
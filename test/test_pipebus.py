@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+앱별 파이프 전송 (lib/core/pipebus.py) 테스트
+PipeQueue.put → PipeBus.get 왕복, 앱 간 번갈아 읽기, 빈 버스 timeout 확인
+"""
+
+import os
+import queue
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import pipebus
+
+@pytest.fixture
+def bus():
+    bus = pipebus.PipeBus()
+    yield bus
+    bus.close()
+
+def test_put_get_round_trip(bus):
+    producer = bus.producer(1)
+    assert bus.empty()
+    producer.put(b"\xa5frame")
+    producer.put("text|frame")
+    assert not bus.empty()
+    assert bus.get(timeout=1.0) == b"\xa5frame"
+    assert bus.get(timeout=1.0) == b"text|frame"
+    assert bus.empty()
+
+def test_producer_reuses_pipe(bus):
+    first = bus.producer(1)
+    second = bus.producer(1)
+    assert first.writer is second.writer
+    assert len(bus.connections()) == 1
+
+def test_ready_pipes_read_in_turn(bus):
+    """한 앱이 많이 보내도 준비된 다른 앱의 메시지가 사이사이 읽힘"""
+    busy, quiet = bus.producer(1), bus.producer(2)
+    for i in range(5):
+        busy.put(b"busy%d" % i)
+    quiet.put(b"quiet")
+    received = [bus.get(timeout=1.0) for _ in range(6)]
+    assert received.index(b"quiet") < 5
+    assert [msg for msg in received if msg.startswith(b"busy")] == [b"busy%d" % i for i in range(5)]
+
+def test_get_times_out(bus):
+    bus.producer(1)
+    start = time.monotonic()
+    with pytest.raises(queue.Empty):
+        bus.get(timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+    with pytest.raises(queue.Empty):
+        bus.get_nowait()
+
+def test_get_without_apps(bus):
+    with pytest.raises(queue.Empty):
+        bus.get(timeout=0.01)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+공유 메모리 링 (lib/core/shmring.py) 테스트
+wrap / 가득 참, crc 검증으로 아직 다 보이지 않은 레코드 거부, 프로세스 간 전달 확인
+"""
+
+import multiprocessing
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import shmring
+
+def test_ring_wraps_and_fills():
+    ring = shmring.ShmRing(64)
+    try:
+        assert ring.read() is None
+        for round_ in range(20):
+            data = bytes([round_]) * 20
+            assert ring.write(data)
+            assert ring.read() == data
+        assert ring.empty()
+
+        # 레코드 = 길이(4) + crc(4) + 데이터 → 64 bytes 링에 32 bytes 레코드 2개까지
+        assert ring.write(b"a" * 24)
+        assert ring.write(b"b" * 24)
+        assert not ring.write(b"c" * 24)
+        assert ring.read() == b"a" * 24
+        assert ring.write(b"c" * 24)
+        assert ring.read() == b"b" * 24
+        assert ring.read() == b"c" * 24
+    finally:
+        ring.close()
+
+def test_ring_rejects_unpublished_record():
+    """head 가 데이터보다 먼저 보인 상황 : crc 가 맞을 때까지 tail 을 옮기지 않음"""
+    ring = shmring.ShmRing(256)
+    try:
+        assert ring.write(b"payload")
+        start = shmring._DATA_OFFSET + shmring._RECORD.size
+        ring.buf[start:start + 7] = b"PAYLOAD"
+        assert ring.read() is None
+        assert not ring.empty()
+
+        ring.buf[start:start + 7] = b"payload"
+        assert ring.read() == b"payload"
+        assert ring.empty()
+    finally:
+        ring.close()
+
+def test_ring_rejects_previous_lap_record():
+    """이전 바퀴에 같은 자리에 있던 레코드는 위치 seed 가 달라 채택되지 않음"""
+    ring = shmring.ShmRing(64)
+    try:
+        assert ring.write(b"x" * 24) and ring.read() == b"x" * 24
+        assert ring.write(b"y" * 24) and ring.read() == b"y" * 24
+        # 다음 레코드 자리(offset 0)에는 첫 바퀴의 레코드가 그대로 남아 있음 → head 만 앞선 상황을 흉내
+        head = ring._head()
+        shmring._INDEX.pack_into(ring.buf, shmring._HEAD_OFFSET, head + 32)
+        assert ring.read() is None
+    finally:
+        ring.close()
+
+def _produce(producer, count):
+    for i in range(count):
+        producer.put(i.to_bytes(4, "little") * (1 + i % 40), timeout=5.0)
+
+def test_ring_bus_across_processes():
+    bus = shmring.RingBus(1024)
+    count = 2000
+    processes = [multiprocessing.Process(target=_produce, args=(bus.producer(app_id), count)) for app_id in range(2)]
+    try:
+        for process in processes:
+            process.start()
+        received = 0
+        while received < 2 * count:
+            msg = bus.get(timeout=5.0)
+            i = int.from_bytes(msg[:4], "little")
+            assert msg == i.to_bytes(4, "little") * (1 + i % 40)
+            received += 1
+        for process in processes:
+            process.join(5.0)
+        assert bus.empty()
+    finally:
+        bus.close()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+열화상 프레임 바이너리 기록 (thermal_camera/thermal_frames.py) 테스트
+INT16 (0.01 °C) / FLOAT32 프레임 왕복, INT16 포화, MLX90640 refresh rate 설정 값 매핑 확인
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from thermal_camera import thermal_frames
+
+def _frames(count):
+    rng = np.random.default_rng(7)
+    return [rng.uniform(15.0, 45.0, thermal_frames.FRAME_PIXELS).astype(np.float32) for _ in range(count)]
+
+def _record(path, frame_format, frames):
+    log = thermal_frames.ThermalFrameLog(path, frame_format)
+    for frame in frames:
+        log.write(frame)
+    log.recorder.close()
+    return log.recorder.path
+
+def test_int16_round_trip(tmp_path):
+    frames = _frames(3)
+    path = _record(str(tmp_path / "int16.frec"), "INT16", frames)
+    header, mono_ns, indices, read = thermal_frames.read_frames(path)
+
+    assert header["scale"] == 0.01 and header["format"][1] == "h"
+    assert list(indices) == [0, 1, 2]
+    assert np.all(np.diff(mono_ns) >= 0)
+    assert read.shape == (3, thermal_frames.FRAME_ROWS, thermal_frames.FRAME_COLS)
+    for original, frame in zip(frames, read):
+        assert np.allclose(frame.ravel(), original, atol=0.005 + 1e-4)
+
+def test_float32_round_trip(tmp_path):
+    frames = _frames(2)
+    path = _record(str(tmp_path / "float32.frec"), "float32", frames)
+    header, _, indices, read = thermal_frames.read_frames(path)
+
+    assert header["scale"] == 1.0 and header["format"][1] == "f"
+    assert list(indices) == [0, 1]
+    for original, frame in zip(frames, read):
+        assert np.array_equal(frame.ravel(), original)
+
+def test_int16_saturates(tmp_path):
+    frame = np.full(thermal_frames.FRAME_PIXELS, 25.0, dtype=np.float32)
+    frame[0], frame[1] = 500.0, -500.0
+    path = _record(str(tmp_path / "saturate.frec"), "INT16", [frame])
+    _, _, _, read = thermal_frames.read_frames(path)
+    assert read[0].ravel()[0] == pytest.approx(327.67)
+    assert read[0].ravel()[1] == pytest.approx(-327.68)
+    assert read[0].ravel()[2] == pytest.approx(25.0)
+
+def test_invalid_frame(tmp_path):
+    with pytest.raises(ValueError):
+        thermal_frames.ThermalFrameLog(str(tmp_path / "bad.frec"), "INT8")
+    log = thermal_frames.ThermalFrameLog(str(tmp_path / "short.frec"), "INT16")
+    with pytest.raises(ValueError):
+        log.write([20.0] * 10)
+    log.recorder.close()
+
+def test_refresh_rate_mapping():
+    pytest.importorskip("cv2")
+    from thermal_camera import thermo_camera
+    assert thermo_camera.refresh_rate_name(0.5) == "REFRESH_0_5_HZ"
+    assert thermo_camera.refresh_rate_name(4.0) == "REFRESH_4_HZ"
+    assert thermo_camera.refresh_rate_name("16") == "REFRESH_16_HZ"
+    for unsupported in (3, 0.25, 128, None):
+        with pytest.raises(ValueError):
+            thermo_camera.refresh_rate_name(unsupported)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+라우터 타이머 휠 (lib/core/timerwheel.py) 테스트
+가짜 monotonic 시계로 1회성/주기 작업, 한 바퀴 이상 남은 작업, next_timeout 확인
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.core import timerwheel
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(timerwheel.time, "monotonic", clock)
+    return clock
+
+def test_after_runs_once(clock):
+    wheel = timerwheel.TimerWheel(tick=0.1, slots=16)
+    calls = []
+    wheel.after(0.5, lambda: calls.append(clock.now))
+
+    clock.now += 0.4
+    assert wheel.run_due() == 0
+    clock.now += 0.2
+    assert wheel.run_due() == 1
+    clock.now += 5.0
+    assert wheel.run_due() == 0
+    assert len(calls) == 1
+
+def test_every_keeps_period_without_catch_up(clock):
+    wheel = timerwheel.TimerWheel(tick=0.1, slots=16)
+    calls = []
+    wheel.every(1.0, lambda: calls.append(clock.now))
+
+    for _ in range(30):
+        clock.now += 0.1
+        wheel.run_due()
+    assert len(calls) == 3
+
+    # 라우터가 오래 멈췄다 깨어나도 밀린 횟수만큼 몰아서 실행하지 않음
+    clock.now += 10.0
+    assert wheel.run_due() == 1
+    assert len(calls) == 4
+
+def test_job_beyond_one_revolution(clock):
+    """한 바퀴(16 tick = 1.6초)보다 먼 작업은 같은 슬롯을 지나도 실행되지 않음"""
+    wheel = timerwheel.TimerWheel(tick=0.1, slots=16)
+    calls = []
+    wheel.after(2.0, lambda: calls.append(clock.now))
+
+    for _ in range(19):
+        clock.now += 0.1
+        wheel.run_due()
+    assert calls == []
+    clock.now += 0.15
+    wheel.run_due()
+    assert len(calls) == 1
+
+def test_next_timeout(clock):
+    wheel = timerwheel.TimerWheel(tick=0.1, slots=16)
+    assert wheel.next_timeout(limit=1.0) == 1.0
+    wheel.after(0.3, lambda: None)
+    assert 0.2 < wheel.next_timeout(limit=1.0) <= 0.31
+    assert wheel.next_timeout(limit=0.1) == 0.1
+
+def test_failing_job_does_not_stop_others(clock):
+    wheel = timerwheel.TimerWheel(tick=0.1, slots=16)
+    calls = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    wheel.after(0.2, broken)
+    wheel.after(0.2, lambda: calls.append("ok"))
+    clock.now += 0.3
+    assert wheel.run_due() == 2
+    assert calls == ["ok"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+통합 로깅 (lib/logging/unified_logging.py) 레벨 필터링 테스트
+모듈(접두어)별 레벨, 꺼진 레벨은 포맷팅 없이 반환, 앱 safe_log 래퍼의 args / app_name 전달 확인
+"""
+
+import os
+import queue
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logging import unified_logging
+
+class _NoFormat:
+    """포맷팅되면 실패하는 인자 (꺼진 레벨에서 포맷팅하지 않는지 확인용)"""
+    def __str__(self):
+        raise AssertionError("formatted while disabled")
+    __repr__ = __str__
+
+@pytest.fixture
+def channel(monkeypatch):
+    if not unified_logging._levels_loaded:
+        unified_logging._load_levels()
+    monkeypatch.setattr(unified_logging, "_current_log_level", unified_logging.LOG_LEVELS["INFO"])
+    monkeypatch.setattr(unified_logging, "_module_levels", {})
+    unified_logging._update_levels()
+    records = queue.Queue()
+    unified_logging.set_log_channel(records)
+    yield records
+    unified_logging.set_log_channel(None)
+    unified_logging._module_levels.clear()
+    monkeypatch.undo()
+    unified_logging._update_levels()
+
+def _drain(records):
+    out = []
+    while not records.empty():
+        _, _, level, app_name, message, _ = records.get_nowait()
+        out.append((level, app_name, message))
+    return out
+
+def test_module_level_longest_prefix(channel):
+    unified_logging.set_log_level("DEBUG", "imu")
+    unified_logging.set_log_level("WARNING", "imu.imuapp")
+    assert unified_logging.log_enabled("DEBUG", "imu.imu")
+    assert not unified_logging.log_enabled("INFO", "imu.imuapp")
+    assert unified_logging.log_enabled("WARNING", "imu.imuapp")
+    assert not unified_logging.log_enabled("DEBUG", "gps.gpsapp")
+    unified_logging.clear_log_level("imu.imuapp")
+    assert unified_logging.log_enabled("DEBUG", "imu.imuapp")
+
+def test_caller_module_used_for_filtering(channel):
+    unified_logging.set_log_level("ERROR", __name__)
+    unified_logging.safe_log("hidden", "INFO", False, "TEST")
+    unified_logging.safe_log("shown", "ERROR", False, "TEST")
+    assert _drain(channel) == [("ERROR", "TEST", "shown")]
+
+def test_disabled_level_not_formatted(channel):
+    unified_logging.safe_log("value=%s", "DEBUG", False, "TEST", args=(_NoFormat(),))
+    unified_logging.safe_log("alt=%.2f m", "INFO", False, "TEST", args=(12.345,))
+    assert _drain(channel) == [("INFO", "TEST", "alt=12.35 m")]
+
+def test_app_wrapper_forwards_args_and_app_name(channel):
+    from hk import hkapp
+    hkapp.safe_log("Bus latency [%s] %s", "INFO", False, args=("send->router", "MID 1"))
+    hkapp.safe_log("dropped %s", "DEBUG", False, args=(_NoFormat(),))
+    assert _drain(channel) == [("INFO", "HK", "Bus latency [send->router] MID 1")]
+
+def test_app_wrapper_uses_app_module_level(channel):
+    from hk import hkapp
+    unified_logging.set_log_level("DEBUG", "hk")
+    hkapp.safe_log("queue depth %d", "DEBUG", False, args=(3,))
+    unified_logging.safe_log("other module", "DEBUG", False, "TEST")
+    assert _drain(channel) == [("DEBUG", "HK", "queue depth 3")]
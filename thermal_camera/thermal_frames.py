@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+MLX90640 열화상 프레임 바이너리 기록 / 오프라인 변환
+매 프레임 768 픽셀을 텍스트("THERMAL_DATA:23.51,23.48,...")로 남기던 thermal_cam.txt 대신
+flight recorder(.frec) 레코드 1개 = 프레임 1개로 기록
+
+- 레코드 : monotonic 시각 (ns) + 프레임 번호 (I) + 픽셀 768개 (행 우선, 24x32)
+- 픽셀 형식 (config.json THERMAL_CAMERA.FRAME_FORMAT)
+  · "INT16"   : 0.01 °C 단위 정수 (h, 프레임당 1.5 KB, -327.68 ~ 327.67 °C 에서 포화)
+  · "FLOAT32" : 원본 float (f, 프레임당 3 KB)
+- 헤더 meta : {"shape": [24, 32], "scale": 0.01 또는 1.0, "unit": "C"} → 변환 시 °C 로 환산
+
+오프라인 변환 : python3 -m thermal_camera.thermal_frames FILE... [--csv] [--png DIR] [--scale N]
+"""
+
+import argparse
+import csv
+import os
+import struct
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from lib.logging.flight_recorder import get_flight_recorder, read_recording
+
+FRAME_ROWS = 24
+FRAME_COLS = 32
+FRAME_PIXELS = FRAME_ROWS * FRAME_COLS
+STREAM = "thermal_frame"
+
+# FRAME_FORMAT → (픽셀 struct 포맷, numpy dtype, 저장 단위 °C)
+FRAME_FORMATS = {
+    "INT16": ("h", "<i2", 0.01),
+    "FLOAT32": ("f", "<f4", 1.0),
+}
+INDEX_STRUCT = struct.Struct("<I")
+INT16_MIN, INT16_MAX = -32768, 32767
+
+def _pixel_fields() -> list:
+    return [f"p{row}_{col}" for row in range(FRAME_ROWS) for col in range(FRAME_COLS)]
+
+class ThermalFrameLog:
+    """프레임 번호를 붙여 열화상 프레임을 .frec 에 기록"""
+
+    def __init__(self, path: str, frame_format: str = "INT16"):
+        frame_format = frame_format.upper()
+        if frame_format not in FRAME_FORMATS:
+            raise ValueError(f"unsupported thermal frame format '{frame_format}' (INT16 / FLOAT32)")
+        pixel_format, self.dtype, self.scale = FRAME_FORMATS[frame_format]
+        self.recorder = get_flight_recorder(path, STREAM, ["frame"] + _pixel_fields(),
+                                            f"I{FRAME_PIXELS}{pixel_format}",
+                                            meta={"shape": [FRAME_ROWS, FRAME_COLS], "scale": self.scale, "unit": "C"})
+        self.frame_index = 0
+
+    def write(self, temps) -> None:
+        """768 픽셀 (°C) 프레임 1개 기록"""
+        pixels = np.asarray(temps, dtype=np.float32)
+        if pixels.size != FRAME_PIXELS:
+            raise ValueError(f"thermal frame has {pixels.size} pixels, expected {FRAME_PIXELS}")
+        if self.scale != 1.0:
+            pixels = np.clip(np.rint(pixels / self.scale), INT16_MIN, INT16_MAX)
+        self.recorder.record_packed(INDEX_STRUCT.pack(self.frame_index) + pixels.astype(self.dtype).tobytes())
+        self.frame_index += 1
+
+######################################################
+## 오프라인 변환                                     ##
+######################################################
+
+def read_frames(path: str):
+    """(헤더, monotonic ns 배열, 프레임 번호 배열, 프레임 배열 [N, 24, 32] °C float32) 반환"""
+    header, body = read_recording(path)
+    if header.get("stream") != STREAM:
+        raise ValueError(f"{path}: not a thermal frame recording (stream={header.get('stream')})")
+    rows, cols = header.get("shape", [FRAME_ROWS, FRAME_COLS])
+    pixel_dtype = "<i2" if header["format"][1] == "h" else "<f4"
+    dtype = np.dtype([("t_mono_ns", "<i8"), ("frame", "<u4"), ("pixels", pixel_dtype, (rows, cols))])
+    records = np.frombuffer(body, dtype=dtype)
+    frames = records["pixels"].astype(np.float32) * np.float32(header.get("scale", 1.0))
+    return header, records["t_mono_ns"], records["frame"], frames
+
+def _wall_times(header: dict, mono_ns) -> list:
+    return [datetime.fromtimestamp(header["wall_time"] + (int(t) - header["mono_ns"]) / 1e9) for t in mono_ns]
+
+def export_csv(path: str, out_path: str = None) -> str:
+    """프레임당 1행 CSV (timestamp, frame, min, max, avg, 픽셀 768개 °C)"""
+    header, mono_ns, indices, frames = read_frames(path)
+    out_path = out_path or os.path.splitext(path)[0] + ".csv"
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "t_mono_ns", "frame", "min", "max", "avg"] + header["fields"][1:])
+        for wall, t, index, frame in zip(_wall_times(header, mono_ns), mono_ns, indices, frames):
+            writer.writerow([wall.isoformat(sep=" ", timespec="milliseconds"), int(t), int(index),
+                             f"{frame.min():.2f}", f"{frame.max():.2f}", f"{frame.mean():.2f}"]
+                            + [f"{value:.2f}" for value in frame.ravel()])
+    return out_path
+
+def export_png(path: str, out_dir: str = None, scale: int = 10) -> list:
+    """프레임마다 컬러맵 PNG (frame_NNNNNN.png, 프레임별 min~max 정규화)"""
+    try:
+        import cv2
+    except ImportError:
+        raise ImportError("PNG export requires OpenCV (pip3 install opencv-python)")
+    _, _, indices, frames = read_frames(path)
+    out_dir = out_dir or os.path.splitext(path)[0] + "_png"
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for index, frame in zip(indices, frames):
+        low, high = float(frame.min()), float(frame.max())
+        if high > low:
+            normalized = ((frame - low) / (high - low) * 255).astype(np.uint8)
+        else:
+            normalized = np.zeros(frame.shape, dtype=np.uint8)
+        image = cv2.applyColorMap(cv2.resize(normalized, (frame.shape[1] * scale, frame.shape[0] * scale),
+                                             interpolation=cv2.INTER_NEAREST), cv2.COLORMAP_JET)
+        out_path = os.path.join(out_dir, f"frame_{int(index):06d}.png")
+        cv2.imwrite(out_path, image)
+        paths.append(out_path)
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Thermal frame recording (.frec) exporter")
+    parser.add_argument("files", nargs="+", help="변환할 thermal_frames*.frec 파일")
+    parser.add_argument("--csv", action="store_true", help="같은 이름의 .csv 로 변환 (프레임당 1행)")
+    parser.add_argument("--png", nargs="?", const="", metavar="DIR", help="프레임별 PNG (기본 : <파일>_png/)")
+    parser.add_argument("--scale", type=int, default=10, help="PNG 확대 배율 (기본 10 → 320x240)")
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        try:
+            header, _, indices, frames = read_frames(path)
+            print(f"{path}: frames={len(frames)} format={header['format'][1]} scale={header.get('scale', 1.0)}")
+            if args.csv:
+                print(f"  -> {export_csv(path)}")
+            if args.png is not None:
+                pngs = export_png(path, args.png or None, args.scale)
+                print(f"  -> {len(pngs)} PNG in {os.path.dirname(pngs[0]) if pngs else '-'}")
+        except (OSError, ValueError, ImportError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ from datetime import datetime
 import cv2
 import numpy as np
 
+from lib import config
+from thermal_camera.thermal_frames import ThermalFrameLog
+
 # ──────────────────────
 # 1)  로그 파일 준비
 # ──────────────────────
@@ -14,6 +17,39 @@ os.makedirs(LOG_DIR, exist_ok=True)
 os.makedirs(VIDEO_DIR, exist_ok=True)
 logfile = open(os.path.join(LOG_DIR, "thermal_cam.txt"), "a")
 
+# 프레임 전체(768 픽셀)는 텍스트 대신 바이너리 레코드로 기록 (thermal_cam.txt 에는 분석 결과만)
+# 변환 : python3 -m thermal_camera.thermal_frames sensorlogs/thermal_frames*.frec --csv --png
+FRAME_LOG_PATH = os.path.join(LOG_DIR, "thermal_frames.frec")
+FRAME_FORMAT = config.get_config("THERMAL_CAMERA.FRAME_FORMAT", "INT16")   # INT16 (0.01 °C) / FLOAT32
+REFRESH_RATE_HZ = config.get_config("THERMAL_CAMERA.REFRESH_RATE_HZ", 2)
+_frame_log = None
+
+# REFRESH_RATE_HZ → adafruit_mlx90640.RefreshRate 속성 이름 (센서가 지원하는 값만)
+REFRESH_RATES = {
+    0.5: "REFRESH_0_5_HZ",
+    1: "REFRESH_1_HZ",
+    2: "REFRESH_2_HZ",
+    4: "REFRESH_4_HZ",
+    8: "REFRESH_8_HZ",
+    16: "REFRESH_16_HZ",
+    32: "REFRESH_32_HZ",
+    64: "REFRESH_64_HZ",
+}
+
+def refresh_rate_name(hz) -> str:
+    """설정 값 (Hz) → RefreshRate 이름, 지원하지 않는 값이면 ValueError (다른 주기로 조용히 바꾸지 않음)"""
+    try:
+        return REFRESH_RATES[float(hz)]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"unsupported THERMAL_CAMERA.REFRESH_RATE_HZ {hz!r} "
+                         f"(choose from {', '.join(str(rate) for rate in REFRESH_RATES)})")
+
+def log_thermal_frame(frame) -> None:
+    global _frame_log
+    if _frame_log is None:
+        _frame_log = ThermalFrameLog(FRAME_LOG_PATH, FRAME_FORMAT)
+    _frame_log.write(frame)
+
 def log_thermal(text: str) -> None:
     t = datetime.now().isoformat(sep=" ", timespec="milliseconds")
     logfile.write(f"{t},{text}\n")
@@ -34,7 +70,7 @@ def init_thermal_camera():
     try:
         # Thermal Camera 센서 직접 연결 (MLX90640 at 0x33)
         sensor = adafruit_mlx90640.MLX90640(i2c, address=0x33)
-        sensor.refresh_rate = adafruit_mlx90640.RefreshRate.REFRESH_2_HZ
+        sensor.refresh_rate = getattr(adafruit_mlx90640.RefreshRate, refresh_rate_name(REFRESH_RATE_HZ))
         time.sleep(0.1)
         # print("Thermal Camera MLX90640 센서 초기화 완료 (주소: 0x33)")
     # 로깅 시스템으로 대체됨
@@ -89,11 +125,9 @@ def read_cam(sensor, ascii: bool = False):
         max_temp = max(temps)
         avg_temp = sum(temps) / len(temps)
         
-        # 738개 전체 데이터를 로그에 저장
+        # 768개 전체 데이터를 바이너리 프레임 레코드로 저장
         try:
-            timestamp = datetime.now().isoformat(sep=" ", timespec="milliseconds")
-            temp_str = ",".join([f"{temp:.2f}" for temp in temps])
-            log_thermal(f"THERMAL_DATA:{temp_str}")
+            log_thermal_frame(temps)
         except Exception as log_e:
             print(f"Thermal data logging error: {log_e}")
         
@@ -3,18 +3,21 @@
 
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[ThermalCamera] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[ThermalCamera] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "ThermalCamera", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[ThermalCamera] 로깅 실패: {e}")
         print(f"[ThermalCamera] 원본 메시지: {message}")
 
-from lib import appargs, msgstructure, logging, prevstate
+from lib import appargs, msgstructure, logging, prevstate, config
+from lib.base_app import MsgReceiver
 import signal, threading, time
 from multiprocessing import Queue, connection
 
@@ -25,6 +28,8 @@ from thermal_camera import thermo_camera as tcam
 # ──────────────────────────────
 THERMOCAMAPP_RUNSTATUS = True
 
+READ_INTERVAL = config.get_config("THERMAL_CAMERA.READ_INTERVAL", 0.5)   # 초 (REFRESH_RATE_HZ 와 맞춤)
+
 # Thermal camera data
 THERMAL_AVG = 0.0
 THERMAL_MIN = 0.0
@@ -91,6 +96,9 @@ def thermocamapp_terminate(i2c):
     for t in thread_dict.values():
         t.join()
 
+    # fork 된 앱 프로세스는 atexit 가 실행되지 않으므로 프레임 기록을 직접 닫음
+    logging.close_flight_recorders()
+
     safe_log("Thermocamapp termination complete", "info".upper(), True)
 
 # ──────────────────────────────
@@ -110,7 +118,7 @@ def read_cam_data(cam):
                 THERMAL_ANALYSIS = analysis  # 분석 결과 저장
         except Exception as e:
             safe_log(f"Thermal camera read error: {e}", "error".upper(), True)
-        time.sleep(0.5)  # 2 Hz
+        time.sleep(READ_INTERVAL)
 
 def send_cam_data(Main_Queue: Queue):
     global THERMAL_AVG, THERMAL_MIN, THERMAL_MAX, THERMAL_ANALYSIS
@@ -126,30 +134,27 @@ def send_cam_data(Main_Queue: Queue):
             max_val = THERMAL_MAX if THERMAL_MAX is not None else 0.0
             
             # Flightlogic 10 Hz
-            msgstructure.send_msg(Main_Queue, fl_msg,
-                                  appargs.ThermalcameraAppArg.AppID,
-                                  appargs.FlightlogicAppArg.AppID,
-                                  appargs.ThermalcameraAppArg.MID_SendCamFlightLogicData,
-                                  f"{avg_val:.2f},{min_val:.2f},{max_val:.2f}")
+            msgstructure.publish_msg(Main_Queue, fl_msg,
+                                     appargs.ThermalcameraAppArg.AppID,
+                                     appargs.ThermalcameraAppArg.MID_SendCamFlightLogicData,
+                                     (avg_val, min_val, max_val))
 
             if cnt > 10:  # 1 Hz telemetry
                 # 기본 데이터만 텔레메트리 전송 (고급 데이터는 로그에만 저장)
-                msgstructure.send_msg(Main_Queue, tlm_msg,
-                                      appargs.ThermalcameraAppArg.AppID,
-                                      appargs.CommAppArg.AppID,
-                                      appargs.ThermalcameraAppArg.MID_SendCamTlmData,
-                                      f"{avg_val:.2f},{min_val:.2f},{max_val:.2f}")
+                msgstructure.publish_msg(Main_Queue, tlm_msg,
+                                         appargs.ThermalcameraAppArg.AppID,
+                                         appargs.ThermalcameraAppArg.MID_SendCamTlmData,
+                                         (avg_val, min_val, max_val))
                 
                 # 고급 데이터는 로그에만 저장
-                if THERMAL_ANALYSIS is not None:
-                    max_grad = THERMAL_ANALYSIS.get('gradient', {}).get('max_gradient', 0.0)
-                    avg_grad = THERMAL_ANALYSIS.get('gradient', {}).get('avg_gradient', 0.0)
-                    std_temp = THERMAL_ANALYSIS.get('basic_stats', {}).get('std_temp', 0.0)
-                    hot_pixels = THERMAL_ANALYSIS.get('distribution', {}).get('ranges', {}).get('hot', 0)
-                    cold_pixels = THERMAL_ANALYSIS.get('distribution', {}).get('ranges', {}).get('cold', 0)
-                    
-                    # 고급 데이터 로깅
-                    safe_log(f"Thermal Camera Advanced Data - MaxGrad: {max_grad:.3f}, AvgGrad: {avg_grad:.3f}, StdTemp: {std_temp:.2f}, HotPixels: {hot_pixels}, ColdPixels: {cold_pixels}", "debug".upper(), False)
+                # (DEBUG 가 꺼져 있으면 값 조회 / 포맷팅 없음)
+                if THERMAL_ANALYSIS is not None and log_enabled("DEBUG", __name__):
+                    gradient = THERMAL_ANALYSIS.get('gradient', {})
+                    ranges = THERMAL_ANALYSIS.get('distribution', {}).get('ranges', {})
+                    safe_log("Thermal Camera Advanced Data - MaxGrad: %.3f, AvgGrad: %.3f, StdTemp: %.2f, HotPixels: %s, ColdPixels: %s",
+                             "DEBUG", False, args=(gradient.get('max_gradient', 0.0), gradient.get('avg_gradient', 0.0),
+                                                   THERMAL_ANALYSIS.get('basic_stats', {}).get('std_temp', 0.0),
+                                                   ranges.get('hot', 0), ranges.get('cold', 0)))
                 
                 cnt = 0
 
@@ -194,26 +199,22 @@ def thermocamapp_main(Main_Queue: Queue, Main_Pipe: connection.Connection):
     for t in thread_dict.values():
         t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.ThermalcameraAppArg.AppID, Main_Queue)
+
     try:
         while THERMOCAMAPP_RUNSTATUS:
-            # Non-blocking receive with timeout
-            if Main_Pipe.poll(1.0):  # 1초 타임아웃
-                try:
-                    raw = Main_Pipe.recv()
-                except Exception as e:
-                    # 에러 시 루프 계속
-                    safe_log(f"메시지 수신 오류: {e}", "WARNING")
-                    continue
-            else:
+            try:
+                m = receiver.receive(1.0)  # 1초 타임아웃
+            except Exception as e:
+                # 에러 시 루프 계속
+                safe_log(f"메시지 수신 오류: {e}", "WARNING")
+                continue
+            if m is None:
                 # 타임아웃 시 루프 계속
                 continue
-            m = raw
 
-            target_apps = (appargs.ThermalcameraAppArg.AppID, appargs.MainAppArg.AppID)
-            if m.receiver_app in target_apps:
-                command_handler(Main_Queue, m)
-            else:
-                safe_log("Receiver MID mismatch", "error".upper(), True)
+            command_handler(Main_Queue, m)
 
     except Exception as e:
         safe_log(f"thermocamapp error: {e}", "error".upper(), True)
@@ -8,17 +8,19 @@ thermis.py – ADS1115 thermistor temperature sensor helper
 import os, time, math
 from datetime import datetime
 
+from lib.logging.mmap_log import open_log_file
+from lib.logging.durability import GroupCommitFile
+
 # ─────────────────────────────
 # 1) 로그 파일 준비
 # ─────────────────────────────
 LOG_DIR = "sensorlogs"
 os.makedirs(LOG_DIR, exist_ok=True)
-thermis_log = open(os.path.join(LOG_DIR, "thermis.txt"), "a")
+thermis_log = GroupCommitFile(open_log_file(os.path.join(LOG_DIR, "thermis.txt")), "THERMIS_DRIVER", "SENSOR_DRIVER")
 
 def _log(line: str) -> None:
     t = datetime.now().isoformat(sep=" ", timespec="milliseconds")
     thermis_log.write(f"{t},{line}\n")
-    thermis_log.flush()
 
 # ─────────────────────────────
 # 2) 초기화 / 종료
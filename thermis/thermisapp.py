@@ -10,18 +10,21 @@
 import board, busio
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[Thermis] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[Thermis] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "Thermis", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[Thermis] 로깅 실패: {e}")
         print(f"[Thermis] 원본 메시지: {message}")
 
 from lib import appargs, msgstructure, prevstate
+from lib.base_app import MsgReceiver
 import signal, threading, time
 from multiprocessing import Queue, connection
 
@@ -125,19 +128,17 @@ def send_thermis_data(main_q: Queue):
 
     while THERMISAPP_RUNSTATUS:
         # Flightlogic 10 Hz
-        msgstructure.send_msg(main_q, fl_msg,
-                              appargs.ThermisAppArg.AppID,
-                              appargs.FlightlogicAppArg.AppID,
-                              appargs.ThermisAppArg.MID_SendThermisFlightLogicData,
-                              f"{TEMP}")
+        msgstructure.publish_msg(main_q, fl_msg,
+                                 appargs.ThermisAppArg.AppID,
+                                 appargs.ThermisAppArg.MID_SendThermisFlightLogicData,
+                                 (TEMP,))
 
         # COMM 1 Hz
         if cnt >= 10:
-            status = msgstructure.send_msg(main_q, tlm_msg,
-                                           appargs.ThermisAppArg.AppID,
-                                           appargs.CommAppArg.AppID,
-                                           appargs.ThermisAppArg.MID_SendThermisTlmData,
-                                           f"{TEMP}")
+            status = msgstructure.publish_msg(main_q, tlm_msg,
+                                              appargs.ThermisAppArg.AppID,
+                                              appargs.ThermisAppArg.MID_SendThermisTlmData,
+                                              (TEMP,))
             if not status:
                 safe_log("Error sending Thermis TLM", "error".upper(), True)
             cnt = 0
@@ -213,24 +214,21 @@ def thermisapp_main(main_q: Queue, main_pipe: connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(main_pipe, appargs.ThermisAppArg.AppID, main_q)
+
     try:
         while THERMISAPP_RUNSTATUS:
-            # Non-blocking receive with timeout
-            if main_pipe.poll(1.0):  # 1초 타임아웃
-                try:
-                    raw = main_pipe.recv()
-                except Exception as e:
-                    # 에러 시 루프 계속
-                    safe_log(f"메시지 수신 오류: {e}", "WARNING")
-                    continue
-            else:
+            try:
+                m = receiver.receive(1.0)  # 1초 타임아웃
+            except Exception as e:
+                # 에러 시 루프 계속
+                safe_log(f"메시지 수신 오류: {e}", "WARNING")
+                continue
+            if m is None:
                 # 타임아웃 시 루프 계속
                 continue
-            m = raw
-            if m.receiver_app in (appargs.ThermisAppArg.AppID, appargs.MainAppArg.AppID):
-                command_handler(main_q, m)
-            else:
-                safe_log("Receiver MID mismatch", "error".upper(), True)
+            command_handler(main_q, m)
     except Exception as e:
         safe_log(f"thermisapp error: {e}", "error".upper(), True)
         THERMISAPP_RUNSTATUS = False
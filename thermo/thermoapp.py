@@ -3,18 +3,21 @@
 import board, busio
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[Thermo] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[Thermo] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "Thermo", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[Thermo] 로깅 실패: {e}")
         print(f"[Thermo] 원본 메시지: {message}")
 
 from lib import appargs, msgstructure, logging, types, prevstate
+from lib.base_app import MsgReceiver
 import signal
 from multiprocessing import Queue, connection
 import threading, time
@@ -129,18 +132,16 @@ def send_thermo_data(Main_Queue: Queue):
     cnt = 0
     while THERMOAPP_RUNSTATUS:
         # FlightLogic 전송 (10 Hz)
-        msgstructure.send_msg(Main_Queue, fl_msg,
-                              appargs.ThermoAppArg.AppID,
-                              appargs.FlightlogicAppArg.AppID,
-                              appargs.ThermoAppArg.MID_SendThermoFlightLogicData,
-                              f"{TEMP_C},{HUMI}")
+        msgstructure.publish_msg(Main_Queue, fl_msg,
+                                 appargs.ThermoAppArg.AppID,
+                                 appargs.ThermoAppArg.MID_SendThermoFlightLogicData,
+                                 (TEMP_C, HUMI))
         # COMM 전송 (1 Hz)
         if cnt >= 10:
-            status = msgstructure.send_msg(Main_Queue, tlm_msg,
-                                           appargs.ThermoAppArg.AppID,
-                                           appargs.CommAppArg.AppID,
-                                           appargs.ThermoAppArg.MID_SendThermoTlmData,
-                                           f"{TEMP_C},{HUMI}")
+            status = msgstructure.publish_msg(Main_Queue, tlm_msg,
+                                              appargs.ThermoAppArg.AppID,
+                                              appargs.ThermoAppArg.MID_SendThermoTlmData,
+                                              (TEMP_C, HUMI))
             if not status:
                 safe_log("Error sending Thermo TLM", "error".upper(), True)
             cnt = 0
@@ -182,26 +183,22 @@ def thermoapp_main(Main_Queue: Queue, Main_Pipe: connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.ThermoAppArg.AppID, Main_Queue)
+
     try:
         while THERMOAPP_RUNSTATUS:
-            # Non-blocking receive with timeout
-            if Main_Pipe.poll(1.0):  # 1초 타임아웃
-                try:
-                    raw = Main_Pipe.recv()
-                except Exception as e:
-                    # 에러 시 루프 계속
-                    safe_log(f"메시지 수신 오류: {e}", "WARNING")
-                    continue
-            else:
+            try:
+                m = receiver.receive(1.0)  # 1초 타임아웃
+            except Exception as e:
+                # 에러 시 루프 계속
+                safe_log(f"메시지 수신 오류: {e}", "WARNING")
+                continue
+            if m is None:
                 # 타임아웃 시 루프 계속
                 continue
-                
-            m = raw
 
-            if m.receiver_app in (appargs.ThermoAppArg.AppID, appargs.MainAppArg.AppID):
-                command_handler(Main_Queue, m, dht)
-            else:
-                safe_log("Receiver MID mismatch", "error".upper(), True)
+            command_handler(Main_Queue, m, dht)
 
     except Exception as e:
         safe_log(f"thermoapp error: {e}", "error".upper(), True)
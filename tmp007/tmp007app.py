@@ -3,14 +3,17 @@
 
 from lib import appargs
 from lib import msgstructure
+from lib.base_app import MsgReceiver
 from lib import logging
 
-def safe_log(message: str, level: str = "INFO", printlogs: bool = True):
-    """안전한 로깅 함수 - lib/logging.py 사용"""
+from lib.logging import safe_log as lib_safe_log, log_enabled
+
+def safe_log(message: str, level: str = "INFO", printlogs: bool = True, args: tuple = ()):
+    """안전한 로깅 함수 - lib/logging.py 사용 (꺼진 레벨은 바로 반환, args 가 있으면 기록하는 레코드만 % 포맷팅)"""
+    if not log_enabled(level, __name__):
+        return
     try:
-        formatted_message = f"[TMP007] [{level}] {message}"
-        from lib.logging import safe_log as lib_safe_log
-        lib_safe_log(f"[TMP007] {message}", level, printlogs)
+        lib_safe_log(message, level, printlogs, "TMP007", args)
     except Exception as e:
         # 로깅 실패 시에도 최소한 콘솔에 출력
         print(f"[TMP007] 로깅 실패: {e}")
@@ -23,7 +26,6 @@ from multiprocessing import Queue, connection
 import threading
 import time
 import os
-import csv
 from datetime import datetime
 
 # Import TMP007 sensor library
@@ -91,16 +93,7 @@ def log_high_freq_tmp007_data(object_temp, die_temp, voltage):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(HIGH_FREQ_LOG_PATH):
-            with open(HIGH_FREQ_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'object_temp', 'die_temp', 'voltage'])
-        
-        # 데이터 추가
-        with open(HIGH_FREQ_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, object_temp, die_temp, voltage])
+        logging.get_csv_writer(HIGH_FREQ_LOG_PATH, ['timestamp', 'object_temp', 'die_temp', 'voltage']).write_row([timestamp, object_temp, die_temp, voltage])
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"High frequency TMP007 logging failed: {e}")
@@ -108,16 +101,7 @@ def log_high_freq_tmp007_data(object_temp, die_temp, voltage):
 def log_csv(filepath: str, headers: list, data: list):
     """CSV 파일에 데이터를 로깅하는 함수"""
     try:
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-        
-        # 데이터 추가
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(data)
+        logging.get_csv_writer(filepath, headers).write_row(data)
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"CSV logging failed: {e}")
@@ -127,16 +111,7 @@ def log_sensor_data(sensor_type: str, data: dict):
     try:
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(SENSOR_LOG_PATH):
-            with open(SENSOR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'sensor_type', 'data'])
-        
-        # 데이터 추가
-        with open(SENSOR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, sensor_type, str(data)])
+        logging.get_csv_writer(SENSOR_LOG_PATH, ['timestamp', 'sensor_type', 'data']).write_row([timestamp, sensor_type, str(data)])
             
     except Exception as e:
         emergency_log_to_file("ERROR", f"Sensor logging failed: {e}")
@@ -147,16 +122,8 @@ def log_error(error_msg: str, context: str = ""):
         timestamp = datetime.now().isoformat(sep=' ', timespec='milliseconds')
         full_msg = f"{error_msg} | Context: {context}" if context else error_msg
         
-        # CSV 헤더가 없으면 생성
-        if not os.path.exists(ERROR_LOG_PATH):
-            with open(ERROR_LOG_PATH, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['timestamp', 'error_message'])
-        
-        # 데이터 추가
-        with open(ERROR_LOG_PATH, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, full_msg])
+        # 오류는 즉시 flush
+        logging.get_csv_writer(ERROR_LOG_PATH, ['timestamp', 'error_message']).write_row([timestamp, full_msg], flush=True)
             
     except Exception as e:
         print(f"Error logging failed: {e}")
@@ -262,6 +229,9 @@ def tmp007app_terminate(i2c_instance):
     for t in thread_dict.values():
         t.join()
     
+    # 버퍼에 남은 CSV 행 기록
+    logging.close_csv_writers()
+    
     safe_log("Terminating tmp007app complete", "info".upper(), True)
 
 ######################################################
@@ -361,12 +331,11 @@ def send_tmp007_data(Main_Queue : Queue):
             try:
                 # Send telemetry message to COMM app
                 Tmp007DataToTlmMsg = msgstructure.MsgStructure()
-                status = msgstructure.send_msg(Main_Queue, 
+                status = msgstructure.publish_msg(Main_Queue, 
                                             Tmp007DataToTlmMsg, 
                                             appargs.Tmp007AppArg.AppID,
-                                            appargs.CommAppArg.AppID,
                                             appargs.Tmp007AppArg.MID_SendTmp007TlmData,
-                                            f"{TMP007_OBJECT_TEMP:.2f},{TMP007_DIE_TEMP:.2f},{TMP007_VOLTAGE:.2f}")
+                                            (TMP007_OBJECT_TEMP, TMP007_DIE_TEMP, TMP007_VOLTAGE))
                 if status == False:
                     consecutive_send_failures += 1
                     if consecutive_send_failures <= max_send_failures:
@@ -385,12 +354,11 @@ def send_tmp007_data(Main_Queue : Queue):
             # Send data to FlightLogic app (4Hz)
             try:
                 Tmp007DataToFlightLogicMsg = msgstructure.MsgStructure()
-                status = msgstructure.send_msg(Main_Queue, 
+                status = msgstructure.publish_msg(Main_Queue, 
                                             Tmp007DataToFlightLogicMsg, 
                                             appargs.Tmp007AppArg.AppID,
-                                            appargs.FlightlogicAppArg.AppID,
                                             appargs.Tmp007AppArg.MID_SendTmp007FlightLogicData,
-                                            f"{TMP007_OBJECT_TEMP:.2f},{TMP007_DIE_TEMP:.2f},{TMP007_VOLTAGE:.2f}")
+                                            (TMP007_OBJECT_TEMP, TMP007_DIE_TEMP, TMP007_VOLTAGE))
                 if status == False:
                     safe_log("Error When sending TMP007 FlightLogic Message", "error".upper(), True)
             except Exception as e:
@@ -429,35 +397,29 @@ def tmp007app_main(Main_Queue : Queue, Main_Pipe : connection.Connection):
         if not hasattr(t, '_is_resilient') or not t._is_resilient:
             t.start()
 
+    # 공통 수신 helper (수신 앱 검증 포함)
+    receiver = MsgReceiver(Main_Pipe, appargs.Tmp007AppArg.AppID, Main_Queue)
+
     try:
         while TMP007APP_RUNSTATUS:
             # Receive Message From Pipe with timeout
-            # Non-blocking receive with timeout
             try:
-                if Main_Pipe.poll(0.5):  # 0.5초 타임아웃으로 단축
-                    try:
-                        message = Main_Pipe.recv()
-                    except (EOFError, BrokenPipeError, ConnectionResetError):
-                        safe_log("Pipe connection lost", "error".upper(), True)
-                        log_error("Pipe connection lost", "tmp007app_main")
-                        break
-                    except Exception as e:
-                        safe_log(f"Pipe receive error: {e}", "error".upper(), True)
-                        log_error(f"Pipe receive error: {e}", "tmp007app_main")
-                        continue
-                else:
+                try:
+                    recv_msg = receiver.receive(0.5)  # 0.5초 타임아웃으로 단축
+                except (EOFError, BrokenPipeError, ConnectionResetError):
+                    safe_log("Pipe connection lost", "error".upper(), True)
+                    log_error("Pipe connection lost", "tmp007app_main")
+                    break
+                except Exception as e:
+                    safe_log(f"Pipe receive error: {e}", "error".upper(), True)
+                    log_error(f"Pipe receive error: {e}", "tmp007app_main")
+                    continue
+                if recv_msg is None:
                     # 타임아웃 시 루프 계속
                     continue
-                    
-                recv_msg = message
-                
-                # Validate Message, Skip this message if target AppID different from tmp007app's AppID
-                # Exception when the message is from main app
-                if recv_msg.receiver_app == appargs.Tmp007AppArg.AppID or recv_msg.receiver_app == appargs.MainAppArg.AppID:
-                    # Handle Command According to Message ID
-                    command_handler(recv_msg)
-                else:
-                    safe_log("Receiver MID does not match with tmp007app MID", "error".upper(), True)
+
+                # Handle Command According to Message ID
+                command_handler(recv_msg)
                     
             except Exception as e:
                 safe_log(f"Main loop error: {e}", "error".upper(), True)